@@ -11,4 +11,8 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    # Needed by PDF extraction worker processes in frozen (PyInstaller) builds.
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -0,0 +1,38 @@
+"""Crash-safe JSON file writes shared by project caches and stores."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def write_json_atomic(path: Path, payload: Any, *, compact: bool = False) -> None:
+    """Write ``payload`` as JSON so readers see either the old or new file.
+
+    The data is fsynced to a temporary file beside ``path`` before it replaces
+    the original. ``compact`` drops indentation and key sorting for large caches.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            if compact:
+                json.dump(payload, handle, separators=(",", ":"))
+            else:
+                json.dump(payload, handle, indent=2, sort_keys=True)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+__all__ = ["write_json_atomic"]
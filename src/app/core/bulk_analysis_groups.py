@@ -87,6 +87,11 @@ class BulkAnalysisGroup:
     combine_output_template: str = "combined_{timestamp}.md"
     use_reasoning: bool = False
 
+    # Number of documents processed concurrently during a map run (1 = serial)
+    max_concurrent_documents: int = 1
+    # Number of chunk prompts in flight for a single chunked document (1 = serial)
+    max_concurrent_chunks: int = 1
+
     @classmethod
     def create(
         cls,
@@ -147,6 +152,8 @@ class BulkAnalysisGroup:
             "combine_order": self.combine_order,
             "combine_output_template": self.combine_output_template,
             "use_reasoning": self.use_reasoning,
+            "max_concurrent_documents": self.max_concurrent_documents,
+            "max_concurrent_chunks": self.max_concurrent_chunks,
         }
 
     @classmethod
@@ -187,6 +194,8 @@ class BulkAnalysisGroup:
             combine_order=str(payload.get("combine_order", "path")),
             combine_output_template=str(payload.get("combine_output_template", "combined_{timestamp}.md")),
             use_reasoning=bool(payload.get("use_reasoning", False)),
+            max_concurrent_documents=_parse_concurrency(payload.get("max_concurrent_documents")),
+            max_concurrent_chunks=_parse_concurrency(payload.get("max_concurrent_chunks")),
         )
 
     # Convenience properties
@@ -195,6 +204,14 @@ class BulkAnalysisGroup:
         return self.slug or _slugify(self.name)
 
 
+def _parse_concurrency(value: object, default: int = 1) -> int:
+    try:
+        parsed = int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
+    return max(parsed, 1)
+
+
 def _parse_datetime(value: object) -> datetime:
     if isinstance(value, str):
         try:
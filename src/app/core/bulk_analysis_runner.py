@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
 
 from src.common.llm.chunking import ChunkingStrategy
+from src.common.llm.response_cache import ResponseCache, response_cache_key
 from src.common.llm.tokens import TokenCounter
 from src.config.paths import app_base_dir, app_resource_root
 from src.config.prompt_store import get_bundled_dir, get_custom_dir
@@ -20,6 +25,12 @@ from .prompt_placeholders import ensure_required_placeholders, format_prompt
 
 LOGGER = logging.getLogger(__name__)
 
+_SUMMARY_SEPARATOR = "\n\n---\n\n"
+PACKING_STRATEGIES = ("greedy", "balanced")
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 @dataclass(frozen=True)
 class PromptBundle:
@@ -168,18 +179,36 @@ def should_chunk(
 
     token_info = TokenCounter.count(text=content, provider=provider_id, model=model_name or "")
     tokens = token_info.get("token_count") if token_info.get("success") else len(content) // 4
-    context_window = TokenCounter.get_model_context_window(model_name or provider_id)
-    max_tokens_per_chunk = max(int(context_window * 0.5), 4000)
+    max_tokens_per_chunk = chunk_token_budget(provider_id, model_name)
     return tokens > max_tokens_per_chunk, tokens, max_tokens_per_chunk
 
 
-def generate_chunks(content: str, max_tokens: int) -> List[str]:
-    """Split the document into manageable chunks."""
+def chunk_token_budget(
+    provider_id: str,
+    model_name: Optional[str],
+    context_window: Optional[int] = None,
+) -> int:
+    """Return the per-chunk token budget (half the context window, at least 4,000)."""
+
+    if not isinstance(context_window, int) or context_window <= 0:
+        context_window = TokenCounter.get_model_context_window(model_name or provider_id)
+    return max(int(context_window * 0.5), 4000)
+
 
-    return ChunkingStrategy.markdown_headers(
+def generate_chunks(
+    content: str,
+    max_tokens: int,
+    provider_id: str = "anthropic",
+    model_name: Optional[str] = None,
+) -> List[str]:
+    """Split the document into chunks that each fit within ``max_tokens``."""
+
+    return ChunkingStrategy.markdown_tokens(
         text=content,
         max_tokens=max_tokens,
-        overlap=2000,
+        provider=provider_id,
+        model=model_name or "",
+        overlap_tokens=500,
     )
 
 
@@ -192,7 +221,7 @@ def combine_chunk_summaries(
 ) -> tuple[str, Dict[str, str]]:
     """Prepare the final prompt for combining chunk summaries."""
 
-    combined = "\n\n---\n\n".join(summary.strip() for summary in summaries if summary.strip())
+    combined = _SUMMARY_SEPARATOR.join(summary.strip() for summary in summaries if summary.strip())
     context = _metadata_context(metadata)
     context.update(
         {
@@ -231,6 +260,8 @@ def combine_chunk_summaries_hierarchical(
     is_cancelled_fn=None,
     load_batch_fn=None,
     save_batch_fn=None,
+    max_concurrent_batches: int = 1,
+    packing: str = "greedy",
 ) -> str:
     """
     Hierarchically combine summaries using multi-level reduction when needed.
@@ -248,6 +279,14 @@ def combine_chunk_summaries_hierarchical(
         model: Model name for token counting
         invoke_fn: Callable that takes a prompt string and returns LLM response
         is_cancelled_fn: Optional callable that returns True if operation should cancel
+        load_batch_fn: Optional callable ``(level, batch_index, checksum) -> str | None``
+            returning a checkpointed batch result to reuse
+        save_batch_fn: Optional callable ``(level, batch_index, checksum, content)``
+            persisting a batch result; always invoked on the calling thread
+        max_concurrent_batches: Maximum number of batches within one level that
+            are combined concurrently (1 keeps the serial behaviour)
+        packing: Batch packing strategy passed to :func:`pack_summary_batches`
+            (``"greedy"`` or ``"balanced"``)
 
     Returns:
         Final combined summary string
@@ -280,8 +319,7 @@ def combine_chunk_summaries_hierarchical(
     )
 
     # Count tokens in the combined prompt
-    token_info = TokenCounter.count(text=prompt, provider=provider_id, model=model)
-    prompt_tokens = token_info.get("token_count") if token_info.get("success") else len(prompt) // 4
+    prompt_tokens = _count_tokens(prompt, provider_id, model)
 
     logger.info(f"Single-pass prompt: {prompt_tokens} tokens")
 
@@ -296,6 +334,17 @@ def combine_chunk_summaries_hierarchical(
         f"switching to hierarchical reduction"
     )
 
+    # Constant prompt cost of a batch: the rendered template with no summaries,
+    # plus one separator between consecutive summaries.
+    empty_prompt, _ = combine_chunk_summaries(
+        [],
+        document_name=document_name,
+        metadata=metadata,
+        placeholder_values=placeholder_values,
+    )
+    overhead_tokens = _count_tokens(empty_prompt, provider_id, model)
+    separator_tokens = _count_tokens(_SUMMARY_SEPARATOR, provider_id, model)
+
     # Process summaries hierarchically
     current_level_summaries = list(summaries)
     level = 0
@@ -308,59 +357,53 @@ def combine_chunk_summaries_hierarchical(
         if is_cancelled_fn and is_cancelled_fn():
             raise BulkAnalysisCancelled(f"Operation cancelled during hierarchical level {level}")
 
-        # Dynamically determine batch size by testing token counts
-        batches = []
-        current_batch = []
-        current_batch_tokens = 0
-
-        for idx, summary in enumerate(current_level_summaries):
-            # Check cancellation periodically
-            if is_cancelled_fn and is_cancelled_fn():
-                raise BulkAnalysisCancelled(f"Operation cancelled at summary {idx} in level {level}")
-
-            # Count tokens in this summary
-            token_info = TokenCounter.count(text=summary, provider=provider_id, model=model)
-            summary_tokens = token_info.get("token_count") if token_info.get("success") else len(summary) // 4
+        # Count each summary once (one batched tokenizer call per level) and
+        # pack batches from the per-summary counts plus the constant
+        # template/separator overhead.
+        summary_tokens = TokenCounter.count_many(
+            [summary.strip() for summary in current_level_summaries],
+            provider=provider_id,
+            model=model,
+        )
 
-            # Calculate tokens if we add this summary to current batch
-            # Include overhead for separators and prompt template (~500 tokens)
-            test_batch = current_batch + [summary]
-            test_prompt, _ = combine_chunk_summaries(
-                test_batch,
-                document_name=document_name,
-                metadata=metadata,
-                placeholder_values=placeholder_values,
-            )
-            test_token_info = TokenCounter.count(text=test_prompt, provider=provider_id, model=model)
-            test_tokens = test_token_info.get("token_count") if test_token_info.get("success") else len(test_prompt) // 4
-
-            # If adding this summary would exceed limit, finalize current batch
-            if test_tokens > max_combine_tokens and current_batch:
-                batches.append(current_batch)
-                logger.info(
-                    f"Level {level}, batch {len(batches)}: {len(current_batch)} summaries, "
-                    f"~{current_batch_tokens} tokens"
-                )
-                current_batch = [summary]
-                current_batch_tokens = summary_tokens
-            else:
-                # Add to current batch
-                current_batch.append(summary)
-                current_batch_tokens = test_tokens
-
-        # Add final batch
-        if current_batch:
-            batches.append(current_batch)
+        index_batches = pack_summary_batches(
+            summary_tokens,
+            budget=max_combine_tokens,
+            overhead=overhead_tokens,
+            separator_tokens=separator_tokens,
+            strategy=packing,
+        )
+        batches = []
+        for indices in index_batches:
+            batches.append([current_level_summaries[i] for i in indices])
+            batch_tokens = overhead_tokens + sum(summary_tokens[i] for i in indices)
+            batch_tokens += separator_tokens * (len(indices) - 1)
             logger.info(
-                f"Level {level}, batch {len(batches)}: {len(current_batch)} summaries, "
-                f"~{current_batch_tokens} tokens"
+                f"Level {level}, batch {len(batches)}: {len(indices)} summaries, "
+                f"~{batch_tokens} tokens"
             )
 
         logger.info(f"Level {level}: created {len(batches)} batches")
 
-        # Combine each batch
-        next_level_summaries = []
+        # Combine each batch. Checkpointed batches are reused up front; the
+        # rest are independent within a level and can be dispatched together.
+        next_level_summaries: List[Optional[str]] = [None] * len(batches)
+        pending: List[tuple[int, List[str], str]] = []
         for batch_idx, batch in enumerate(batches):
+            # Determine checksum for this batch to enable checkpoint reuse
+            batch_input_checksum = _batch_checksum(batch)
+            if load_batch_fn:
+                cached = load_batch_fn(level, batch_idx + 1, batch_input_checksum)
+                if cached:
+                    next_level_summaries[batch_idx] = cached
+                    logger.info(
+                        f"Level {level}, batch {batch_idx + 1} reused cached result (checkpoint)"
+                    )
+                    continue
+            pending.append((batch_idx, batch, batch_input_checksum))
+
+        def _combine_batch(item: tuple[int, List[str], str]) -> str:
+            batch_idx, batch, _ = item
             # Check cancellation
             if is_cancelled_fn and is_cancelled_fn():
                 raise BulkAnalysisCancelled(
@@ -372,17 +415,6 @@ def combine_chunk_summaries_hierarchical(
                 f"({len(batch)} summaries)"
             )
 
-            # Determine checksum for this batch to enable checkpoint reuse
-            batch_input_checksum = _batch_checksum(batch)
-            if load_batch_fn:
-                cached = load_batch_fn(level, batch_idx + 1, batch_input_checksum)
-                if cached:
-                    next_level_summaries.append(cached)
-                    logger.info(
-                        f"Level {level}, batch {batch_idx + 1} reused cached result (checkpoint)"
-                    )
-                    continue
-
             # Create prompt for this batch
             batch_prompt, _ = combine_chunk_summaries(
                 batch,
@@ -393,19 +425,9 @@ def combine_chunk_summaries_hierarchical(
 
             # Invoke LLM to combine this batch
             try:
-                batch_result = invoke_fn(batch_prompt)
-                if save_batch_fn:
-                    try:
-                        save_batch_fn(level, batch_idx + 1, batch_input_checksum, batch_result)
-                    except Exception:
-                        logger.debug(
-                            "Level %s, batch %s failed to persist checkpoint",
-                            level,
-                            batch_idx + 1,
-                            exc_info=True,
-                        )
-                next_level_summaries.append(batch_result)
-                logger.info(f"Level {level}, batch {batch_idx + 1} completed successfully")
+                return invoke_fn(batch_prompt)
+            except BulkAnalysisCancelled:
+                raise
             except Exception as e:
                 # Wrap error with context
                 logger.error(
@@ -417,8 +439,37 @@ def combine_chunk_summaries_hierarchical(
                     f"batch {batch_idx + 1}/{len(batches)}: {e}"
                 ) from e
 
+        def _batch_done(position: int, batch_result: str) -> None:
+            # Runs on the calling thread, so save_batch_fn never sees concurrent calls.
+            batch_idx, _, batch_input_checksum = pending[position]
+            if save_batch_fn:
+                try:
+                    save_batch_fn(level, batch_idx + 1, batch_input_checksum, batch_result)
+                except Exception:
+                    logger.debug(
+                        "Level %s, batch %s failed to persist checkpoint",
+                        level,
+                        batch_idx + 1,
+                        exc_info=True,
+                    )
+            next_level_summaries[batch_idx] = batch_result
+            logger.info(f"Level {level}, batch {batch_idx + 1} completed successfully")
+
+        if max_concurrent_batches > 1 and len(pending) > 1:
+            logger.info(
+                f"Level {level}: dispatching {len(pending)} batches with up to "
+                f"{max_concurrent_batches} in flight"
+            )
+        map_bounded(
+            pending,
+            _combine_batch,
+            max_workers=max_concurrent_batches,
+            on_complete=_batch_done,
+            thread_name_prefix=f"reduce-level-{level}",
+        )
+
         # Move to next level
-        current_level_summaries = next_level_summaries
+        current_level_summaries = [summary for summary in next_level_summaries if summary is not None]
         logger.info(
             f"Level {level} complete: reduced {len(batches)} batches to "
             f"{len(next_level_summaries)} summaries"
@@ -434,9 +485,252 @@ def combine_chunk_summaries_hierarchical(
     return final_summary
 
 
+def pack_summary_batches(
+    token_counts: Sequence[int],
+    *,
+    budget: int,
+    overhead: int = 0,
+    separator_tokens: int = 0,
+    strategy: str = "greedy",
+) -> List[List[int]]:
+    """Group consecutive summaries into batches whose combine prompts fit ``budget``.
+
+    ``token_counts`` holds one pre-computed count per summary; a batch costs
+    ``overhead + sum(counts) + separator_tokens * (len(batch) - 1)``. Returns
+    lists of indices into ``token_counts`` preserving input order.
+
+    ``"greedy"`` fills each batch before starting the next. ``"balanced"`` keeps
+    the greedy batch count but places the boundaries at even shares of the
+    total so batches come out roughly the same size (useful when a level runs
+    in parallel and is bounded by its largest batch). Summaries that overflow the budget on
+    their own get a batch to themselves; if that would leave every batch with a
+    single summary, summaries are paired so each reduction level still shrinks.
+    """
+
+    if strategy not in PACKING_STRATEGIES:
+        raise ValueError(f"Unknown packing strategy '{strategy}'")
+    if not token_counts:
+        return []
+
+    batches = _greedy_pack(token_counts, budget, overhead, separator_tokens)
+    if len(token_counts) > 1 and len(batches) == len(token_counts):
+        LOGGER.warning(
+            "No two summaries fit within %s tokens; pairing summaries to guarantee progress",
+            budget,
+        )
+        return _greedy_pack(token_counts, budget, overhead, separator_tokens, min_items=2)
+
+    if strategy == "balanced" and len(batches) > 1:
+        balanced = _balanced_pack(token_counts, len(batches), budget, overhead, separator_tokens)
+        if balanced is not None:
+            batches = balanced
+    return batches
+
+
+def _greedy_pack(
+    token_counts: Sequence[int],
+    cap: int,
+    overhead: int,
+    separator_tokens: int,
+    *,
+    min_items: int = 1,
+) -> List[List[int]]:
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_cost = overhead
+    for index, tokens in enumerate(token_counts):
+        added = tokens + (separator_tokens if current else 0)
+        if current and len(current) >= min_items and current_cost + added > cap:
+            batches.append(current)
+            current = []
+            current_cost = overhead
+            added = tokens
+        current.append(index)
+        current_cost += added
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _balanced_pack(
+    token_counts: Sequence[int],
+    batch_count: int,
+    budget: int,
+    overhead: int,
+    separator_tokens: int,
+) -> Optional[List[List[int]]]:
+    """Split into ``batch_count`` contiguous batches of near-equal cost, or None if one overflows."""
+
+    total_items = len(token_counts)
+    prefix = list(accumulate((tokens + separator_tokens for tokens in token_counts), initial=0))
+    total = prefix[-1]
+    bounds = [0]
+    for step in range(1, batch_count):
+        target = total * step / batch_count
+        position = bisect_left(prefix, target)
+        if position > 0 and (position >= len(prefix) or target - prefix[position - 1] <= prefix[position] - target):
+            position -= 1
+        position = max(position, bounds[-1] + 1)
+        position = min(position, total_items - (batch_count - step))
+        bounds.append(position)
+    bounds.append(total_items)
+
+    batches: List[List[int]] = []
+    for start, end in zip(bounds, bounds[1:]):
+        cost = overhead - separator_tokens + prefix[end] - prefix[start]
+        if cost > budget and end - start > 1:
+            return None
+        batches.append(list(range(start, end)))
+    return batches
+
+
+def _count_tokens(text: str, provider_id: str, model: Optional[str]) -> int:
+    token_info = TokenCounter.count(text=text, provider=provider_id, model=model)
+    return token_info.get("token_count") if token_info.get("success") else len(text) // 4
+
+
+def group_concurrency(group: BulkAnalysisGroup, attribute: str) -> int:
+    """Return the group's ``attribute`` concurrency setting (e.g. ``max_concurrent_chunks``), at least 1."""
+
+    try:
+        value = int(getattr(group, attribute, 1) or 1)
+    except (TypeError, ValueError):
+        value = 1
+    return max(value, 1)
+
+
+def lookup_cached_response(
+    cache: Optional[ResponseCache],
+    *,
+    provider_id: str,
+    model: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str,
+    prompt: str,
+    force_rerun: bool = False,
+) -> Tuple[Optional[str], Optional[str]]:
+    """Return ``(cache_key, cached_content)`` for one completion request.
+
+    Both are None without a cache. A forced re-run skips the lookup but still
+    returns the key, so the fresh response refreshes the cache.
+    """
+
+    if cache is None:
+        return None, None
+    key = response_cache_key(
+        provider=provider_id,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        system_prompt=system_prompt,
+        prompt=prompt,
+    )
+    return key, None if force_rerun else cache.get(key)
+
+
+def response_content(
+    response: Mapping[str, Any],
+    *,
+    cache: Optional[ResponseCache] = None,
+    cache_key: Optional[str] = None,
+) -> str:
+    """Return the text of a provider response, storing it under ``cache_key``.
+
+    Raises RuntimeError when the provider reported a failure or returned no text.
+    """
+
+    if not response.get("success"):
+        raise RuntimeError(response.get("error", "Unknown LLM error"))
+    content = (response.get("content") or "").strip()
+    if not content:
+        raise RuntimeError("LLM returned empty response")
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, content)
+    return content
+
+
+def map_bounded(
+    items: Sequence[_T],
+    fn: Callable[[_T], _R],
+    *,
+    max_workers: int,
+    on_complete: Optional[Callable[[int, _R], None]] = None,
+    thread_name_prefix: str = "bulk",
+) -> List[_R]:
+    """Apply ``fn`` to ``items`` with at most ``max_workers`` calls in flight.
+
+    Results are returned in input order. ``on_complete(index, result)`` runs on
+    the calling thread as each item finishes (completion order), which keeps
+    progress reporting and book-keeping single-threaded. With ``max_workers``
+    of 1 the items run inline, in order. The first exception raised by ``fn``
+    propagates after queued items are dropped and in-flight ones finish.
+    """
+
+    results: List[Optional[_R]] = [None] * len(items)
+    if max_workers <= 1 or len(items) <= 1:
+        for index, item in enumerate(items):
+            result = fn(item)
+            results[index] = result
+            if on_complete:
+                on_complete(index, result)
+        return results  # type: ignore[return-value]
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix=thread_name_prefix,
+    )
+    try:
+        futures = {executor.submit(fn, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            index = futures[future]
+            result = future.result()
+            results[index] = result
+            if on_complete:
+                on_complete(index, result)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results  # type: ignore[return-value]
+
+
+async def amap_bounded(
+    items: Sequence[_T],
+    fn: Callable[[_T], Awaitable[_R]],
+    *,
+    limit: int,
+    on_complete: Optional[Callable[[int, _R], None]] = None,
+) -> List[_R]:
+    """Coroutine counterpart of :func:`map_bounded` for async providers.
+
+    Every request shares the calling thread's event loop, so ``limit`` bounds
+    requests in flight without a thread per request. Results come back in
+    input order and ``on_complete`` runs on the loop as items finish. The
+    first exception cancels the remaining items and propagates.
+    """
+
+    results: List[Optional[_R]] = [None] * len(items)
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def _run(index: int, item: _T) -> None:
+        async with semaphore:
+            result = await fn(item)
+        results[index] = result
+        if on_complete:
+            on_complete(index, result)
+
+    tasks = [asyncio.ensure_future(_run(index, item)) for index, item in enumerate(items)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return results  # type: ignore[return-value]
+
+
 def _batch_checksum(batch: List[str]) -> str:
     """Return a stable checksum for a batch of summaries."""
-    joined = "\n\n---\n\n".join(batch)
+    joined = _SUMMARY_SEPARATOR.join(batch)
     return hashlib.sha256(joined.encode("utf-8")).hexdigest()
 
 
@@ -508,15 +802,23 @@ def _metadata_context(metadata: Optional[ProjectMetadata]) -> Dict[str, str]:
 
 
 __all__ = [
+    "PACKING_STRATEGIES",
     "BulkAnalysisCancelled",
     "BulkAnalysisDocument",
     "PromptBundle",
     "combine_chunk_summaries",
     "combine_chunk_summaries_hierarchical",
+    "chunk_token_budget",
     "generate_chunks",
     "load_prompts",
+    "amap_bounded",
+    "group_concurrency",
+    "lookup_cached_response",
+    "map_bounded",
+    "pack_summary_batches",
     "prepare_documents",
     "render_system_prompt",
     "render_user_prompt",
+    "response_content",
     "should_chunk",
 ]
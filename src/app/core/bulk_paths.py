@@ -25,6 +25,12 @@ def get_group_dir(project_dir: Path, slug: str) -> Path:
     return project_dir / "bulk_analysis" / slug
 
 
+def token_cache_path(project_dir: Path) -> Path:
+    """Return the per-project SQLite file used to persist token counts."""
+
+    return project_dir / "bulk_analysis" / "token_counts.sqlite3"
+
+
 def _outputs_root(group_dir: Path) -> Path:
     outputs = group_dir / "outputs"
     return outputs if outputs.exists() else group_dir
@@ -37,6 +43,18 @@ def _is_excluded(rel_path: str) -> bool:
     return False
 
 
+def map_outputs_root(project_dir: Path, slug: str) -> Path:
+    """Return the directory that holds a group's per-document outputs."""
+
+    return _outputs_root(get_group_dir(project_dir, slug))
+
+
+def is_map_output(rel_path: str) -> bool:
+    """Return True if ``rel_path`` (relative to the outputs root) is a per-document output."""
+
+    return rel_path.endswith(".md") and not _is_excluded(rel_path)
+
+
 def iter_map_outputs(project_dir: Path, slug: str) -> Iterator[Tuple[Path, str]]:
     """Yield (absolute_path, relative_key) for per-document outputs in a group."""
 
@@ -80,8 +98,10 @@ def resolve_map_output_path(project_dir: Path, slug: str, relative_file: str) ->
 
 
 __all__ = [
+    "is_map_output",
     "iter_map_outputs",
     "iter_map_outputs_under",
+    "map_outputs_root",
     "normalize_map_relative",
     "resolve_map_output_path",
 ]
@@ -4,14 +4,18 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from stat import S_ISREG
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 import frontmatter
 
 from .project_manager import ProjectManager
+from .source_hash_cache import SourceHashCache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +24,11 @@ SUPPORTED_MARKDOWN_EXTENSIONS = {".md", ".markdown"}
 SUPPORTED_DOC_EXTENSIONS = {".doc", ".docx"}
 SUPPORTED_PDF_EXTENSIONS = {".pdf"}
 
+HASH_CACHE_FILENAME = ".source_hashes.json"
+# Hashing is bound by disk reads; a few threads keep the device busy without
+# thrashing spinning or network storage.
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
 
 @dataclass(frozen=True)
 class ConversionJob:
@@ -55,7 +64,11 @@ class ConversionPlan:
 
 
 def build_conversion_jobs(project_manager: ProjectManager) -> ConversionPlan:
-    """Return jobs required to bring selected folders into converted_documents."""
+    """Return jobs required to bring selected folders into converted_documents.
+
+    Source digests are cached in the project by (path, size, mtime_ns); only
+    new or modified files are hashed, in a thread pool.
+    """
     project_dir = project_manager.project_dir
     if not project_dir:
         return ConversionPlan.empty()
@@ -73,16 +86,14 @@ def build_conversion_jobs(project_manager: ProjectManager) -> ConversionPlan:
     if not selected:
         return ConversionPlan.empty()
 
-    jobs: List[ConversionJob] = []
-    duplicates: List[DuplicateSource] = []
+    candidates: List[Tuple[Path, str, str, os.stat_result]] = []
     seen_sources: set[Path] = set()
-    seen_hashes: dict[str, str] = {}
     for folder in selected:
         folder_path = root_path / folder
         if not folder_path.exists() or not folder_path.is_dir():
             LOGGER.debug("Selected folder %s missing under %s", folder, root_path)
             continue
-        for source_file in _iter_files(folder_path):
+        for source_file, stat in _iter_files(folder_path):
             if source_file in seen_sources:
                 continue
             seen_sources.add(source_file)
@@ -90,33 +101,47 @@ def build_conversion_jobs(project_manager: ProjectManager) -> ConversionPlan:
             conversion_type = _classify_conversion(source_file)
             if conversion_type is None:
                 continue
-            digest = _hash_source(source_file)
-            if digest:
-                primary = seen_hashes.get(digest)
-                if primary:
-                    duplicates.append(
-                        DuplicateSource(
-                            digest=digest,
-                            primary_relative=primary,
-                            duplicate_relative=relative,
-                        )
+            candidates.append((source_file, relative, conversion_type, stat))
+
+    hash_cache = SourceHashCache(project_dir / HASH_CACHE_FILENAME)
+    digests = _hash_sources(
+        [(source_file, stat) for source_file, _, _, stat in candidates],
+        hash_cache,
+    )
+    hash_cache.retain(source_file for source_file, _, _, _ in candidates)
+    hash_cache.save()
+
+    jobs: List[ConversionJob] = []
+    duplicates: List[DuplicateSource] = []
+    seen_hashes: dict[str, str] = {}
+    for source_file, relative, conversion_type, _ in candidates:
+        digest = digests.get(source_file)
+        if digest:
+            primary = seen_hashes.get(digest)
+            if primary:
+                duplicates.append(
+                    DuplicateSource(
+                        digest=digest,
+                        primary_relative=primary,
+                        duplicate_relative=relative,
                     )
-                    continue
-                seen_hashes[digest] = relative
-            destination = _destination_for(project_dir, relative, conversion_type)
-            needs_conversion = _needs_conversion(source_file, destination)
-            if not needs_conversion:
-                continue
-            if digest and _has_matching_checksum(destination, digest):
-                continue
-            jobs.append(
-                ConversionJob(
-                    source_path=source_file,
-                    relative_path=relative,
-                    destination_path=destination,
-                    conversion_type=conversion_type,
                 )
+                continue
+            seen_hashes[digest] = relative
+        destination = _destination_for(project_dir, relative, conversion_type)
+        needs_conversion = _needs_conversion(source_file, destination)
+        if not needs_conversion:
+            continue
+        if digest and _has_matching_checksum(destination, digest):
+            continue
+        jobs.append(
+            ConversionJob(
+                source_path=source_file,
+                relative_path=relative,
+                destination_path=destination,
+                conversion_type=conversion_type,
             )
+        )
     return ConversionPlan(jobs=tuple(jobs), duplicates=tuple(duplicates))
 
 
@@ -127,10 +152,16 @@ def _resolve_root(project_dir: Path, root_spec: str) -> Path | None:
     return path
 
 
-def _iter_files(folder: Path) -> Iterable[Path]:
+def _iter_files(folder: Path) -> Iterable[Tuple[Path, os.stat_result]]:
     for path in folder.rglob("*"):
-        if path.is_file() and not path.name.startswith("."):
-            yield path
+        if path.name.startswith("."):
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if S_ISREG(stat.st_mode):
+            yield path, stat
 
 
 def _classify_conversion(source_file: Path) -> str | None:
@@ -168,6 +199,33 @@ def _needs_conversion(source: Path, destination: Path) -> bool:
         return True
 
 
+def _hash_sources(
+    sources: Sequence[Tuple[Path, os.stat_result]],
+    cache: SourceHashCache,
+) -> Dict[Path, str | None]:
+    """Return digests for ``sources``, hashing only files the cache cannot answer."""
+    digests: Dict[Path, str | None] = {}
+    pending: List[Tuple[Path, os.stat_result]] = []
+    for source, stat in sources:
+        cached = cache.lookup(source, stat)
+        if cached:
+            digests[source] = cached
+        else:
+            pending.append((source, stat))
+    if not pending:
+        return digests
+
+    workers = min(HASH_WORKERS, len(pending))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="source-hash") as pool:
+        hashed = pool.map(_hash_source, [source for source, _ in pending])
+        for (source, stat), digest in zip(pending, hashed):
+            digests[source] = digest
+            if digest:
+                cache.store(source, stat, digest)
+    LOGGER.debug("Hashed %d of %d source files", len(pending), len(sources))
+    return digests
+
+
 def _hash_source(path: Path) -> str | None:
     """Compute a SHA256 digest for the provided file, returning None on failure."""
     try:
@@ -5,17 +5,19 @@ from __future__ import annotations
 import json
 import logging
 from collections import defaultdict
+from fnmatch import fnmatch
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING
 
 from src.app.core.bulk_paths import (
-    iter_map_outputs,
-    iter_map_outputs_under,
+    is_map_output,
+    map_outputs_root,
     normalize_map_relative,
     resolve_map_output_path,
 )
+from src.app.core.stat_index import FileProbe, StatIndex
 
 if TYPE_CHECKING:
     from .bulk_analysis_groups import BulkAnalysisGroup
@@ -23,7 +25,9 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 TRACKER_FILENAME = "file_tracker.json"
+INDEX_FILENAME = ".file_tracker_index.json"
 TRACKER_VERSION = "1"
+TRACKED_FOLDERS = ("converted_documents", "bulk_analysis", "highlights")
 
 
 @dataclass
@@ -190,12 +194,21 @@ class FileTracker:
     - bulk_analysis/
 
     Each `scan()` collects counts and missing counterparts, then persists
-    the snapshot to `file_tracker.json` under the project root.
+    the snapshot to `file_tracker.json` under the project root. Directory
+    listings and file stats are kept in `.file_tracker_index.json` so a
+    rescan only revisits what changed, and `rescan()` can limit the walk to
+    the folders a watcher reported and return the per-folder changes.
     """
 
     def __init__(self, project_path: Path) -> None:
         self.project_path = project_path
         self.snapshot: Optional[FileTrackerSnapshot] = None
+        self._index: Optional[StatIndex] = None
+        # Latest listing per tracked folder, used to diff successive scans.
+        self._listings: Dict[str, Dict[str, object]] = {}
+        # Incremented by every scan so callers can tell whether results they
+        # derived from the previous scan are still current.
+        self.generation = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -216,26 +229,58 @@ class FileTracker:
 
     def scan(self) -> FileTrackerSnapshot:
         """Walk the project directories and generate a fresh snapshot."""
-        imported = self._gather_files("converted_documents")
-        converted_root = self.project_path / "converted_documents"
-        bulk_analysis = self._filter_bulk_analysis_files(
-            self._gather_files("bulk_analysis")
-        )
-        highlights_files = self._gather_files("highlights")
+        snapshot, _ = self.rescan()
+        return snapshot
+
+    def rescan(
+        self, folders: Optional[Iterable[str]] = None
+    ) -> tuple[FileTrackerSnapshot, Dict[str, set[str]]]:
+        """Rescan ``folders`` (every tracked folder by default) and report what changed.
+
+        Folders that are not listed reuse their listing from the previous scan
+        made by this tracker. The second value maps each folder whose contents
+        changed to the relative paths that were added, removed or re-probed.
+        """
+        targets = set(TRACKED_FOLDERS if folders is None else folders)
+        changes: Dict[str, set[str]] = {}
+        for folder_name in TRACKED_FOLDERS:
+            previous = self._listings.get(folder_name)
+            if previous is not None and folder_name not in targets:
+                continue
+            # Which converted files originated from PDFs (eligible for
+            # highlights) is sniffed from front matter only for files whose
+            # stat changed.
+            probe = _converted_is_pdf if folder_name == "converted_documents" else None
+            listing = self._gather_files(folder_name, probe=probe)
+            if previous is None:
+                changed = set(listing)
+            else:
+                changed = set(previous.keys() ^ listing.keys())
+                changed.update(rel for rel in listing.keys() & previous.keys() if listing[rel] != previous[rel])
+            if changed:
+                changes[folder_name] = changed
+            self._listings[folder_name] = listing
+
+        snapshot = self._build_snapshot()
+        self.snapshot = snapshot
+        self.generation += 1
+        self._write_snapshot(snapshot)
+        self._stat_index().save()
+        return snapshot, changes
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _build_snapshot(self) -> FileTrackerSnapshot:
+        converted = self._listings.get("converted_documents", {})
+        imported = set(converted)
+        imported_pdf = {rel for rel, is_pdf in converted.items() if is_pdf}
+        bulk_analysis = self._filter_bulk_analysis_files(set(self._listings.get("bulk_analysis", {})))
+        highlights_files = set(self._listings.get("highlights", {}))
         highlights_normalized = self._normalize_highlight_files(highlights_files)
 
         normalized_bulk_for_docs = self._normalize_bulk_outputs(bulk_analysis, imported)
 
-        # Determine which converted files originated from PDFs (eligible for highlights)
-        imported_pdf: set[str] = set()
-        for rel in imported:
-            try:
-                if _converted_is_pdf(converted_root / rel):
-                    imported_pdf.add(rel)
-            except Exception:
-                # Defensive: treat unreadable entries as non-PDF
-                continue
-
         counts = {
             "imported": len(imported),
             "imported_pdf": len(imported_pdf),
@@ -256,33 +301,31 @@ class FileTracker:
             "highlights_missing": sorted(imported_pdf - highlights_normalized),
         }
 
-        snapshot = FileTrackerSnapshot(
+        return FileTrackerSnapshot(
             timestamp=datetime.now(timezone.utc),
             counts=counts,
             files=files,
             missing=missing,
         )
-        self.snapshot = snapshot
-        self._write_snapshot(snapshot)
-        return snapshot
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
     def _tracker_file(self) -> Path:
         return self.project_path / TRACKER_FILENAME
 
-    def _gather_files(self, folder_name: str) -> set[str]:
+    def _stat_index(self) -> StatIndex:
+        if self._index is None:
+            self._index = StatIndex(self.project_path / INDEX_FILENAME)
+        return self._index
+
+    def _gather_files(self, folder_name: str, probe: Optional[FileProbe] = None) -> Dict[str, object]:
+        """Return files under ``folder_name`` mapped to ``probe`` results (None without a probe).
+
+        Unchanged subtrees are served from the persistent stat index.
+        """
         folder = self.project_path / folder_name
         if not folder.exists():
             folder.mkdir(parents=True, exist_ok=True)
-            return set()
-
-        collected: set[str] = set()
-        for path in folder.rglob("*"):
-            if path.is_file():
-                collected.add(path.relative_to(folder).as_posix())
-        return collected
+            return {}
+        return self._stat_index().files(folder_name, folder, probe)
 
     def _filter_bulk_analysis_files(self, files: set[str]) -> set[str]:
         """Return bulk-analysis output paths that should be counted."""
@@ -415,8 +458,20 @@ def build_workspace_metrics(
     dashboard: "DashboardMetrics",
     bulk_analysis_groups: Sequence["BulkAnalysisGroup"],
     project_dir: Path | None = None,
+    previous: WorkspaceMetrics | None = None,
+    affected_slugs: Collection[str] | None = None,
+    recompute_combined: bool = True,
+    combined_cache: CombinedStatusCache | None = None,
 ) -> WorkspaceMetrics:
-    """Translate raw tracker data into workspace-friendly metrics."""
+    """Translate raw tracker data into workspace-friendly metrics.
+
+    When ``previous`` and ``affected_slugs`` are given, per-document groups
+    whose slug is not affected keep their metrics from ``previous``; combined
+    groups are kept too unless ``recompute_combined`` is set. Callers pass
+    ``affected_slugs=None`` whenever the converted documents changed.
+    Passing the same ``combined_cache`` across calls lets combined groups
+    reuse listings, parsed manifests and results from earlier refreshes.
+    """
 
     if snapshot is None:
         highlights_missing: tuple[str, ...] = tuple()
@@ -454,45 +509,34 @@ def build_workspace_metrics(
     highlights_missing = tuple(sorted(converted_pdf_files - highlights_normalized))
     bulk_missing = tuple(sorted(converted_files - normalized_bulk_files))
 
+    combined_cache = combined_cache or CombinedStatusCache()
+    combined_cache.begin_refresh()
+
+    reusable: Dict[str, WorkspaceGroupMetrics] = {}
+    if previous is not None and affected_slugs is not None:
+        reusable = previous.groups
+
     group_metrics: Dict[str, WorkspaceGroupMetrics] = {}
     for group in bulk_analysis_groups:
         slug = getattr(group, "slug", None) or group.folder_name
-        converted_subset = _resolve_group_converted_paths(group, converted_files)
-        group_outputs = bulk_outputs_by_group.get(slug, set())
-        bulk_subset = {path for path in converted_subset if path in group_outputs}
-
-        pending_bulk = len(converted_subset) - len(bulk_subset)
-        pending_files = tuple(sorted(converted_subset - bulk_subset))
-
-        # Defaults for combined fields
         op_type = getattr(group, "operation", "per_document") or "per_document"
-        combined_input_count = 0
-        combined_latest_path: str | None = None
-        combined_latest_at: datetime | None = None
-        combined_is_stale = False
-
-        # If the group represents a combined operation, compute inputs and status.
-        if op_type == "combined" and project_dir is not None:
-            combined_input_count, combined_latest_path, combined_latest_at, combined_is_stale = (
-                _compute_combined_status(project_dir, group)
-            )
-
-        metrics = WorkspaceGroupMetrics(
-            group_id=group.group_id,
-            name=group.name,
+        prior = reusable.get(group.group_id)
+        if prior is not None and prior.slug == slug and prior.operation == op_type:
+            if op_type == "combined" and not recompute_combined:
+                group_metrics[group.group_id] = prior
+                continue
+            if op_type != "combined" and slug not in affected_slugs:
+                group_metrics[group.group_id] = prior
+                continue
+        group_metrics[group.group_id] = _build_group_metrics(
+            group,
             slug=slug,
-            converted_files=tuple(sorted(converted_subset)),
-            converted_count=len(converted_subset),
-            bulk_analysis_total=len(bulk_subset),
-            pending_bulk_analysis=max(pending_bulk, 0),
-            pending_files=pending_files,
             operation=op_type,
-            combined_input_count=combined_input_count,
-            combined_latest_path=combined_latest_path,
-            combined_latest_at=combined_latest_at,
-            combined_is_stale=combined_is_stale,
+            converted_files=converted_files,
+            group_outputs=bulk_outputs_by_group.get(slug, set()),
+            project_dir=project_dir,
+            combined_cache=combined_cache,
         )
-        group_metrics[group.group_id] = metrics
 
     return WorkspaceMetrics(
         dashboard=dashboard,
@@ -502,120 +546,247 @@ def build_workspace_metrics(
     )
 
 
-def _iter_project_files(root: Path, rel_dirs: Sequence[str]) -> set[str]:
-    selected: set[str] = set()
-    normalized_rel = {d.strip("/") for d in rel_dirs}
-    for rel in list(normalized_rel):
-        base = (root / rel).resolve()
-        if not base.exists():
-            continue
-        if base.is_file():
-            selected.add(rel)
-            continue
-        for path in base.rglob("*.md"):
+def _build_group_metrics(
+    group: "BulkAnalysisGroup",
+    *,
+    slug: str,
+    operation: str,
+    converted_files: set[str],
+    group_outputs: set[str],
+    project_dir: Path | None,
+    combined_cache: CombinedStatusCache,
+) -> WorkspaceGroupMetrics:
+    converted_subset = _resolve_group_converted_paths(group, converted_files)
+    bulk_subset = {path for path in converted_subset if path in group_outputs}
+
+    pending_bulk = len(converted_subset) - len(bulk_subset)
+    pending_files = tuple(sorted(converted_subset - bulk_subset))
+
+    # Defaults for combined fields
+    combined_input_count = 0
+    combined_latest_path: str | None = None
+    combined_latest_at: datetime | None = None
+    combined_is_stale = False
+
+    # If the group represents a combined operation, compute inputs and status.
+    if operation == "combined" and project_dir is not None:
+        combined_input_count, combined_latest_path, combined_latest_at, combined_is_stale = (
+            _compute_combined_status(project_dir, group, combined_cache)
+        )
+
+    return WorkspaceGroupMetrics(
+        group_id=group.group_id,
+        name=group.name,
+        slug=slug,
+        converted_files=tuple(sorted(converted_subset)),
+        converted_count=len(converted_subset),
+        bulk_analysis_total=len(bulk_subset),
+        pending_bulk_analysis=max(pending_bulk, 0),
+        pending_files=pending_files,
+        operation=operation,
+        combined_input_count=combined_input_count,
+        combined_latest_path=combined_latest_path,
+        combined_latest_at=combined_latest_at,
+        combined_is_stale=combined_is_stale,
+    )
+
+
+CombinedStatus = tuple[int, "str | None", "datetime | None", bool]
+
+
+class CombinedStatusCache:
+    """Reuse the work behind combined-group staleness between metric refreshes.
+
+    Input trees (the converted documents, each map group's outputs and each
+    group's ``reduce/`` folder) are listed through an in-memory
+    :class:`StatIndex`, so a tree is only walked again when one of its
+    directories changed, and groups that share map outputs share the
+    listing. The latest manifest is parsed once per ``(mtime, size)``. Input
+    files are rewritten in place, which leaves directory mtimes untouched, so
+    their mtimes are still read, but only once per refresh however many
+    groups consume them. Each group's result is kept with the inputs, artifact
+    and manifest it was computed from and is reused while those match, so an
+    input change only invalidates the groups that consume it.
+    """
+
+    def __init__(self) -> None:
+        self._index = StatIndex(None)
+        self._manifests: Dict[Path, tuple[tuple[int, int], Dict[str, float], frozenset[str]]] = {}
+        self._results: Dict[str, tuple[tuple, CombinedStatus]] = {}
+        self._mtimes: Dict[Path, float] = {}
+
+    def begin_refresh(self) -> None:
+        """Forget input mtimes memoised during the previous refresh."""
+        self._mtimes.clear()
+
+    def status(self, project_dir: Path, group: "BulkAnalysisGroup") -> CombinedStatus:
+        conv_root = project_dir / "converted_documents"
+        converted_selected = self._select_converted(conv_root, group)
+        map_paths = self._select_map_outputs(project_dir, group)
+
+        latest_path, latest_mtime = self._latest_artifact(
+            project_dir / "bulk_analysis" / (getattr(group, "slug", None) or group.folder_name) / "reduce"
+        )
+        latest_ts: datetime | None = None
+        latest_rel: str | None = None
+        if latest_path is not None:
             try:
-                selected.add(path.relative_to(root).as_posix())
-            except ValueError:
-                # Path not under root; skip
+                latest_ts = datetime.fromtimestamp(int(latest_mtime or 0))
+                latest_rel = latest_path.relative_to(project_dir).as_posix()
+            except Exception:
+                latest_ts = None
+                latest_rel = None
+
+        # Staleness: if no artifact and there are inputs → stale
+        inputs_count = len(converted_selected) + len(map_paths)
+        if inputs_count == 0:
+            return 0, latest_rel, latest_ts, False
+        if latest_path is None:
+            return inputs_count, latest_rel, latest_ts, True
+
+        manifest = latest_path.with_suffix(".manifest.json")
+        inputs = [(f"converted/{rel}", conv_root / rel) for rel in sorted(converted_selected)]
+        inputs.extend((f"map/{key}", path) for key, path in sorted(map_paths.items()))
+        signature = (
+            latest_rel,
+            latest_mtime,
+            self._manifest_signature(manifest),
+            tuple((key, self._mtime(path)) for key, path in inputs),
+        )
+        cached = self._results.get(group.group_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        recorded, high_precision = self._recorded_mtimes(manifest)
+        stale = False
+        for key, current in signature[3]:
+            recorded_m = recorded.get(key)
+            if recorded_m is None or recorded_m <= 0:
+                stale = True
+                break
+            tolerance = 1e-6 if key in high_precision else 0.5
+            if current - recorded_m > tolerance:
+                stale = True
+                break
+
+        result: CombinedStatus = (inputs_count, latest_rel, latest_ts, stale)
+        self._results[group.group_id] = (signature, result)
+        return result
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _files(self, root: Path) -> Dict[str, object]:
+        if not root.is_dir():
+            return {}
+        return self._index.files(str(root), root)
+
+    def _select_converted(self, conv_root: Path, group: "BulkAnalysisGroup") -> set[str]:
+        selected: set[str] = set()
+        for rel in group.combine_converted_files or []:
+            rel = rel.strip("/")
+            if rel:
+                selected.add(rel)
+        directories = [d.strip("/") for d in group.combine_converted_directories or []]
+        if not directories:
+            return selected
+        markdown = [rel for rel in self._files(conv_root) if rel.endswith(".md")]
+        for rel in directories:
+            if not rel:
+                selected.update(markdown)
                 continue
-    return selected
+            prefix = rel + "/"
+            matched = [path for path in markdown if path.startswith(prefix)]
+            if matched:
+                selected.update(matched)
+            elif (conv_root / rel).is_file():
+                selected.add(rel)
+        return selected
+
+    def _map_outputs(self, project_dir: Path, slug: str) -> tuple[Path, List[str]]:
+        root = map_outputs_root(project_dir, slug)
+        return root, [rel for rel in self._files(root) if is_map_output(rel)]
+
+    def _select_map_outputs(self, project_dir: Path, group: "BulkAnalysisGroup") -> Dict[str, Path]:
+        map_paths: Dict[str, Path] = {}
+
+        for slug in group.combine_map_groups or []:
+            slug = slug.strip()
+            if not slug:
+                continue
+            root, outputs = self._map_outputs(project_dir, slug)
+            for rel in outputs:
+                map_paths.setdefault(f"{slug}/{rel}", root / rel)
 
+        for rel in group.combine_map_directories or []:
+            parts = rel.strip("/").split("/", 1)
+            if len(parts) != 2 or not parts[0].strip():
+                continue
+            slug = parts[0].strip()
+            prefix = normalize_map_relative(parts[1]).rstrip("/")
+            root, outputs = self._map_outputs(project_dir, slug)
+            for output in outputs:
+                if not prefix or output == prefix or output.startswith(prefix + "/"):
+                    map_paths.setdefault(f"{slug}/{output}", root / output)
+
+        for rel in group.combine_map_files or []:
+            parts = rel.strip("/").split("/", 1)
+            if len(parts) != 2 or not parts[0].strip():
+                continue
+            slug = parts[0].strip()
+            normalized = normalize_map_relative(parts[1])
+            if not normalized:
+                continue
+            map_paths.setdefault(f"{slug}/{normalized}", resolve_map_output_path(project_dir, slug, normalized))
 
-def _compute_combined_status(project_dir: Path, group: "BulkAnalysisGroup") -> tuple[int, str | None, datetime | None, bool]:
-    # Build selection from converted_documents
-    conv_root = project_dir / "converted_documents"
-    converted_selected: set[str] = set()
-    for rel in group.combine_converted_files or []:
-        rel = rel.strip("/")
-        if rel:
-            converted_selected.add(rel)
-    converted_selected |= _iter_project_files(conv_root, group.combine_converted_directories or [])
-
-    # Build selection from per-document outputs under bulk_analysis
-    ba_root = project_dir / "bulk_analysis"
-    map_selected: set[str] = set()
-    map_paths: Dict[str, Path] = {}
-
-    for slug in group.combine_map_groups or []:
-        slug = slug.strip()
-        if not slug:
-            continue
-        for path, rel in iter_map_outputs(project_dir, slug):
-            key = f"{slug}/{rel}"
-            map_selected.add(key)
-            map_paths.setdefault(key, path)
-
-    for rel in group.combine_map_directories or []:
-        rel = rel.strip("/")
-        if not rel:
-            continue
-        parts = rel.split("/", 1)
-        if len(parts) != 2:
-            continue
-        slug, remainder = parts
-        slug = slug.strip()
-        if not slug:
-            continue
-        normalized = normalize_map_relative(remainder)
-        for path, rel_path in iter_map_outputs_under(project_dir, slug, normalized):
-            key = f"{slug}/{rel_path}"
-            map_selected.add(key)
-            map_paths.setdefault(key, path)
-
-    for rel in group.combine_map_files or []:
-        rel = rel.strip("/")
-        if not rel:
-            continue
-        parts = rel.split("/", 1)
-        if len(parts) != 2:
-            continue
-        slug, remainder = parts
-        slug = slug.strip()
-        if not slug:
-            continue
-        normalized = normalize_map_relative(remainder)
-        if not normalized:
-            continue
-        key = f"{slug}/{normalized}"
-        map_selected.add(key)
-        map_paths.setdefault(key, resolve_map_output_path(project_dir, slug, normalized))
-
-    # Latest combined artifact under reduce/
-    reduce_dir = ba_root / (getattr(group, "slug", None) or group.folder_name) / "reduce"
-    latest_path: Path | None = None
-    latest_mtime: float | None = None
-    if reduce_dir.exists():
-        for f in reduce_dir.glob("combined_*.md"):
+        return map_paths
+
+    def _latest_artifact(self, reduce_dir: Path) -> tuple[Path | None, float | None]:
+        latest_path: Path | None = None
+        latest_mtime: float | None = None
+        for rel in self._files(reduce_dir):
+            if "/" in rel or not fnmatch(rel, "combined_*.md"):
+                continue
+            path = reduce_dir / rel
             try:
-                mtime = f.stat().st_mtime
+                mtime = path.stat().st_mtime
             except OSError:
                 continue
             if latest_mtime is None or mtime > latest_mtime:
                 latest_mtime = mtime
-                latest_path = f
+                latest_path = path
+        return latest_path, latest_mtime
+
+    def _mtime(self, path: Path) -> float:
+        mtime = self._mtimes.get(path)
+        if mtime is None:
+            try:
+                mtime = float(path.stat().st_mtime)
+            except OSError:
+                mtime = 0.0
+            self._mtimes[path] = mtime
+        return mtime
 
-    latest_ts: datetime | None = None
-    latest_rel: str | None = None
-    if latest_path is not None:
+    @staticmethod
+    def _manifest_signature(manifest: Path) -> tuple[int, int] | None:
         try:
-            latest_ts = datetime.fromtimestamp(int(latest_mtime or 0))
-            latest_rel = latest_path.relative_to(project_dir).as_posix()
-        except Exception:
-            latest_ts = None
-            latest_rel = None
-
-    # Staleness: if no artifact and there are inputs → stale
-    inputs_count = len(converted_selected) + len(map_selected)
-    if inputs_count == 0:
-        return 0, latest_rel, latest_ts, False
-    if latest_path is None:
-        return inputs_count, latest_rel, latest_ts, True
-
-    # Compare mtimes with manifest if present; else fallback to simple mtime comparison
-    manifest = latest_path.with_suffix(".manifest.json")
-    recorded: dict[str, float] = {}
-    high_precision: set[str] = set()
-    if manifest.exists():
+            stat = manifest.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _recorded_mtimes(self, manifest: Path) -> tuple[Dict[str, float], frozenset[str]]:
+        """Return input mtimes recorded in ``manifest``, parsing it only when it changed."""
+        signature = self._manifest_signature(manifest)
+        if signature is None:
+            self._manifests.pop(manifest, None)
+            return {}, frozenset()
+        cached = self._manifests.get(manifest)
+        if cached is not None and cached[0] == signature:
+            return cached[1], cached[2]
+
+        recorded: Dict[str, float] = {}
+        high_precision: set[str] = set()
         try:
             payload = json.loads(manifest.read_text())
             for entry in payload.get("inputs", []):
@@ -631,50 +802,17 @@ def _compute_combined_status(project_dir: Path, group: "BulkAnalysisGroup") -> t
         except Exception:
             recorded = {}
             high_precision = set()
+        frozen = frozenset(high_precision)
+        self._manifests[manifest] = (signature, recorded, frozen)
+        return recorded, frozen
 
-    def _current_mtime(path: Path) -> float:
-        try:
-            return float(path.stat().st_mtime)
-        except OSError:
-            return 0.0
-
-    stale = False
-    # Converted inputs: key namespace "converted/" for manifest paths
-    for rel in converted_selected:
-        key = f"converted/{rel}"
-        current = _current_mtime(conv_root / rel)
-        recorded_m = recorded.get(key)
-        if recorded_m is None or recorded_m <= 0:
-            stale = True
-            break
-        tolerance = 1e-6 if key in high_precision else 0.5
-        if current - recorded_m > tolerance:
-            stale = True
-            break
-
-    if not stale:
-        for rel in map_selected:
-            # rel is "slug/relative.md"
-            key = f"map/{rel}"
-            parts = rel.split("/", 1)
-            slug = parts[0]
-            remainder = parts[1] if len(parts) == 2 else ""
-            normalized = normalize_map_relative(remainder)
-            path = map_paths.get(rel)
-            if path is None:
-                path = resolve_map_output_path(project_dir, slug, normalized)
-                map_paths[rel] = path
-            current = _current_mtime(path)
-            recorded_m = recorded.get(key)
-            if recorded_m is None or recorded_m <= 0:
-                stale = True
-                break
-            tolerance = 1e-6 if key in high_precision else 0.5
-            if current - recorded_m > tolerance:
-                stale = True
-                break
 
-    return inputs_count, latest_rel, latest_ts, stale
+def _compute_combined_status(
+    project_dir: Path,
+    group: "BulkAnalysisGroup",
+    cache: CombinedStatusCache | None = None,
+) -> CombinedStatus:
+    return (cache or CombinedStatusCache()).status(project_dir, group)
 
 
 def _resolve_group_converted_paths(
@@ -779,8 +917,10 @@ def _parse_bulk_output_entry(relative_path: str) -> tuple[str, str] | None:
 __all__ = [
     "FileTracker",
     "FileTrackerSnapshot",
+    "TRACKED_FOLDERS",
     "DashboardMetrics",
     "WorkspaceMetrics",
     "WorkspaceGroupMetrics",
     "build_workspace_metrics",
+    "CombinedStatusCache",
 ]
@@ -0,0 +1,112 @@
+"""Persistent cache of highlight extraction results per source PDF."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.common.markdown import compute_file_checksum
+
+from .atomic_json import write_json_atomic
+from .highlights import Highlight, HighlightCollection
+
+LOGGER = logging.getLogger(__name__)
+
+HIGHLIGHT_CACHE_FILENAME = ".highlight_cache.json"
+CACHE_VERSION = 1
+
+# Files modified this recently may change again within the same timestamp
+# tick, so their results are not cached yet.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class HighlightCache:
+    """Remember the highlights found in each PDF, keyed by its stat and checksum.
+
+    A result is reused while the PDF's size and mtime are unchanged. When only
+    the mtime moved (a re-copied production), the file is hashed and the
+    result reused if its SHA-256 still matches.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: Dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    def lookup(self, source: Path) -> Optional[HighlightCollection]:
+        entry = self._entries.get(str(source))
+        if entry is None:
+            return None
+        try:
+            stat = source.stat()
+        except OSError:
+            return None
+        if entry["size"] != stat.st_size:
+            return None
+        if entry["mtime_ns"] != stat.st_mtime_ns:
+            if compute_file_checksum(source) != entry["checksum"]:
+                return None
+            if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+                entry["mtime_ns"] = stat.st_mtime_ns
+                self._dirty = True
+        highlights = tuple(Highlight(*values) for values in entry["highlights"])
+        return HighlightCollection(
+            highlights=highlights,
+            source_file=source,
+            extracted_at=datetime.fromisoformat(entry["extracted_at"]),
+        )
+
+    def store(self, source: Path, collection: HighlightCollection) -> None:
+        try:
+            stat = source.stat()
+        except OSError:
+            return
+        if time.time_ns() - stat.st_mtime_ns <= _RACY_WINDOW_NS:
+            return
+        checksum = compute_file_checksum(source)
+        if checksum is None:
+            return
+        self._entries[str(source)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "checksum": checksum,
+            "extracted_at": collection.extracted_at.astimezone(timezone.utc).isoformat(),
+            "highlights": [
+                [item.text, item.page_number, item.color, item.position_x, item.position_y]
+                for item in collection.highlights
+            ],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if anything changed since it was loaded."""
+
+        if not self._dirty:
+            return
+        payload = {"version": CACHE_VERSION, "entries": self._entries}
+        try:
+            write_json_atomic(self.path, payload, compact=True)
+            self._dirty = False
+        except OSError as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Failed to persist highlight cache %s: %s", self.path, exc)
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception:
+            LOGGER.debug("Ignoring unreadable highlight cache %s", self.path, exc_info=True)
+            return
+        if isinstance(payload, dict) and payload.get("version") == CACHE_VERSION:
+            entries = payload.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+
+__all__ = ["HIGHLIGHT_CACHE_FILENAME", "HighlightCache"]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
+import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Set
 
 from src.common.markdown import (
     SourceReference,
@@ -16,6 +18,14 @@ from src.common.markdown import (
     infer_project_path,
 )
 
+from .atomic_json import write_json_atomic
+
+LOGGER = logging.getLogger(__name__)
+
+# Stored beside the color aggregates it describes.
+HIGHLIGHT_INDEX_FILENAME = ".index.json"
+HIGHLIGHT_INDEX_VERSION = 1
+
 
 @dataclass(slots=True)
 class Highlight:
@@ -189,16 +199,123 @@ class ColorEntry:
     text: str
 
 
+class HighlightIndex:
+    """Persisted highlights of every document that feeds the color aggregates.
+
+    Each extraction run records its documents here, and the aggregates are
+    rebuilt from the whole index. A run over a few new PDFs therefore keeps
+    every other document in the color files, and only the colors whose
+    entries changed need rewriting.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._documents: Dict[str, dict] = {}
+        self._dirty = False
+        self.exists = self._load()
+
+    def update(self, source_relative: str, collection: HighlightCollection) -> Set[str]:
+        """Record ``collection`` for ``source_relative``; return the colors whose entries changed."""
+
+        highlights = [
+            [item.text, item.page_number, item.color, item.position_x, item.position_y]
+            for item in collection.highlights
+        ]
+        record = {"source_path": str(collection.source_file), "highlights": highlights}
+        previous = self._documents.get(source_relative)
+        if previous == record or (previous is None and not highlights):
+            return set()
+        touched = {entry[2] for entry in highlights}
+        if previous is not None:
+            touched.update(entry[2] for entry in previous["highlights"])
+        if highlights:
+            self._documents[source_relative] = record
+        else:
+            self._documents.pop(source_relative, None)
+        self._dirty = True
+        return touched
+
+    def prune_missing_sources(self) -> Set[str]:
+        """Drop documents whose source PDF no longer exists; return the colors they touched."""
+
+        return self._drop(
+            source_relative
+            for source_relative, record in self._documents.items()
+            if not Path(record["source_path"]).exists()
+        )
+
+    def prune_unselected(self, selected: Iterable[str]) -> Set[str]:
+        """Drop documents outside ``selected`` source paths; return the colors they touched."""
+
+        keep = set(selected)
+        return self._drop(source_relative for source_relative in self._documents if source_relative not in keep)
+
+    def _drop(self, source_relatives: Iterable[str]) -> Set[str]:
+        touched: Set[str] = set()
+        for source_relative in list(source_relatives):
+            record = self._documents.pop(source_relative)
+            touched.update(entry[2] for entry in record["highlights"])
+            self._dirty = True
+        return touched
+
+    def collections(self) -> List[tuple[str, HighlightCollection]]:
+        return [
+            (
+                source_relative,
+                HighlightCollection(
+                    highlights=tuple(Highlight(*entry) for entry in record["highlights"]),
+                    source_file=Path(record["source_path"]),
+                ),
+            )
+            for source_relative, record in sorted(self._documents.items())
+        ]
+
+    def save(self) -> None:
+        if not self._dirty and self.exists:
+            return
+        payload = {"version": HIGHLIGHT_INDEX_VERSION, "documents": self._documents}
+        try:
+            write_json_atomic(self.path, payload, compact=True)
+            self._dirty = False
+            self.exists = True
+        except OSError as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Failed to persist highlight index %s: %s", self.path, exc)
+
+    def _load(self) -> bool:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return False
+        except Exception:
+            LOGGER.warning("Ignoring unreadable highlight index %s", self.path, exc_info=True)
+            return False
+        if not isinstance(payload, dict) or payload.get("version") != HIGHLIGHT_INDEX_VERSION:
+            return False
+        documents = payload.get("documents")
+        if not isinstance(documents, dict):
+            return False
+        self._documents = documents
+        return True
+
+
 def aggregate_highlights_by_color(
-    collections: Sequence[tuple[str, HighlightCollection]]
+    collections: Sequence[tuple[str, HighlightCollection]],
+    *,
+    colors: Optional[Iterable[str]] = None,
 ) -> Dict[str, List[ColorEntry]]:
-    """Group highlights by color with their source metadata."""
+    """Group highlights by color with their source metadata.
+
+    With ``colors``, only highlights of those colors are grouped.
+    """
 
+    wanted = set(colors) if colors is not None else None
     aggregates: Dict[str, List[ColorEntry]] = {}
     for source_relative, collection in collections:
         if collection.is_empty():
             continue
         for highlight in collection.highlights:
+            if wanted is not None and highlight.color not in wanted:
+                continue
             aggregates.setdefault(highlight.color, []).append(
                 ColorEntry(
                     source_relative=source_relative,
@@ -241,20 +358,31 @@ def save_color_aggregates(
     output_dir: Path,
     *,
     generated_at: datetime,
+    colors: Optional[Iterable[str]] = None,
 ) -> Dict[str, Path]:
     """Persist per-color markdown files summarising highlight entries.
 
+    Without ``colors`` every existing color file is replaced. With
+    ``colors``, only those colors' files are rewritten (or removed when they
+    have no entries left) and the rest are left untouched.
+
     Returns a mapping of color display name to written file path.
     """
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for existing in output_dir.glob("*.md"):
-        existing.unlink()
+    if colors is None:
+        for existing in output_dir.glob("*.md"):
+            existing.unlink()
+    else:
+        colors = set(colors)
+        for color in colors:
+            if not aggregates.get(color):
+                (output_dir / f"{_color_slug(color)}.md").unlink(missing_ok=True)
 
     written: Dict[str, Path] = {}
     for color, entries in aggregates.items():
-        if not entries:
+        if not entries or (colors is not None and color not in colors):
             continue
         slug = _color_slug(color)
         path = output_dir / f"{slug}.md"
@@ -354,4 +482,6 @@ __all__ = [
     "aggregate_highlights_by_color",
     "save_color_aggregates",
     "ColorEntry",
+    "HIGHLIGHT_INDEX_FILENAME",
+    "HighlightIndex",
 ]
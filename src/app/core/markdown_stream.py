@@ -0,0 +1,227 @@
+"""Memory-bounded chunking for very large converted markdown files."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import frontmatter
+
+from src.common.llm.chunking import ChunkingStrategy
+
+LOGGER = logging.getLogger(__name__)
+
+# Converted documents at or above this size are chunked from disk instead of
+# being loaded (and copied several times) in memory. Anything this large is
+# far beyond a single context window, so it always takes the chunked path.
+STREAMING_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+# Bytes decoded and chunked per step. Widened to hold several chunks when the
+# chunk budget is large.
+_WINDOW_BYTES = 8 * 1024 * 1024
+_CHARS_PER_TOKEN_CEILING = 8
+
+
+@dataclass(frozen=True)
+class ChunkSpan:
+    """Byte range of one chunk within the source file."""
+
+    start: int
+    end: int
+    checksum: str
+    token_count: int
+
+
+def should_stream(path: Path) -> bool:
+    """Return True when ``path`` is large enough to be chunked from disk."""
+
+    try:
+        return path.stat().st_size >= STREAMING_THRESHOLD_BYTES
+    except OSError:
+        return False
+
+
+class StreamedMarkdown:
+    """Chunk plan for a markdown file read through ``mmap``.
+
+    Planning walks the body once in fixed-size windows, recording only byte
+    offsets, chunk checksums and token counts; chunk text is decoded from the
+    mapping when a chunk is actually sent. Peak memory is therefore one window
+    plus the chunks in flight, regardless of file size.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._handle = self.path.open("rb")
+        try:
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._map = None
+        self.metadata: Dict[str, object] = {}
+        self.body_start = 0
+        self.spans: List[ChunkSpan] = []
+        self.body_checksum = ""
+        self._read_frontmatter()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._handle.close()
+
+    def __enter__(self) -> "StreamedMarkdown":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+    def plan(
+        self,
+        max_tokens: int,
+        provider_id: str,
+        model_name: Optional[str] = None,
+        *,
+        overlap_tokens: int = 500,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[ChunkSpan]:
+        """Compute chunk spans and the body checksum in a single pass."""
+
+        size = len(self._map) if self._map is not None else 0
+        window = max(_WINDOW_BYTES, max_tokens * _CHARS_PER_TOKEN_CEILING * 4)
+        digest = hashlib.sha256()
+        hashed_to = self.body_start
+        spans: List[ChunkSpan] = []
+        position = self.body_start
+
+        while position < size:
+            if is_cancelled and is_cancelled():
+                break
+            stop = _utf8_boundary(self._map, min(position + window, size))
+            if stop <= position:
+                stop = size
+            final = stop >= size
+            # surrogateescape keeps invalid bytes one-to-one so character
+            # offsets map back to exact byte offsets.
+            text = self._map[position:stop].decode("utf-8", errors="surrogateescape")
+            if stop > hashed_to:
+                digest.update(self._map[hashed_to:stop])
+                hashed_to = stop
+
+            ranges = ChunkingStrategy.token_ranges(
+                text, max_tokens, provider_id, model_name, overlap_tokens=overlap_tokens
+            )
+            if not final and len(ranges) < 2:
+                # Less than one full chunk fits in the window; widen it rather
+                # than cutting at an arbitrary byte.
+                window *= 2
+                continue
+            if not final:
+                # The last range may be cut short by the window edge; re-chunk
+                # it (overlap included) at the start of the next window.
+                carry_from = ranges[-1][0]
+                ranges = ranges[:-1]
+            else:
+                carry_from = len(text)
+
+            offsets = _byte_offsets(text, [point for start, end, _ in ranges for point in (start, end)] + [carry_from])
+            for start, end, tokens in ranges:
+                byte_start = position + offsets[start]
+                byte_end = position + offsets[end]
+                spans.append(
+                    ChunkSpan(
+                        start=byte_start,
+                        end=byte_end,
+                        checksum=hashlib.sha256(self._map[byte_start:byte_end]).hexdigest(),
+                        token_count=tokens,
+                    )
+                )
+            position += offsets[carry_from]
+
+        self.spans = spans
+        self.body_checksum = digest.hexdigest()
+        return spans
+
+    @property
+    def token_count(self) -> int:
+        """Tokens across all chunks (overlapping text is counted per chunk)."""
+
+        return sum(span.token_count for span in self.spans)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    def chunk_text(self, index: int) -> str:
+        """Decode chunk ``index`` (1-based, matching checkpoint numbering)."""
+
+        span = self.spans[index - 1]
+        return self._map[span.start:span.end].decode("utf-8", errors="replace")
+
+    def iter_chunks(self) -> Iterator[Tuple[int, str, str]]:
+        """Yield ``(index, text, checksum)`` lazily, one chunk at a time."""
+
+        for index, span in enumerate(self.spans, start=1):
+            yield index, self.chunk_text(index), span.checksum
+
+    def _read_frontmatter(self) -> None:
+        if self._map is None or not self._map[:3] == b"---":
+            return
+        first_break = self._map.find(b"\n")
+        if first_break < 0 or self._map[:first_break].strip() != b"---":
+            return
+        closing = self._map.find(b"\n---", first_break)
+        while closing >= 0:
+            line_end = self._map.find(b"\n", closing + 1)
+            line_end = len(self._map) if line_end < 0 else line_end
+            if self._map[closing + 1:line_end].strip() == b"---":
+                header = self._map[:line_end].decode("utf-8", errors="replace")
+                try:
+                    self.metadata = dict(frontmatter.loads(header).metadata or {})
+                except Exception:
+                    LOGGER.debug("Failed to parse front matter of %s", self.path, exc_info=True)
+                    return
+                self.body_start = min(line_end + 1, len(self._map))
+                return
+            closing = self._map.find(b"\n---", closing + 1)
+
+
+def _utf8_boundary(buffer: mmap.mmap, stop: int) -> int:
+    """Move ``stop`` back so it does not split a UTF-8 sequence."""
+
+    size = len(buffer)
+    if stop >= size:
+        return size
+    floor = max(stop - 4, 0)
+    while stop > floor and (buffer[stop] & 0xC0) == 0x80:
+        stop -= 1
+    return stop
+
+
+def _byte_offsets(text: str, points: List[int]) -> Dict[int, int]:
+    """Map character offsets in ``text`` to UTF-8 byte offsets in one pass."""
+
+    offsets: Dict[int, int] = {}
+    previous_char = 0
+    previous_byte = 0
+    for point in sorted(set(points)):
+        previous_byte += len(text[previous_char:point].encode("utf-8", "surrogateescape"))
+        previous_char = point
+        offsets[point] = previous_byte
+    return offsets
+
+
+__all__ = [
+    "ChunkSpan",
+    "STREAMING_THRESHOLD_BYTES",
+    "StreamedMarkdown",
+    "should_stream",
+]
@@ -0,0 +1,162 @@
+"""Per-page conversion cache keyed by PDF page content fingerprints."""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.core.file_utils import pdf_page_fingerprints
+
+LOGGER = logging.getLogger(__name__)
+
+PAGE_CACHE_FILENAME = ".page_cache.sqlite3"
+
+_PAGE_BREAK_RE = re.compile(r"^\s*<!--\s*PageBreak\s*-->\s*$", re.IGNORECASE | re.MULTILINE)
+PAGE_BREAK = "<!-- PageBreak -->"
+
+
+def page_fingerprints(pdf_path: Path) -> List[str]:
+    """Return one content fingerprint per page of ``pdf_path``.
+
+    A fingerprint hashes what the page draws: its decompressed content
+    streams, geometry and rotation, the raw streams of the images and form
+    XObjects it references, and its annotations. Object numbers are left out,
+    so a page keeps its fingerprint when pages are appended to the file or it
+    is rewritten.
+
+    Anything drawn on the page counts, including a Bates stamp: re-stamping a
+    production changes every stamped page's fingerprint and converts those
+    pages again, so the stamped numbers in the output always match the source.
+
+    The pages are read in a worker process, so callers need not hold
+    :data:`~src.core.file_utils.FITZ_LOCK`.
+    """
+
+    return pdf_page_fingerprints(pdf_path)
+
+
+def extract_page_texts(pdf_path: Path, indices: Sequence[int]) -> List[str]:
+    """Return the plain text of the zero-based ``indices`` pages, in order."""
+
+    import fitz  # PyMuPDF
+
+    with fitz.open(pdf_path) as doc:
+        return [doc[index].get_text() for index in indices]
+
+
+def pages_to_pdf_bytes(pdf_path: Path, indices: Sequence[int]) -> bytes:
+    """Return a PDF containing only the zero-based ``indices`` pages, in order."""
+
+    import fitz  # PyMuPDF
+
+    with fitz.open(pdf_path) as source, fitz.open() as subset:
+        for start, end in _runs(indices):
+            subset.insert_pdf(source, from_page=start, to_page=end)
+        return subset.tobytes()
+
+
+def split_markdown_pages(markdown: str) -> List[str]:
+    """Split Azure DI markdown on its ``<!-- PageBreak -->`` lines."""
+
+    return [part.strip("\n") for part in _PAGE_BREAK_RE.split(markdown.replace("\r\n", "\n"))]
+
+
+def join_markdown_pages(pages: Iterable[str]) -> str:
+    """Inverse of :func:`split_markdown_pages`."""
+
+    return f"\n\n{PAGE_BREAK}\n\n".join(pages).strip() + "\n"
+
+
+class PageCache:
+    """Page output keyed by ``(converter, fingerprint)`` in a per-project SQLite file.
+
+    Entries are content-addressed, so identical pages are shared between
+    documents and a page that moves within a file is still found.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Caller holds ``self._lock``.
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "converter TEXT NOT NULL, fingerprint TEXT NOT NULL, content TEXT NOT NULL, "
+                "PRIMARY KEY (converter, fingerprint))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, converter: str, fingerprints: Sequence[str]) -> Dict[str, str]:
+        """Return cached content for whichever ``fingerprints`` are known."""
+
+        wanted = sorted(set(fingerprints))
+        found: Dict[str, str] = {}
+        with self._lock:
+            try:
+                conn = self._connection()
+                # Stay below SQLite's bound-parameter limit.
+                for offset in range(0, len(wanted), 500):
+                    batch = wanted[offset : offset + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT fingerprint, content FROM pages WHERE converter = ? AND fingerprint IN ({placeholders})",
+                        (converter, *batch),
+                    ).fetchall()
+                    found.update(rows)
+            except sqlite3.Error as exc:
+                LOGGER.warning("Page cache %s unavailable: %s", self.path, exc)
+        return found
+
+    def put_many(self, converter: str, pages: Iterable[Tuple[str, str]]) -> None:
+        rows = [(converter, fingerprint, content) for fingerprint, content in pages]
+        if not rows:
+            return
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO pages (converter, fingerprint, content) VALUES (?, ?, ?)", rows
+                )
+                conn.commit()
+            except sqlite3.Error as exc:
+                LOGGER.warning("Failed to update page cache %s: %s", self.path, exc)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _runs(indices: Sequence[int]) -> List[Tuple[int, int]]:
+    runs: List[Tuple[int, int]] = []
+    for index in indices:
+        if runs and runs[-1][1] == index - 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
+
+
+__all__ = [
+    "PAGE_BREAK",
+    "PAGE_CACHE_FILENAME",
+    "PageCache",
+    "extract_page_texts",
+    "join_markdown_pages",
+    "page_fingerprints",
+    "pages_to_pdf_bytes",
+    "split_markdown_pages",
+]
@@ -10,7 +10,7 @@ import shutil
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, List, Sequence, TYPE_CHECKING
+from typing import Dict, Iterable, Optional, Any, List, Sequence, TYPE_CHECKING
 from dataclasses import dataclass, asdict, field
 
 from PySide6.QtCore import QObject, Signal, QTimer
@@ -19,7 +19,13 @@ if TYPE_CHECKING:
     from .bulk_analysis_groups import BulkAnalysisGroup
 
 from .secure_settings import SecureSettings
-from .file_tracker import DashboardMetrics, WorkspaceMetrics, build_workspace_metrics
+from .file_tracker import (
+    TRACKED_FOLDERS,
+    CombinedStatusCache,
+    DashboardMetrics,
+    WorkspaceMetrics,
+    build_workspace_metrics,
+)
 from .placeholders import PlaceholderEntry, ProjectPlaceholders, SYSTEM_PLACEHOLDERS, system_placeholder_map
 
 
@@ -401,6 +407,8 @@ class ProjectManager(QObject):
         self._auto_save_timer.setInterval(60000)  # 1 minute
         self._modified = False
         self._file_tracker = None
+        self._workspace_metrics_generation: Optional[int] = None
+        self._combined_status_cache = CombinedStatusCache()
         self.bulk_analysis_groups: Dict[str, "BulkAnalysisGroup"] = {}
         
         # Load project if path provided
@@ -731,8 +739,10 @@ class ProjectManager(QObject):
         """Return combined dashboard and group metrics for workspace views."""
         if not refresh and self.workspace_metrics is not None:
             return self.workspace_metrics
+        if refresh:
+            return self.refresh_workspace_metrics()
 
-        dashboard = self.get_dashboard_metrics(refresh=refresh)
+        dashboard = self.get_dashboard_metrics()
         tracker = self.get_file_tracker()
         snapshot = tracker.snapshot or tracker.load()
         bulk_analysis_groups = self.list_bulk_analysis_groups()
@@ -742,12 +752,51 @@ class ProjectManager(QObject):
             dashboard=dashboard,
             bulk_analysis_groups=bulk_analysis_groups,
             project_dir=self.project_dir,
+            combined_cache=self._combined_status_cache,
+        )
+        self._store_workspace_metrics(metrics)
+        return metrics
+
+    def refresh_workspace_metrics(self, folders: Optional[Iterable[str]] = None) -> WorkspaceMetrics:
+        """Rescan tracked folders and update workspace metrics from what changed.
+
+        Only ``folders`` (every tracked folder by default) are walked again.
+        Group metrics from the previous refresh are kept for groups whose
+        inputs and outputs did not change, so a watcher-driven refresh during
+        a bulk run only recomputes the groups that are writing output.
+        """
+        tracker = self.get_file_tracker()
+        previous = self.workspace_metrics
+        if not tracker.generation or self._workspace_metrics_generation != tracker.generation:
+            # ``previous`` was not built from this tracker's latest scan, so
+            # the changes found below are not relative to it.
+            previous = None
+        scanned = set(TRACKED_FOLDERS if folders is None else folders)
+        snapshot, changes = tracker.rescan(scanned)
+        self.update_source_state(last_scan=snapshot.timestamp.isoformat())
+        self._store_dashboard_metrics(snapshot.to_dashboard_metrics())
+
+        affected_slugs: Optional[set[str]] = None
+        if previous is not None and "converted_documents" not in changes:
+            affected_slugs = {path.split("/", 1)[0] for path in changes.get("bulk_analysis", ())}
+
+        metrics = build_workspace_metrics(
+            snapshot=snapshot,
+            dashboard=self.dashboard_metrics,
+            bulk_analysis_groups=self.list_bulk_analysis_groups(),
+            project_dir=self.project_dir,
+            previous=previous,
+            affected_slugs=affected_slugs,
+            recompute_combined=bool(scanned & {"converted_documents", "bulk_analysis"}),
+            combined_cache=self._combined_status_cache,
         )
         self._store_workspace_metrics(metrics)
         return metrics
 
     def _store_workspace_metrics(self, metrics: WorkspaceMetrics) -> None:
         self.workspace_metrics = metrics
+        tracker = self._file_tracker
+        self._workspace_metrics_generation = tracker.generation if tracker is not None else None
 
     # ------------------------------------------------------------------
     # Bulk analysis group helpers
@@ -1316,6 +1365,7 @@ class ProjectManager(QObject):
         self.dashboard_metrics = DashboardMetrics.empty()
         self.workspace_metrics = None
         self._file_tracker = None
+        self._combined_status_cache = CombinedStatusCache()
         self._modified = False
 
         self.logger.info("Closed project")
@@ -0,0 +1,84 @@
+"""Persistent cache of source-file digests used when planning conversions."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .atomic_json import write_json_atomic
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Files modified this recently may change again within the same timestamp
+# tick, so their digest is not cached yet.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class SourceHashCache:
+    """Remember SHA-256 digests keyed by ``(path, size, mtime_ns)``.
+
+    A digest is reused only while the file's size and mtime are unchanged;
+    otherwise the caller hashes the file again and stores the new value.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: Dict[str, list] = {}
+        self._dirty = False
+        self._load()
+
+    def lookup(self, source: Path, stat: os.stat_result) -> Optional[str]:
+        entry = self._entries.get(str(source))
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def store(self, source: Path, stat: os.stat_result, digest: str) -> None:
+        if time.time_ns() - stat.st_mtime_ns <= _RACY_WINDOW_NS:
+            return
+        self._entries[str(source)] = [stat.st_size, stat.st_mtime_ns, digest]
+        self._dirty = True
+
+    def retain(self, sources: Iterable[Path]) -> None:
+        """Forget digests for files outside ``sources``, e.g. deleted or renamed ones."""
+
+        keep = {str(source) for source in sources}
+        stale = [key for key in self._entries if key not in keep]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if anything was stored since it was loaded."""
+
+        if not self._dirty:
+            return
+        payload = {"version": CACHE_VERSION, "entries": self._entries}
+        try:
+            write_json_atomic(self.path, payload, compact=True)
+            self._dirty = False
+        except OSError as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Failed to persist source hash cache %s: %s", self.path, exc)
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception:
+            LOGGER.debug("Ignoring unreadable source hash cache %s", self.path, exc_info=True)
+            return
+        if isinstance(payload, dict) and payload.get("version") == CACHE_VERSION:
+            entries = payload.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+
+__all__ = ["SourceHashCache"]
@@ -0,0 +1,180 @@
+"""Persistent stat index used to rescan project folders incrementally."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Entries modified this close to the moment they were indexed may change again
+# within the same filesystem timestamp tick, so their mtime is not trusted on
+# the next scan (the "racy" case).
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Sentinel mtime that never matches a real stat result.
+_UNTRUSTED = -1
+
+FileProbe = Callable[[Path], object]
+
+
+class StatIndex:
+    """Remember directory listings and file stats between scans.
+
+    For every directory the index keeps its ``st_mtime_ns`` and inode plus
+    the names of its files and subdirectories. Adding, removing or renaming
+    an entry changes the directory's mtime, so a directory whose stat is
+    unchanged is not listed again. Only its subdirectories are visited, and
+    its files are stat'ed only when the caller needs a per-file probe result.
+    Files keep ``(size, mtime_ns, inode, probe)``, and the probe (for example
+    a front-matter sniff) only runs again when that stat tuple changes.
+
+    With ``path=None`` the index lives in memory only and :meth:`save` is a
+    no-op.
+    """
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self._roots: Dict[str, Dict[str, dict]] = {}
+        self._dirty = False
+        self._load()
+
+    def files(self, name: str, root: Path, probe: Optional[FileProbe] = None) -> Dict[str, object]:
+        """Return ``{relative_path: probe_result}`` for every file under ``root``.
+
+        ``name`` identifies the tree inside the index. Without ``probe`` the
+        values are None, and unchanged directories are not stat'ed beyond
+        themselves.
+        """
+
+        previous = self._roots.get(name, {})
+        current: Dict[str, dict] = {}
+        results: Dict[str, object] = {}
+        now_ns = time.time_ns()
+        pending: List[str] = [""]
+
+        while pending:
+            rel_dir = pending.pop()
+            directory = root / rel_dir if rel_dir else root
+            try:
+                dir_stat = os.stat(directory)
+            except OSError:
+                continue
+
+            cached = previous.get(rel_dir)
+            if (
+                cached is not None
+                and cached["mtime_ns"] == dir_stat.st_mtime_ns
+                and cached["ino"] == dir_stat.st_ino
+                and (probe is None or cached.get("probed"))
+            ):
+                entry = cached
+                if probe is not None:
+                    entry = dict(cached, files=self._refresh_files(directory, cached["files"], probe))
+            else:
+                entry = self._list_directory(directory, cached, probe)
+                self._dirty = True
+            trusted = now_ns - dir_stat.st_mtime_ns > _RACY_WINDOW_NS
+            entry["mtime_ns"] = dir_stat.st_mtime_ns if trusted else _UNTRUSTED
+            entry["ino"] = dir_stat.st_ino
+            current[rel_dir] = entry
+
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            for file_name, record in entry["files"].items():
+                results[prefix + file_name] = record[3]
+            pending.extend(prefix + sub for sub in entry["subdirs"])
+
+        if current.keys() != previous.keys():
+            self._dirty = True
+        self._roots[name] = current
+        return results
+
+    def save(self) -> None:
+        """Persist the index if anything changed since it was loaded."""
+
+        if not self._dirty or self.path is None:
+            return
+        payload = {"version": INDEX_VERSION, "roots": self._roots}
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Failed to persist stat index %s: %s", self.path, exc)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception:
+            LOGGER.debug("Ignoring unreadable stat index %s", self.path, exc_info=True)
+            return
+        if isinstance(payload, dict) and payload.get("version") == INDEX_VERSION:
+            roots = payload.get("roots")
+            if isinstance(roots, dict):
+                self._roots = roots
+
+    def _list_directory(self, directory: Path, cached: Optional[dict], probe: Optional[FileProbe]) -> dict:
+        known_files = (cached or {}).get("files", {})
+        files: Dict[str, list] = {}
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for item in entries:
+                    try:
+                        if item.is_dir():
+                            subdirs.append(item.name)
+                        elif item.is_file():
+                            files[item.name] = self._file_record(
+                                Path(item.path), item.stat(), known_files.get(item.name), probe
+                            )
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return {"files": files, "subdirs": sorted(subdirs), "probed": probe is not None}
+
+    def _refresh_files(self, directory: Path, files: Dict[str, list], probe: FileProbe) -> Dict[str, list]:
+        refreshed: Dict[str, list] = {}
+        for file_name, record in files.items():
+            path = directory / file_name
+            try:
+                stat = path.stat()
+            except OSError:
+                self._dirty = True
+                continue
+            refreshed[file_name] = self._file_record(path, stat, record, probe)
+        return refreshed
+
+    def _file_record(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        cached: Optional[list],
+        probe: Optional[FileProbe],
+    ) -> list:
+        key = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        if time.time_ns() - stat.st_mtime_ns <= _RACY_WINDOW_NS:
+            key[1] = _UNTRUSTED
+        if cached is not None and cached[:3] == key and key[1] != _UNTRUSTED:
+            return cached
+        if cached is None or cached[:3] != key:
+            self._dirty = True
+        value = probe(path) if probe is not None else None
+        return key + [value]
+
+
+__all__ = ["FileProbe", "StatIndex"]
@@ -0,0 +1,292 @@
+"""Watch tracked project folders and report which ones changed."""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from .file_tracker import TRACKED_FOLDERS
+
+LOGGER = logging.getLogger(__name__)
+
+# Coalesce bursts of filesystem events (a bulk run writes several files per
+# document) into one refresh. The timer is not restarted by later events, so a
+# long run still refreshes at this interval.
+DEBOUNCE_MS = 500
+# Interval used when native watching is unavailable. Rescans are served from
+# the stat index, so polling an unchanged project is cheap.
+POLL_INTERVAL_MS = 5000
+# Stay well below typical inotify watch limits; larger trees are polled.
+MAX_WATCHED_DIRECTORIES = 4000
+# The token-count and checkpoint stores create and delete a rollback journal
+# on every commit. Neither the journals nor the stores' contents change what
+# the dashboard shows, so journals are ignored and stores compared by name.
+_IGNORED_SUFFIXES = ("-journal",)
+_STORE_SUFFIXES = (".sqlite3",)
+
+
+class WorkspaceWatcher(QObject):
+    """Emit the tracked folders that changed under a project directory.
+
+    Every directory below ``converted_documents/``, ``bulk_analysis/`` and
+    ``highlights/`` is registered with :class:`QFileSystemWatcher` (inotify,
+    kqueue or ReadDirectoryChangesW depending on the platform). Events are
+    debounced and reported as the set of top-level folders they touched; an
+    event is dropped when the directory's entries, ignoring SQLite journals,
+    are unchanged since its last event. If
+    the tree is too large to watch or the platform refuses the watches, the
+    watcher falls back to reporting every tracked folder on a timer.
+
+    Listing a large tree is slow, so UI callers should list the directories
+    off the UI thread with :func:`list_watch_directories` and pass them to
+    :meth:`watch`.
+    """
+
+    folders_changed = Signal(list)
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        *,
+        debounce_ms: int = DEBOUNCE_MS,
+        poll_interval_ms: int = POLL_INTERVAL_MS,
+        max_directories: int = MAX_WATCHED_DIRECTORIES,
+    ) -> None:
+        super().__init__(parent)
+        self._project_dir: Optional[Path] = None
+        self._max_directories = max_directories
+        self._watcher: Optional[QFileSystemWatcher] = None
+        self._pending: Set[str] = set()
+        self._snapshots: Dict[str, FrozenSet[Tuple[str, int]]] = {}
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self._flush)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self._poll)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def polling(self) -> bool:
+        return self._poll_timer.isActive()
+
+    @property
+    def active(self) -> bool:
+        return self._project_dir is not None
+
+    @property
+    def max_directories(self) -> int:
+        return self._max_directories
+
+    def watch(self, project_dir: Optional[Path], directories: Optional[List[str]] = None) -> None:
+        """Start watching ``project_dir``, replacing any previous project.
+
+        ``directories`` is the output of :func:`list_watch_directories`; when
+        omitted the tree is listed here, on the calling thread.
+        """
+        self.stop()
+        if project_dir is None:
+            return
+        self._project_dir = Path(project_dir)
+
+        if directories is None:
+            directories = list_watch_directories(self._project_dir, limit=self._max_directories) or []
+        if len(directories) > self._max_directories:
+            LOGGER.info(
+                "Polling %s for changes: %d directories exceed the watch limit",
+                self._project_dir,
+                len(directories),
+            )
+            self._poll_timer.start()
+            return
+
+        watcher = QFileSystemWatcher(self)
+        failed = watcher.addPaths(directories) if directories else []
+        if failed:
+            LOGGER.info("Polling %s for changes: %d directories could not be watched", self._project_dir, len(failed))
+            watcher.deleteLater()
+            self._poll_timer.start()
+            return
+        watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watcher = watcher
+
+    def stop(self) -> None:
+        self._debounce.stop()
+        self._poll_timer.stop()
+        self._pending.clear()
+        self._snapshots.clear()
+        if self._watcher is not None:
+            self._watcher.directoryChanged.disconnect(self._on_directory_changed)
+            self._watcher.deleteLater()
+            self._watcher = None
+        self._project_dir = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _on_directory_changed(self, path: str) -> None:
+        if self._project_dir is not None and Path(path) == self._project_dir:
+            self._watch_new_folders()
+            return
+        folder_name = self._tracked_folder(Path(path))
+        if folder_name is None:
+            return
+        listing = _list_entries(path)
+        if listing is not None:
+            snapshot, subdirs = listing
+            if self._snapshots.get(path) == snapshot:
+                return
+            self._snapshots[path] = snapshot
+            self._watch_new_subdirectories(subdirs)
+        else:
+            self._snapshots.pop(path, None)
+        self._pending.add(folder_name)
+        self._schedule_flush()
+
+    def _watch_new_folders(self) -> None:
+        watcher = self._watcher
+        if watcher is None or self._project_dir is None:
+            return
+        watched = set(watcher.directories())
+        for folder_name in TRACKED_FOLDERS:
+            folder = self._project_dir / folder_name
+            if str(folder) in watched or not folder.is_dir():
+                continue
+            self._watch_new_subdirectories([str(folder)])
+            self._pending.add(folder_name)
+            self._schedule_flush()
+
+    def _watch_new_subdirectories(self, candidates: List[str]) -> None:
+        """Watch the unwatched ``candidates`` and every directory below them.
+
+        Only new directories are walked; already watched ones report their own
+        changes.
+        """
+        watcher = self._watcher
+        if watcher is None:
+            return
+        watched = set(watcher.directories())
+        new_dirs = [
+            directory
+            for candidate in candidates
+            if candidate not in watched
+            for directory in _walk_directories(Path(candidate))
+            if directory not in watched
+        ]
+        if not new_dirs:
+            return
+        if len(watched) + len(new_dirs) > self._max_directories or watcher.addPaths(new_dirs):
+            LOGGER.info("Switching to polling for %s; directory watches exhausted", self._project_dir)
+            project_dir = self._project_dir
+            self.stop()
+            self._project_dir = project_dir
+            self._poll_timer.start()
+            # Report everything once so nothing written meanwhile is missed.
+            self._pending.update(TRACKED_FOLDERS)
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if not self._debounce.isActive():
+            self._debounce.start()
+
+    def _tracked_folder(self, path: Path) -> Optional[str]:
+        if self._project_dir is None:
+            return None
+        try:
+            relative = path.relative_to(self._project_dir)
+        except ValueError:
+            return None
+        if not relative.parts or relative.parts[0] not in TRACKED_FOLDERS:
+            return None
+        return relative.parts[0]
+
+    def _poll(self) -> None:
+        if self._project_dir is not None:
+            self.folders_changed.emit(list(TRACKED_FOLDERS))
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        folders = sorted(self._pending)
+        self._pending.clear()
+        self.folders_changed.emit(folders)
+
+
+def list_watch_directories(
+    project_dir: Path,
+    *,
+    limit: Optional[int] = None,
+    is_cancelled: Callable[[], bool] = lambda: False,
+) -> Optional[List[str]]:
+    """Return the directories :class:`WorkspaceWatcher` registers for ``project_dir``.
+
+    That is the project root plus every directory below the tracked folders.
+    Listing stops once more than ``limit`` directories are found, since the
+    watcher polls such trees anyway. Returns None when ``is_cancelled``
+    reports cancellation part way through.
+    """
+
+    # The project root is watched so tracked folders created later are picked up.
+    directories: List[str] = [str(project_dir)]
+    for folder_name in TRACKED_FOLDERS:
+        root = project_dir / folder_name
+        if not root.is_dir():
+            continue
+        directories.append(str(root))
+        for current, subdirs, _files in os.walk(root):
+            if is_cancelled():
+                return None
+            directories.extend(os.path.join(current, name) for name in subdirs)
+            if limit is not None and len(directories) > limit:
+                return directories
+    return directories
+
+
+def _list_entries(path: str) -> Optional[Tuple[FrozenSet[Tuple[str, int]], List[str]]]:
+    """Return a snapshot of ``path``'s direct entries and its subdirectories.
+
+    The snapshot pairs each file name with its mtime, so files replaced in
+    place register too; SQLite journals are left out and SQLite stores count
+    only by name. Returns None when ``path`` is no longer a directory.
+    """
+    entries = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(_IGNORED_SUFFIXES):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        entries.append((entry.name, 0))
+                    elif entry.name.endswith(_STORE_SUFFIXES):
+                        entries.append((entry.name, 0))
+                    else:
+                        entries.append((entry.name, entry.stat(follow_symlinks=False).st_mtime_ns))
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    return frozenset(entries), subdirs
+
+
+def _walk_directories(root: Path) -> Iterable[str]:
+    if not root.is_dir():
+        return []
+    directories = [str(root)]
+    for current, subdirs, _files in os.walk(root):
+        directories.extend(os.path.join(current, name) for name in subdirs)
+    return directories
+
+
+__all__ = ["WorkspaceWatcher", "list_watch_directories"]
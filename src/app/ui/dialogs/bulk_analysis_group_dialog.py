@@ -204,6 +204,22 @@ class BulkAnalysisGroupDialog(QDialog):
         self.reasoning_checkbox = QCheckBox("Use reasoning (thinking models)")
         form.addRow("Reasoning", self.reasoning_checkbox)
 
+        self.document_concurrency_spin = QSpinBox()
+        self.document_concurrency_spin.setRange(1, 16)
+        self.document_concurrency_spin.setValue(1)
+        self.document_concurrency_spin.setToolTip(
+            "Number of documents sent to the model at the same time during a per-document run."
+        )
+        form.addRow("Parallel documents", self.document_concurrency_spin)
+
+        self.chunk_concurrency_spin = QSpinBox()
+        self.chunk_concurrency_spin.setRange(1, 16)
+        self.chunk_concurrency_spin.setValue(1)
+        self.chunk_concurrency_spin.setToolTip(
+            "Number of chunks (or reduce batches) of a large document sent to the model at the same time."
+        )
+        form.addRow("Parallel chunks", self.chunk_concurrency_spin)
+
         layout.addLayout(form)
         self._refresh_placeholder_requirements()
 
@@ -383,6 +399,7 @@ class BulkAnalysisGroupDialog(QDialog):
         self.order_combo.setEnabled(combined)
         self.output_template_edit.setEnabled(combined)
         self.reasoning_checkbox.setEnabled(True)
+        self.document_concurrency_spin.setEnabled(not combined)
         # Show Extra Files only for Combined
         self.manual_files_label.setVisible(combined)
         self.manual_files_edit.setVisible(combined)
@@ -497,6 +514,8 @@ class BulkAnalysisGroupDialog(QDialog):
             "model_context_window": custom_window,
             "placeholder_requirements": placeholder_settings,
             "use_reasoning": self.reasoning_checkbox.isChecked(),
+            "max_concurrent_documents": int(self.document_concurrency_spin.value()),
+            "max_concurrent_chunks": int(self.chunk_concurrency_spin.value()),
         }
 
         if op == "combined":
@@ -669,6 +688,8 @@ class BulkAnalysisGroupDialog(QDialog):
         self.system_prompt_edit.setText(self._normalise_text(group.system_prompt_path))
         self.user_prompt_edit.setText(self._normalise_text(group.user_prompt_path))
         self.reasoning_checkbox.setChecked(group.use_reasoning)
+        self.document_concurrency_spin.setValue(max(int(group.max_concurrent_documents or 1), 1))
+        self.chunk_concurrency_spin.setValue(max(int(group.max_concurrent_chunks or 1), 1))
         if group.combine_output_template:
             self.output_template_edit.setText(group.combine_output_template)
         current_order = group.combine_order or "path"
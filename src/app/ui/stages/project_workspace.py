@@ -20,8 +20,6 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QTabWidget,
-    QTreeWidget,
-    QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
     QDialog,
@@ -159,7 +157,6 @@ class ProjectWorkspace(QWidget):
         self._bulk_banner = tab.bulk_banner
 
         self._rescan_button.clicked.connect(lambda: self._trigger_conversion(auto_run=False))
-        self._source_tree.itemChanged.connect(self._on_source_item_changed)
         return tab
 
     def _build_highlights_tab(self) -> HighlightsTab:
@@ -529,10 +526,6 @@ class ProjectWorkspace(QWidget):
         if self._documents_controller:
             self._documents_controller.populate_source_tree()
 
-    def _populate_directory_contents(self, *args, **kwargs) -> None:
-        if self._documents_controller:
-            self._documents_controller.populate_directory_contents(*args, **kwargs)
-
     def _iter_directories(self, root_path: Path) -> List[str]:
         if self._documents_controller:
             return self._documents_controller.iter_directories(root_path)
@@ -543,10 +536,6 @@ class ProjectWorkspace(QWidget):
             return self._documents_controller.normalise_relative_path(path)
         return Path(path.strip('/')).as_posix() if path else ''
 
-    def _apply_directory_flags(self, item: QTreeWidgetItem) -> None:
-        if self._documents_controller:
-            self._documents_controller.apply_directory_flags(item)
-
     def _should_skip_source_entry(self, entry: Path) -> bool:
         if self._documents_controller:
             return self._documents_controller.should_skip_source_entry(entry)
@@ -578,26 +567,10 @@ class ProjectWorkspace(QWidget):
         if self._documents_controller:
             self._documents_controller.prompt_for_new_directories(new_dirs)
 
-    def _expand_to_item(self, item: QTreeWidgetItem) -> None:
-        if self._documents_controller:
-            self._documents_controller.expand_to_item(item)
-
     def _handle_missing_directories(self, missing_dirs: Sequence[str]) -> None:
         if self._documents_controller:
             self._documents_controller.handle_missing_directories(missing_dirs)
 
-    def _on_source_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
-        if self._documents_controller:
-            self._documents_controller.handle_source_item_changed(item, column)
-
-    def _cascade_source_check_state(self, item: QTreeWidgetItem, state: Qt.CheckState) -> None:
-        if self._documents_controller:
-            self._documents_controller.cascade_source_check_state(item, state)
-
-    def _update_parent_source_state(self, item: Optional[QTreeWidgetItem]) -> None:
-        if self._documents_controller:
-            self._documents_controller.update_parent_source_state(item)
-
     def _update_selected_folders_from_tree(self) -> None:
         if self._documents_controller:
             self._documents_controller.update_selected_folders_from_tree()
@@ -607,10 +580,6 @@ class ProjectWorkspace(QWidget):
             return self._documents_controller.collect_selected_directories()
         return []
 
-    def _collect_selected_directories_from_item(self, item: QTreeWidgetItem, results: Set[str]) -> None:
-        if self._documents_controller:
-            self._documents_controller.collect_selected_directories_from_item(item, results)
-
     def _set_root_warning(self, warnings: List[str]) -> None:
         if self._documents_controller:
             self._documents_controller.set_root_warning(warnings)
@@ -652,13 +621,6 @@ class ProjectWorkspace(QWidget):
         if self._documents_controller:
             self._documents_controller.run_scheduled_file_tracker_refresh()
 
-    def _find_child(self, parent: QTreeWidgetItem, name: str) -> Optional[QTreeWidgetItem]:
-        for index in range(parent.childCount()):
-            child = parent.child(index)
-            if child.text(0) == name:
-                return child
-        return None
-
     def _resolve_source_root(self) -> Optional[Path]:
         if not self._project_manager or not self._project_manager.project_dir:
             return None
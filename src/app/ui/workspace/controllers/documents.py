@@ -6,34 +6,39 @@ import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Set, TYPE_CHECKING
+from typing import Callable, List, Optional, Sequence, Set, TYPE_CHECKING
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QColor, QBrush
-from PySide6.QtWidgets import QMessageBox, QTreeWidgetItem
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QMessageBox
+from shiboken6 import isValid
 
 from src.app.core.conversion_manager import (
     ConversionJob,
     DuplicateSource,
     build_conversion_jobs,
 )
-from src.app.core.file_tracker import WorkspaceMetrics
+from src.app.core.file_tracker import TRACKED_FOLDERS, WorkspaceMetrics
 from src.app.core.project_manager import ProjectManager
+from src.app.core.workspace_watcher import WorkspaceWatcher
 from src.app.ui.workspace.documents_tab import DocumentsTab
-from src.app.ui.workspace.qt_flags import (
-    ITEM_IS_ENABLED,
-    ITEM_IS_TRISTATE,
-    ITEM_IS_USER_CHECKABLE,
-)
+from src.app.ui.workspace.source_tree_model import is_skipped_source_name
 from src.app.ui.widgets import BannerAction
+from src.app.workers.source_scan_worker import SourceScanWorker, WatchScanWorker, list_source_directories
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from src.app.ui.stages.project_workspace import ProjectWorkspace
 
+# New folders beyond this many are marked but not expanded into view, so a
+# first scan of a large share does not list the whole tree.
+_MAX_EXPANDED_NEW_DIRECTORIES = 25
+
 
 class DocumentsController:
     """Coordinate state and interactions for the documents tab."""
 
+    _DISCOVERY_KEY = "documents:discover"
+    _WATCH_SCAN_KEY = "documents:watch_scan"
+
     def __init__(
         self,
         workspace: "ProjectWorkspace",
@@ -44,14 +49,20 @@ class DocumentsController:
         self._tab = tab
         self._run_conversion = run_conversion
         self._project_manager: Optional[ProjectManager] = None
-        self._source_tree_nodes: Dict[str, QTreeWidgetItem] = {}
-        self._block_source_tree_signal = False
+        self._discovery_generation = 0
+        self._watch_generation = 0
         self._new_directory_alerts: Set[str] = set()
         self._new_dir_prompt_active = False
         self._pending_file_tracker_refresh = False
+        self._pending_refresh_folders: Set[str] = set()
         self._current_warnings: List[str] = []
         self._missing_root_prompted = False
         self._workspace_metrics: WorkspaceMetrics | None = None
+        # Filesystem events under the tracked folders schedule a refresh of
+        # just those folders instead of a full rescan.
+        self._watcher = WorkspaceWatcher(workspace)
+        self._watcher.folders_changed.connect(self.schedule_file_tracker_refresh)
+        self._tab.source_model.check_state_changed.connect(self.handle_source_check_changed)
 
     # ------------------------------------------------------------------
     # Lifecycle helpers
@@ -60,8 +71,9 @@ class DocumentsController:
         self._project_manager = project_manager
         self._workspace_metrics = None
         self._pending_file_tracker_refresh = False
-        self._source_tree_nodes.clear()
-        self._block_source_tree_signal = False
+        self._pending_refresh_folders.clear()
+        self._start_watching(project_manager.project_dir if project_manager else None)
+        self._cancel_directory_discovery()
         self._new_directory_alerts.clear()
         self._new_dir_prompt_active = False
         self._current_warnings = []
@@ -69,9 +81,8 @@ class DocumentsController:
         self._tab.highlights_banner.reset()
         self._tab.bulk_banner.reset()
 
-        tree = self._tab.source_tree
-        tree.clear()
-        tree.setDisabled(project_manager is None)
+        self._tab.source_model.clear()
+        self._tab.source_tree.setDisabled(project_manager is None)
 
         if project_manager is None:
             self._tab.source_root_label.setText("Source root: not set")
@@ -80,9 +91,12 @@ class DocumentsController:
         self.set_root_warning([])
 
     def shutdown(self) -> None:
-        self._source_tree_nodes.clear()
+        self._cancel_directory_discovery()
         self._new_directory_alerts.clear()
         self._pending_file_tracker_refresh = False
+        self._pending_refresh_folders.clear()
+        self._cancel_watch_scan()
+        self._watcher.stop()
         self._workspace_metrics = None
 
     # ------------------------------------------------------------------
@@ -159,7 +173,7 @@ class DocumentsController:
         )
         QMessageBox.warning(workspace, "Duplicate Files Skipped", message)
 
-    def refresh_file_tracker(self) -> WorkspaceMetrics | None:
+    def refresh_file_tracker(self, folders: Optional[Sequence[str]] = None) -> WorkspaceMetrics | None:
         project_manager = self._project_manager
         counts_label = self._tab.counts_label
         if not project_manager:
@@ -170,7 +184,7 @@ class DocumentsController:
             return None
 
         try:
-            self._workspace_metrics = project_manager.get_workspace_metrics(refresh=True)
+            self._workspace_metrics = project_manager.refresh_workspace_metrics(folders)
         except Exception:
             counts_label.setText("Scan failed")
             self._tab.highlights_banner.reset()
@@ -238,18 +252,26 @@ class DocumentsController:
         label.setText(display)
 
     def populate_source_tree(self) -> None:
+        """Show the source root in the tree and start discovering its folders.
+
+        Only the root level is listed here; deeper folders are listed when
+        expanded. The full folder walk that detects new and removed folders
+        runs on the worker pool (see :meth:`apply_discovered_directories`).
+        """
         tree = self._tab.source_tree
-        tree.clear()
-        self._source_tree_nodes.clear()
+        model = self._tab.source_model
+        self._cancel_directory_discovery()
         project_manager = self._project_manager
 
         if not project_manager:
+            model.clear()
             tree.setDisabled(True)
             self.set_root_warning([])
             return
 
         root_path = self.resolve_source_root()
         if not root_path or not root_path.exists():
+            model.clear()
             tree.setDisabled(True)
             warning = [
                 "Source folder missing. Update the project location to resume scanning."
@@ -270,34 +292,33 @@ class DocumentsController:
             self.normalise_relative_path(path)
             for path in (project_manager.source_state.selected_folders or [])
         }
-        acknowledged_set = {
-            self.normalise_relative_path(path)
-            for path in (project_manager.source_state.acknowledged_folders or [])
-        }
 
         self._current_warnings = self.compute_root_warnings(root_path)
         self.set_root_warning(self._current_warnings)
         project_manager.update_source_state(warnings=self._current_warnings)
 
         root_label = root_path.name or root_path.as_posix()
-        root_item = QTreeWidgetItem([root_label])
-        root_item.setData(0, Qt.UserRole, ("root", ""))
-        self.apply_directory_flags(root_item)
-        root_item.setCheckState(0, Qt.Checked if "" in selected_set else Qt.Unchecked)
-        self._source_tree_nodes[""] = root_item
-        tree.addTopLevelItem(root_item)
-
-        processed_dirs: Set[Path] = set()
-        self._populate_directory_contents(
-            parent_item=root_item,
-            directory=root_path,
-            processed=processed_dirs,
-            root_path=root_path,
-            selected=selected_set,
-        )
-        tree.expandItem(root_item)
+        model.set_root(root_path, root_label, selected_set)
+        for relative in self._new_directory_alerts:
+            model.set_new_directory(relative, True)
+        tree.expand(model.root_index())
+
+        self._start_directory_discovery(root_path)
 
-        all_directories = {self.normalise_relative_path(entry) for entry in self.iter_directories(root_path)}
+    def apply_discovered_directories(self, directories: Sequence[str]) -> None:
+        """Reconcile the folders found under the source root with the project state."""
+        project_manager = self._project_manager
+        if not project_manager:
+            return
+        selected_set = {
+            self.normalise_relative_path(path)
+            for path in (project_manager.source_state.selected_folders or [])
+        }
+        acknowledged_set = {
+            self.normalise_relative_path(path)
+            for path in (project_manager.source_state.acknowledged_folders or [])
+        }
+        all_directories = {self.normalise_relative_path(entry) for entry in directories}
         known_set = {
             self.normalise_relative_path(entry)
             for entry in (project_manager.source_state.known_folders or [])
@@ -309,8 +330,9 @@ class DocumentsController:
                 project_manager.update_source_state(acknowledged_folders=initial_ack)
 
         new_directories = sorted(path for path in all_directories if path and path not in known_set)
+        expand = len(new_directories) <= _MAX_EXPANDED_NEW_DIRECTORIES
         for relative in new_directories:
-            self.mark_directory_as_new(relative)
+            self.mark_directory_as_new(relative, expand=expand)
         if new_directories:
             self.prompt_for_new_directories(new_directories)
 
@@ -324,31 +346,13 @@ class DocumentsController:
         if known_snapshot != (project_manager.source_state.known_folders or []):
             project_manager.update_source_state(known_folders=known_snapshot)
 
-    def handle_source_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
-        if column != 0 or self._block_source_tree_signal:
-            return
-
-        data = item.data(0, Qt.UserRole)
-        if not data:
-            return
-        node_type, relative = data
-        if node_type not in {"dir", "root"}:
-            return
-
-        state = item.checkState(0)
-        self._block_source_tree_signal = True
-        try:
-            if state in (Qt.Checked, Qt.Unchecked):
-                self.cascade_source_check_state(item, state)
-                self.update_parent_source_state(item.parent())
-        finally:
-            self._block_source_tree_signal = False
-
+    def handle_source_check_changed(self, node_type: str, relative: str) -> None:
         self.update_selected_folders_from_tree()
         if node_type == "dir" and relative:
             self.acknowledge_directories([relative])
 
-    def schedule_file_tracker_refresh(self) -> None:
+    def schedule_file_tracker_refresh(self, folders: Optional[Sequence[str]] = None) -> None:
+        self._pending_refresh_folders.update(TRACKED_FOLDERS if folders is None else folders)
         if self._pending_file_tracker_refresh:
             return
         self._pending_file_tracker_refresh = True
@@ -356,9 +360,69 @@ class DocumentsController:
 
     def run_scheduled_file_tracker_refresh(self) -> None:
         self._pending_file_tracker_refresh = False
-        metrics = self.refresh_file_tracker()
+        folders = sorted(self._pending_refresh_folders)
+        self._pending_refresh_folders.clear()
+        if not folders:
+            return
+        metrics = self.refresh_file_tracker(folders)
         if metrics is not None:
             self._workspace._workspace_metrics = metrics  # keep stage state in sync
+            feature_flags = getattr(self._workspace, "_feature_flags", None)
+            if feature_flags and feature_flags.bulk_analysis_groups_enabled:
+                self._workspace._refresh_bulk_analysis_groups()
+
+    def _start_directory_discovery(self, root_path: Path) -> None:
+        generation = self._discovery_generation
+        worker = SourceScanWorker(root_path, is_skipped=is_skipped_source_name)
+        worker.finished.connect(
+            lambda directories, w=worker, g=generation: self._on_directories_discovered(w, g, directories)
+        )
+        self._workspace._workers.start(self._DISCOVERY_KEY, worker)
+
+    def _on_directories_discovered(self, worker: SourceScanWorker, generation: int, directories: list) -> None:
+        if self._workspace._workers.get(self._DISCOVERY_KEY) is worker:
+            self._workspace._workers.pop(self._DISCOVERY_KEY)
+        if isValid(worker):
+            worker.deleteLater()
+        if generation != self._discovery_generation:
+            return
+        self.apply_discovered_directories(directories)
+
+    def _start_watching(self, project_dir: Optional[Path]) -> None:
+        # Listing the tracked folders can take seconds on large projects, so
+        # it runs on the pool and the watches are added once it finishes.
+        self._cancel_watch_scan()
+        self._watcher.stop()
+        if project_dir is None:
+            return
+        generation = self._watch_generation
+        worker = WatchScanWorker(Path(project_dir), limit=self._watcher.max_directories)
+        worker.finished.connect(
+            lambda directories, w=worker, g=generation, p=Path(project_dir): self._on_watch_directories_listed(
+                w, g, p, directories
+            )
+        )
+        self._workspace._workers.start(self._WATCH_SCAN_KEY, worker)
+
+    def _on_watch_directories_listed(
+        self, worker: WatchScanWorker, generation: int, project_dir: Path, directories: list
+    ) -> None:
+        if self._workspace._workers.get(self._WATCH_SCAN_KEY) is worker:
+            self._workspace._workers.pop(self._WATCH_SCAN_KEY)
+        if isValid(worker):
+            worker.deleteLater()
+        if generation != self._watch_generation:
+            return
+        self._watcher.watch(project_dir, directories)
+
+    def _cancel_watch_scan(self) -> None:
+        self._watch_generation += 1
+        self._workspace._workers.cancel(self._WATCH_SCAN_KEY)
+
+    def _cancel_directory_discovery(self) -> None:
+        # Results of a scan started for an earlier tree are ignored.
+        self._discovery_generation += 1
+        self._workspace._workers.cancel(self._DISCOVERY_KEY)
 
     def resolve_source_root(self) -> Optional[Path]:
         project_manager = self._project_manager
@@ -446,86 +510,16 @@ class DocumentsController:
     # ------------------------------------------------------------------
     # Tree helpers (adapted from original ProjectWorkspace implementation)
     # ------------------------------------------------------------------
-    def populate_directory_contents(self, *args, **kwargs) -> None:
-        self._populate_directory_contents(*args, **kwargs)
-
-    def _populate_directory_contents(
-        self,
-        parent_item: QTreeWidgetItem,
-        directory: Path,
-        processed: Set[Path],
-        root_path: Path,
-        selected: Set[str],
-    ) -> None:
-        directory = directory.resolve()
-        if directory in processed:
-            return
-        processed.add(directory)
-
-        try:
-            entries = sorted(
-                directory.iterdir(),
-                key=lambda entry: (not entry.is_dir(), entry.name.lower()),
-            )
-        except Exception:
-            return
-
-        for entry in entries:
-            if self.should_skip_source_entry(entry):
-                continue
-            try:
-                relative = entry.relative_to(root_path).as_posix()
-            except ValueError:
-                continue
-
-            if entry.is_dir():
-                node = self._source_tree_nodes.get(relative)
-                if node is None:
-                    node = QTreeWidgetItem([entry.name])
-                    node.setData(0, Qt.UserRole, ("dir", relative))
-                    self.apply_directory_flags(node)
-                    node.setCheckState(
-                        0,
-                        Qt.Checked if self.is_path_tracked(relative, selected) else Qt.Unchecked,
-                    )
-                    self._source_tree_nodes[relative] = node
-                    parent_item.addChild(node)
-                else:
-                    self.apply_directory_flags(node)
-                self._populate_directory_contents(node, entry, processed, root_path, selected)
-            else:
-                file_item = QTreeWidgetItem([entry.name])
-                file_item.setData(0, Qt.UserRole, ("file", relative))
-                file_item.setFlags(file_item.flags() & ~Qt.ItemIsUserCheckable)
-                parent_item.addChild(file_item)
-
     def iter_directories(self, root_path: Path) -> List[str]:
-        results: List[str] = []
-        for path in root_path.rglob("*"):
-            if path.is_dir():
-                try:
-                    rel = path.relative_to(root_path).as_posix()
-                except ValueError:
-                    continue
-                results.append(rel)
-        return results
+        return list_source_directories(root_path, is_skipped=is_skipped_source_name) or []
 
     def normalise_relative_path(self, path: str) -> str:
         if not path:
             return ""
         return Path(path.strip("/")).as_posix()
 
-    def apply_directory_flags(self, item: QTreeWidgetItem) -> None:
-        flags = item.flags()
-        flags |= ITEM_IS_ENABLED | ITEM_IS_USER_CHECKABLE
-        flags &= ~ITEM_IS_TRISTATE
-        item.setFlags(flags)
-
     def should_skip_source_entry(self, entry: Path) -> bool:
-        return any(
-            part in {".azure-di", ".azure_di"} or part.startswith(".azure-di") or part.startswith(".azure_di")
-            for part in entry.parts
-        )
+        return any(is_skipped_source_name(part) for part in entry.parts)
 
     def is_path_tracked(self, relative: str, tracked: Set[str]) -> bool:
         candidate = self.normalise_relative_path(relative)
@@ -559,24 +553,21 @@ class DocumentsController:
             new_entries.append(normalized)
         return sorted(new_entries)
 
-    def mark_directory_as_new(self, relative: str) -> None:
+    def mark_directory_as_new(self, relative: str, *, expand: bool = True) -> None:
         normalized = self.normalise_relative_path(relative)
         if not normalized:
             return
-        item = self._source_tree_nodes.get(normalized)
-        if not item:
-            return
-        item.setBackground(0, QBrush(QColor("#fff3bf")))
+        self._tab.source_model.set_new_directory(normalized, True)
         self._new_directory_alerts.add(normalized)
-        self.expand_to_item(item)
+        if expand:
+            self.expand_to_directory(normalized)
 
     def clear_new_directory_marker(self, relative: str) -> None:
         normalized = self.normalise_relative_path(relative)
         if not normalized:
             return
-        item = self._source_tree_nodes.get(normalized)
-        if item:
-            item.setBackground(0, QBrush())
+        if normalized in self._new_directory_alerts:
+            self._tab.source_model.set_new_directory(normalized, False)
         self._new_directory_alerts.discard(normalized)
 
     def acknowledge_directories(self, directories: Sequence[str]) -> None:
@@ -629,11 +620,15 @@ class DocumentsController:
         finally:
             self._new_dir_prompt_active = False
 
-    def expand_to_item(self, item: QTreeWidgetItem) -> None:
+    def expand_to_directory(self, relative: str) -> None:
+        """Expand the ancestors of ``relative`` so its row is visible."""
         tree = self._tab.source_tree
-        current = item.parent()
-        while current:
-            tree.expandItem(current)
+        index = self._tab.source_model.index_for_directory(relative)
+        if not index.isValid():
+            return
+        current = index.parent()
+        while current.isValid():
+            tree.expand(current)
             current = current.parent()
 
     def highlight_directory_item(self, relative: str) -> None:
@@ -641,12 +636,12 @@ class DocumentsController:
         normalized = self.normalise_relative_path(relative)
         if not normalized:
             return
-        item = self._source_tree_nodes.get(normalized)
-        if not item:
+        index = self._tab.source_model.index_for_directory(normalized)
+        if not index.isValid():
             return
-        tree.setCurrentItem(item)
-        self.expand_to_item(item)
-        tree.scrollToItem(item)
+        tree.setCurrentIndex(index)
+        self.expand_to_directory(normalized)
+        tree.scrollTo(index)
 
     def handle_missing_directories(self, missing: Sequence[str]) -> None:
         project_manager = self._project_manager
@@ -699,33 +694,6 @@ class DocumentsController:
                 if candidate.exists() and not any(candidate.iterdir()):
                     shutil.rmtree(candidate, ignore_errors=True)
 
-    def cascade_source_check_state(self, item: QTreeWidgetItem, state: Qt.CheckState) -> None:
-        for index in range(item.childCount()):
-            child = item.child(index)
-            if child.flags() & Qt.ItemIsUserCheckable:
-                child.setCheckState(0, state)
-            self.cascade_source_check_state(child, state)
-
-    def update_parent_source_state(self, item: Optional[QTreeWidgetItem]) -> None:
-        while item is not None and item.flags() & Qt.ItemIsUserCheckable:
-            checked = unchecked = 0
-            for index in range(item.childCount()):
-                child_state = item.child(index).checkState(0)
-                if child_state == Qt.Checked:
-                    checked += 1
-                elif child_state == Qt.Unchecked:
-                    unchecked += 1
-                else:
-                    checked += 1
-                    unchecked += 1
-            if checked and unchecked:
-                item.setCheckState(0, Qt.PartiallyChecked)
-            elif checked:
-                item.setCheckState(0, Qt.Checked)
-            else:
-                item.setCheckState(0, Qt.Unchecked)
-            item = item.parent()
-
     def update_selected_folders_from_tree(self) -> None:
         project_manager = self._project_manager
         if not project_manager:
@@ -746,24 +714,7 @@ class DocumentsController:
             self._workspace._refresh_bulk_analysis_groups()
 
     def collect_selected_directories(self) -> List[str]:
-        tree = self._tab.source_tree
-        results: Set[str] = set()
-        root = tree.invisibleRootItem()
-        for index in range(root.childCount()):
-            self.collect_selected_directories_from_item(root.child(index), results)
-        return sorted(results)
-
-    def collect_selected_directories_from_item(self, item: QTreeWidgetItem, results: Set[str]) -> None:
-        data = item.data(0, Qt.UserRole)
-        if not data:
-            return
-        node_type, relative = data
-        state = item.checkState(0)
-        if node_type == "dir" and state == Qt.Checked:
-            results.add(self.normalise_relative_path(relative))
-            return
-        for index in range(item.childCount()):
-            self.collect_selected_directories_from_item(item.child(index), results)
+        return self._tab.source_model.selected_directories()
 
     # ------------------------------------------------------------------
     # Warning helpers
@@ -7,13 +7,13 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
 from src.app.ui.widgets import SmartBanner
+from src.app.ui.workspace.source_tree_model import SourceTreeModel
 
 
 class DocumentsTab(QWidget):
@@ -36,7 +36,9 @@ class DocumentsTab(QWidget):
 
         self.rescan_button = QPushButton("Re-scan")
 
-        self.source_tree = QTreeWidget()
+        self.source_model = SourceTreeModel(self)
+        self.source_tree = QTreeView()
+        self.source_tree.setModel(self.source_model)
         self.source_tree.setHeaderHidden(True)
         self.source_tree.setSelectionMode(QAbstractItemView.NoSelection)
         self.source_tree.setUniformRowHeights(True)
@@ -83,11 +85,3 @@ class DocumentsTab(QWidget):
         layout.addWidget(self.bulk_banner)
 
         layout.addStretch()
-
-    # Convenience accessors for code that still expects specific widget types
-    # ------------------------------------------------------------------
-    def add_top_level_item(self, item: QTreeWidgetItem) -> None:
-        self.source_tree.addTopLevelItem(item)
-
-    def clear_tree(self) -> None:
-        self.source_tree.clear()
@@ -36,7 +36,9 @@ class HighlightsService:
         if not jobs:
             return False
 
-        worker = HighlightWorker(jobs)
+        # Jobs cover every selected PDF with converted output, which is what the
+        # color aggregates should reflect.
+        worker = HighlightWorker(jobs, selected_sources=[job.pdf_relative for job in jobs])
 
         worker.progress.connect(on_progress)
         worker.file_failed.connect(on_failed)
@@ -10,7 +10,11 @@ from shiboken6 import isValid
 
 from src.app.core.project_manager import ProjectMetadata
 from src.app.workers import WorkerCoordinator
-from src.app.workers.report_worker import DraftReportWorker, ReportRefinementWorker
+from src.app.workers.report_worker import (
+    DEFAULT_MAX_CONCURRENT_SECTIONS,
+    DraftReportWorker,
+    ReportRefinementWorker,
+)
 
 
 @dataclass(slots=True)
@@ -31,6 +35,7 @@ class ReportDraftJobConfig:
     max_report_tokens: int = 60_000
     placeholder_values: Mapping[str, str] | None = None
     project_name: str = ""
+    max_concurrent_sections: int = DEFAULT_MAX_CONCURRENT_SECTIONS
 
 
 @dataclass(slots=True)
@@ -103,6 +108,7 @@ class ReportsService:
             max_report_tokens=config.max_report_tokens,
             placeholder_values=config.placeholder_values,
             project_name=config.project_name,
+            max_concurrent_sections=config.max_concurrent_sections,
         )
 
         return self._start_worker(
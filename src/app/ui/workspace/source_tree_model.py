@@ -0,0 +1,354 @@
+"""Lazily populated item model for the Documents tab source tree."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt, Signal
+from PySide6.QtGui import QBrush, QColor
+
+from src.app.ui.workspace.qt_flags import ITEM_IS_ENABLED, ITEM_IS_USER_CHECKABLE
+
+NEW_DIRECTORY_COLOR = "#fff3bf"
+
+# Listings of directories modified this recently are not cached: another
+# change within the same timestamp tick would go unnoticed.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_skipped_source_name(name: str) -> bool:
+    """Return True for entries hidden from the source tree (Azure DI sidecars)."""
+    return name.startswith(".azure-di") or name.startswith(".azure_di")
+
+
+class DirectoryListingCache:
+    """Cache ``os.scandir`` listings, reused while a directory's mtime is unchanged."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[int, List[str], List[str]]] = {}
+
+    def listing(self, directory: Path) -> Tuple[List[str], List[str]]:
+        """Return sorted ``(subdirectory names, file names)`` for ``directory``."""
+        key = str(directory)
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._entries.pop(key, None)
+            return [], []
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        dirs: List[str] = []
+        files: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if is_skipped_source_name(entry.name):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                        else:
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return [], []
+        dirs.sort(key=str.lower)
+        files.sort(key=str.lower)
+        if time.time_ns() - mtime_ns > _RACY_WINDOW_NS:
+            self._entries[key] = (mtime_ns, dirs, files)
+        return dirs, files
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _Node:
+    __slots__ = ("name", "kind", "relative", "parent", "row", "children", "by_name", "fetched", "check_state")
+
+    def __init__(self, name: str, kind: str, relative: str, parent: Optional["_Node"], row: int) -> None:
+        self.name = name
+        self.kind = kind
+        self.relative = relative
+        self.parent = parent
+        self.row = row
+        self.children: List[_Node] = []
+        self.by_name: Dict[str, _Node] = {}
+        self.fetched = kind == "file"
+        self.check_state = Qt.Unchecked
+
+
+class SourceTreeModel(QAbstractItemModel):
+    """Directory tree of the project's source root, listed on demand.
+
+    Only the root level is listed up front; other directories are listed the
+    first time the view expands them (``canFetchMore``/``fetchMore``). Check
+    states of directories that have not been listed yet are derived from the
+    selected folder set, so selections below collapsed folders are preserved
+    by :meth:`selected_directories`.
+    """
+
+    # Emitted after the user toggles a directory: (node type, relative path).
+    check_state_changed = Signal(str, str)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._invisible = _Node("", "invisible", "", None, 0)
+        self._invisible.fetched = True
+        self._root_path: Optional[Path] = None
+        self._selected: Set[str] = set()
+        self._new_directories: Set[str] = set()
+        self._listings = DirectoryListingCache()
+
+    # ------------------------------------------------------------------
+    # Population
+    # ------------------------------------------------------------------
+    def set_root(self, root_path: Path, label: str, selected: Iterable[str]) -> None:
+        """Show ``root_path`` with ``selected`` folders checked; only its first level is listed."""
+        self.beginResetModel()
+        self._root_path = root_path
+        self._selected = {entry for entry in selected}
+        self._invisible = _Node("", "invisible", "", None, 0)
+        self._invisible.fetched = True
+        root = _Node(label, "root", "", self._invisible, 0)
+        root.check_state = self._initial_state("")
+        self._invisible.children.append(root)
+        self._fetch(root)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._root_path = None
+        self._selected = set()
+        self._new_directories.clear()
+        self._invisible = _Node("", "invisible", "", None, 0)
+        self._invisible.fetched = True
+        self._listings.clear()
+        self.endResetModel()
+
+    def root_index(self) -> QModelIndex:
+        if not self._invisible.children:
+            return QModelIndex()
+        return self.createIndex(0, 0, self._invisible.children[0])
+
+    def index_for_directory(self, relative: str) -> QModelIndex:
+        """Return the index of directory ``relative``, listing its ancestors as needed."""
+        if not self._invisible.children:
+            return QModelIndex()
+        node = self._invisible.children[0]
+        for part in [part for part in relative.split("/") if part]:
+            if not node.fetched:
+                self.fetchMore(self.createIndex(node.row, 0, node))
+            child = node.by_name.get(part)
+            if child is None or child.kind != "dir":
+                return QModelIndex()
+            node = child
+        return self.createIndex(node.row, 0, node)
+
+    # ------------------------------------------------------------------
+    # Selection and markers
+    # ------------------------------------------------------------------
+    def selected_directories(self) -> List[str]:
+        """Return the topmost checked directories, including those below unlisted folders."""
+        results: Set[str] = set()
+        pending = list(self._invisible.children)
+        while pending:
+            node = pending.pop()
+            if node.kind == "dir" and node.check_state == Qt.Checked:
+                results.add(node.relative)
+                continue
+            if node.kind in {"dir", "root"} and not node.fetched:
+                if node.check_state != Qt.Unchecked:
+                    prefix = f"{node.relative}/" if node.relative else ""
+                    results.update(entry for entry in self._selected if entry and entry.startswith(prefix))
+                continue
+            pending.extend(child for child in node.children if child.kind != "file")
+        return sorted(results)
+
+    def set_new_directory(self, relative: str, is_new: bool) -> None:
+        if is_new:
+            self._new_directories.add(relative)
+        else:
+            self._new_directories.discard(relative)
+        node = self._loaded_directory(relative)
+        if node is not None:
+            index = self.createIndex(node.row, 0, node)
+            self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel
+    # ------------------------------------------------------------------
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self._node(parent)
+        if column != 0 or row < 0 or row >= len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._invisible:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        if node.kind == "file":
+            return False
+        return bool(node.children) or not node.fetched
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not self._node(parent).fetched
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        node = self._node(parent)
+        if node.fetched:
+            return
+        dirs, files = self._listings.listing(self._path(node))
+        if dirs or files:
+            self.beginInsertRows(parent, 0, len(dirs) + len(files) - 1)
+            self._populate(node, dirs, files)
+            self.endInsertRows()
+        node.fetched = True
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node: _Node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.name
+        if role == Qt.CheckStateRole and node.kind != "file":
+            return node.check_state
+        if role == Qt.UserRole:
+            return (node.kind, node.relative)
+        if role == Qt.BackgroundRole and node.kind == "dir" and node.relative in self._new_directories:
+            return QBrush(QColor(NEW_DIRECTORY_COLOR))
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalPointer().kind == "file":
+            return ITEM_IS_ENABLED
+        return ITEM_IS_ENABLED | ITEM_IS_USER_CHECKABLE
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        node: _Node = index.internalPointer()
+        if node.kind == "file":
+            return False
+        state = value if isinstance(value, Qt.CheckState) else Qt.CheckState(int(value))
+        if state == Qt.PartiallyChecked:
+            state = Qt.Checked
+        node.check_state = state
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self._cascade(node, state)
+        self._update_ancestors(node.parent)
+        self.check_state_changed.emit(node.kind, node.relative)
+        return True
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _node(self, index: QModelIndex) -> _Node:
+        if index.isValid():
+            return index.internalPointer()
+        return self._invisible
+
+    def _path(self, node: _Node) -> Path:
+        assert self._root_path is not None
+        return self._root_path / node.relative if node.relative else self._root_path
+
+    def _fetch(self, node: _Node) -> None:
+        dirs, files = self._listings.listing(self._path(node))
+        self._populate(node, dirs, files)
+        node.fetched = True
+
+    def _populate(self, node: _Node, dirs: List[str], files: List[str]) -> None:
+        prefix = f"{node.relative}/" if node.relative else ""
+        for name in dirs:
+            child = _Node(name, "dir", prefix + name, node, len(node.children))
+            if node.check_state == Qt.PartiallyChecked:
+                child.check_state = self._initial_state(child.relative)
+            else:
+                child.check_state = node.check_state
+            node.children.append(child)
+            node.by_name[name] = child
+        for name in files:
+            child = _Node(name, "file", prefix + name, node, len(node.children))
+            node.children.append(child)
+            node.by_name.setdefault(name, child)
+
+    def _initial_state(self, relative: str) -> Qt.CheckState:
+        if "" in self._selected:
+            return Qt.Checked
+        if relative:
+            candidate = relative
+            while candidate:
+                if candidate in self._selected:
+                    return Qt.Checked
+                candidate = candidate.rpartition("/")[0]
+        prefix = f"{relative}/" if relative else ""
+        if any(entry.startswith(prefix) for entry in self._selected if entry):
+            return Qt.PartiallyChecked
+        return Qt.Unchecked
+
+    def _cascade(self, node: _Node, state: Qt.CheckState) -> None:
+        pending = [node]
+        while pending:
+            current = pending.pop()
+            directories = [child for child in current.children if child.kind == "dir"]
+            for child in directories:
+                child.check_state = state
+                pending.append(child)
+            if directories:
+                first = self.createIndex(0, 0, current.children[0])
+                last = self.createIndex(len(current.children) - 1, 0, current.children[-1])
+                self.dataChanged.emit(first, last, [Qt.CheckStateRole])
+
+    def _update_ancestors(self, node: Optional[_Node]) -> None:
+        while node is not None and node.kind in {"dir", "root"}:
+            # Files cannot be selected, so a folder with files of its own is
+            # only partially covered by its checked subfolders.
+            states = {child.check_state if child.kind == "dir" else Qt.Unchecked for child in node.children}
+            if not states:
+                break
+            if states == {Qt.Checked}:
+                state = Qt.Checked
+            elif states == {Qt.Unchecked}:
+                state = Qt.Unchecked
+            else:
+                state = Qt.PartiallyChecked
+            if state != node.check_state:
+                node.check_state = state
+                index = self.createIndex(node.row, 0, node)
+                self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            node = node.parent
+
+    def _loaded_directory(self, relative: str) -> Optional[_Node]:
+        if not self._invisible.children:
+            return None
+        node = self._invisible.children[0]
+        for part in [part for part in relative.split("/") if part]:
+            node = node.by_name.get(part)
+            if node is None:
+                return None
+        return node
+
+
+__all__ = ["DirectoryListingCache", "SourceTreeModel", "is_skipped_source_name"]
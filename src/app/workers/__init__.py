@@ -8,6 +8,7 @@ from .highlight_worker import HighlightWorker
 from .pool import get_worker_pool
 from .coordinator import WorkerCoordinator
 from .report_worker import DraftReportWorker, ReportRefinementWorker
+from .source_scan_worker import SourceScanWorker, WatchScanWorker
 
 __all__ = [
     "DashboardWorker",
@@ -19,4 +20,6 @@ __all__ = [
     "WorkerCoordinator",
     "get_worker_pool",
     "BulkReduceWorker",
+    "SourceScanWorker",
+    "WatchScanWorker",
 ]
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
-from typing import Final
+from typing import Awaitable, Final, TypeVar
 from uuid import uuid4
 
 from PySide6.QtCore import QObject, QRunnable
 
+from src.common.llm.base import aclose_async_clients
+
+_T = TypeVar("_T")
+
+# How often a running event loop checks for a cancel request.
+_CANCEL_POLL_SECONDS = 0.1
+
 
 class DashboardWorker(QObject, QRunnable):
     """Base class for QRunnable-based workers used in the dashboard.
@@ -43,6 +51,30 @@ class DashboardWorker(QObject, QRunnable):
         """Return True if cancellation has been requested."""
         return self._cancel_event.is_set()
 
+    def run_async(self, awaitable: Awaitable[_T]) -> _T:
+        """Drive ``awaitable`` to completion on a private loop in this thread.
+
+        Lets a worker keep many async provider requests in flight from its
+        single pool thread. A cancel request cancels the awaitable, so
+        in-flight requests are abandoned and ``asyncio.CancelledError`` is
+        raised to the caller. Provider async clients created on the loop are
+        closed before it finishes.
+        """
+
+        async def _watch() -> _T:
+            task = asyncio.ensure_future(awaitable)
+            try:
+                while not task.done():
+                    await asyncio.wait({task}, timeout=_CANCEL_POLL_SECONDS)
+                    if not task.done() and self._cancel_event.is_set():
+                        task.cancel()
+                        break
+                return await task
+            finally:
+                await aclose_async_clients()
+
+        return asyncio.run(_watch())
+
     def run(self) -> None:  # pragma: no cover - thin wrapper around subclass logic
         try:
             self.logger.info("%s started", self.job_tag)
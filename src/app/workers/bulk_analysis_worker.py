@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import frontmatter
 from PySide6.QtCore import Signal
@@ -18,20 +20,30 @@ from src.app.core.bulk_analysis_runner import (
     BulkAnalysisCancelled,
     BulkAnalysisDocument,
     PromptBundle,
+    amap_bounded,
+    chunk_token_budget,
     combine_chunk_summaries,
     generate_chunks,
+    group_concurrency,
     load_prompts,
+    lookup_cached_response,
+    map_bounded,
     prepare_documents,
     render_system_prompt,
     render_user_prompt,
+    response_content,
     should_chunk,
 )
+from src.app.core.bulk_paths import token_cache_path
 from src.app.core.bulk_prompt_context import build_bulk_placeholders
+from src.app.core.markdown_stream import StreamedMarkdown, should_stream
 from src.app.core.placeholders.system import SourceFileContext
 from src.app.core.project_manager import ProjectMetadata
 from src.app.core.secure_settings import SecureSettings
 from src.common.llm.base import BaseLLMProvider
 from src.common.llm.factory import create_provider
+from src.common.llm.response_cache import ResponseCache, open_response_cache
+from src.common.llm.tokens import TokenCounter
 from src.common.markdown import (
     PromptReference,
     SourceReference,
@@ -43,6 +55,7 @@ from src.common.markdown import (
 
 from .base import DashboardWorker
 from .checkpoint_manager import CheckpointManager, _sha256
+from .manifest_store import ManifestJournal
 
 
 @dataclass(frozen=True)
@@ -91,14 +104,8 @@ def _default_manifest() -> Dict[str, object]:
     return {"version": _MANIFEST_VERSION, "signature": None, "documents": {}}
 
 
-def _load_manifest(path: Path) -> Dict[str, object]:
-    if not path.exists():
-        return _default_manifest()
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return _default_manifest()
-
+def _load_manifest(path: Path, journal: Optional[ManifestJournal] = None) -> Dict[str, object]:
+    data = (journal or ManifestJournal(path)).load()
     if not isinstance(data, dict):
         return _default_manifest()
 
@@ -113,14 +120,14 @@ def _load_manifest(path: Path) -> Dict[str, object]:
     }
 
 
-def _save_manifest(path: Path, manifest: Dict[str, object]) -> None:
+def _save_manifest(path: Path, manifest: Dict[str, object], journal: Optional[ManifestJournal] = None) -> None:
+    """Atomically write the full manifest snapshot, folding in any journaled updates."""
     payload = {
         "version": _MANIFEST_VERSION,
         "signature": manifest.get("signature"),
         "documents": manifest.get("documents", {}),
     }
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    (journal or ManifestJournal(path)).compact(payload)
 
 
 def _stable_placeholders(placeholders: Mapping[str, str]) -> Dict[str, str]:
@@ -218,6 +225,10 @@ class BulkAnalysisWorker(DashboardWorker):
         self._base_placeholders = dict(placeholder_values or {})
         self._project_name = project_name
         self._run_timestamp = datetime.now(timezone.utc)
+        # Guards the in-memory manifest when documents run concurrently
+        self._manifest_lock = threading.RLock()
+        self._response_cache: Optional[ResponseCache] = None
+        self._manifest_journal: Optional[ManifestJournal] = None
 
     # ------------------------------------------------------------------
     # QRunnable API
@@ -299,6 +310,7 @@ class BulkAnalysisWorker(DashboardWorker):
         skipped = 0
         manifest: Optional[Dict[str, object]] = None
         manifest_path: Optional[Path] = None
+        checkpoint_mgr: Optional[CheckpointManager] = None
 
         try:
             documents = prepare_documents(self._project_dir, self._group, self._files)
@@ -328,6 +340,7 @@ class BulkAnalysisWorker(DashboardWorker):
             provider = self._create_provider(provider_config, system_prompt)
             if provider is None:
                 raise RuntimeError("Bulk analysis provider failed to initialise")
+            self._response_cache = open_response_cache(SecureSettings().get("llm_response_cache", {}))
 
             prompt_hash = _compute_prompt_hash(
                 bundle,
@@ -336,6 +349,7 @@ class BulkAnalysisWorker(DashboardWorker):
                 self._metadata,
                 placeholder_values=self._base_placeholders,
             )
+            TokenCounter.enable_disk_cache(token_cache_path(self._project_dir))
             slug = getattr(self._group, "slug", None) or self._group.folder_name
             checkpoint_mgr = CheckpointManager(
                 self._project_dir / "bulk_analysis" / slug / "map" / "checkpoints"
@@ -345,14 +359,18 @@ class BulkAnalysisWorker(DashboardWorker):
                 "placeholders": _stable_placeholders(self._serialise_placeholders(global_placeholders)),
             }
             manifest_path = _manifest_path(self._project_dir, self._group)
-            manifest = _load_manifest(manifest_path)
+            journal = self._journal_for(manifest_path)
+            manifest = _load_manifest(manifest_path, journal)
             if manifest.get("version") != _MANIFEST_VERSION or manifest.get("signature") != signature:
                 checkpoint_mgr.clear_all()
                 manifest = _default_manifest()
-            manifest["signature"] = signature
+                manifest["signature"] = signature
+                # Journaled updates below must apply to the new signature.
+                _save_manifest(manifest_path, manifest, journal)
             entries = manifest.setdefault("documents", {})  # type: ignore[arg-type]
 
-            for index, document in enumerate(documents, start=1):
+            pending: List[Tuple[BulkAnalysisDocument, float]] = []
+            for document in documents:
                 if self.is_cancelled():
                     raise BulkAnalysisCancelled
 
@@ -379,52 +397,33 @@ class BulkAnalysisWorker(DashboardWorker):
                     self.progress.emit(progress_count, total, document.relative_path)
                     continue
 
-                try:
-                    summary, run_details, doc_placeholders = self._process_document(
-                        provider,
-                        provider_config,
-                        bundle,
-                        system_prompt,
-                        document,
-                        global_placeholders,
-                        checkpoint_mgr,
-                        manifest,
-                        prompt_hash,
-                        manifest_path,
-                    )
-                except BulkAnalysisCancelled:
-                    raise
-                except Exception as exc:  # noqa: BLE001 - propagate via signal
-                    failures += 1
-                    self.logger.exception("%s failed %s", self.job_tag, document.source_path)
-                    self.file_failed.emit(document.relative_path, str(exc))
-                else:
-                    try:
-                        document.output_path.parent.mkdir(parents=True, exist_ok=True)
-                        written_at = datetime.now(timezone.utc)
-                        metadata = self._build_summary_metadata(
-                            document,
-                            provider_config,
-                            prompt_hash,
-                            run_details,
-                            created_at=written_at,
-                        )
-                        updated = apply_frontmatter(summary, metadata, merge_existing=True)
-                        document.output_path.write_text(updated, encoding="utf-8")
-                    except Exception as exc:  # noqa: BLE001 - propagate via signal
-                        failures += 1
-                        self.logger.exception("%s write failed %s", self.job_tag, document.output_path)
-                        self.file_failed.emit(document.relative_path, str(exc))
-                    else:
-                        successes += 1
-                        ran_timestamp = written_at.isoformat()
-                        entries[document.relative_path] = {
-                            "source_mtime": round(source_mtime, 6),
-                            "prompt_hash": prompt_hash,
-                            "ran_at": ran_timestamp,
-                            "placeholders": self._serialise_placeholders(doc_placeholders),
-                        }
+                pending.append((document, source_mtime))
+
+            def _execute(item: Tuple[BulkAnalysisDocument, float]) -> bool:
+                if self.is_cancelled():
+                    raise BulkAnalysisCancelled
+                document, source_mtime = item
+                return self._execute_document(
+                    provider,
+                    provider_config,
+                    bundle,
+                    system_prompt,
+                    document,
+                    source_mtime,
+                    global_placeholders,
+                    checkpoint_mgr,
+                    manifest,
+                    prompt_hash,
+                    manifest_path,
+                )
 
+            def _record(position: int, succeeded: bool) -> None:
+                nonlocal successes, failures
+                document = pending[position][0]
+                if succeeded:
+                    successes += 1
+                else:
+                    failures += 1
                 progress_count = successes + failures + skipped
                 self.logger.debug(
                     "%s progress %s/%s %s",
@@ -435,6 +434,19 @@ class BulkAnalysisWorker(DashboardWorker):
                 )
                 self.progress.emit(progress_count, total, document.relative_path)
 
+            concurrency = group_concurrency(self._group, "max_concurrent_documents")
+            if concurrency > 1 and len(pending) > 1:
+                self.log_message.emit(
+                    f"Processing {len(pending)} document(s) with up to {concurrency} in flight"
+                )
+            map_bounded(
+                pending,
+                _execute,
+                max_workers=concurrency,
+                on_complete=_record,
+                thread_name_prefix=f"bulk-{self.job_id}",
+            )
+
         except BulkAnalysisCancelled:
             self.log_message.emit("Bulk analysis run cancelled.")
             self.logger.info("%s cancelled", self.job_tag)
@@ -447,11 +459,16 @@ class BulkAnalysisWorker(DashboardWorker):
                 provider.deleteLater()
             if manifest is not None and manifest_path is not None:
                 try:
-                    _save_manifest(manifest_path, manifest)
+                    with self._manifest_lock:
+                        _save_manifest(manifest_path, manifest, self._journal_for(manifest_path))
                 except Exception:
                     self.logger.debug("%s failed to save bulk analysis manifest", self.job_tag, exc_info=True)
+            if checkpoint_mgr is not None:
+                checkpoint_mgr.close()
             if skipped:
                 self.log_message.emit(f"Skipped {skipped} document(s) (no changes detected)")
+            if self._response_cache is not None:
+                self.logger.info("%s response cache: %s", self.job_tag, self._response_cache.stats())
             self.logger.info("%s finished: successes=%s failures=%s skipped=%s", self.job_tag, successes, failures, skipped)
             self.finished.emit(successes, failures)
     def cancel(self) -> None:
@@ -460,6 +477,73 @@ class BulkAnalysisWorker(DashboardWorker):
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _execute_document(
+        self,
+        provider: BaseLLMProvider,
+        provider_config: ProviderConfig,
+        bundle: PromptBundle,
+        system_prompt: str,
+        document: BulkAnalysisDocument,
+        source_mtime: float,
+        global_placeholders: Dict[str, str],
+        checkpoint_mgr: CheckpointManager,
+        manifest: Dict[str, object],
+        prompt_hash: str,
+        manifest_path: Path,
+    ) -> bool:
+        """Process and persist one document; return True when the output was written.
+
+        Safe to call from several threads at once: manifest mutations are
+        serialised through ``self._manifest_lock``.
+        """
+        try:
+            summary, run_details, doc_placeholders = self._process_document(
+                provider,
+                provider_config,
+                bundle,
+                system_prompt,
+                document,
+                global_placeholders,
+                checkpoint_mgr,
+                manifest,
+                prompt_hash,
+                manifest_path,
+            )
+        except BulkAnalysisCancelled:
+            raise
+        except Exception as exc:  # noqa: BLE001 - propagate via signal
+            self.logger.exception("%s failed %s", self.job_tag, document.source_path)
+            self.file_failed.emit(document.relative_path, str(exc))
+            return False
+
+        try:
+            document.output_path.parent.mkdir(parents=True, exist_ok=True)
+            written_at = datetime.now(timezone.utc)
+            metadata = self._build_summary_metadata(
+                document,
+                provider_config,
+                prompt_hash,
+                run_details,
+                created_at=written_at,
+            )
+            updated = apply_frontmatter(summary, metadata, merge_existing=True)
+            document.output_path.write_text(updated, encoding="utf-8")
+        except Exception as exc:  # noqa: BLE001 - propagate via signal
+            self.logger.exception("%s write failed %s", self.job_tag, document.output_path)
+            self.file_failed.emit(document.relative_path, str(exc))
+            return False
+
+        with self._manifest_lock:
+            entries = manifest.setdefault("documents", {})  # type: ignore[assignment]
+            entries[document.relative_path] = {
+                "source_mtime": round(source_mtime, 6),
+                "prompt_hash": prompt_hash,
+                "ran_at": written_at.isoformat(),
+                "placeholders": self._serialise_placeholders(doc_placeholders),
+            }
+            self._journal_document(manifest, manifest_path, document.relative_path)
+        return True
+
     def _process_document(
         self,
         provider: BaseLLMProvider,
@@ -476,6 +560,20 @@ class BulkAnalysisWorker(DashboardWorker):
         if self.is_cancelled():
             raise BulkAnalysisCancelled
 
+        if should_stream(document.source_path):
+            return self._process_streamed_document(
+                provider,
+                provider_config,
+                bundle,
+                system_prompt,
+                document,
+                global_placeholders,
+                checkpoint_mgr,
+                manifest,
+                prompt_hash,
+                manifest_path,
+            )
+
         body, metadata, source_context = self._load_document(document)
         doc_placeholders = self._build_document_placeholders(global_placeholders, source_context)
 
@@ -487,8 +585,6 @@ class BulkAnalysisWorker(DashboardWorker):
 
         override_window = getattr(self._group, "model_context_window", None)
         if isinstance(override_window, int) and override_window > 0:
-            from src.common.llm.tokens import TokenCounter
-
             token_info = TokenCounter.count(
                 text=body,
                 provider=provider_config.provider_id,
@@ -534,7 +630,7 @@ class BulkAnalysisWorker(DashboardWorker):
             result = self._invoke_provider(provider, provider_config, prompt, system_prompt)
             return result, run_details, doc_placeholders
 
-        chunks = generate_chunks(body, max_tokens)
+        chunks = generate_chunks(body, max_tokens, provider_config.provider_id, provider_config.model)
         if not chunks:
             prompt = render_user_prompt(
                 bundle,
@@ -548,81 +644,240 @@ class BulkAnalysisWorker(DashboardWorker):
             result = self._invoke_provider(provider, provider_config, prompt, system_prompt)
             return result, run_details, doc_placeholders
 
-        documents = manifest.setdefault("documents", {})  # type: ignore[assignment]
-        entry: Dict[str, object] = dict(documents.get(document.relative_path, {}) or {})
-        source_checksum = _sha256(body)
-        total_chunks = len(chunks)
-        needs_reset = (
-            entry.get("source_checksum") != source_checksum
-            or entry.get("prompt_hash") != prompt_hash
-            or entry.get("chunk_count") != total_chunks
+        result = self._map_and_combine_chunks(
+            provider,
+            provider_config,
+            bundle,
+            system_prompt,
+            document,
+            doc_placeholders,
+            checkpoint_mgr,
+            manifest,
+            prompt_hash,
+            manifest_path,
+            source_checksum=_sha256(body),
+            chunk_checksums=[_sha256(chunk) for chunk in chunks],
+            chunk_text=lambda idx: chunks[idx - 1],
         )
-        if needs_reset:
-            checkpoint_mgr.clear_map_document(document.relative_path)
-            entry = {"chunks_done": [], "checksums": {}}
-
-        entry["source_checksum"] = source_checksum
-        entry["prompt_hash"] = prompt_hash
-        entry["chunk_count"] = total_chunks
-        entry.setdefault("chunks_done", [])
-        entry.setdefault("checksums", {})
-        documents[document.relative_path] = entry
-
-        chunk_summaries: List[str] = []
-        run_details["chunk_count"] = total_chunks
+        run_details["chunk_count"] = len(chunks)
+        return result, run_details, doc_placeholders
+
+    def _process_streamed_document(
+        self,
+        provider: BaseLLMProvider,
+        provider_config: ProviderConfig,
+        bundle: PromptBundle,
+        system_prompt: str,
+        document: BulkAnalysisDocument,
+        global_placeholders: Dict[str, str],
+        checkpoint_mgr: CheckpointManager,
+        manifest: Dict[str, object],
+        prompt_hash: str,
+        manifest_path: Path,
+    ) -> tuple[str, Dict[str, object], Dict[str, str]]:
+        """Map a very large document chunk by chunk straight from disk."""
+
+        with StreamedMarkdown(document.source_path) as stream:
+            source_context = self._extract_source_context(stream.metadata, document)
+            doc_placeholders = self._build_document_placeholders(global_placeholders, source_context)
+            self._enforce_placeholder_requirements(
+                doc_placeholders,
+                context=f"bulk analysis document '{document.relative_path}'",
+                dynamic_keys=_DYNAMIC_DOCUMENT_KEYS,
+            )
+
+            max_tokens = chunk_token_budget(
+                provider_config.provider_id,
+                provider_config.model,
+                getattr(self._group, "model_context_window", None),
+            )
+            self.log_message.emit(f"Planning chunks for large document {document.relative_path} from disk")
+            spans = stream.plan(
+                max_tokens,
+                provider_config.provider_id,
+                provider_config.model or "",
+                is_cancelled=self.is_cancelled,
+            )
+            if self.is_cancelled():
+                raise BulkAnalysisCancelled
+
+            run_details: Dict[str, object] = {
+                "token_count": stream.token_count,
+                "max_tokens": max_tokens,
+                "chunking": True,
+                "chunk_count": len(spans),
+                "streamed": True,
+            }
+            self.log_message.emit(
+                f"Processing {document.relative_path} ({stream.token_count} tokens, "
+                f"{len(spans)} chunks, streamed)"
+            )
+            result = self._map_and_combine_chunks(
+                provider,
+                provider_config,
+                bundle,
+                system_prompt,
+                document,
+                doc_placeholders,
+                checkpoint_mgr,
+                manifest,
+                prompt_hash,
+                manifest_path,
+                source_checksum=stream.body_checksum,
+                chunk_checksums=[span.checksum for span in spans],
+                chunk_text=stream.chunk_text,
+            )
+        return result, run_details, doc_placeholders
+
+    def _map_and_combine_chunks(
+        self,
+        provider: BaseLLMProvider,
+        provider_config: ProviderConfig,
+        bundle: PromptBundle,
+        system_prompt: str,
+        document: BulkAnalysisDocument,
+        doc_placeholders: Dict[str, str],
+        checkpoint_mgr: CheckpointManager,
+        manifest: Dict[str, object],
+        prompt_hash: str,
+        manifest_path: Path,
+        *,
+        source_checksum: str,
+        chunk_checksums: Sequence[str],
+        chunk_text: Callable[[int], str],
+    ) -> str:
+        """Map each chunk (reusing checkpoints) and combine the summaries.
+
+        ``chunk_text`` is only called for chunks that are actually sent, so
+        streamed documents never hold more than the in-flight chunks.
+        """
+
+        total_chunks = len(chunk_checksums)
+        with self._manifest_lock:
+            documents = manifest.setdefault("documents", {})  # type: ignore[assignment]
+            entry: Dict[str, object] = dict(documents.get(document.relative_path, {}) or {})
+            needs_reset = (
+                entry.get("source_checksum") != source_checksum
+                or entry.get("prompt_hash") != prompt_hash
+                or entry.get("chunk_count") != total_chunks
+            )
+            if needs_reset:
+                checkpoint_mgr.clear_map_document(document.relative_path)
+                entry = {"chunks_done": [], "checksums": {}}
+
+            entry["source_checksum"] = source_checksum
+            entry["prompt_hash"] = prompt_hash
+            entry["chunk_count"] = total_chunks
+            entry.setdefault("chunks_done", [])
+            entry.setdefault("checksums", {})
+            documents[document.relative_path] = entry
+
+        chunk_summaries: List[str] = [""] * total_chunks
         done_set = set(entry.get("chunks_done") or [])
         checksums: Dict[str, str] = dict(entry.get("checksums") or {})
+        pending: List[Tuple[int, str]] = []
 
-        for idx, chunk in enumerate(chunks, start=1):
+        saved_chunks = checkpoint_mgr.load_map_chunks(document.relative_path)
+        for idx, chunk_checksum in enumerate(chunk_checksums, start=1):
             if self.is_cancelled():
                 raise BulkAnalysisCancelled
 
-            chunk_checksum = _sha256(chunk)
-            cached = checkpoint_mgr.load_map_chunk(document.relative_path, idx)
+            cached = saved_chunks.get(idx)
             cached_content = None
             if (
                 cached
                 and cached.get("input_checksum") == chunk_checksum
                 and cached.get("content")
-                and cached.get("content_checksum") == _sha256(cached.get("content"))
                 and checksums.get(str(idx)) == chunk_checksum
             ):
                 cached_content = cached.get("content")
 
+            checksums[str(idx)] = chunk_checksum
             if cached_content:
-                summary = cached_content
+                chunk_summaries[idx - 1] = cached_content
+                done_set.add(idx)
                 self.log_message.emit(
                     f"Reusing chunk {idx}/{total_chunks} for {document.relative_path} from checkpoint"
                 )
             else:
-                chunk_prompt = render_user_prompt(
-                    bundle,
-                    self._metadata,
-                    document.relative_path,
-                    chunk,
-                    chunk_index=idx,
-                    chunk_total=total_chunks,
-                    placeholder_values=doc_placeholders,
-                )
-                summary = self._invoke_provider(
-                    provider,
-                    provider_config,
-                    chunk_prompt,
-                    system_prompt,
-                )
-                checkpoint_mgr.save_map_chunk(document.relative_path, idx, summary, chunk_checksum)
+                pending.append((idx, chunk_checksum))
 
-            checksums[str(idx)] = chunk_checksum
-            done_set.add(idx)
+        # Record every chunk checksum once, before any chunk is sent. Each mapped
+        # chunk is then durable through its row in the checkpoints.sqlite3
+        # store, so a crash mid-map resumes from whatever checkpoints landed
+        # without rewriting the manifest per chunk.
+        with self._manifest_lock:
             entry["checksums"] = checksums
             entry["chunks_done"] = sorted(done_set)
             documents[document.relative_path] = entry
-            try:
-                _save_manifest(manifest_path, manifest)
-            except Exception:
-                self.logger.debug("Failed to persist map chunk manifest update", exc_info=True)
+            self._journal_document(manifest, manifest_path, document.relative_path)
+
+        def _chunk_prompt(idx: int) -> str:
+            return render_user_prompt(
+                bundle,
+                self._metadata,
+                document.relative_path,
+                chunk_text(idx),
+                chunk_index=idx,
+                chunk_total=total_chunks,
+                placeholder_values=doc_placeholders,
+            )
+
+        def _map_chunk(item: Tuple[int, str]) -> str:
+            idx, chunk_checksum = item
+            summary = self._invoke_provider(
+                provider,
+                provider_config,
+                _chunk_prompt(idx),
+                system_prompt,
+            )
+            checkpoint_mgr.save_map_chunk(document.relative_path, idx, summary, chunk_checksum)
+            return summary
+
+        async def _amap_chunk(item: Tuple[int, str]) -> str:
+            idx, chunk_checksum = item
+            summary = await self._ainvoke_provider(
+                provider,
+                provider_config,
+                _chunk_prompt(idx),
+                system_prompt,
+            )
+            checkpoint_mgr.save_map_chunk(document.relative_path, idx, summary, chunk_checksum)
+            return summary
+
+        def _chunk_done(position: int, summary: str) -> None:
+            idx = pending[position][0]
+            chunk_summaries[idx - 1] = summary
+            done_set.add(idx)
+
+        if pending:
+            concurrency = group_concurrency(self._group, "max_concurrent_chunks")
+            if concurrency > 1 and len(pending) > 1:
+                self.log_message.emit(
+                    f"Mapping {len(pending)} chunk(s) of {document.relative_path} "
+                    f"with up to {concurrency} in flight"
+                )
+            if getattr(provider, "supports_async", False) and concurrency > 1 and len(pending) > 1:
+                # Native async clients keep every chunk request on this
+                # thread's event loop instead of a thread per request.
+                try:
+                    self.run_async(
+                        amap_bounded(pending, _amap_chunk, limit=concurrency, on_complete=_chunk_done)
+                    )
+                except asyncio.CancelledError:
+                    raise BulkAnalysisCancelled from None
+            else:
+                map_bounded(
+                    pending,
+                    _map_chunk,
+                    max_workers=concurrency,
+                    on_complete=_chunk_done,
+                    thread_name_prefix=f"bulk-{self.job_id}-chunks",
+                )
 
-            chunk_summaries.append(summary)
+        with self._manifest_lock:
+            entry["chunks_done"] = sorted(done_set)
+            documents[document.relative_path] = entry
 
         combine_prompt, _ = combine_chunk_summaries(
             chunk_summaries,
@@ -631,14 +886,15 @@ class BulkAnalysisWorker(DashboardWorker):
             placeholder_values=doc_placeholders,
         )
         result = self._invoke_provider(provider, provider_config, combine_prompt, system_prompt)
-        entry["status"] = "complete"
-        entry["ran_at"] = datetime.now(timezone.utc).isoformat()
-        documents[document.relative_path] = entry
-        try:
-            _save_manifest(manifest_path, manifest)
-        finally:
-            checkpoint_mgr.clear_map_document(document.relative_path)
-        return result, run_details, doc_placeholders
+        with self._manifest_lock:
+            entry["status"] = "complete"
+            entry["ran_at"] = datetime.now(timezone.utc).isoformat()
+            documents[document.relative_path] = entry
+            try:
+                self._journal_document(manifest, manifest_path, document.relative_path)
+            finally:
+                checkpoint_mgr.clear_map_document(document.relative_path)
+        return result
 
     def _invoke_provider(
         self,
@@ -653,6 +909,9 @@ class BulkAnalysisWorker(DashboardWorker):
         if self._cancel_event.is_set():
             raise BulkAnalysisCancelled
 
+        cache_key, cached = self._lookup_response(provider, provider_config, prompt, system_prompt, temperature, max_tokens)
+        if cached:
+            return cached
         response = provider.generate(
             prompt=prompt,
             model=provider_config.model,
@@ -660,12 +919,69 @@ class BulkAnalysisWorker(DashboardWorker):
             temperature=temperature,
             max_tokens=max_tokens,
         )
-        if not response.get("success"):
-            raise RuntimeError(response.get("error", "Unknown LLM error"))
-        content = (response.get("content") or "").strip()
-        if not content:
-            raise RuntimeError("LLM returned empty response")
-        return content
+        return response_content(response, cache=self._response_cache, cache_key=cache_key)
+
+    async def _ainvoke_provider(
+        self,
+        provider: BaseLLMProvider,
+        provider_config: ProviderConfig,
+        prompt: str,
+        system_prompt: str,
+        *,
+        temperature: float = 0.1,
+        max_tokens: int = 32_000,
+    ) -> str:
+        if self._cancel_event.is_set():
+            raise BulkAnalysisCancelled
+
+        cache_key, cached = self._lookup_response(provider, provider_config, prompt, system_prompt, temperature, max_tokens)
+        if cached:
+            return cached
+        response = await provider.agenerate(
+            prompt=prompt,
+            model=provider_config.model,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return response_content(response, cache=self._response_cache, cache_key=cache_key)
+
+    def _journal_for(self, manifest_path: Path) -> ManifestJournal:
+        journal = self._manifest_journal
+        if journal is None or journal.path != manifest_path:
+            journal = ManifestJournal(manifest_path)
+            self._manifest_journal = journal
+        return journal
+
+    def _journal_document(self, manifest: Dict[str, object], manifest_path: Path, relative_path: str) -> None:
+        """Append one document's manifest entry; the caller holds ``_manifest_lock``."""
+        documents = manifest.get("documents") or {}
+        journal = self._journal_for(manifest_path)
+        try:
+            if journal.record(["documents", relative_path], documents.get(relative_path)):
+                _save_manifest(manifest_path, manifest, journal)
+        except Exception:
+            self.logger.debug("%s failed to journal manifest entry for %s", self.job_tag, relative_path, exc_info=True)
+
+    def _lookup_response(
+        self,
+        provider: BaseLLMProvider,
+        provider_config: ProviderConfig,
+        prompt: str,
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[Optional[str], Optional[str]]:
+        return lookup_cached_response(
+            self._response_cache,
+            provider_id=provider_config.provider_id,
+            model=provider_config.model or getattr(provider, "default_model", None),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            prompt=prompt,
+            force_rerun=self._force_rerun,
+        )
 
     def _resolve_provider(self) -> ProviderConfig:
         provider_id = self._group.provider_id or self._default_provider[0] or "anthropic"
@@ -21,9 +21,13 @@ from src.app.core.bulk_analysis_runner import (
     combine_chunk_summaries,
     combine_chunk_summaries_hierarchical,
     generate_chunks,
+    group_concurrency,
     load_prompts,
+    lookup_cached_response,
+    map_bounded,
     render_system_prompt,
     render_user_prompt,
+    response_content,
     should_chunk,
 )
 from src.app.core.bulk_paths import (
@@ -31,6 +35,7 @@ from src.app.core.bulk_paths import (
     iter_map_outputs_under,
     normalize_map_relative,
     resolve_map_output_path,
+    token_cache_path,
 )
 from src.app.core.bulk_prompt_context import build_bulk_placeholders
 from src.app.core.placeholders.system import SourceFileContext
@@ -38,6 +43,8 @@ from src.app.core.project_manager import ProjectMetadata
 from src.app.core.secure_settings import SecureSettings
 from src.common.llm.base import BaseLLMProvider
 from src.common.llm.factory import create_provider
+from src.common.llm.response_cache import ResponseCache, open_response_cache
+from src.common.llm.tokens import TokenCounter
 from src.common.markdown import (
     PromptReference,
     SourceReference,
@@ -49,6 +56,7 @@ from src.common.markdown import (
 
 from .base import DashboardWorker
 from .checkpoint_manager import CheckpointManager, _sha256
+from .manifest_store import ManifestJournal
 
 LOGGER = logging.getLogger(__name__)
 
@@ -79,13 +87,8 @@ def _default_manifest() -> Dict[str, object]:
     }
 
 
-def _load_manifest(path: Path) -> Dict[str, object]:
-    if not path.exists():
-        return _default_manifest()
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return _default_manifest()
+def _load_manifest(path: Path, journal: Optional[ManifestJournal] = None) -> Dict[str, object]:
+    data = (journal or ManifestJournal(path)).load()
     if not isinstance(data, dict):
         return _default_manifest()
     chunks = data.get("chunks") if isinstance(data.get("chunks"), dict) else {"count": 0, "done": [], "checksums": {}}
@@ -100,7 +103,8 @@ def _load_manifest(path: Path) -> Dict[str, object]:
     }
 
 
-def _save_manifest(path: Path, manifest: Dict[str, object]) -> None:
+def _save_manifest(path: Path, manifest: Dict[str, object], journal: Optional[ManifestJournal] = None) -> None:
+    """Atomically write the full manifest snapshot, folding in any journaled updates."""
     payload = {
         "version": _MANIFEST_VERSION,
         "signature": manifest.get("signature"),
@@ -109,8 +113,7 @@ def _save_manifest(path: Path, manifest: Dict[str, object]) -> None:
         "batches": manifest.get("batches", {}),
         "finalized": bool(manifest.get("finalized", False)),
     }
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    (journal or ManifestJournal(path)).compact(payload)
 
 
 def _stable_placeholders(placeholders: Mapping[str, str]) -> Dict[str, str]:
@@ -208,6 +211,7 @@ class BulkReduceWorker(DashboardWorker):
         self._base_placeholders = dict(placeholder_values or {})
         self._project_name = project_name
         self._run_timestamp = datetime.now(timezone.utc)
+        self._response_cache: Optional[ResponseCache] = None
 
     # ------------------------------------------------------------------
     # QRunnable API
@@ -327,6 +331,7 @@ class BulkReduceWorker(DashboardWorker):
         return list(unique.values())
 
     def _run(self) -> None:  # pragma: no cover - executed in worker thread
+        checkpoint_mgr: Optional[CheckpointManager] = None
         try:
             provider_cfg = self._resolve_provider()
             bundle = load_prompts(self._project_dir, self._group, self._metadata)
@@ -368,10 +373,12 @@ class BulkReduceWorker(DashboardWorker):
             provider = self._create_provider(provider_cfg, system_prompt)
             if provider is None:
                 raise RuntimeError("Reduce provider failed to initialise")
+            self._response_cache = open_response_cache(SecureSettings().get("llm_response_cache", {}))
 
             signature_inputs = _inputs_signature(inputs)
             state_manifest_path = _manifest_path(self._project_dir, self._group)
-            previous = _load_manifest(state_manifest_path)
+            journal = ManifestJournal(state_manifest_path)
+            previous = _load_manifest(state_manifest_path, journal)
             signature_placeholders = _stable_placeholders(self._serialise_placeholders(placeholders_global))
             signature = {
                 "prompt_hash": prompt_hash,
@@ -379,6 +386,7 @@ class BulkReduceWorker(DashboardWorker):
                 "placeholders": signature_placeholders,
             }
 
+            TokenCounter.enable_disk_cache(token_cache_path(self._project_dir))
             slug = getattr(self._group, "slug", None) or self._group.folder_name
             checkpoint_mgr = CheckpointManager(
                 self._project_dir / "bulk_analysis" / slug / "reduce" / "checkpoints"
@@ -429,8 +437,6 @@ class BulkReduceWorker(DashboardWorker):
 
             override_window = getattr(self._group, "model_context_window", None)
             if isinstance(override_window, int) and override_window > 0:
-                from src.common.llm.tokens import TokenCounter
-
                 token_info = TokenCounter.count(
                     text=combined_content,
                     provider=provider_cfg.provider_id,
@@ -468,7 +474,9 @@ class BulkReduceWorker(DashboardWorker):
                 chunk_state["done"] = [1]
                 current_manifest["chunks"] = chunk_state
             else:
-                chunks = generate_chunks(combined_content, max_tokens)
+                chunks = generate_chunks(
+                    combined_content, max_tokens, provider_cfg.provider_id, provider_cfg.model
+                )
                 if not chunks:
                     prompt = render_user_prompt(
                         bundle,
@@ -481,12 +489,14 @@ class BulkReduceWorker(DashboardWorker):
                     run_details["chunk_count"] = 1
                     run_details["chunking"] = False
                 else:
-                    chunk_summaries = []
                     total_chunks = len(chunks)
+                    chunk_summaries: List[str] = [""] * total_chunks
                     run_details["chunk_count"] = total_chunks
                     chunk_state = current_manifest.get("chunks", {"count": 0, "done": [], "checksums": {}})
                     chunk_state["count"] = total_chunks
                     done_set = set(chunk_state.get("done") or [])
+                    checksums = chunk_state.setdefault("checksums", {})
+                    pending: List[Tuple[int, str, str]] = []
 
                     for idx, chunk in enumerate(chunks, start=1):
                         if self.is_cancelled():
@@ -499,36 +509,57 @@ class BulkReduceWorker(DashboardWorker):
                             cached
                             and cached.get("input_checksum") == chunk_checksum
                             and cached.get("content")
-                            and chunk_state.get("checksums", {}).get(str(idx)) == chunk_checksum
+                            and checksums.get(str(idx)) == chunk_checksum
                         ):
                             cached_content = cached.get("content")
 
+                        checksums[str(idx)] = chunk_checksum
                         if cached_content:
-                            summary = cached_content
+                            chunk_summaries[idx - 1] = cached_content
+                            done_set.add(idx)
                             self.log_message.emit(f"Reuse chunk {idx}/{total_chunks} from checkpoint")
                         else:
-                            prompt = render_user_prompt(
-                                bundle,
-                                self._metadata,
-                                self._group.name,
-                                chunk,
-                                chunk_index=idx,
-                                chunk_total=total_chunks,
-                                placeholder_values=placeholders_global,
-                            )
-                            summary = self._invoke_provider(provider, provider_cfg, prompt, system_prompt)
-                            checkpoint_mgr.save_reduce_chunk(idx, summary, chunk_checksum)
-
-                        chunk_state.setdefault("checksums", {})[str(idx)] = chunk_checksum
+                            pending.append((idx, chunk, chunk_checksum))
+
+                    # Checksums are recorded up front; each mapped chunk is made
+                    # durable by its row in the checkpoints.sqlite3 store.
+                    chunk_state["done"] = sorted(done_set)
+                    current_manifest["chunks"] = chunk_state
+                    try:
+                        # Signature and reset state land in one atomic snapshot.
+                        _save_manifest(state_manifest_path, current_manifest, journal)
+                    except Exception:
+                        self.logger.debug("Failed to persist chunk manifest update", exc_info=True)
+
+                    def map_chunk(item: Tuple[int, str, str]) -> str:
+                        idx, chunk, chunk_checksum = item
+                        prompt = render_user_prompt(
+                            bundle,
+                            self._metadata,
+                            self._group.name,
+                            chunk,
+                            chunk_index=idx,
+                            chunk_total=total_chunks,
+                            placeholder_values=placeholders_global,
+                        )
+                        summary = self._invoke_provider(provider, provider_cfg, prompt, system_prompt)
+                        checkpoint_mgr.save_reduce_chunk(idx, summary, chunk_checksum)
+                        return summary
+
+                    def chunk_done(position: int, summary: str) -> None:
+                        idx = pending[position][0]
+                        chunk_summaries[idx - 1] = summary
                         done_set.add(idx)
-                        chunk_state["done"] = sorted(done_set)
-                        current_manifest["chunks"] = chunk_state
-                        try:
-                            _save_manifest(state_manifest_path, current_manifest)
-                        except Exception:
-                            self.logger.debug("Failed to persist chunk manifest update", exc_info=True)
 
-                        chunk_summaries.append(summary)
+                    map_bounded(
+                        pending,
+                        map_chunk,
+                        max_workers=group_concurrency(self._group, "max_concurrent_chunks"),
+                        on_complete=chunk_done,
+                        thread_name_prefix=f"reduce-{self.job_id}-chunks",
+                    )
+                    chunk_state["done"] = sorted(done_set)
+                    current_manifest["chunks"] = chunk_state
 
                     # Use hierarchical reduction to combine chunk summaries
                     # This handles large documents that would exceed token limits
@@ -552,7 +583,11 @@ class BulkReduceWorker(DashboardWorker):
                         batches = current_manifest.setdefault("batches", {})
                         batches[f"{level}:{batch_index}"] = checksum
                         current_manifest["batches"] = batches
-                        _save_manifest(state_manifest_path, current_manifest)
+                        try:
+                            if journal.record(["batches", f"{level}:{batch_index}"], checksum):
+                                _save_manifest(state_manifest_path, current_manifest, journal)
+                        except Exception:
+                            self.logger.debug("Failed to journal reduce batch %s:%s", level, batch_index, exc_info=True)
 
                     result = combine_chunk_summaries_hierarchical(
                         chunk_summaries,
@@ -565,6 +600,8 @@ class BulkReduceWorker(DashboardWorker):
                         is_cancelled_fn=self.is_cancelled,
                         load_batch_fn=load_batch,
                         save_batch_fn=save_batch,
+                        max_concurrent_batches=group_concurrency(self._group, "max_concurrent_chunks"),
+                        packing="balanced",
                     )
 
             # Persist
@@ -588,9 +625,11 @@ class BulkReduceWorker(DashboardWorker):
             current_manifest["ran_at"] = written_at.isoformat()
             current_manifest["group_id"] = self._group.group_id
             current_manifest["group_slug"] = getattr(self._group, "slug", None) or self._group.folder_name
-            _save_manifest(state_manifest_path, current_manifest)
+            _save_manifest(state_manifest_path, current_manifest, journal)
             checkpoint_mgr.clear_reduce()
 
+            if self._response_cache is not None:
+                self.logger.info("%s response cache: %s", self.job_tag, self._response_cache.stats())
             self.progress.emit(1, 1, "Completed")
             self.finished.emit(1, 0)
 
@@ -601,6 +640,9 @@ class BulkReduceWorker(DashboardWorker):
             self.logger.exception("BulkReduceWorker crashed: %s", exc)
             self.log_message.emit(f"Combined operation error: {exc}")
             self.finished.emit(0, 1)
+        finally:
+            if checkpoint_mgr is not None:
+                checkpoint_mgr.close()
 
     # ------------------------------------------------------------------
     # Helpers
@@ -827,6 +869,18 @@ class BulkReduceWorker(DashboardWorker):
     ) -> str:
         if self._cancel_event.is_set():
             raise BulkAnalysisCancelled
+        cache_key, cached = lookup_cached_response(
+            self._response_cache,
+            provider_id=provider_cfg.provider_id,
+            model=provider_cfg.model or getattr(provider, "default_model", None),
+            temperature=provider_cfg.temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            prompt=prompt,
+            force_rerun=self._force_rerun,
+        )
+        if cached:
+            return cached
         response = provider.generate(
             prompt=prompt,
             model=provider_cfg.model,
@@ -834,12 +888,7 @@ class BulkReduceWorker(DashboardWorker):
             temperature=provider_cfg.temperature,
             max_tokens=max_tokens,
         )
-        if not response.get("success"):
-            raise RuntimeError(response.get("error", "Unknown LLM error"))
-        content = (response.get("content") or "").strip()
-        if not content:
-            raise RuntimeError("LLM returned empty response")
-        return content
+        return response_content(response, cache=self._response_cache, cache_key=cache_key)
 
     def _timestamp(self) -> str:
         return datetime.now().strftime("%Y%m%d-%H%M")
@@ -4,139 +4,223 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import shutil
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+_STORE_NAME = "checkpoints.sqlite3"
+_ALL = "*"
+_REDUCE = "reduce"
 
 
 def _sha256(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def _map_scope(document_rel: str) -> str:
+    return f"map:{Path(document_rel).as_posix()}"
+
+
 class CheckpointManager:
-    """Lightweight checkpoint IO for map and reduce stages."""
+    """Checkpoint IO for map and reduce stages, packed into one SQLite file per stage.
+
+    Every checkpoint row carries the generation of its scope (one scope per
+    mapped document, one for reduce) and of the whole store. Clearing bumps a
+    generation counter, which is O(1) no matter how many checkpoints exist;
+    rows from older generations are ignored on load and purged the next time
+    the store is opened. SQLite's rollback journal keeps each save atomic, so
+    loads do not need to re-hash content to detect torn writes.
+
+    Checkpoints from the former one-JSON-file-per-chunk layout are imported
+    on first open and the loose files removed.
+    """
 
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._generations: Dict[str, int] = {}
 
     # ---------------------------
-    # Generic helpers
+    # Store lifecycle
     # ---------------------------
-    def _read_json(self, path: Path) -> Optional[dict]:
-        try:
-            raw = path.read_text(encoding="utf-8")
-            return json.loads(raw)
-        except Exception:
-            return None
-
-    def _write_json(self, path: Path, payload: Dict[str, object]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    @property
+    def store_path(self) -> Path:
+        return self.base_dir / _STORE_NAME
+
+    def _connection(self) -> sqlite3.Connection:
+        # Caller holds ``self._lock``.
+        if self._conn is not None:
+            return self._conn
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.store_path), check_same_thread=False)
+        # The default rollback journal works on network-mounted case folders,
+        # unlike WAL.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS generations (scope TEXT PRIMARY KEY, generation INTEGER NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "scope TEXT NOT NULL, key TEXT NOT NULL, epoch INTEGER NOT NULL, generation INTEGER NOT NULL, "
+            "input_checksum TEXT NOT NULL, content TEXT NOT NULL, content_checksum TEXT NOT NULL, "
+            "PRIMARY KEY (scope, key))"
+        )
+        self._generations = dict(conn.execute("SELECT scope, generation FROM generations").fetchall())
+        self._conn = conn
+        self._purge_stale()
+        self._import_legacy_files()
+        conn.commit()
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _purge_stale(self) -> None:
+        epoch = self._generations.get(_ALL, 0)
+        self._conn.execute(
+            "DELETE FROM checkpoints WHERE epoch != ? OR generation != "
+            "COALESCE((SELECT generation FROM generations g WHERE g.scope = checkpoints.scope), 0)",
+            (epoch,),
+        )
+
+    def _bump(self, scope: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            generation = self._generations.get(scope, 0) + 1
+            conn.execute("INSERT OR REPLACE INTO generations (scope, generation) VALUES (?, ?)", (scope, generation))
+            conn.commit()
+            self._generations[scope] = generation
 
-    def _read_text(self, path: Path) -> Optional[str]:
-        try:
-            return path.read_text(encoding="utf-8")
-        except Exception:
+    # ---------------------------
+    # Generic helpers
+    # ---------------------------
+    def _load(self, scope: str, key: str) -> Optional[dict]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT input_checksum, content, content_checksum FROM checkpoints "
+                "WHERE scope = ? AND key = ? AND epoch = ? AND generation = ?",
+                (scope, key, self._generations.get(_ALL, 0), self._generations.get(scope, 0)),
+            ).fetchone()
+        if row is None:
             return None
-
-    def _write_text(self, path: Path, content: str) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
-
-    def _safe_doc_path(self, relative_path: str) -> Path:
-        return Path(relative_path).as_posix()
+        return {"input_checksum": row[0], "content": row[1], "content_checksum": row[2]}
+
+    def _save(self, scope: str, key: str, content: str, input_checksum: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(scope, key, epoch, generation, input_checksum, content, content_checksum) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    scope,
+                    key,
+                    self._generations.get(_ALL, 0),
+                    self._generations.get(scope, 0),
+                    input_checksum,
+                    content,
+                    _sha256(content),
+                ),
+            )
+            conn.commit()
 
     # ---------------------------
     # Map checkpoints
     # ---------------------------
-    def map_chunk_path(self, document_rel: str, index: int) -> Path:
-        safe_rel = Path(self._safe_doc_path(document_rel))
-        return self.base_dir / "map" / safe_rel / f"chunk_{index}.json"
-
     def load_map_chunk(self, document_rel: str, index: int) -> Optional[dict]:
-        return self._read_json(self.map_chunk_path(document_rel, index))
+        return self._load(_map_scope(document_rel), str(index))
+
+    def load_map_chunks(self, document_rel: str) -> Dict[int, dict]:
+        """Return every current checkpoint for ``document_rel`` in one query, keyed by chunk index."""
+        scope = _map_scope(document_rel)
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT key, input_checksum, content, content_checksum FROM checkpoints "
+                "WHERE scope = ? AND epoch = ? AND generation = ?",
+                (scope, self._generations.get(_ALL, 0), self._generations.get(scope, 0)),
+            ).fetchall()
+        return {
+            int(key): {"input_checksum": checksum, "content": content, "content_checksum": content_checksum}
+            for key, checksum, content, content_checksum in rows
+        }
 
     def save_map_chunk(self, document_rel: str, index: int, content: str, input_checksum: str) -> None:
-        payload = {"input_checksum": input_checksum, "content": content, "content_checksum": _sha256(content)}
-        self._write_json(self.map_chunk_path(document_rel, index), payload)
+        self._save(_map_scope(document_rel), str(index), content, input_checksum)
 
     def clear_map_document(self, document_rel: str) -> None:
-        path = self.base_dir / "map" / Path(self._safe_doc_path(document_rel))
-        if path.exists():
-            for child in sorted(path.rglob("*"), reverse=True):
-                try:
-                    child.unlink()
-                except IsADirectoryError:
-                    try:
-                        child.rmdir()
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
-            try:
-                path.rmdir()
-            except Exception:
-                pass
+        self._bump(_map_scope(document_rel))
 
     # ---------------------------
     # Reduce checkpoints
     # ---------------------------
-    def reduce_chunk_path(self, index: int) -> Path:
-        return self.base_dir / "reduce" / "chunks" / f"chunk_{index}.json"
-
     def load_reduce_chunk(self, index: int) -> Optional[dict]:
-        return self._read_json(self.reduce_chunk_path(index))
+        return self._load(_REDUCE, f"chunk:{index}")
 
     def save_reduce_chunk(self, index: int, content: str, input_checksum: str) -> None:
-        payload = {"input_checksum": input_checksum, "content": content, "content_checksum": _sha256(content)}
-        self._write_json(self.reduce_chunk_path(index), payload)
-
-    def reduce_batch_path(self, level: int, batch_index: int) -> Path:
-        return self.base_dir / "reduce" / "batches" / f"level_{level}_batch_{batch_index}.json"
+        self._save(_REDUCE, f"chunk:{index}", content, input_checksum)
 
     def load_reduce_batch(self, level: int, batch_index: int) -> Optional[dict]:
-        return self._read_json(self.reduce_batch_path(level, batch_index))
+        return self._load(_REDUCE, f"batch:{level}:{batch_index}")
 
     def save_reduce_batch(self, level: int, batch_index: int, content: str, input_checksum: str) -> None:
-        payload = {"input_checksum": input_checksum, "content": content, "content_checksum": _sha256(content)}
-        self._write_json(self.reduce_batch_path(level, batch_index), payload)
+        self._save(_REDUCE, f"batch:{level}:{batch_index}", content, input_checksum)
 
     def clear_reduce(self) -> None:
-        reduce_root = self.base_dir / "reduce"
-        if not reduce_root.exists():
-            return
-        for child in sorted(reduce_root.rglob("*"), reverse=True):
-            try:
-                child.unlink()
-            except IsADirectoryError:
-                try:
-                    child.rmdir()
-                except Exception:
-                    pass
-            except Exception:
-                pass
-        try:
-            reduce_root.rmdir()
-        except Exception:
-            pass
+        self._bump(_REDUCE)
 
     def clear_all(self) -> None:
-        if not self.base_dir.exists():
-            return
-        for child in sorted(self.base_dir.rglob("*"), reverse=True):
+        self._bump(_ALL)
+
+    # ---------------------------
+    # Legacy layout
+    # ---------------------------
+    def _import_legacy_files(self) -> None:
+        imported = 0
+        for scope, key, path in self._legacy_checkpoints():
             try:
-                child.unlink()
-            except IsADirectoryError:
-                try:
-                    child.rmdir()
-                except Exception:
-                    pass
+                payload = json.loads(path.read_text(encoding="utf-8"))
+                content = payload["content"]
+                checksum = payload["input_checksum"]
             except Exception:
-                pass
-        try:
-            self.base_dir.rmdir()
-        except Exception:
-            pass
+                continue
+            # Legacy writes were not atomic; only trust verified content.
+            if payload.get("content_checksum") != _sha256(content):
+                continue
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(scope, key, epoch, generation, input_checksum, content, content_checksum) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (scope, key, self._generations.get(_ALL, 0), self._generations.get(scope, 0), checksum, content, _sha256(content)),
+            )
+            imported += 1
+        for folder in ("map", "reduce"):
+            shutil.rmtree(self.base_dir / folder, ignore_errors=True)
+        if imported:
+            LOGGER.info("Imported %d legacy checkpoint file(s) into %s", imported, self.store_path)
+
+    def _legacy_checkpoints(self) -> Iterable[Tuple[str, str, Path]]:
+        map_root = self.base_dir / "map"
+        if map_root.is_dir():
+            for path in map_root.rglob("chunk_*.json"):
+                document_rel = path.parent.relative_to(map_root).as_posix()
+                yield _map_scope(document_rel), path.stem.split("_", 1)[1], path
+        reduce_root = self.base_dir / "reduce"
+        if (reduce_root / "chunks").is_dir():
+            for path in (reduce_root / "chunks").glob("chunk_*.json"):
+                yield _REDUCE, f"chunk:{path.stem.split('_', 1)[1]}", path
+        if (reduce_root / "batches").is_dir():
+            for path in (reduce_root / "batches").glob("level_*_batch_*.json"):
+                _, level, _, batch_index = path.stem.split("_")
+                yield _REDUCE, f"batch:{level}:{batch_index}", path
 
 
 __all__ = ["CheckpointManager", "_sha256"]
-
@@ -8,10 +8,13 @@ Adds standardised YAML front matter and page markers to PDF/DOCX conversions:
 
 from __future__ import annotations
 
+import os
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
 
 from PySide6.QtCore import Signal
 
@@ -22,18 +25,50 @@ from src.common.markdown import (
     compute_file_checksum,
 )
 from src.core.file_utils import (
-    extract_text_from_pdf,
+    FITZ_LOCK,
+    extract_pdf_pages,
     process_docx_to_markdown,
     write_file_content,
 )
 from src.app.core.conversion_manager import ConversionJob, copy_existing_markdown
 from src.app.core.conversion_helpers import ConversionHelper, registry
+from src.app.core.page_cache import (
+    PAGE_CACHE_FILENAME,
+    PageCache,
+    extract_page_texts,
+    join_markdown_pages,
+    page_fingerprints,
+    pages_to_pdf_bytes,
+    split_markdown_pages,
+)
 from src.app.core.secure_settings import SecureSettings
 from .base import DashboardWorker
 
+_T = TypeVar("_T")
+
+# Azure DI jobs mostly wait on the remote service, so they are pipelined by
+# default; other helpers convert one job at a time unless configured.
+_DEFAULT_AZURE_CONCURRENCY = 4
+
+# Azure DI analyses at most this many pages per request; larger sets of
+# changed pages go through the chunked full-document path.
+_AZURE_MAX_PAGES = 1000
+
 
 class ConversionWorker(DashboardWorker):
-    """Run conversion jobs on a thread pool."""
+    """Run conversion jobs on a thread pool.
+
+    Azure DI jobs are pipelined (see :meth:`_run_pipelined`) with up to
+    ``max_concurrent_jobs`` analyses in flight (default 4); other helpers run
+    jobs one at a time unless that option is raised. Local work is bounded by
+    ``max_local_workers``, but in-process PyMuPDF calls are serialised by
+    :data:`~src.core.file_utils.FITZ_LOCK`, so only pandoc, the page-marker
+    pass and the process-pool extraction of large PDFs run in parallel.
+
+    PDF output is cached per page under the project's content fingerprints
+    (see :mod:`src.app.core.page_cache`), so re-converting an edited PDF only
+    extracts or re-analyses the pages that changed.
+    """
 
     progress = Signal(int, int, str)  # completed, total, relative path
     file_failed = Signal(str, str)    # source path, error message
@@ -51,10 +86,32 @@ class ConversionWorker(DashboardWorker):
         self._helper_id = helper or "azure_di"
         self._options = dict(options or {})
         self._helper_cache: Optional[ConversionHelper] = None
+        self._local_pool: Optional[ThreadPoolExecutor] = None
+        self._page_caches: Dict[Path, PageCache] = {}
+        self._page_caches_lock = threading.Lock()
 
     def _run(self) -> None:  # pragma: no cover - executed in worker thread
         total = len(self._jobs)
-        self.logger.info("%s starting conversion (jobs=%s)", self.job_tag, total)
+        concurrency = self._option_int(
+            "max_concurrent_jobs", _DEFAULT_AZURE_CONCURRENCY if self._use_azure() else 1
+        )
+        self.logger.info(
+            "%s starting conversion (jobs=%s, concurrency=%s)", self.job_tag, total, concurrency
+        )
+        try:
+            if concurrency > 1 and total > 1:
+                successes, failures = self._run_pipelined(concurrency)
+            else:
+                successes, failures = self._run_serial()
+        finally:
+            for cache in self._page_caches.values():
+                cache.close()
+            self._page_caches.clear()
+        self.logger.info("%s finished: successes=%s failures=%s", self.job_tag, successes, failures)
+        self.finished.emit(successes, failures)
+
+    def _run_serial(self) -> tuple[int, int]:
+        total = len(self._jobs)
         successes = 0
         failures = 0
         for job in self._jobs:
@@ -65,25 +122,139 @@ class ConversionWorker(DashboardWorker):
                 self._execute(job)
             except Exception as exc:  # noqa: BLE001 - propagate via signal
                 failures += 1
-                self.logger.exception("%s failed %s", self.job_tag, job.source_path)
-                self.file_failed.emit(str(job.source_path), str(exc))
+                self._report_failure(job, exc)
             else:
                 successes += 1
             finally:
-                self.logger.debug(
-                    "%s progress %s/%s %s",
-                    self.job_tag,
-                    successes + failures,
-                    total,
-                    job.display_name,
-                )
-                self.progress.emit(successes + failures, total, job.display_name)
-        self.logger.info("%s finished: successes=%s failures=%s", self.job_tag, successes, failures)
-        self.finished.emit(successes, failures)
+                self._report_progress(successes + failures, total, job)
+        return successes, failures
+
+    def _run_pipelined(self, concurrency: int) -> tuple[int, int]:
+        """Run jobs with up to ``concurrency`` in flight, reporting results in job order.
+
+        Azure DI analyses wait on a remote service, so they are submitted to
+        their own pool; local CPU-bound work (PDF extraction, pandoc and the
+        page-marker/front-matter pass) runs on a smaller bounded pool. Signals
+        are emitted from this thread in job order, so progress and failures
+        read exactly as in a serial run.
+        """
+        total = len(self._jobs)
+        local_workers = self._option_int("max_local_workers", min(4, os.cpu_count() or 1))
+        successes = 0
+        failures = 0
+        remote_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="conversion-remote")
+        local_pool = ThreadPoolExecutor(max_workers=local_workers, thread_name_prefix="conversion-local")
+        self._local_pool = local_pool
+        try:
+            futures: List[Future] = [
+                (remote_pool if self._is_remote(job) else local_pool).submit(self._execute, job)
+                for job in self._jobs
+            ]
+            for job, future in zip(self._jobs, futures):
+                while not future.done() and not self.is_cancelled():
+                    wait([future], timeout=0.2)
+                if not future.done():
+                    self.logger.info(
+                        "%s cancelled after %s/%s jobs", self.job_tag, successes + failures, total
+                    )
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                try:
+                    future.result()
+                except Exception as exc:  # noqa: BLE001 - propagate via signal
+                    failures += 1
+                    self._report_failure(job, exc)
+                else:
+                    successes += 1
+                self._report_progress(successes + failures, total, job)
+        finally:
+            remote_pool.shutdown(wait=True, cancel_futures=True)
+            local_pool.shutdown(wait=True, cancel_futures=True)
+            self._local_pool = None
+        return successes, failures
+
+    def _report_failure(self, job: ConversionJob, exc: BaseException) -> None:
+        self.logger.error("%s failed %s", self.job_tag, job.source_path, exc_info=exc)
+        self.file_failed.emit(str(job.source_path), str(exc))
+
+    def _report_progress(self, completed: int, total: int, job: ConversionJob) -> None:
+        self.logger.debug("%s progress %s/%s %s", self.job_tag, completed, total, job.display_name)
+        self.progress.emit(completed, total, job.display_name)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _option_int(self, key: str, default: int) -> int:
+        try:
+            value = int(self._options.get(key) or default)
+        except (TypeError, ValueError):
+            value = default
+        return max(value, 1)
+
+    def _is_remote(self, job: ConversionJob) -> bool:
+        return job.conversion_type == "pdf" and self._use_azure()
+
+    def _run_local(self, fn: Callable[[], _T]) -> _T:
+        """Run CPU-bound follow-up work on the local pool when pipelining."""
+        pool = self._local_pool
+        if pool is None:
+            return fn()
+        return pool.submit(fn).result()
+
+    def _page_count(self, source_path: Path) -> int | None:
+        """Count PDF pages via PyMuPDF as a sanity check."""
+        try:
+            import fitz  # PyMuPDF
+
+            with FITZ_LOCK, fitz.open(source_path) as doc:
+                return len(doc)
+        except Exception:
+            return None
+
+    def _page_cache(self, job: ConversionJob) -> Optional[PageCache]:
+        project_dir, _ = self._project_context(job)
+        if project_dir is None:
+            return None
+        with self._page_caches_lock:
+            cache = self._page_caches.get(project_dir)
+            if cache is None:
+                cache = PageCache(project_dir / PAGE_CACHE_FILENAME)
+                self._page_caches[project_dir] = cache
+        return cache
+
+    def _cached_pages(
+        self, job: ConversionJob, converter: str
+    ) -> tuple[List[str], List[Optional[str]]]:
+        """Return the source's page fingerprints and any cached output for each page."""
+        cache = self._page_cache(job)
+        if cache is None:
+            return [], []
+        try:
+            fingerprints = page_fingerprints(job.source_path)
+        except Exception as exc:  # noqa: BLE001 - fall back to a full conversion
+            self.logger.debug("%s could not fingerprint %s: %s", self.job_tag, job.source_path, exc)
+            return [], []
+        found = cache.get_many(converter, fingerprints)
+        return fingerprints, [found.get(fingerprint) for fingerprint in fingerprints]
+
+    def _remember_pages(
+        self, job: ConversionJob, converter: str, fingerprints: List[str], pages: List[str]
+    ) -> None:
+        cache = self._page_cache(job)
+        if cache is None or not fingerprints:
+            return
+        if len(pages) != len(fingerprints):
+            self.logger.debug(
+                "%s not caching pages of %s: %s pages for %s fingerprints",
+                self.job_tag,
+                job.source_path.name,
+                len(pages),
+                len(fingerprints),
+            )
+            return
+        cache.put_many(converter, zip(fingerprints, pages))
+
     def _execute(self, job: ConversionJob) -> None:
         conversion_type = job.conversion_type
         if conversion_type == "copy":
@@ -129,29 +300,39 @@ class ConversionWorker(DashboardWorker):
 
     def _convert_pdf_locally(self, job: ConversionJob) -> None:
         job.destination_path.parent.mkdir(parents=True, exist_ok=True)
-        raw = extract_text_from_pdf(str(job.source_path))
-        # Replace legacy page markers with HTML comments carrying project-relative path
+        converter = "pdf-local"
+        fingerprints, cached = self._cached_pages(job, converter)
+        missing = [index for index, text in enumerate(cached) if text is None]
+        if fingerprints and len(missing) < len(fingerprints):
+            self.logger.info(
+                "%s reusing %s/%s cached pages for %s",
+                self.job_tag,
+                len(fingerprints) - len(missing),
+                len(fingerprints),
+                job.source_path.name,
+            )
+            with FITZ_LOCK:
+                fresh = extract_page_texts(job.source_path, missing)
+            for index, text in zip(missing, fresh):
+                cached[index] = text
+            self._remember_pages(job, converter, [fingerprints[index] for index in missing], fresh)
+            pages = list(enumerate(cached, start=1))
+            pages_pdf = len(fingerprints)
+        else:
+            # Takes FITZ_LOCK only to open the document; large PDFs are then
+            # extracted across worker processes without holding it.
+            pages, pages_pdf = extract_pdf_pages(str(job.source_path))
+            self._remember_pages(job, converter, fingerprints, [text for _, text in pages])
+        # Page markers are HTML comments carrying the project-relative path
         source_rel = self._project_relative(job)
-        # Pattern like: --- Page N --- at start of a line
-        def _repl(match: re.Match) -> str:
-            n = match.group(1)
-            return f"<!--- {source_rel}#page={n} --->\n"
-
-        content = re.sub(r"^---\s*Page\s*(\d+)\s*---\s*$", _repl, raw, flags=re.MULTILINE)
-        # Inject YAML front-matter with page count (count of markers)
-        pages_detected = len(re.findall(r"<!---\s*.+#page=\d+\s*--->", content)) or 0
-        # Count pages via PyMuPDF as a sanity check
-        try:
-            import fitz  # PyMuPDF
-            pages_pdf = len(fitz.open(job.source_path))
-        except Exception:
-            pages_pdf = None
+        content = "\n\n".join(f"<!--- {source_rel}#page={number} --->\n\n{text}" for number, text in pages)
+        pages_detected = len(pages)
         metadata = self._conversion_metadata(
             job,
             source_format="pdf",
             pages_detected=pages_detected or None,
             pages_pdf=pages_pdf,
-            converter="pdf-local",
+            converter=converter,
         )
         self._warn_if_page_mismatch(job, pages_detected, pages_pdf)
         updated = apply_frontmatter(content, metadata, merge_existing=True)
@@ -167,6 +348,17 @@ class ConversionWorker(DashboardWorker):
         # json_dir.mkdir(parents=True, exist_ok=True)
         json_dir = None
 
+        converter = self._azure_converter_tag()
+        fingerprints, cached = self._cached_pages(job, converter)
+        missing = [index for index, page in enumerate(cached) if page is None]
+        if (
+            fingerprints
+            and len(missing) < len(fingerprints)
+            and len(missing) <= _AZURE_MAX_PAGES
+            and self._convert_changed_pages_with_azure(job, endpoint, key, fingerprints, cached, missing)
+        ):
+            return
+
         json_path, markdown_path = self._process_with_azure(
             job.source_path,
             output_dir,
@@ -175,7 +367,67 @@ class ConversionWorker(DashboardWorker):
             key,
         )
 
-        produced = Path(markdown_path)
+        self._run_local(lambda: self._finish_azure_markdown(job, Path(markdown_path), fingerprints))
+
+        if json_path:
+            self.logger.debug("%s Azure DI JSON saved to %s", self.job_tag, json_path)
+
+    def _convert_changed_pages_with_azure(
+        self,
+        job: ConversionJob,
+        endpoint: str,
+        key: str,
+        fingerprints: List[str],
+        cached: List[Optional[str]],
+        missing: List[int],
+    ) -> bool:
+        """Analyse only the uncached pages and splice them between cached ones.
+
+        Returns False (leaving the caller to convert the whole document) when
+        Azure's page breaks do not line up with the pages that were sent.
+        """
+        converter = self._azure_converter_tag()
+        self.logger.info(
+            "%s reusing %s/%s cached pages for %s",
+            self.job_tag,
+            len(fingerprints) - len(missing),
+            len(fingerprints),
+            job.source_path.name,
+        )
+        if missing:
+            try:
+                from src.core.pdf_utils import analyze_pdf_bytes_with_azure
+            except ImportError as exc:  # pragma: no cover
+                raise RuntimeError(
+                    "Azure Document Intelligence dependencies are not installed. "
+                    "Install azure-ai-documentintelligence to enable this helper."
+                ) from exc
+
+            with FITZ_LOCK:
+                pdf_bytes = pages_to_pdf_bytes(job.source_path, missing)
+            fresh = split_markdown_pages(analyze_pdf_bytes_with_azure(pdf_bytes, endpoint, key))
+            if len(fresh) != len(missing):
+                self.logger.info(
+                    "%s Azure DI returned %s pages for %s changed pages of %s; converting the whole document",
+                    self.job_tag,
+                    len(fresh),
+                    len(missing),
+                    job.source_path.name,
+                )
+                return False
+            for index, page in zip(missing, fresh):
+                cached[index] = page
+            self._remember_pages(job, converter, [fingerprints[index] for index in missing], fresh)
+
+        # Same layout as process_pdf_with_azure output, so marker insertion is unchanged.
+        produced = job.destination_path
+        produced.write_text(f"# {job.source_path.name}\n\n" + join_markdown_pages(cached), encoding="utf-8")
+        self._run_local(lambda: self._finish_azure_markdown(job, produced))
+        return True
+
+    def _finish_azure_markdown(
+        self, job: ConversionJob, produced: Path, fingerprints: Optional[List[str]] = None
+    ) -> None:
         final_path = job.destination_path
         if produced != final_path:
             if final_path.exists():
@@ -188,28 +440,23 @@ class ConversionWorker(DashboardWorker):
         except Exception as exc:  # pragma: no cover - defensive
             self.logger.warning("Failed to read Azure DI markdown for page markers: %s", exc)
             return
+        if fingerprints:
+            body = content.removeprefix(f"# {job.source_path.name}\n\n")
+            self._remember_pages(job, self._azure_converter_tag(), fingerprints, split_markdown_pages(body))
         source_rel = self._project_relative(job)
         content_marked, pages_detected = self._insert_azure_page_markers(content, source_rel)
-        try:
-            import fitz  # PyMuPDF
-            pages_pdf = len(fitz.open(job.source_path))
-        except Exception:
-            pages_pdf = None
-        converter_tag = f"pdf-{self._helper_id.replace('_', '-')}"
+        pages_pdf = self._page_count(job.source_path)
         metadata = self._conversion_metadata(
             job,
             source_format="pdf",
             pages_detected=pages_detected or None,
             pages_pdf=pages_pdf,
-            converter=converter_tag,
+            converter=self._azure_converter_tag(),
         )
         updated = apply_frontmatter(content_marked, metadata, merge_existing=True)
         final_path.write_text(updated, encoding="utf-8")
         self._warn_if_page_mismatch(job, pages_detected, pages_pdf)
 
-        if json_path:
-            self.logger.debug("%s Azure DI JSON saved to %s", self.job_tag, json_path)
-
     def _azure_credentials(self) -> tuple[str, str]:
         settings = SecureSettings()
         endpoint = (settings.get("azure_di_settings", {}) or {}).get("endpoint", "")
@@ -246,6 +493,9 @@ class ConversionWorker(DashboardWorker):
             key,
         )
 
+    def _azure_converter_tag(self) -> str:
+        return f"pdf-{self._helper_id.replace('_', '-')}"
+
     def _use_azure(self) -> bool:
         return self._helper_id == "azure_di"
 
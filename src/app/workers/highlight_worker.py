@@ -2,25 +2,36 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from PySide6.QtCore import Signal
 
-from src.app.core.highlight_extractor import HighlightExtractor
+from src.app.core.highlight_cache import HIGHLIGHT_CACHE_FILENAME, HighlightCache
+from src.app.core.highlight_extractor import HighlightExtractor, collection_from_records
 from src.app.core.highlights import (
+    HIGHLIGHT_INDEX_FILENAME,
     HighlightCollection,
+    HighlightIndex,
     aggregate_highlights_by_color,
     save_color_aggregates,
     save_highlights_markdown,
     save_placeholder_markdown,
 )
 from src.app.core.highlight_manager import HighlightJob
+from src.core.pdf_highlights import get_highlight_pool, read_highlight_annotations, shutdown_highlight_pool
 from .base import DashboardWorker
 
+# Below this many PDFs to extract, worker-process start-up outweighs the gain.
+PARALLEL_EXTRACTION_MIN_JOBS = 4
+
 
 @dataclass(slots=True)
 class HighlightExtractionSummary:
@@ -34,16 +45,38 @@ class HighlightExtractionSummary:
 
 
 class HighlightWorker(DashboardWorker):
-    """Extract highlights for a batch of PDF documents."""
+    """Extract highlights for a batch of PDF documents.
+
+    PDFs whose size and mtime (or checksum) match the project's highlight
+    cache reuse their previous result and keep their existing output. The
+    rest are extracted on the shared highlight process pool, at most
+    ``max_workers`` at a time, when there are enough of them, otherwise in
+    this thread. Results are
+    written and reported in job order either way.
+
+    ``selected_sources`` lists the source-relative PDF paths of the current
+    selection; color aggregates drop documents outside it. When omitted, only
+    documents whose PDF no longer exists are dropped. ``word_index`` selects
+    the :class:`HighlightExtractor` text-recovery mode for both paths.
+    """
 
     progress = Signal(int, int, str)
     file_failed = Signal(str, str)
     finished = Signal(int, int)
 
-    def __init__(self, jobs: Iterable[HighlightJob]) -> None:
+    def __init__(
+        self,
+        jobs: Iterable[HighlightJob],
+        *,
+        max_workers: Optional[int] = None,
+        selected_sources: Optional[Iterable[str]] = None,
+        word_index: bool = False,
+    ) -> None:
         super().__init__(worker_name="highlights")
         self._jobs: List[HighlightJob] = list(jobs)
-        self._extractor = HighlightExtractor()
+        self._selected_sources = None if selected_sources is None else set(selected_sources)
+        self._extractor = HighlightExtractor(word_index=word_index)
+        self._max_workers = max(1, max_workers or os.cpu_count() or 1)
         self.summary: Optional[HighlightExtractionSummary] = None
 
     def _run(self) -> None:  # pragma: no cover - executed in worker thread
@@ -53,63 +86,80 @@ class HighlightWorker(DashboardWorker):
         failures = 0
         documents_with_highlights = 0
         total_highlights = 0
-        collections_for_colors: List[tuple[HighlightJob, HighlightCollection]] = []
+        processed: List[tuple[HighlightJob, HighlightCollection]] = []
         colors_root: Optional[Path] = None
         generated_at = datetime.now(timezone.utc)
 
-        for index, job in enumerate(self._jobs, start=1):
-            if self.is_cancelled():
-                self.logger.info("%s cancelled after %s/%s jobs", self.job_tag, index - 1, total)
-                break
+        cache = self._open_cache()
+        cached: Dict[int, HighlightCollection] = {}
+        if cache is not None:
+            for position, job in enumerate(self._jobs):
+                hit = cache.lookup(job.source_pdf)
+                if hit is not None and job.highlight_output.exists():
+                    cached[position] = hit
+        if cached:
+            self.logger.info("%s reusing cached highlights for %s/%s PDFs", self.job_tag, len(cached), total)
+        pending = [position for position in range(total) if position not in cached]
+        queued = self._parallel_positions(pending)
+        futures: Dict[int, Future] = {}
 
-            try:
-                collection = self._process_job(job)
-                if collection and not collection.is_empty():
-                    documents_with_highlights += 1
-                    total_highlights += len(collection.highlights)
-                    collections_for_colors.append((job, collection))
+        try:
+            for index, job in enumerate(self._jobs, start=1):
+                if self.is_cancelled():
+                    self.logger.info("%s cancelled after %s/%s jobs", self.job_tag, index - 1, total)
+                    break
+
+                self._submit_extractions(queued, futures)
+                try:
+                    collection = cached.get(index - 1)
+                    if collection is None:
+                        future = futures.pop(index - 1, None)
+                        if future is not None:
+                            try:
+                                extracted = collection_from_records(job.source_pdf, future.result())
+                            except BrokenProcessPool:
+                                self.logger.warning("%s highlight workers stopped; extracting in-thread", self.job_tag)
+                                shutdown_highlight_pool()
+                                queued.clear()
+                                extracted = self._extractor.extract(job.source_pdf)
+                            collection = self._write_outputs(job, extracted)
+                        else:
+                            collection = self._process_job(job)
+                        if cache is not None:
+                            cache.store(job.source_pdf, collection)
+                    processed.append((job, collection))
+                    if not collection.is_empty():
+                        documents_with_highlights += 1
+                        total_highlights += len(collection.highlights)
                     if colors_root is None:
                         colors_root = _resolve_colors_root(job.highlight_output)
-                elif colors_root is None:
-                    colors_root = _resolve_colors_root(job.highlight_output)
-            except Exception as exc:  # noqa: BLE001 - surface via signal
-                failures += 1
-                self.logger.exception("%s failed %s", self.job_tag, job.source_pdf)
-                self.file_failed.emit(str(job.source_pdf), str(exc))
-            else:
-                successes += 1
-            finally:
-                self.logger.debug(
-                    "%s progress %s/%s %s",
-                    self.job_tag,
-                    successes + failures,
-                    total,
-                    job.converted_relative,
-                )
-                self.progress.emit(successes + failures, total, job.converted_relative)
+                except Exception as exc:  # noqa: BLE001 - surface via signal
+                    failures += 1
+                    self.logger.exception("%s failed %s", self.job_tag, job.source_pdf)
+                    self.file_failed.emit(str(job.source_pdf), str(exc))
+                else:
+                    successes += 1
+                finally:
+                    self.logger.debug(
+                        "%s progress %s/%s %s",
+                        self.job_tag,
+                        successes + failures,
+                        total,
+                        job.converted_relative,
+                    )
+                    self.progress.emit(successes + failures, total, job.converted_relative)
+        finally:
+            for future in futures.values():
+                future.cancel()
+            if cache is not None:
+                cache.save()
 
         color_files_written = 0
         if self.is_cancelled():
             self.summary = None
         else:
             if colors_root is not None:
-                colors_root.mkdir(parents=True, exist_ok=True)
-            if collections_for_colors and colors_root is not None:
-                aggregates = aggregate_highlights_by_color(
-                    [
-                        (job.pdf_relative, collection)
-                        for job, collection in collections_for_colors
-                    ]
-                )
-                written = save_color_aggregates(
-                    aggregates,
-                    colors_root,
-                    generated_at=generated_at,
-                )
-                color_files_written = len(written)
-            elif colors_root is not None:
-                for existing in colors_root.glob("*.md"):
-                    existing.unlink()
+                color_files_written = self._update_color_aggregates(colors_root, processed, generated_at)
 
             if total:
                 self.summary = HighlightExtractionSummary(
@@ -123,9 +173,52 @@ class HighlightWorker(DashboardWorker):
         self.logger.info("%s finished: successes=%s failures=%s", self.job_tag, successes, failures)
         self.finished.emit(successes, failures)
 
+    def _update_color_aggregates(
+        self,
+        colors_root: Path,
+        processed: List[tuple[HighlightJob, HighlightCollection]],
+        generated_at: datetime,
+    ) -> int:
+        """Merge this run's documents into the highlight index and refresh affected color files.
+
+        Documents outside this run keep their entries, so extracting only new
+        PDFs still yields complete aggregates; documents whose PDF is gone or
+        that fall outside ``selected_sources`` are dropped. Without a prior
+        index every color file is rebuilt once; afterwards only colors whose
+        entries changed are rewritten.
+        """
+
+        colors_root.mkdir(parents=True, exist_ok=True)
+        index = HighlightIndex(colors_root / HIGHLIGHT_INDEX_FILENAME)
+        touched = index.prune_missing_sources()
+        if self._selected_sources is not None:
+            touched |= index.prune_unselected(self._selected_sources)
+        for job, collection in processed:
+            touched |= index.update(job.pdf_relative, collection)
+        colors = touched if index.exists else None
+        if colors is not None and not colors:
+            index.save()
+            return 0
+        aggregates = aggregate_highlights_by_color(index.collections(), colors=colors)
+        written = save_color_aggregates(
+            aggregates,
+            colors_root,
+            generated_at=generated_at,
+            colors=colors,
+        )
+        index.save()
+        self.logger.debug(
+            "%s rewrote %s color files (%s)",
+            self.job_tag,
+            len(written),
+            "all" if colors is None else ", ".join(sorted(colors)),
+        )
+        return len(written)
+
     def _process_job(self, job: HighlightJob) -> HighlightCollection:
-        collection = self._extractor.extract(job.source_pdf)
+        return self._write_outputs(job, self._extractor.extract(job.source_pdf))
 
+    def _write_outputs(self, job: HighlightJob, collection: Optional[HighlightCollection]) -> HighlightCollection:
         if collection is None:
             raise RuntimeError("Highlight extraction returned no result")
 
@@ -145,6 +238,41 @@ class HighlightWorker(DashboardWorker):
         )
         return collection
 
+    def _open_cache(self) -> Optional[HighlightCache]:
+        if not self._jobs:
+            return None
+        highlights_root = next(
+            (parent for parent in self._jobs[0].highlight_output.parents if parent.name == "highlights"),
+            None,
+        )
+        if highlights_root is None:
+            return None
+        return HighlightCache(highlights_root.parent / HIGHLIGHT_CACHE_FILENAME)
+
+    def _parallel_positions(self, positions: List[int]) -> deque[int]:
+        """Return the positions to extract on the process pool, or none when too few."""
+
+        workers = min(self._max_workers, len(positions))
+        if len(positions) < PARALLEL_EXTRACTION_MIN_JOBS or workers <= 1:
+            return deque()
+        self.logger.info("%s extracting %s PDFs on up to %s processes", self.job_tag, len(positions), workers)
+        return deque(positions)
+
+    def _submit_extractions(self, queued: deque[int], futures: Dict[int, Future]) -> None:
+        """Keep up to ``max_workers`` queued extractions in flight on the shared pool."""
+
+        while queued and len(futures) < self._max_workers:
+            position = queued.popleft()
+            try:
+                futures[position] = get_highlight_pool().submit(
+                    read_highlight_annotations,
+                    str(self._jobs[position].source_pdf),
+                    self._extractor.word_index,
+                )
+            except Exception as exc:  # noqa: BLE001 - fall back to in-thread extraction
+                self.logger.warning("%s process pool unavailable, extracting in-thread: %s", self.job_tag, exc)
+                queued.clear()
+
 
 def _resolve_colors_root(highlight_output: Path) -> Path:
     """Return the colors directory under highlights/, migrating legacy layout."""
@@ -0,0 +1,119 @@
+"""Journaled storage for bulk-analysis manifests.
+
+A manifest is kept as a JSON snapshot (the existing ``manifest.json``) plus an
+append-only JSONL journal of keyed updates beside it. Recording an update
+appends one line, so its cost does not grow with the size of the manifest;
+the snapshot is rewritten atomically (temp file + ``os.replace``) only when
+the journal is compacted. A crash can at worst truncate the final journal
+line, which is ignored on load, so resume state is never corrupted.
+
+Existing ``manifest.json`` files load unchanged: they are simply a snapshot
+with no journal.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from src.app.core.atomic_json import write_json_atomic
+
+LOGGER = logging.getLogger(__name__)
+
+# Journal lines recorded before :meth:`ManifestJournal.record` asks the caller
+# to compact into a fresh snapshot.
+COMPACT_AFTER = 1000
+
+
+class ManifestJournal:
+    """Snapshot-plus-journal store for one manifest file."""
+
+    def __init__(self, path: Path, *, compact_after: int = COMPACT_AFTER) -> None:
+        self.path = Path(path)
+        self.compact_after = compact_after
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def journal_path(self) -> Path:
+        return self.path.with_name(self.path.stem + ".journal.jsonl")
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the snapshot with journaled updates applied, or None if absent or unreadable."""
+
+        data: Optional[Dict[str, Any]] = None
+        if self.path.exists():
+            try:
+                loaded = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                LOGGER.warning("Ignoring unreadable manifest %s", self.path, exc_info=True)
+                loaded = None
+            if isinstance(loaded, dict):
+                data = loaded
+
+        applied = 0
+        torn = False
+        if self.journal_path.exists():
+            data = dict(data or {})
+            with self.journal_path.open("r", encoding="utf-8", errors="replace") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                        keys = record["k"]
+                    except Exception:
+                        # Only the final line can be torn by a crash; stop there.
+                        torn = True
+                        break
+                    _apply(data, keys, record.get("v"))
+                    applied += 1
+        if torn and data is not None:
+            # Fold the intact updates into the snapshot so later appends do
+            # not land behind the torn line.
+            LOGGER.warning("Recovered manifest journal %s after an interrupted write", self.journal_path)
+            self.compact(data)
+            return data
+        with self._lock:
+            self._pending = applied
+        return data
+
+    def record(self, keys: Sequence[str], value: Any) -> bool:
+        """Append one ``keys = value`` update; return True once compaction is due."""
+
+        line = json.dumps({"k": list(keys), "v": value}, sort_keys=True, separators=(",", ":"))
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+            self._pending += 1
+            return self._pending >= self.compact_after
+
+    def compact(self, payload: Dict[str, Any]) -> None:
+        """Atomically replace the snapshot with ``payload`` and drop the journal."""
+
+        with self._lock:
+            write_json_atomic(self.path, payload)
+            try:
+                self.journal_path.unlink()
+            except FileNotFoundError:
+                pass
+            self._pending = 0
+
+
+def _apply(data: Dict[str, Any], keys: Sequence[str], value: Any) -> None:
+    if not keys:
+        return
+    target = data
+    for key in keys[:-1]:
+        child = target.get(key)
+        if not isinstance(child, dict):
+            child = {}
+            target[key] = child
+        target = child
+    target[keys[-1]] = value
+
+
+__all__ = ["COMPACT_AFTER", "ManifestJournal", "write_json_atomic"]
@@ -10,6 +10,7 @@ from typing import Dict, List, Mapping, Optional, Sequence
 import frontmatter
 from PySide6.QtCore import Signal
 
+from src.app.core.bulk_analysis_runner import map_bounded
 from src.app.core.project_manager import ProjectMetadata
 from src.app.core.prompt_placeholders import format_prompt
 from src.app.core.refinement_prompt import (
@@ -32,9 +33,19 @@ from src.common.markdown import (
 
 from .report_common import ReportWorkerBase
 
+# Sections only share the run's inputs, so several can be generated at once.
+DEFAULT_MAX_CONCURRENT_SECTIONS = 4
+DEFAULT_SECTION_RETRIES = 1
+
 
 class DraftReportWorker(ReportWorkerBase):
-    """Generate a draft report from selected project inputs."""
+    """Generate a draft report from selected project inputs.
+
+    Template sections are generated with up to ``max_concurrent_sections``
+    requests in flight and assembled in template order. A failed section is
+    retried ``section_retries`` times; if it still fails, the whole draft
+    fails and nothing is written.
+    """
 
     progress = Signal(int, str)
     log_message = Signal(str)
@@ -58,6 +69,8 @@ class DraftReportWorker(ReportWorkerBase):
         max_report_tokens: int = 60_000,
         placeholder_values: Mapping[str, str] | None = None,
         project_name: str = "",
+        max_concurrent_sections: int = DEFAULT_MAX_CONCURRENT_SECTIONS,
+        section_retries: int = DEFAULT_SECTION_RETRIES,
     ) -> None:
         super().__init__(
             worker_name="report-draft",
@@ -76,6 +89,8 @@ class DraftReportWorker(ReportWorkerBase):
         self._transcript_path = Path(transcript_path) if transcript_path else None
         self._generation_user_prompt_path = Path(generation_user_prompt_path).expanduser()
         self._generation_system_prompt_path = Path(generation_system_prompt_path).expanduser()
+        self._max_concurrent_sections = max(int(max_concurrent_sections or 1), 1)
+        self._section_retries = max(int(section_retries or 0), 0)
 
     # ------------------------------------------------------------------
     # QRunnable implementation
@@ -256,45 +271,90 @@ class DraftReportWorker(ReportWorkerBase):
         placeholder_map: Mapping[str, str],
     ) -> List[dict]:
         provider = self._create_provider(system_prompt)
-        outputs: List[dict] = []
+        prompts = [
+            format_prompt(
+                user_prompt_template,
+                build_report_generation_placeholders(
+                    base_placeholders=placeholder_map,
+                    template_section=section.body.strip(),
+                    section_title=section.title or "",
+                    transcript=transcript_text,
+                    additional_documents=additional_documents,
+                ),
+            )
+            for section in sections
+        ]
 
         total = len(sections)
-        for index, section in enumerate(sections, start=1):
-            generation_placeholders = build_report_generation_placeholders(
-                base_placeholders=placeholder_map,
-                template_section=section.body.strip(),
-                section_title=section.title or "",
-                transcript=transcript_text,
-                additional_documents=additional_documents,
-            )
-            prompt = format_prompt(user_prompt_template, generation_placeholders)
-
-            pct = 5 + int(60 * index / max(total, 1))
-            self.progress.emit(pct, f"Generating section {index} of {total}: {section.title}")
-            response = provider.generate(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                model=self._custom_model or self._model,
-                temperature=0.2,
-                max_tokens=self._max_report_tokens,
-            )
-            if not response.get("success"):
-                raise RuntimeError(
-                    response.get("error", f"Failed to generate section: {section.title}")
-                )
-            content = (response.get("content") or "").strip()
-            if not content:
-                raise RuntimeError(f"Generated section is empty: {section.title}")
-            outputs.append(
-                {
-                    "title": section.title,
-                    "prompt": prompt,
-                    "content": content,
-                }
-            )
-            self.log_message.emit(f"Section generated: {section.title}")
+        completed = 0
+
+        def _generate(index: int) -> str:
+            section = sections[index]
+            attempts = self._section_retries + 1
+            for attempt in range(1, attempts + 1):
+                if self.is_cancelled():
+                    raise RuntimeError("Draft generation cancelled")
+                try:
+                    return self._generate_section(provider, section, prompts[index], system_prompt)
+                except Exception as exc:
+                    if attempt >= attempts:
+                        raise
+                    self.logger.warning(
+                        "%s section %r failed (attempt %s/%s): %s",
+                        self.job_tag,
+                        section.title,
+                        attempt,
+                        attempts,
+                        exc,
+                    )
+                    self.log_message.emit(f"Retrying section {section.title}: {exc}")
+            raise AssertionError("unreachable")  # pragma: no cover
+
+        def _record(index: int, _content: str) -> None:
+            nonlocal completed
+            completed += 1
+            title = sections[index].title
+            pct = 5 + int(60 * completed / max(total, 1))
+            self.progress.emit(pct, f"Generated section {completed} of {total}: {title}")
+            self.log_message.emit(f"Section generated: {title}")
+
+        concurrency = min(self._max_concurrent_sections, total)
+        if concurrency > 1:
+            self.log_message.emit(f"Generating up to {concurrency} section(s) at a time…")
+        self.progress.emit(5, f"Generating {total} section(s)…")
+        contents = map_bounded(
+            list(range(total)),
+            _generate,
+            max_workers=concurrency,
+            on_complete=_record,
+            thread_name_prefix=f"report-{self.job_id}",
+        )
 
-        return outputs
+        return [
+            {
+                "title": section.title,
+                "prompt": prompt,
+                "content": content,
+            }
+            for section, prompt, content in zip(sections, prompts, contents)
+        ]
+
+    def _generate_section(self, provider, section: TemplateSection, prompt: str, system_prompt: str) -> str:
+        response = provider.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=self._custom_model or self._model,
+            temperature=0.2,
+            max_tokens=self._max_report_tokens,
+        )
+        if not response.get("success"):
+            raise RuntimeError(
+                response.get("error", f"Failed to generate section: {section.title}")
+            )
+        content = (response.get("content") or "").strip()
+        if not content:
+            raise RuntimeError(f"Generated section is empty: {section.title}")
+        return content
 
     def _combine_section_outputs(self, outputs: Sequence[dict]) -> str:
         combined_sections = []
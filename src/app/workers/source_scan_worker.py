@@ -0,0 +1,99 @@
+"""Background discovery of directories under a project's source root and tracked folders."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import Signal
+
+from src.app.core.workspace_watcher import list_watch_directories
+from .base import DashboardWorker
+
+
+def list_source_directories(
+    root_path: Path,
+    *,
+    is_skipped: Callable[[str], bool] = lambda name: False,
+    is_cancelled: Callable[[], bool] = lambda: False,
+) -> Optional[List[str]]:
+    """Return every directory below ``root_path`` as a root-relative POSIX path.
+
+    Walks with ``os.scandir`` so each directory costs one listing. Entries for
+    which ``is_skipped(name)`` is true are not reported or descended into.
+    Symlinked directories are reported but not followed. Returns None when
+    ``is_cancelled`` reports cancellation part way through.
+    """
+
+    results: List[str] = []
+    pending: List[str] = [""]
+    while pending:
+        if is_cancelled():
+            return None
+        relative = pending.pop()
+        directory = root_path / relative if relative else root_path
+        prefix = f"{relative}/" if relative else ""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if is_skipped(entry.name):
+                        continue
+                    try:
+                        if not entry.is_dir():
+                            continue
+                        child = prefix + entry.name
+                        results.append(child)
+                        if not entry.is_symlink():
+                            pending.append(child)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    results.sort()
+    return results
+
+
+class SourceScanWorker(DashboardWorker):
+    """List every directory under a source root off the UI thread."""
+
+    finished = Signal(list)  # root-relative directory paths
+
+    def __init__(self, root_path: Path, *, is_skipped: Callable[[str], bool] = lambda name: False) -> None:
+        super().__init__(worker_name="source_scan")
+        self._root_path = root_path
+        self._is_skipped = is_skipped
+
+    def _run(self) -> None:  # pragma: no cover - executed in worker thread
+        directories = list_source_directories(
+            self._root_path,
+            is_skipped=self._is_skipped,
+            is_cancelled=self.is_cancelled,
+        )
+        if directories is None:
+            self.logger.info("%s cancelled while scanning %s", self.job_tag, self._root_path)
+            return
+        self.logger.debug("%s found %s directories under %s", self.job_tag, len(directories), self._root_path)
+        self.finished.emit(directories)
+
+
+class WatchScanWorker(DashboardWorker):
+    """List the directories a :class:`WorkspaceWatcher` should watch, off the UI thread."""
+
+    finished = Signal(list)  # absolute directory paths
+
+    def __init__(self, project_dir: Path, *, limit: Optional[int] = None) -> None:
+        super().__init__(worker_name="watch_scan")
+        self._project_dir = project_dir
+        self._limit = limit
+
+    def _run(self) -> None:  # pragma: no cover - executed in worker thread
+        directories = list_watch_directories(self._project_dir, limit=self._limit, is_cancelled=self.is_cancelled)
+        if directories is None:
+            self.logger.info("%s cancelled while scanning %s", self.job_tag, self._project_dir)
+            return
+        self.logger.debug("%s found %s directories under %s", self.job_tag, len(directories), self._project_dir)
+        self.finished.emit(directories)
+
+
+__all__ = ["SourceScanWorker", "WatchScanWorker", "list_source_directories"]
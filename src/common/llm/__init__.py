@@ -7,15 +7,33 @@ This package provides a clean, modular interface for working with various LLM pr
 
 from .base import BaseLLMProvider
 from .chunking import ChunkingStrategy
-from .tokens import TokenCounter, MODEL_CONTEXT_WINDOWS, count_tokens_cached
+from .rate_limit import RateLimiter, configure_rate_limit, get_rate_limiter
+from .response_cache import ResponseCache, open_response_cache, response_cache_key
+from .tokens import (
+    TokenCounter,
+    TokenEncoder,
+    MODEL_CONTEXT_WINDOWS,
+    count_tokens_cached,
+    get_tokenizer,
+    register_tokenizer,
+)
 from .factory import create_provider, get_available_providers
 
 __all__ = [
     'BaseLLMProvider',
     'ChunkingStrategy',
+    'RateLimiter',
+    'configure_rate_limit',
+    'get_rate_limiter',
+    'ResponseCache',
+    'open_response_cache',
+    'response_cache_key',
     'TokenCounter',
+    'TokenEncoder',
     'MODEL_CONTEXT_WINDOWS',
     'count_tokens_cached',
+    'get_tokenizer',
+    'register_tokenizer',
     'create_provider',
     'get_available_providers',
 ]
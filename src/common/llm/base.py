@@ -3,15 +3,26 @@ Abstract base class for LLM providers following Qt/PySide6 patterns.
 """
 
 import abc
+import asyncio
+import inspect
 import logging
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 
 from PySide6.QtCore import QObject, Signal, Property
 from dotenv import load_dotenv
 
+from .rate_limit import get_rate_limiter
 from .tokens import TokenCounter
 
+_T = TypeVar("_T")
+
+# Async clients created on each event loop, with the provider cache holding them.
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[tuple]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -55,6 +66,11 @@ class BaseLLMProvider(QObject):
         self.max_retries = max_retries
         self.debug = debug
         self._initialized = False
+        # Async SDK clients hold connection pools bound to the loop that
+        # created them, so keep one per running event loop.
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
         
         # Set default system prompt
         if default_system_prompt is None:
@@ -132,6 +148,34 @@ class BaseLLMProvider(QObject):
         """
         pass
     
+    async def agenerate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 32000,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Coroutine variant of :meth:`generate`.
+        
+        Providers with an async SDK override this so many requests can share
+        one thread; the default runs :meth:`generate` in a worker thread.
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            prompt=prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+        )
+    
+    @property
+    def supports_async(self) -> bool:
+        """Whether :meth:`agenerate` uses a native async client."""
+        return type(self).agenerate is not BaseLLMProvider.agenerate
+    
     @abc.abstractmethod
     def count_tokens(
         self,
@@ -160,6 +204,62 @@ class BaseLLMProvider(QObject):
         """Return the default model for this provider."""
         pass
     
+    def _rate_limited_call(
+        self,
+        model: Optional[str],
+        request: Callable[[], _T],
+        *,
+        prompt: str = "",
+        system_prompt: Optional[str] = None,
+    ) -> _T:
+        """
+        Send ``request`` through the shared limiter for this provider/model.
+
+        The limiter paces requests/tokens per minute, adapts concurrency and
+        owns retries for throttled and transient errors (up to ``max_retries``),
+        so SDK clients should be created with their own retries disabled.
+        ``request`` may return an SDK raw response (``with_raw_response``) so the
+        limiter learns rate-limit headers from successful calls too.
+        """
+        text = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+        estimate = TokenCounter.count(text=text, provider=self.provider_name, model=model)
+        return get_rate_limiter(self.provider_name, model or self.default_model).call(
+            request,
+            estimated_tokens=int(estimate.get("token_count") or 0),
+            max_retries=self.max_retries,
+        )
+    
+    async def _arate_limited_call(
+        self,
+        model: Optional[str],
+        request: Callable[[], Awaitable[_T]],
+        *,
+        prompt: str = "",
+        system_prompt: Optional[str] = None,
+    ) -> _T:
+        """Coroutine variant of :meth:`_rate_limited_call`; ``request`` makes a new awaitable per attempt."""
+        text = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+        estimate = TokenCounter.count(text=text, provider=self.provider_name, model=model)
+        return await get_rate_limiter(self.provider_name, model or self.default_model).acall(
+            request,
+            estimated_tokens=int(estimate.get("token_count") or 0),
+            max_retries=self.max_retries,
+        )
+    
+    def _async_client(self, factory: Callable[[], Any]) -> Any:
+        """
+        Return the async SDK client for the running event loop, creating it once.
+        
+        Clients are closed by :func:`aclose_async_clients` before their loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = factory()
+            self._async_clients[loop] = client
+            _loop_clients.setdefault(loop, []).append((self._async_clients, client))
+        return client
+    
     def emit_progress(self, percent: int, message: str):
         """Emit a progress update."""
         self.progress_updated.emit(percent, message)
@@ -171,4 +271,24 @@ class BaseLLMProvider(QObject):
     
     def emit_response(self, response: Dict[str, Any]):
         """Emit a response."""
-        self.response_ready.emit(response)
\ No newline at end of file
+        self.response_ready.emit(response)
+
+async def aclose_async_clients() -> None:
+    """
+    Close every provider async client created on the running event loop.
+    
+    Call this before a short-lived loop finishes so SDK connection pools are
+    released rather than leaked once the loop is gone.
+    """
+    loop = asyncio.get_running_loop()
+    for cache, client in _loop_clients.pop(loop, []):
+        cache.pop(loop, None)
+        close = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if close is None:
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logging.debug(f"Failed to close async client {type(client).__name__}: {e}")
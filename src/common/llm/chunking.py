@@ -3,12 +3,32 @@ Markdown-aware document chunking strategies using langchain-text-splitters.
 """
 
 import logging
+import re
 from typing import List, Optional, Tuple
 from langchain_text_splitters import MarkdownHeaderTextSplitter
 
+from .tokens import TokenCounter
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Boundary strengths used by the token chunker. Chunks prefer to end on the
+# strongest boundary available near the budget; overlap only starts on a
+# sentence boundary or better.
+_HEADER, _PARAGRAPH, _SENTENCE, _WORD, _CHAR = 3, 2, 1, 0, -1
+
+# Whitespace runs that contain a newline, or that follow sentence punctuation
+# (optionally closed by quotes/brackets). The boundary is the end of the run.
+_BOUNDARY_RE = re.compile(r"[ \t]*\n\s*|(?<=[.!?])[\"'\u201d\u2019)\]]*\s+")
+
+# A chunk is cut on the strongest boundary whose prefix fills at least this
+# share of the budget, so chunks stay full instead of ending at the first
+# header.
+_MIN_FILL = 0.75
+
+# Span = (start, end, token_count, boundary strength at end)
+_Span = Tuple[int, int, int, int]
+
 
 class ChunkingStrategy:
     """Provides various strategies for chunking documents."""
@@ -109,6 +129,84 @@ class ChunkingStrategy:
         
         return chunks
     
+    @staticmethod
+    def markdown_tokens(
+        text: str,
+        max_tokens: int,
+        provider: str = "anthropic",
+        model: Optional[str] = None,
+        overlap_tokens: int = 500,
+    ) -> List[str]:
+        """
+        Split text into chunks measured with the provider's tokenizer.
+
+        The text is scanned once for header, paragraph and sentence boundaries
+        and packed as (start, end) offsets; chunk strings are only sliced out at
+        the end. Headers stay inline instead of being re-prepended, cuts prefer
+        the strongest boundary near the budget, and overlap is whole sentences
+        or paragraphs taken from the end of the previous chunk.
+
+        Args:
+            text: The markdown text to split
+            max_tokens: Hard token budget per chunk
+            provider: Provider id used to pick the tokenizer
+            model: Model name used to pick the tokenizer
+            overlap_tokens: Maximum tokens repeated from the previous chunk
+
+        Returns:
+            List of text chunks, none exceeding ``max_tokens``
+        """
+        if not text or not text.strip():
+            return [text] if text else []
+        ranges = ChunkingStrategy.token_ranges(text, max_tokens, provider, model, overlap_tokens)
+        chunks = [text[start:end] for start, end, _ in ranges]
+
+        logger.info(f"Split document into {len(chunks)} chunks of at most {max_tokens} tokens")
+        return chunks or [text]
+
+    @staticmethod
+    def token_ranges(
+        text: str,
+        max_tokens: int,
+        provider: str = "anthropic",
+        model: Optional[str] = None,
+        overlap_tokens: int = 500,
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Return ``(start, end, token_count)`` character ranges for ``markdown_tokens``.
+
+        Ranges are trimmed of surrounding whitespace, may overlap, and each
+        measures at most ``max_tokens`` when sliced out of ``text``.
+        """
+        max_tokens = max(int(max_tokens), 1)
+        overlap_tokens = max(0, min(int(overlap_tokens), max_tokens // 4))
+        if not text.strip():
+            return []
+
+        spans = _segment(text, max_tokens, provider, model)
+        ranges = [_trim(text, start, end) for start, end in _pack_spans(spans, max_tokens, overlap_tokens)]
+        ranges = [(start, end) for start, end in ranges if end > start]
+        counts = TokenCounter.count_many(
+            [text[start:end] for start, end in ranges], provider=provider, model=model, use_cache=False
+        )
+
+        result: List[Tuple[int, int, int]] = []
+        for (start, end), count in zip(ranges, counts):
+            if count <= max_tokens:
+                result.append((start, end, count))
+                continue
+            # Tokens merged across a boundary pushed this chunk over; split it
+            # again with a budget scaled down by the overshoot.
+            scaled = min(max(1, (max_tokens * max_tokens) // count - 1), max_tokens - 1)
+            if scaled < 1 or end - start <= 1:
+                result.append((start, end, count))
+                continue
+            for sub_start, sub_end, sub_count in ChunkingStrategy.token_ranges(
+                text[start:end], scaled, provider, model, overlap_tokens=0
+            ):
+                result.append((start + sub_start, start + sub_end, sub_count))
+        return result
+
     @staticmethod
     def simple_overlap(
         text: str,
@@ -171,4 +269,144 @@ class ChunkingStrategy:
             start = max(end - overlap, start + 1)
         
         logger.info(f"Split document into {len(chunks)} chunks using simple overlap")
-        return chunks if chunks else [text]
\ No newline at end of file
+        return chunks if chunks else [text]
+
+
+def _segment(text: str, max_tokens: int, provider: str, model: Optional[str]) -> List[_Span]:
+    """Return sentence-level spans covering ``text`` with their token counts."""
+
+    bounds: List[Tuple[int, int]] = []
+    position = 0
+    for match in _BOUNDARY_RE.finditer(text):
+        end = match.end()
+        if end <= position or end >= len(text):
+            continue
+        if text.startswith("#", end):
+            strength = _HEADER
+        elif match.group().count("\n") >= 2:
+            strength = _PARAGRAPH
+        else:
+            strength = _SENTENCE
+        bounds.append((end, strength))
+        position = end
+    bounds.append((len(text), _HEADER))
+
+    starts = [0] + [end for end, _ in bounds[:-1]]
+    counts = TokenCounter.count_many(
+        [text[start:end] for start, (end, _) in zip(starts, bounds)],
+        provider=provider,
+        model=model,
+        use_cache=False,
+    )
+
+    spans: List[_Span] = []
+    for start, (end, strength), count in zip(starts, bounds, counts):
+        # Per-span counts are not exactly additive (tokens can merge across a
+        # boundary, estimates round down); one token of slack per span keeps
+        # the packed sum an upper bound on the chunk's real count.
+        count += 1
+        if count <= max_tokens:
+            spans.append((start, end, count, strength))
+            continue
+        # A single "sentence" larger than the budget (tables, OCR runs without
+        # punctuation): fall back to word boundaries, then raw characters.
+        refined = _split_oversized(text, start, end, max_tokens, provider, model)
+        refined[-1] = refined[-1][:3] + (strength,)
+        spans.extend(refined)
+    return spans
+
+
+def _split_oversized(
+    text: str,
+    start: int,
+    end: int,
+    max_tokens: int,
+    provider: str,
+    model: Optional[str],
+) -> List[_Span]:
+    def measure(a: int, b: int) -> int:
+        return TokenCounter.count_many([text[a:b]], provider=provider, model=model, use_cache=False)[0] + 1
+
+    # Step by the span's own characters-per-token ratio, snapping back to the
+    # last whitespace so words stay intact where possible.
+    chars_per_token = (end - start) / max(measure(start, end), 1)
+    step = max(1, int(max_tokens * chars_per_token * 0.95))
+    def snap(position: int, stop: int) -> int:
+        if stop >= end:
+            return end
+        cut = max(text.rfind(" ", position + 1, stop), text.rfind("\n", position + 1, stop))
+        return cut + 1 if cut > position else stop
+
+    spans: List[_Span] = []
+    position = start
+    while position < end:
+        stop = snap(position, min(position + step, end))
+        count = measure(position, stop)
+        while count > max_tokens and stop - position > 1:
+            stop = snap(position, position + max(1, (stop - position) * 9 // 10))
+            count = measure(position, stop)
+        strength = _WORD if stop == end or text[stop - 1].isspace() else _CHAR
+        spans.append((position, stop, count, strength))
+        position = stop
+    return spans
+
+
+def _trim(text: str, start: int, end: int) -> Tuple[int, int]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _pack_spans(spans: List[_Span], max_tokens: int, overlap_tokens: int) -> List[Tuple[int, int]]:
+    """Greedily pack spans into (start, end) chunk ranges within ``max_tokens``."""
+
+    ranges: List[Tuple[int, int]] = []
+    total_spans = len(spans)
+    first = 0  # first span of the current chunk (may be overlap)
+    fresh = 0  # first span not yet emitted in any chunk
+    while fresh < total_spans:
+        used = sum(span[2] for span in spans[first:fresh])
+        stop = fresh
+        while stop < total_spans and used + spans[stop][2] <= max_tokens:
+            used += spans[stop][2]
+            stop += 1
+        if stop == fresh:
+            # The overlap left no room for the next span; drop it.
+            first = fresh
+            continue
+        if stop == total_spans:
+            ranges.append((spans[first][0], spans[-1][1]))
+            break
+
+        # Cut after the strongest boundary that keeps the chunk reasonably
+        # full; ties go to the later (fuller) cut.
+        cut = stop
+        best = None
+        running = sum(span[2] for span in spans[first:fresh])
+        threshold = max_tokens * _MIN_FILL
+        for index in range(fresh, stop):
+            running += spans[index][2]
+            if running < threshold and index + 1 < stop:
+                continue
+            strength = spans[index][3]
+            if best is None or strength >= best:
+                best = strength
+                cut = index + 1
+        ranges.append((spans[first][0], spans[cut - 1][1]))
+
+        # Overlap: whole spans from the end of this chunk, starting right
+        # after a sentence boundary or better.
+        next_first = cut
+        carried = 0
+        if overlap_tokens:
+            index = cut
+            while index - 1 > first and carried + spans[index - 1][2] <= overlap_tokens:
+                carried += spans[index - 1][2]
+                index -= 1
+                if spans[index - 1][3] >= _SENTENCE:
+                    next_first = index
+        first = next_first
+        fresh = cut
+    return ranges
@@ -6,7 +6,7 @@ import base64
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject
 
@@ -82,7 +82,8 @@ class AnthropicProvider(BaseLLMProvider):
             self.client = anthropic.Anthropic(
                 api_key=api_key,
                 timeout=self.timeout,
-                max_retries=self.max_retries,
+                # Retries are handled by the shared rate limiter.
+                max_retries=0,
                 default_headers={"anthropic-version": "2023-06-01"},
             )
             
@@ -148,26 +149,7 @@ class AnthropicProvider(BaseLLMProvider):
             return {"success": False, "error": "Anthropic client not initialized"}
         
         try:
-            # Use default model if not specified
-            if not model:
-                model = self.default_model
-            
-            # Use default system prompt if not provided
-            if not system_prompt:
-                system_prompt = self.default_system_prompt
-            
-            # Set options
-            options = {
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "system": system_prompt,
-            }
-            
-            # Log request details
-            if self.debug:
-                logger.debug(f"Anthropic API Request - Model: {model}")
-                logger.debug(f"Anthropic API Request - Prompt length: {len(prompt)}")
-                logger.debug(f"Anthropic API Request - Temperature: {temperature}")
+            model, request = self._message_request(prompt, model, max_tokens, temperature, system_prompt)
             
             # Emit progress
             self.emit_progress(10, "Sending request to Anthropic...")
@@ -176,58 +158,132 @@ class AnthropicProvider(BaseLLMProvider):
             start_time = time.time()
             
             # Make the API call
-            message = self.client.messages.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                **options,
+            message = self._rate_limited_call(
+                model,
+                lambda: self.client.messages.with_raw_response.create(**request),
+                prompt=prompt,
+                system_prompt=request["system"],
             )
-            
-            # Extract response
-            content = message.content[0].text
-            
-            # Calculate elapsed time
-            elapsed_time = time.time() - start_time
-            if self.debug:
-                logger.debug(f"Anthropic API Response received in {elapsed_time:.2f} seconds")
-            
-            # Get token usage
-            usage = {}
-            if hasattr(message, "usage"):
-                usage = {
-                    "input_tokens": message.usage.input_tokens,
-                    "output_tokens": message.usage.output_tokens,
-                }
-            
-            self.emit_progress(100, "Response received")
-            
-            result = {
-                "success": True,
-                "content": content,
-                "usage": usage,
-                "provider": self.provider_name,
-                "model": model,
-            }
-            
-            self.emit_response(result)
-            return result
+            return self._message_result(message, model, start_time)
             
         except Exception as e:
-            # Handle specific API errors
-            error_message = str(e)
-            
-            if "rate limit" in error_message.lower():
-                error_message = f"Rate limit exceeded: {error_message}"
-            elif "authentication" in error_message.lower():
-                error_message = f"Authentication error: {error_message}"
+            return self._message_error(e)
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 32000,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Generate a response from Claude with the async client."""
+        if not self.initialized:
+            return {"success": False, "error": "Anthropic client not initialized"}
+        
+        try:
+            import anthropic
             
-            logger.error(f"Anthropic API Error: {error_message}")
-            self.emit_error(error_message)
+            model, request = self._message_request(prompt, model, max_tokens, temperature, system_prompt)
+            client = self._async_client(
+                lambda: anthropic.AsyncAnthropic(
+                    api_key=os.getenv("ANTHROPIC_API_KEY"),
+                    timeout=self.timeout,
+                    max_retries=0,
+                    default_headers={"anthropic-version": "2023-06-01"},
+                )
+            )
+            start_time = time.time()
+            message = await self._arate_limited_call(
+                model,
+                lambda: client.messages.with_raw_response.create(**request),
+                prompt=prompt,
+                system_prompt=request["system"],
+            )
+            return self._message_result(message, model, start_time)
             
-            return {
-                "success": False,
-                "error": error_message,
-                "provider": self.provider_name,
+        except Exception as e:
+            return self._message_error(e)
+    
+    def _message_request(
+        self,
+        prompt: str,
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[str],
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Resolve defaults and build the messages.create arguments."""
+        # Use default model if not specified
+        if not model:
+            model = self.default_model
+        
+        # Use default system prompt if not provided
+        if not system_prompt:
+            system_prompt = self.default_system_prompt
+        
+        # Log request details
+        if self.debug:
+            logger.debug(f"Anthropic API Request - Model: {model}")
+            logger.debug(f"Anthropic API Request - Prompt length: {len(prompt)}")
+            logger.debug(f"Anthropic API Request - Temperature: {temperature}")
+        
+        return model, {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system_prompt,
+        }
+    
+    def _message_result(self, message: Any, model: str, start_time: float) -> Dict[str, Any]:
+        """Convert an Anthropic message into the provider result dict."""
+        # Extract response
+        content = message.content[0].text
+        
+        # Calculate elapsed time
+        elapsed_time = time.time() - start_time
+        if self.debug:
+            logger.debug(f"Anthropic API Response received in {elapsed_time:.2f} seconds")
+        
+        # Get token usage
+        usage = {}
+        if hasattr(message, "usage"):
+            usage = {
+                "input_tokens": message.usage.input_tokens,
+                "output_tokens": message.usage.output_tokens,
             }
+        
+        self.emit_progress(100, "Response received")
+        
+        result = {
+            "success": True,
+            "content": content,
+            "usage": usage,
+            "provider": self.provider_name,
+            "model": model,
+        }
+        
+        self.emit_response(result)
+        return result
+    
+    def _message_error(self, e: Exception) -> Dict[str, Any]:
+        # Handle specific API errors
+        error_message = str(e)
+        
+        if "rate limit" in error_message.lower():
+            error_message = f"Rate limit exceeded: {error_message}"
+        elif "authentication" in error_message.lower():
+            error_message = f"Authentication error: {error_message}"
+        
+        logger.error(f"Anthropic API Error: {error_message}")
+        self.emit_error(error_message)
+        
+        return {
+            "success": False,
+            "error": error_message,
+            "provider": self.provider_name,
+        }
     
     def count_tokens(
         self,
@@ -337,7 +393,12 @@ class AnthropicProvider(BaseLLMProvider):
             self.emit_progress(10, "Sending PDF to Anthropic...")
             
             # Create message
-            response = self.client.messages.create(**message_params)
+            response = self._rate_limited_call(
+                model,
+                lambda: self.client.messages.with_raw_response.create(**message_params),
+                prompt=prompt,
+                system_prompt=system_prompt,
+            )
             
             # Extract content
             content = ""
@@ -418,7 +479,12 @@ class AnthropicProvider(BaseLLMProvider):
             self.emit_progress(10, "Processing with extended thinking...")
             
             # Create message
-            response = self.client.messages.create(**message_params)
+            response = self._rate_limited_call(
+                model,
+                lambda: self.client.messages.with_raw_response.create(**message_params),
+                prompt=prompt,
+                system_prompt=system_prompt,
+            )
             
             # Extract content and thinking
             content = ""
@@ -528,7 +594,12 @@ class AnthropicProvider(BaseLLMProvider):
             self.emit_progress(10, "Processing PDF with extended thinking...")
             
             # Create message
-            response = self.client.messages.create(**message_params)
+            response = self._rate_limited_call(
+                model,
+                lambda: self.client.messages.with_raw_response.create(**message_params),
+                prompt=prompt,
+                system_prompt=system_prompt,
+            )
             
             # Extract content and thinking
             content = ""
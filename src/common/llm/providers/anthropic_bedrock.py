@@ -8,7 +8,7 @@ import logging
 import os
 import time
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject
 
@@ -82,6 +82,7 @@ class AnthropicBedrockProvider(BaseLLMProvider):
         super().__init__(timeout, max_retries, default_system_prompt, debug, parent)
 
         self.client = None
+        self._client_kwargs: Dict[str, Any] = {}
         self._aws_region = aws_region or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
         self._aws_profile = aws_profile
         self._available_models: List[BedrockModel] = list(DEFAULT_BEDROCK_MODELS)
@@ -133,7 +134,8 @@ class AnthropicBedrockProvider(BaseLLMProvider):
 
             client_kwargs: Dict[str, Any] = {
                 "timeout": self.timeout,
-                "max_retries": self.max_retries,
+                # Retries are handled by the shared rate limiter.
+                "max_retries": 0,
             }
 
             session = None
@@ -160,6 +162,7 @@ class AnthropicBedrockProvider(BaseLLMProvider):
                 client_kwargs["region_name"] = self._aws_region
 
             self.client = anthropic.AnthropicBedrock(**client_kwargs)
+            self._client_kwargs = client_kwargs
             self._test_connection()
         except ImportError:
             logger.error(
@@ -246,67 +249,115 @@ class AnthropicBedrockProvider(BaseLLMProvider):
             return {"success": False, "error": "Anthropic Bedrock client not initialised"}
 
         try:
-            selected_model = model or self.default_model
-            effective_system_prompt = system_prompt or self.default_system_prompt
+            selected_model, request = self._message_request(prompt, model, max_tokens, temperature, system_prompt)
+            self.emit_progress(10, "Sending request to AWS Bedrock…")
 
-            options = {
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-            }
-            if effective_system_prompt:
-                options["system"] = effective_system_prompt
+            start_time = time.time()
+            message = self._rate_limited_call(
+                selected_model,
+                lambda: self.client.messages.create(**request),
+                prompt=prompt,
+                system_prompt=request.get("system"),
+            )
+            return self._message_result(message, selected_model, start_time)
 
-            if self.debug:
-                logger.debug("Bedrock Request - Model: %s", selected_model)
-                logger.debug("Bedrock Request - Prompt length: %d", len(prompt))
-                logger.debug("Bedrock Request - Temperature: %s", temperature)
+        except Exception as exc:
+            return self._message_error(exc)
 
-            self.emit_progress(10, "Sending request to AWS Bedrock…")
+    async def agenerate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 32000,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Generate a response on Bedrock with the async Anthropic client."""
+        if not self.initialized or not self.client:
+            return {"success": False, "error": "Anthropic Bedrock client not initialised"}
 
+        try:
+            import anthropic  # type: ignore
+
+            selected_model, request = self._message_request(prompt, model, max_tokens, temperature, system_prompt)
+            client = self._async_client(lambda: anthropic.AsyncAnthropicBedrock(**self._client_kwargs))
             start_time = time.time()
-            message = self.client.messages.create(
-                model=selected_model,
-                messages=[{"role": "user", "content": prompt}],
-                **options,
+            message = await self._arate_limited_call(
+                selected_model,
+                lambda: client.messages.create(**request),
+                prompt=prompt,
+                system_prompt=request.get("system"),
             )
-            elapsed_time = time.time() - start_time
+            return self._message_result(message, selected_model, start_time)
 
-            content = ""
-            if hasattr(message, "content") and message.content:
-                try:
-                    content = "".join(part.text for part in message.content if hasattr(part, "text"))
-                except Exception:
-                    content = message.content[0].text if hasattr(message.content[0], "text") else str(message.content)
+        except Exception as exc:
+            return self._message_error(exc)
 
-            if self.debug:
-                logger.debug("Bedrock Response received in %.2f seconds", elapsed_time)
-
-            usage = {}
-            if hasattr(message, "usage") and message.usage:
-                usage = {
-                    "input_tokens": getattr(message.usage, "input_tokens", None),
-                    "output_tokens": getattr(message.usage, "output_tokens", None),
-                }
-
-            response = {
-                "success": True,
-                "content": content,
-                "model": selected_model,
-                "usage": usage,
-                "elapsed": elapsed_time,
+    def _message_request(
+        self,
+        prompt: str,
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[str],
+    ) -> Tuple[str, Dict[str, Any]]:
+        selected_model = model or self.default_model
+        effective_system_prompt = system_prompt or self.default_system_prompt
+
+        request: Dict[str, Any] = {
+            "model": selected_model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if effective_system_prompt:
+            request["system"] = effective_system_prompt
+
+        if self.debug:
+            logger.debug("Bedrock Request - Model: %s", selected_model)
+            logger.debug("Bedrock Request - Prompt length: %d", len(prompt))
+            logger.debug("Bedrock Request - Temperature: %s", temperature)
+        return selected_model, request
+
+    def _message_result(self, message: Any, selected_model: str, start_time: float) -> Dict[str, Any]:
+        elapsed_time = time.time() - start_time
+
+        content = ""
+        if hasattr(message, "content") and message.content:
+            try:
+                content = "".join(part.text for part in message.content if hasattr(part, "text"))
+            except Exception:
+                content = message.content[0].text if hasattr(message.content[0], "text") else str(message.content)
+
+        if self.debug:
+            logger.debug("Bedrock Response received in %.2f seconds", elapsed_time)
+
+        usage = {}
+        if hasattr(message, "usage") and message.usage:
+            usage = {
+                "input_tokens": getattr(message.usage, "input_tokens", None),
+                "output_tokens": getattr(message.usage, "output_tokens", None),
             }
-            self.emit_response(response)
-            self.emit_progress(100, "AWS Bedrock response received")
-            return response
 
-        except Exception as exc:
-            logger.error("Anthropic Bedrock generate call failed: %s", exc)
-            error_message = (
-                "Anthropic Bedrock request failed. Verify AWS credentials with 'aws sts get-caller-identity'. "
-                f"Details: {exc}"
-            )
-            self.emit_error(error_message)
-            return {"success": False, "error": error_message}
+        response = {
+            "success": True,
+            "content": content,
+            "model": selected_model,
+            "usage": usage,
+            "elapsed": elapsed_time,
+        }
+        self.emit_response(response)
+        self.emit_progress(100, "AWS Bedrock response received")
+        return response
+
+    def _message_error(self, exc: Exception) -> Dict[str, Any]:
+        logger.error("Anthropic Bedrock generate call failed: %s", exc)
+        error_message = (
+            "Anthropic Bedrock request failed. Verify AWS credentials with 'aws sts get-caller-identity'. "
+            f"Details: {exc}"
+        )
+        self.emit_error(error_message)
+        return {"success": False, "error": error_message}
 
     def count_tokens(
         self,
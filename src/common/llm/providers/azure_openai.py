@@ -5,7 +5,7 @@ Azure OpenAI provider implementation.
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import openai
 from PySide6.QtCore import QObject
@@ -47,6 +47,9 @@ class AzureOpenAIProvider(BaseLLMProvider):
         super().__init__(timeout, max_retries, default_system_prompt, debug, parent)
         
         self.client = None
+        self.azure_endpoint: Optional[str] = None
+        self.api_version: Optional[str] = None
+        self._api_key: Optional[str] = None
         self._init_client(api_key, azure_endpoint, api_version)
         
         # Auto-instrument OpenAI calls with Phoenix if enabled
@@ -108,13 +111,18 @@ class AzureOpenAIProvider(BaseLLMProvider):
             logger.info(f"Using Azure OpenAI Endpoint: {current_azure_endpoint}")
             logger.info(f"Using Azure OpenAI API Version: {current_api_version}")
             
+            self._api_key = current_api_key
+            self.azure_endpoint = current_azure_endpoint
+            self.api_version = current_api_version
+
             # Create client
             self.client = openai.AzureOpenAI(
                 api_key=current_api_key,
                 azure_endpoint=current_azure_endpoint,
                 api_version=current_api_version,
                 timeout=self.timeout,
-                max_retries=self.max_retries,
+                # Retries are handled by the shared rate limiter.
+                max_retries=0,
             )
             
             self._test_connection()
@@ -171,31 +179,9 @@ class AzureOpenAIProvider(BaseLLMProvider):
         if not self.initialized:
             return {"success": False, "error": "Azure OpenAI client not initialized"}
         
+        model = model or self.default_model
         try:
-            # Use default deployment if not specified
-            if not model:
-                model = self.default_model
-            
-            # Use default system prompt if not provided
-            actual_system_prompt = system_prompt or self.default_system_prompt
-            
-            # Prepare messages
-            messages = []
-            if actual_system_prompt:
-                messages.append({"role": "system", "content": actual_system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
-            # Log request details
-            total_tokens = self.count_tokens(messages=messages).get("token_count", 0)
-            
-            logger.info(f"Azure OpenAI API Request - Deployment: {model}, Total tokens: {total_tokens}")
-            if self.debug:
-                logger.debug(f"Azure OpenAI API Request - System prompt length: {len(actual_system_prompt or '')}")
-                logger.debug(f"Azure OpenAI API Request - User prompt length: {len(prompt)}")
-                logger.debug(f"Azure OpenAI API Request - Temperature: {temperature}")
-                logger.debug(f"Azure OpenAI API Request - Max tokens: {max_tokens}")
-                logger.debug(f"Azure OpenAI API Request - Endpoint: {self.azure_endpoint}")
-                logger.debug(f"Azure OpenAI API Request - API Version: {self.api_version}")
+            messages, actual_system_prompt = self._chat_request(prompt, model, max_tokens, temperature, system_prompt)
             
             # Emit progress
             self.emit_progress(10, "Sending request to Azure OpenAI...")
@@ -203,103 +189,154 @@ class AzureOpenAIProvider(BaseLLMProvider):
             # Time the API call
             start_time = time.time()
             
-            # Enhanced retry logic for API calls
-            completion = None
-            last_error = None
-            retry_delay = 1.0  # Start with 1 second delay
-            
-            for attempt in range(self.max_retries + 1):
-                try:
-                    # Log retry attempt
-                    if attempt > 0:
-                        logger.info(f"Retry attempt {attempt}/{self.max_retries} for Azure OpenAI request")
-                        self.emit_progress(10 + (attempt * 10), f"Retrying request (attempt {attempt + 1})...")
-                    
-                    # Make the API call
-                    completion = self.client.chat.completions.create(
-                        model=model,  # Deployment name for Azure
-                        messages=messages,
-                        temperature=temperature,
-                        max_tokens=max_tokens,
-                        timeout=self.timeout,
-                    )
-                    
-                    # Success - break out of retry loop
-                    break
-                    
-                except (openai.APITimeoutError, openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError) as e:
-                    last_error = e
-                    logger.warning(
-                        f"Retryable error on attempt {attempt + 1}/{self.max_retries + 1}: {type(e).__name__}: {str(e)}"
-                    )
-                    
-                    if attempt < self.max_retries:
-                        # Wait before retrying with exponential backoff
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        # Final attempt failed, re-raise
-                        raise
-                        
-                except Exception as e:
-                    # Non-retryable error, re-raise immediately
-                    raise
-            
-            if completion is None and last_error:
-                raise last_error
-            
-            # Calculate elapsed time
-            elapsed_time = time.time() - start_time
-            if self.debug:
-                logger.debug(f"Azure OpenAI API Response received in {elapsed_time:.2f} seconds")
-            
-            # Extract content
-            content = completion.choices[0].message.content if completion.choices else ""
-            
-            # Get token usage
-            usage = {}
-            if completion.usage:
-                usage = {
-                    "input_tokens": completion.usage.prompt_tokens,
-                    "output_tokens": completion.usage.completion_tokens,
-                }
-            else:
-                # Estimate if not provided
-                usage = {
-                    "input_tokens": self.count_tokens(messages=messages).get("token_count", 0),
-                    "output_tokens": self.count_tokens(text=content).get("token_count", 0),
-                }
+            # Throttling and transient failures are retried by the shared
+            # rate limiter, which also paces requests/tokens per minute.
+            completion = self._rate_limited_call(
+                model,
+                lambda: self.client.chat.completions.with_raw_response.create(
+                    model=model,  # Deployment name for Azure
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                ),
+                prompt=prompt,
+                system_prompt=actual_system_prompt,
+            )
+            return self._chat_result(completion, model, messages, start_time)
             
-            self.emit_progress(100, "Response received")
+        except Exception as e:
+            return self._chat_error(e, model)
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Generate a response from Azure OpenAI with the async client."""
+        if not self.initialized:
+            return {"success": False, "error": "Azure OpenAI client not initialized"}
+        
+        model = model or self.default_model
+        try:
+            messages, actual_system_prompt = self._chat_request(prompt, model, max_tokens, temperature, system_prompt)
+            client = self._async_client(
+                lambda: openai.AsyncAzureOpenAI(
+                    api_key=self._api_key,
+                    azure_endpoint=self.azure_endpoint,
+                    api_version=self.api_version,
+                    timeout=self.timeout,
+                    max_retries=0,
+                )
+            )
+            start_time = time.time()
+            completion = await self._arate_limited_call(
+                model,
+                lambda: client.chat.completions.with_raw_response.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                ),
+                prompt=prompt,
+                system_prompt=actual_system_prompt,
+            )
+            return self._chat_result(completion, model, messages, start_time)
             
-            result = {
-                "success": True,
-                "content": content,
-                "usage": usage,
-                "provider": self.provider_name,
-                "model": model,
+        except Exception as e:
+            return self._chat_error(e, model)
+    
+    def _chat_request(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[str],
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """Build the chat messages and log the request."""
+        # Use default system prompt if not provided
+        actual_system_prompt = system_prompt or self.default_system_prompt
+        
+        # Prepare messages
+        messages = []
+        if actual_system_prompt:
+            messages.append({"role": "system", "content": actual_system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        # Log request details
+        total_tokens = self.count_tokens(messages=messages).get("token_count", 0)
+        
+        logger.info(f"Azure OpenAI API Request - Deployment: {model}, Total tokens: {total_tokens}")
+        if self.debug:
+            logger.debug(f"Azure OpenAI API Request - System prompt length: {len(actual_system_prompt or '')}")
+            logger.debug(f"Azure OpenAI API Request - User prompt length: {len(prompt)}")
+            logger.debug(f"Azure OpenAI API Request - Temperature: {temperature}")
+            logger.debug(f"Azure OpenAI API Request - Max tokens: {max_tokens}")
+            logger.debug(f"Azure OpenAI API Request - Endpoint: {self.azure_endpoint}")
+            logger.debug(f"Azure OpenAI API Request - API Version: {self.api_version}")
+        return messages, actual_system_prompt
+    
+    def _chat_result(
+        self,
+        completion: Any,
+        model: str,
+        messages: List[Dict[str, str]],
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """Convert a chat completion into the provider response dict."""
+        # Calculate elapsed time
+        elapsed_time = time.time() - start_time
+        if self.debug:
+            logger.debug(f"Azure OpenAI API Response received in {elapsed_time:.2f} seconds")
+        
+        # Extract content
+        content = completion.choices[0].message.content if completion.choices else ""
+        
+        # Get token usage
+        usage = {}
+        if completion.usage:
+            usage = {
+                "input_tokens": completion.usage.prompt_tokens,
+                "output_tokens": completion.usage.completion_tokens,
             }
-            
-            self.emit_response(result)
-            return result
-            
-        except openai.APIAuthenticationError as e:
+        else:
+            # Estimate if not provided
+            usage = {
+                "input_tokens": self.count_tokens(messages=messages).get("token_count", 0),
+                "output_tokens": self.count_tokens(text=content).get("token_count", 0),
+            }
+        
+        self.emit_progress(100, "Response received")
+        
+        result = {
+            "success": True,
+            "content": content,
+            "usage": usage,
+            "provider": self.provider_name,
+            "model": model,
+        }
+        
+        self.emit_response(result)
+        return result
+    
+    def _chat_error(self, e: Exception, model: str) -> Dict[str, Any]:
+        """Log and report a failed chat completion."""
+        if isinstance(e, openai.AuthenticationError):
             error_message = f"Authentication error: {str(e)}"
             logger.error(f"Azure OpenAI {error_message}", extra={
                 "deployment": model,
                 "endpoint": self.azure_endpoint,
                 "api_version": self.api_version
             })
-            self.emit_error(error_message)
-            return {"success": False, "error": error_message, "provider": self.provider_name}
-            
-        except openai.RateLimitError as e:
+        elif isinstance(e, openai.RateLimitError):
             error_message = f"Rate limit exceeded: {str(e)}"
             logger.error(f"Azure OpenAI {error_message}")
-            self.emit_error(error_message)
-            return {"success": False, "error": error_message, "provider": self.provider_name}
-            
-        except openai.NotFoundError as e:
+        elif isinstance(e, openai.NotFoundError):
             error_message = f"Deployment not found (check deployment name '{model}'): {str(e)}"
             logger.error(f"Azure OpenAI {error_message}", extra={
                 "deployment": model,
@@ -307,26 +344,19 @@ class AzureOpenAIProvider(BaseLLMProvider):
                 "api_version": self.api_version,
                 "hint": "For GPT-4.1, ensure deployment name matches exactly (e.g., 'gpt-4.1' not 'gpt-41')"
             })
-            self.emit_error(error_message)
-            return {"success": False, "error": error_message, "provider": self.provider_name}
-            
-        except openai.APIConnectionError as e:
+        elif isinstance(e, openai.APIConnectionError):
             error_message = f"Connection error: {str(e)}"
             logger.error(f"Azure OpenAI {error_message}")
-            self.emit_error(error_message)
-            return {"success": False, "error": error_message, "provider": self.provider_name}
-            
-        except Exception as e:
+        else:
             error_message = f"API error: {str(e)}"
             logger.error(f"Azure OpenAI {error_message}", extra={
                 "deployment": model,
                 "endpoint": self.azure_endpoint,
                 "api_version": self.api_version,
                 "error_type": type(e).__name__,
-                "total_tokens": total_tokens if 'total_tokens' in locals() else "unknown"
             }, exc_info=True)
-            self.emit_error(error_message)
-            return {"success": False, "error": error_message, "provider": self.provider_name}
+        self.emit_error(error_message)
+        return {"success": False, "error": error_message, "provider": self.provider_name}
     
     def count_tokens(
         self,
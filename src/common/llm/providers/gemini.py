@@ -5,7 +5,7 @@ Google Gemini provider implementation.
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject
 
@@ -145,16 +145,10 @@ class GeminiProvider(BaseLLMProvider):
             return {"success": False, "error": "Gemini client not initialized"}
         
         try:
-            # Use default model if not specified
-            if not model:
-                model = self.default_model
-            
-            # Log request details
-            if self.debug:
-                logger.debug(f"Gemini API Request - Model: {model}")
-                logger.debug(f"Gemini API Request - Prompt length: {len(prompt)}")
-                logger.debug(f"Gemini API Request - Temperature: {temperature}")
-                logger.debug(f"Gemini API Request - Max tokens: {max_tokens}")
+            model = model or self.default_model
+            gemini_model, generation_config, prompt = self._content_request(
+                prompt, model, max_tokens, temperature, system_prompt
+            )
             
             # Emit progress
             self.emit_progress(10, "Sending request to Gemini...")
@@ -163,86 +157,119 @@ class GeminiProvider(BaseLLMProvider):
             start_time = time.time()
             
             try:
-                # Create generation config
-                generation_config = self.genai.GenerationConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                    top_p=0.95,
-                    top_k=40,
-                )
-                
-                # Get a GenerativeModel instance
-                gemini_model = self.genai.GenerativeModel(model_name=model)
-                
-                # Add system instruction if provided and supported
-                if hasattr(gemini_model, "with_system_instruction"):
-                    if system_prompt:
-                        gemini_model = gemini_model.with_system_instruction(system_prompt)
-                    elif self.default_system_prompt:
-                        gemini_model = gemini_model.with_system_instruction(self.default_system_prompt)
-                else:
-                    # If with_system_instruction is not available, prepend system prompt to user prompt
-                    if system_prompt:
-                        prompt = f"{system_prompt}\n\n{prompt}"
-                    elif self.default_system_prompt:
-                        prompt = f"{self.default_system_prompt}\n\n{prompt}"
-                
                 # Generate content
-                response = gemini_model.generate_content(
-                    prompt, generation_config=generation_config
+                response = self._rate_limited_call(
+                    model,
+                    lambda: gemini_model.generate_content(prompt, generation_config=generation_config),
+                    prompt=prompt,
                 )
-                
-                # Calculate elapsed time
-                elapsed_time = time.time() - start_time
-                if self.debug:
-                    logger.debug(f"Gemini API Response received in {elapsed_time:.2f} seconds")
-                
-                # Extract the response text
-                if hasattr(response, "text"):
-                    content = response.text
-                else:
-                    return {
-                        "success": False,
-                        "error": "Invalid response format from Gemini API",
-                        "provider": self.provider_name,
-                    }
-                
-                # Estimate token usage (Gemini doesn't provide exact counts)
-                usage = {
-                    "input_tokens": len(prompt) // 4,  # Rough estimate
-                    "output_tokens": len(content) // 4,  # Rough estimate
-                }
-                
-                self.emit_progress(100, "Response received")
-                
-                result = {
-                    "success": True,
-                    "content": content,
-                    "usage": usage,
-                    "provider": self.provider_name,
-                    "model": model,
-                }
-                
-                self.emit_response(result)
-                return result
+                return self._content_result(response, model, prompt, start_time)
                 
             except Exception as e:
-                logger.error(f"Error from Gemini API: {str(e)}")
-                self.emit_error(f"Gemini API error: {str(e)}")
-                return {
-                    "success": False,
-                    "error": f"Gemini API error: {str(e)}",
-                    "provider": self.provider_name,
-                }
+                return self._api_error(e)
                 
         except Exception as e:
-            logger.error(f"Error in Gemini request: {str(e)}")
-            self.emit_error(f"Gemini request error: {str(e)}")
+            return self._request_error(e)
+    
+    # No native ``agenerate``: google-generativeai keeps one process-wide
+    # grpc.aio client bound to the first event loop that used it, while
+    # workers run a fresh loop per document. The base class runs
+    # :meth:`generate` in a thread instead, so ``supports_async`` is False.
+    
+    def _content_request(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[str],
+    ) -> Tuple[Any, Any, str]:
+        """Build the model, generation config and final prompt for a request."""
+        # Log request details
+        if self.debug:
+            logger.debug(f"Gemini API Request - Model: {model}")
+            logger.debug(f"Gemini API Request - Prompt length: {len(prompt)}")
+            logger.debug(f"Gemini API Request - Temperature: {temperature}")
+            logger.debug(f"Gemini API Request - Max tokens: {max_tokens}")
+        
+        # Create generation config
+        generation_config = self.genai.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            top_p=0.95,
+            top_k=40,
+        )
+        
+        # Get a GenerativeModel instance
+        gemini_model = self.genai.GenerativeModel(model_name=model)
+        
+        # Add system instruction if provided and supported
+        if hasattr(gemini_model, "with_system_instruction"):
+            if system_prompt:
+                gemini_model = gemini_model.with_system_instruction(system_prompt)
+            elif self.default_system_prompt:
+                gemini_model = gemini_model.with_system_instruction(self.default_system_prompt)
+        else:
+            # If with_system_instruction is not available, prepend system prompt to user prompt
+            if system_prompt:
+                prompt = f"{system_prompt}\n\n{prompt}"
+            elif self.default_system_prompt:
+                prompt = f"{self.default_system_prompt}\n\n{prompt}"
+        return gemini_model, generation_config, prompt
+    
+    def _content_result(self, response: Any, model: str, prompt: str, start_time: float) -> Dict[str, Any]:
+        """Convert a Gemini response into the provider response dict."""
+        # Calculate elapsed time
+        elapsed_time = time.time() - start_time
+        if self.debug:
+            logger.debug(f"Gemini API Response received in {elapsed_time:.2f} seconds")
+        
+        # Extract the response text
+        if hasattr(response, "text"):
+            content = response.text
+        else:
             return {
                 "success": False,
-                "error": f"Error in Gemini request: {str(e)}",
+                "error": "Invalid response format from Gemini API",
                 "provider": self.provider_name,
             }
+        
+        # Estimate token usage (Gemini doesn't provide exact counts)
+        usage = {
+            "input_tokens": len(prompt) // 4,  # Rough estimate
+            "output_tokens": len(content) // 4,  # Rough estimate
+        }
+        
+        self.emit_progress(100, "Response received")
+        
+        result = {
+            "success": True,
+            "content": content,
+            "usage": usage,
+            "provider": self.provider_name,
+            "model": model,
+        }
+        
+        self.emit_response(result)
+        return result
+    
+    def _api_error(self, e: Exception) -> Dict[str, Any]:
+        logger.error(f"Error from Gemini API: {str(e)}")
+        self.emit_error(f"Gemini API error: {str(e)}")
+        return {
+            "success": False,
+            "error": f"Gemini API error: {str(e)}",
+            "provider": self.provider_name,
+        }
+    
+    def _request_error(self, e: Exception) -> Dict[str, Any]:
+        logger.error(f"Error in Gemini request: {str(e)}")
+        self.emit_error(f"Gemini request error: {str(e)}")
+        return {
+            "success": False,
+            "error": f"Error in Gemini request: {str(e)}",
+            "provider": self.provider_name,
+        }
     
     def count_tokens(
         self,
@@ -370,8 +397,11 @@ class GeminiProvider(BaseLLMProvider):
             if hasattr(gemini_model, "with_system_instruction"):
                 gemini_model = gemini_model.with_system_instruction(reasoning_system_prompt)
             
-            response = gemini_model.generate_content(
-                structured_prompt, generation_config=generation_config
+            response = self._rate_limited_call(
+                model,
+                lambda: gemini_model.generate_content(structured_prompt, generation_config=generation_config),
+                prompt=structured_prompt,
+                system_prompt=reasoning_system_prompt,
             )
             
             if not response or not hasattr(response, "text"):
@@ -0,0 +1,592 @@
+"""
+Shared rate limiting for LLM providers.
+
+Every provider call goes through a per provider/model ``RateLimiter`` that
+combines request and token buckets (learned from rate-limit headers and 429
+responses) with an AIMD concurrency controller, so concurrent bulk runs ramp
+up to the account's real throughput and back off as soon as it is exceeded.
+
+Requests may return an SDK raw response (``client.messages.with_raw_response.create``);
+its headers are learned on every success and the parsed body is returned.
+"""
+
+import asyncio
+import inspect
+import logging
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Error classes returned by classify_error.
+RATE_LIMITED = "rate_limited"
+TRANSIENT = "transient"
+FATAL = "fatal"
+
+_RATE_LIMIT_STATUS = {429, 529}
+_TRANSIENT_STATUS = {408, 409, 500, 502, 503, 504}
+_RATE_LIMIT_NAMES = {"RateLimitError", "ResourceExhausted", "TooManyRequests", "ThrottlingException", "OverloadedError"}
+_TRANSIENT_NAMES = {
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+    "ServiceUnavailableError",
+}
+
+_DEFAULT_INITIAL_CONCURRENCY = 8
+_DEFAULT_MAX_CONCURRENCY = 64
+# Concurrent requests that were already in flight when the limit was hit
+# report their 429s too; only the first one inside this window shrinks the
+# concurrency limit.
+_DECREASE_COOLDOWN = 2.0
+_BASE_BACKOFF = 1.0
+_MAX_BACKOFF = 60.0
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class TokenBucket:
+    """Per-minute bucket that lets callers reserve capacity ahead of time.
+
+    Reservations may drive the balance negative; the returned delay is how
+    long the caller must wait for the debt to refill. A bucket without a
+    capacity does not limit anything until one is learned.
+    """
+
+    def __init__(self, per_minute: Optional[float] = None) -> None:
+        self.capacity: Optional[float] = None
+        self.available = 0.0
+        # True while the capacity is only a floor inferred from remaining values.
+        self.inferred = False
+        self._updated = time.monotonic()
+        if per_minute:
+            self.set_capacity(per_minute)
+
+    def set_capacity(self, per_minute: float) -> None:
+        per_minute = float(per_minute)
+        if per_minute <= 0:
+            return
+        if self.capacity is None:
+            self.available = per_minute
+        else:
+            self._refill()
+            self.available = min(self.available, per_minute)
+        self.capacity = per_minute
+        self.inferred = False
+
+    def set_remaining(self, remaining: float) -> None:
+        if self.capacity is None:
+            return
+        self._refill()
+        self.available = min(self.available, float(remaining))
+
+    def observe_remaining(self, remaining: float) -> None:
+        """Lower the balance to ``remaining``, inferring the capacity when no limit is known.
+
+        Azure only reports what is left, so the largest remaining value seen
+        stands in for the per-minute limit; a low first reading is raised as
+        soon as a later response shows more headroom.
+        """
+
+        remaining = float(remaining)
+        if self.capacity is None or (self.inferred and remaining > self.capacity):
+            self._refill()
+            self.capacity = max(remaining, 1.0)
+            self.available = remaining
+            self.inferred = True
+            return
+        self.set_remaining(remaining)
+
+    def reserve(self, amount: float) -> float:
+        """Deduct ``amount`` and return the seconds to wait before using it."""
+
+        if self.capacity is None or amount <= 0:
+            return 0.0
+        self._refill()
+        self.available -= min(float(amount), self.capacity)
+        if self.available >= 0:
+            return 0.0
+        return -self.available * 60.0 / self.capacity
+
+    def credit(self, amount: float) -> None:
+        """Return (or, if negative, charge) capacity after the real cost is known."""
+
+        if self.capacity is None:
+            return
+        self._refill()
+        self.available = min(self.capacity, self.available + float(amount))
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.capacity is not None:
+            self.available = min(self.capacity, self.available + (now - self._updated) * self.capacity / 60.0)
+        self._updated = now
+
+
+class ConcurrencyController:
+    """AIMD limit on in-flight requests: +1 per window of successes, halve on throttling."""
+
+    def __init__(self, initial: int = _DEFAULT_INITIAL_CONCURRENCY, maximum: int = _DEFAULT_MAX_CONCURRENCY) -> None:
+        self.maximum = max(1, int(maximum))
+        self.limit = float(max(1, min(int(initial), self.maximum)))
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+        self._last_decrease = 0.0
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """Coroutine variant of :meth:`acquire` that never blocks the event loop."""
+
+        while True:
+            with self._condition:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._wake()
+
+    def on_success(self) -> None:
+        with self._condition:
+            previous = int(self.limit)
+            self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            if int(self.limit) > previous:
+                self._wake()
+
+    def _wake(self) -> None:
+        # Caller holds the condition. Thread waiters re-check on notify; async
+        # waiters are all woken and race to re-acquire in their own loops.
+        self._condition.notify()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:  # loop already closed
+                pass
+
+    def on_throttle(self) -> bool:
+        """Halve the limit; returns False when ignored inside the cooldown."""
+
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease < _DECREASE_COOLDOWN:
+                return False
+            self._last_decrease = now
+            self.limit = max(1.0, self.limit / 2.0)
+            return True
+
+    def set_maximum(self, maximum: int) -> None:
+        with self._condition:
+            self.maximum = max(1, int(maximum))
+            self.limit = min(self.limit, float(self.maximum))
+
+
+class RateLimiter:
+    """Rate limiter and retry loop shared by every caller of one provider/model."""
+
+    def __init__(
+        self,
+        key: Tuple[str, str],
+        *,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        initial_concurrency: int = _DEFAULT_INITIAL_CONCURRENCY,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.key = key
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.concurrency = ConcurrencyController(initial_concurrency, max_concurrency)
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        # Anthropic sizes the token bucket by input tokens only.
+        self._input_tokens_only = False
+        self._sleep = sleep
+        self.stats: Dict[str, int] = {"requests": 0, "rate_limited": 0, "retries": 0, "failures": 0}
+
+    def call(
+        self,
+        request: Callable[[], _T],
+        *,
+        estimated_tokens: int = 0,
+        max_retries: int = 2,
+        usage_tokens: Optional[Callable[[_T], Optional[int]]] = None,
+    ) -> _T:
+        """Run ``request`` within the limits, retrying throttled and transient errors."""
+
+        backoff = _BASE_BACKOFF
+        attempt = 0
+        while True:
+            self.concurrency.acquire()
+            try:
+                self._sleep_for(self._reserve(estimated_tokens))
+                try:
+                    result = self._unwrap(request())
+                except Exception as exc:
+                    wait = self._record_failure(exc, attempt, max_retries, backoff)
+                else:
+                    self._record_success(result, estimated_tokens, usage_tokens)
+                    return result
+            finally:
+                self.concurrency.release()
+
+            attempt += 1
+            self._sleep_for(wait)
+            backoff = min(backoff * 2, _MAX_BACKOFF)
+
+    async def acall(
+        self,
+        request: Callable[[], Awaitable[_T]],
+        *,
+        estimated_tokens: int = 0,
+        max_retries: int = 2,
+        usage_tokens: Optional[Callable[[_T], Optional[int]]] = None,
+    ) -> _T:
+        """Coroutine variant of :meth:`call`; ``request`` returns a fresh awaitable per attempt."""
+
+        backoff = _BASE_BACKOFF
+        attempt = 0
+        while True:
+            await self.concurrency.acquire_async()
+            try:
+                delay = self._reserve(estimated_tokens)
+                if delay > 0:
+                    await asyncio.sleep(min(delay, _MAX_BACKOFF))
+                try:
+                    result = self._unwrap(await request())
+                    if inspect.isawaitable(result):
+                        result = await result
+                except Exception as exc:
+                    wait = self._record_failure(exc, attempt, max_retries, backoff)
+                else:
+                    self._record_success(result, estimated_tokens, usage_tokens)
+                    return result
+            finally:
+                self.concurrency.release()
+
+            attempt += 1
+            await asyncio.sleep(min(wait, _MAX_BACKOFF))
+            backoff = min(backoff * 2, _MAX_BACKOFF)
+
+    def _unwrap(self, result: Any) -> Any:
+        """Learn headers from a raw SDK response and return its parsed body."""
+
+        headers = _response_headers(result)
+        if headers is None:
+            return result
+        if headers:
+            self.observe_headers(headers)
+        return result.parse()
+
+    def _record_success(
+        self,
+        result: Any,
+        estimated_tokens: int,
+        usage_tokens: Optional[Callable[[Any], Optional[int]]],
+    ) -> None:
+        self.concurrency.on_success()
+        if usage_tokens is None:
+            usage_tokens = response_input_tokens if self._input_tokens_only else response_token_usage
+        try:
+            actual = usage_tokens(result)
+        except Exception:
+            actual = None
+        with self._lock:
+            self.stats["requests"] += 1
+            if actual is not None:
+                self.tokens.credit(estimated_tokens - actual)
+
+    def _record_failure(self, exc: Exception, attempt: int, max_retries: int, backoff: float) -> float:
+        """Learn from ``exc`` and return the delay before retrying; re-raise when final."""
+
+        kind = classify_error(exc)
+        headers = _error_headers(exc)
+        if headers:
+            self.observe_headers(headers)
+        if kind == FATAL or attempt >= max_retries:
+            with self._lock:
+                self.stats["failures"] += 1
+            raise exc
+        wait = backoff
+        if kind == RATE_LIMITED:
+            retry_after = _retry_after(headers)
+            wait = retry_after if retry_after is not None else backoff
+            with self._lock:
+                self.stats["rate_limited"] += 1
+                self._paused_until = max(self._paused_until, time.monotonic() + wait)
+            if self.concurrency.on_throttle():
+                logger.info(
+                    "Rate limited on %s/%s; concurrency limit now %d",
+                    self.key[0],
+                    self.key[1],
+                    int(self.concurrency.limit),
+                )
+        logger.warning(
+            "%s error from %s/%s (attempt %d/%d): %s",
+            kind,
+            self.key[0],
+            self.key[1],
+            attempt + 1,
+            max_retries + 1,
+            exc,
+        )
+        with self._lock:
+            self.stats["retries"] += 1
+        return wait
+
+    def observe_headers(self, headers: Mapping[str, Any]) -> None:
+        """Learn limits and remaining budget from OpenAI/Azure/Anthropic headers."""
+
+        lowered = {str(key).lower(): value for key, value in dict(headers).items()}
+        with self._lock:
+            if any(key.startswith("anthropic-ratelimit-input-tokens-") for key in lowered):
+                self._input_tokens_only = True
+            for bucket, limit_keys, remaining_keys in (
+                (
+                    self.requests,
+                    ("x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit"),
+                    ("x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining"),
+                ),
+                (
+                    self.tokens,
+                    (
+                        "x-ratelimit-limit-tokens",
+                        "anthropic-ratelimit-input-tokens-limit",
+                        "anthropic-ratelimit-tokens-limit",
+                    ),
+                    (
+                        "x-ratelimit-remaining-tokens",
+                        "anthropic-ratelimit-input-tokens-remaining",
+                        "anthropic-ratelimit-tokens-remaining",
+                    ),
+                ),
+            ):
+                limit = _first_number(lowered, limit_keys)
+                if limit is not None:
+                    bucket.set_capacity(limit)
+                remaining = _first_number(lowered, remaining_keys)
+                if remaining is not None:
+                    bucket.observe_remaining(remaining)
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        with self._lock:
+            pause = max(0.0, self._paused_until - time.monotonic())
+            return max(pause, self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+
+    def _sleep_for(self, seconds: float) -> None:
+        if seconds > 0:
+            self._sleep(min(seconds, _MAX_BACKOFF))
+
+
+_LIMITERS: Dict[Tuple[str, str], RateLimiter] = {}
+_LIMITS: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: Optional[str] = None) -> RateLimiter:
+    """Return the process-wide limiter for ``provider``/``model``."""
+
+    key = (provider, model or "")
+    with _REGISTRY_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            options = dict(_LIMITS.get(key) or _LIMITS.get((provider, "")) or {})
+            limiter = RateLimiter(key, **options)
+            _LIMITERS[key] = limiter
+        return limiter
+
+
+def configure_rate_limit(
+    provider: str,
+    model: Optional[str] = None,
+    *,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+) -> None:
+    """Seed known limits for a provider (``model=None`` applies to all its models)."""
+
+    options: Dict[str, Any] = {}
+    if requests_per_minute:
+        options["requests_per_minute"] = requests_per_minute
+    if tokens_per_minute:
+        options["tokens_per_minute"] = tokens_per_minute
+    if max_concurrency:
+        options["max_concurrency"] = max_concurrency
+        options["initial_concurrency"] = min(_DEFAULT_INITIAL_CONCURRENCY, max_concurrency)
+    with _REGISTRY_LOCK:
+        _LIMITS[(provider, model or "")] = options
+        for key, limiter in _LIMITERS.items():
+            if key[0] != provider or (model and key[1] != model):
+                continue
+            if requests_per_minute:
+                limiter.requests.set_capacity(requests_per_minute)
+            if tokens_per_minute:
+                limiter.tokens.set_capacity(tokens_per_minute)
+            if max_concurrency:
+                limiter.concurrency.set_maximum(max_concurrency)
+
+
+def reset_rate_limiters() -> None:
+    """Forget learned limits (used by tests and when credentials change)."""
+
+    with _REGISTRY_LOCK:
+        _LIMITERS.clear()
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def classify_error(exc: BaseException) -> str:
+    """Return RATE_LIMITED, TRANSIENT or FATAL for a provider exception."""
+
+    status = _status_code(exc)
+    name = type(exc).__name__
+    if status in _RATE_LIMIT_STATUS or name in _RATE_LIMIT_NAMES:
+        return RATE_LIMITED
+    if status in _TRANSIENT_STATUS or name in _TRANSIENT_NAMES or isinstance(exc, (TimeoutError, ConnectionError)):
+        return TRANSIENT
+    if status is None and "rate limit" in str(exc).lower():
+        return RATE_LIMITED
+    return FATAL
+
+
+def response_token_usage(response: Any) -> Optional[int]:
+    """Total tokens reported by an Anthropic, OpenAI or Gemini response, if any."""
+
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        input_tokens = _usage_input_tokens(usage)
+        output_tokens = getattr(usage, "output_tokens", None)
+        if output_tokens is None:
+            output_tokens = getattr(usage, "completion_tokens", None)
+        if isinstance(input_tokens, int) and isinstance(output_tokens, int):
+            return input_tokens + output_tokens
+    metadata = getattr(response, "usage_metadata", None)
+    total = getattr(metadata, "total_token_count", None)
+    return total if isinstance(total, int) else None
+
+
+def response_input_tokens(response: Any) -> Optional[int]:
+    """Input (prompt) tokens reported by a response, if any."""
+
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        input_tokens = _usage_input_tokens(usage)
+        if isinstance(input_tokens, int):
+            return input_tokens
+    metadata = getattr(response, "usage_metadata", None)
+    prompt = getattr(metadata, "prompt_token_count", None)
+    return prompt if isinstance(prompt, int) else None
+
+
+def _usage_input_tokens(usage: Any) -> Optional[int]:
+    input_tokens = getattr(usage, "input_tokens", None)
+    if input_tokens is None:
+        input_tokens = getattr(usage, "prompt_tokens", None)
+    return input_tokens
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for candidate in (
+        getattr(exc, "status_code", None),
+        getattr(getattr(exc, "response", None), "status_code", None),
+        getattr(exc, "code", None),
+    ):
+        if isinstance(candidate, int):
+            return candidate
+    return None
+
+
+def _error_headers(exc: BaseException) -> Dict[str, Any]:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    try:
+        return dict(headers) if headers else {}
+    except Exception:
+        return {}
+
+
+def _response_headers(result: Any) -> Optional[Dict[str, Any]]:
+    """Headers of a raw SDK response (one with ``headers`` and ``parse``), else None."""
+
+    headers = getattr(result, "headers", None)
+    if headers is None or not callable(getattr(result, "parse", None)):
+        return None
+    try:
+        return dict(headers)
+    except Exception:
+        return {}
+
+
+def _retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    lowered = {str(key).lower(): value for key, value in headers.items()}
+    milliseconds = _first_number(lowered, ("retry-after-ms",))
+    if milliseconds is not None:
+        return milliseconds / 1000.0
+    seconds = _first_number(lowered, ("retry-after",))
+    if seconds is not None:
+        return seconds
+    resets = [
+        _parse_duration(lowered[key])
+        for key in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+        if key in lowered
+    ]
+    resets = [value for value in resets if value is not None]
+    return max(resets) if resets else None
+
+
+def _first_number(headers: Mapping[str, Any], keys: Tuple[str, ...]) -> Optional[float]:
+    for key in keys:
+        if key in headers:
+            try:
+                return float(headers[key])
+            except (TypeError, ValueError):
+                continue
+    return None
+
+
+def _parse_duration(value: Any) -> Optional[float]:
+    """Parse reset durations such as ``"1s"``, ``"6m0s"`` or ``"250ms"``."""
+
+    matches = _DURATION_RE.findall(str(value))
+    if not matches:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in matches)
+
+
+__all__ = [
+    "ConcurrencyController",
+    "FATAL",
+    "RATE_LIMITED",
+    "RateLimiter",
+    "TRANSIENT",
+    "TokenBucket",
+    "classify_error",
+    "configure_rate_limit",
+    "get_rate_limiter",
+    "reset_rate_limiters",
+    "response_input_tokens",
+    "response_token_usage",
+]
@@ -0,0 +1,180 @@
+"""Content-addressed cache of LLM responses shared across groups and projects.
+
+Entries are keyed by a digest of everything that determines a completion
+(provider, model, temperature, max_tokens, system prompt and user prompt), so
+the same request made from any bulk-analysis group or project is answered
+from disk instead of being re-billed. The cache is opt-in and bounded by
+size; the least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from src.config.paths import app_user_root
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Evict down to this fraction of the limit so a full cache does not evict on
+# every write.
+_EVICT_TO = 0.9
+
+_SHARED: Dict[Path, "ResponseCache"] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def response_cache_key(
+    *,
+    provider: str,
+    model: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    system_prompt: Optional[str],
+    prompt: str,
+) -> str:
+    """Return the content address for one completion request."""
+
+    digest = hashlib.sha256()
+    for part in (provider, model or "", repr(float(temperature)), str(int(max_tokens)), system_prompt or "", prompt):
+        encoded = part.encode("utf-8", "surrogatepass")
+        # Length-prefix each field so adjacent fields cannot run together.
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed LRU store of response text keyed by request digest."""
+
+    def __init__(self, path: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(int(max_bytes), 0)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, content TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        self._total_bytes = int(row[0])
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key`` and mark it recently used."""
+
+        with self._lock:
+            row = self._conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self._stats["hits"] += 1
+            return row[0]
+
+    def put(self, key: str, content: str) -> None:
+        """Store ``content`` under ``key``, evicting old entries past the size limit."""
+
+        size = len(content.encode("utf-8", "surrogatepass"))
+        if self.max_bytes and size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, content, size, now, now),
+            )
+            self._total_bytes += size - (int(previous[0]) if previous else 0)
+            self._stats["stores"] += 1
+            if self.max_bytes and self._total_bytes > self.max_bytes:
+                self._evict_locked(int(self.max_bytes * _EVICT_TO))
+            self._conn.commit()
+
+    def _evict_locked(self, target: int) -> None:
+        evicted = []
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC")
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            evicted.append((key,))
+            self._total_bytes -= int(size)
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self._stats["evictions"] += len(evicted)
+        logger.debug("Evicted %d cached response(s) from %s", len(evicted), self.path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this process plus current size."""
+
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(entries=int(entries), bytes=self._total_bytes, max_bytes=self.max_bytes)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def default_response_cache_path() -> Path:
+    return app_user_root() / "cache" / "llm_responses.sqlite3"
+
+
+def open_response_cache(options: Optional[Mapping[str, Any]]) -> Optional[ResponseCache]:
+    """Return the shared cache described by the ``llm_response_cache`` setting.
+
+    Returns None unless the setting is enabled. Recognised keys are
+    ``enabled``, ``max_size_mb`` and ``path``; one instance is shared per path
+    so every worker in the process sees the same statistics.
+    """
+
+    options = options or {}
+    if not options.get("enabled"):
+        return None
+    path = Path(options.get("path") or default_response_cache_path()).expanduser()
+    try:
+        max_bytes = int(float(options.get("max_size_mb") or 0) * 1024 * 1024) or DEFAULT_MAX_BYTES
+    except (TypeError, ValueError):
+        max_bytes = DEFAULT_MAX_BYTES
+    with _SHARED_LOCK:
+        cache = _SHARED.get(path)
+        if cache is None:
+            try:
+                cache = ResponseCache(path, max_bytes=max_bytes)
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("LLM response cache unavailable at %s: %s", path, exc)
+                return None
+            _SHARED[path] = cache
+        cache.max_bytes = max_bytes
+        return cache
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "ResponseCache",
+    "default_response_cache_path",
+    "open_response_cache",
+    "response_cache_key",
+]
@@ -2,9 +2,16 @@
 Token counting utilities for LLM providers.
 """
 
+import hashlib
+import json
 import logging
+import math
+import sqlite3
+import threading
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Dict, List, Optional, Any
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +38,231 @@ MODEL_CONTEXT_WINDOWS = {
     "gemini-1.5-flash": int(1_000_000 * 0.65),  # 650,000 tokens
 }
 
-# Token counting cache
-_TOKEN_COUNT_CACHE = {}
-_MAX_CACHE_SIZE = 1000
-_CACHE_STATS = {"hits": 0, "misses": 0}
+# Texts shorter than this are not written to the on-disk cache; recounting
+# them is cheaper than the SQLite round-trip.
+_DISK_CACHE_MIN_CHARS = 2048
+_MAX_CACHE_SIZE = 4096
+# cl100k_base usually undercounts Claude and Gemini tokens; estimated counts
+# are scaled up so budget checks err towards smaller prompts.
+_ESTIMATE_SAFETY_FACTOR = 1.2
+# Bumped when cached counts change meaning, so stale on-disk entries are missed.
+_CACHE_KEY_VERSION = 2
+
+
+class TokenEncoder:
+    """Count tokens with a tiktoken encoding that is loaded once per process.
+
+    ``estimated`` marks encoders used as a stand-in for a provider whose own
+    tokenizer is not available locally (Anthropic, Gemini); their counts are
+    multiplied by ``scale`` and rounded up.
+    """
+
+    def __init__(self, encoding_name: str, *, estimated: bool = False, scale: float = 1.0) -> None:
+        self.name = encoding_name
+        self.estimated = estimated
+        self.scale = scale
+        self._encoding = _load_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        return self._scaled(len(self._encoding.encode_ordinary(text)))
+
+    def count_batch(self, texts: Sequence[str]) -> List[int]:
+        return [self._scaled(len(tokens)) for tokens in self._encoding.encode_ordinary_batch(list(texts))]
+
+    def _scaled(self, count: int) -> int:
+        return count if self.scale == 1.0 else math.ceil(count * self.scale)
+
+
+TokenizerResolver = Callable[[Optional[str]], Optional[TokenEncoder]]
+
+_TOKENIZER_REGISTRY: Dict[str, TokenizerResolver] = {}
+_TOKENIZERS: Dict[Tuple[str, str], Optional[TokenEncoder]] = {}
+_TOKENIZER_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(encoding_name: str):
+    import tiktoken
+
+    return tiktoken.get_encoding(encoding_name)
+
+
+def register_tokenizer(provider: str, resolver: TokenizerResolver) -> None:
+    """Register ``resolver(model) -> TokenEncoder | None`` for ``provider``.
+
+    Returning ``None`` falls back to the character-based estimate.
+    """
+    with _TOKENIZER_LOCK:
+        _TOKENIZER_REGISTRY[provider] = resolver
+        for key in [key for key in _TOKENIZERS if key[0] == provider]:
+            _TOKENIZERS.pop(key, None)
+
+
+def get_tokenizer(provider: str, model: Optional[str] = None) -> Optional[TokenEncoder]:
+    """Return the (process-wide, memoised) encoder for ``provider``/``model``."""
+    key = (provider, model or "")
+    with _TOKENIZER_LOCK:
+        if key in _TOKENIZERS:
+            return _TOKENIZERS[key]
+        resolver = _TOKENIZER_REGISTRY.get(provider)
+    encoder: Optional[TokenEncoder] = None
+    if resolver is not None:
+        try:
+            encoder = resolver(model)
+        except Exception as exc:
+            # Missing tiktoken or an encoding that cannot be downloaded:
+            # remember the failure so every call does not retry it.
+            logger.warning(f"Tokenizer for {provider}/{model or 'default'} unavailable, using estimation: {exc}")
+            encoder = None
+    with _TOKENIZER_LOCK:
+        _TOKENIZERS.setdefault(key, encoder)
+        return _TOKENIZERS[key]
+
+
+def _openai_tokenizer(model: Optional[str]) -> Optional[TokenEncoder]:
+    name = (model or "").lower()
+    if name:
+        try:
+            import tiktoken
+
+            return TokenEncoder(tiktoken.encoding_name_for_model(name))
+        except KeyError:
+            pass
+    # Azure deployment names rarely match OpenAI model ids; pick by family.
+    if any(marker in name for marker in ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")):
+        return TokenEncoder("o200k_base")
+    return TokenEncoder("cl100k_base")
+
+
+def _approximate_tokenizer(model: Optional[str]) -> Optional[TokenEncoder]:
+    # Claude and Gemini tokenizers are not distributed for local use. A BPE
+    # encoding tracks them far more closely than len(text) // 4, particularly
+    # on OCR output full of numbers, dates and punctuation, but still runs
+    # low, hence the safety factor.
+    return TokenEncoder("cl100k_base", estimated=True, scale=_ESTIMATE_SAFETY_FACTOR)
+
+
+register_tokenizer("azure_openai", _openai_tokenizer)
+register_tokenizer("openai", _openai_tokenizer)
+register_tokenizer("anthropic", _approximate_tokenizer)
+register_tokenizer("anthropic_bedrock", _approximate_tokenizer)
+register_tokenizer("gemini", _approximate_tokenizer)
+
+
+class _TokenCountCache:
+    """Thread-safe bounded LRU of token counts keyed by a stable content digest."""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TokenCountStore:
+    """Optional SQLite-backed token count cache that survives restarts.
+
+    Keys are the same digests used by the in-memory LRU, so re-running a
+    project skips recounting documents whose text has not changed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS token_counts ("
+            "key TEXT PRIMARY KEY, token_count INTEGER NOT NULL, estimated INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT token_count, estimated FROM token_counts WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        result: Dict[str, Any] = {"success": True, "token_count": int(row[0])}
+        if row[1]:
+            result["estimated"] = True
+        return result
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the stored results among ``keys``, looked up in one query per 500 keys."""
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(keys), 500):
+            batch = list(keys[start : start + 500])
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, token_count, estimated FROM token_counts WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+            for key, token_count, estimated in rows:
+                result: Dict[str, Any] = {"success": True, "token_count": int(token_count)}
+                if estimated:
+                    result["estimated"] = True
+                found[key] = result
+        return found
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        self.put_many([(key, result)])
+
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        rows = [
+            (key, int(result["token_count"]), 1 if result.get("estimated") else 0)
+            for key, result in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO token_counts (key, token_count, estimated) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_MEMORY_CACHE = _TokenCountCache(_MAX_CACHE_SIZE)
+_DISK_CACHE: Optional[TokenCountStore] = None
+
+
+def _cache_key(provider: str, model: Optional[str], kind: str, payload: str) -> str:
+    digest = hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=20).hexdigest()
+    return f"v{_CACHE_KEY_VERSION}:{provider}:{model or ''}:{kind}:{digest}"
 
 
 class TokenCounter:
@@ -90,77 +318,128 @@ class TokenCounter:
         cache_key = None
         if use_cache:
             if text is not None:
-                cache_key = f"{provider}:text:{hash(text)}"
+                cache_key = _cache_key(provider, model, "text", text)
             elif messages is not None:
-                msg_str = str(messages)
-                cache_key = f"{provider}:messages:{hash(msg_str)}"
-        
-        # Check cache
-        if cache_key and cache_key in _TOKEN_COUNT_CACHE:
-            _CACHE_STATS["hits"] += 1
-            # Move to end (LRU)
-            result = _TOKEN_COUNT_CACHE.pop(cache_key)
-            _TOKEN_COUNT_CACHE[cache_key] = result
-            return result
+                cache_key = _cache_key(provider, model, "messages", json.dumps(messages, sort_keys=True, default=str))
         
-        # Cache miss
-        if use_cache:
-            _CACHE_STATS["misses"] += 1
-        
-        # Provider-specific counting
-        result = None
+        # Check caches (memory first, then the optional on-disk store)
+        if cache_key:
+            cached = _MEMORY_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            disk = _DISK_CACHE
+            if disk is not None and text is not None and len(text) >= _DISK_CACHE_MIN_CHARS:
+                try:
+                    cached = disk.get(cache_key)
+                except Exception:
+                    logger.debug("Token count disk cache lookup failed", exc_info=True)
+                    cached = None
+                if cached is not None:
+                    _MEMORY_CACHE.put(cache_key, cached)
+                    return cached
         
-        if provider in {"anthropic", "anthropic_bedrock"}:
-            result = TokenCounter._count_anthropic(text, messages)
-        elif provider == "azure_openai":
-            result = TokenCounter._count_openai(text, messages, model)
-        elif provider == "gemini":
-            result = TokenCounter._count_gemini(text, messages)
+        encoder = get_tokenizer(provider, model)
+        if encoder is not None:
+            result = TokenCounter._count_with_encoder(encoder, text, messages)
         else:
             # Default to character-based estimation
             result = TokenCounter._count_estimate(text, messages)
         
         # Cache successful results
-        if use_cache and cache_key and result.get("success", False):
-            # Manage cache size
-            if len(_TOKEN_COUNT_CACHE) >= _MAX_CACHE_SIZE:
-                # Remove oldest item
-                oldest_key = next(iter(_TOKEN_COUNT_CACHE))
-                _TOKEN_COUNT_CACHE.pop(oldest_key)
-            
-            _TOKEN_COUNT_CACHE[cache_key] = result
+        if cache_key and result.get("success", False):
+            _MEMORY_CACHE.put(cache_key, result)
+            disk = _DISK_CACHE
+            if disk is not None and text is not None and len(text) >= _DISK_CACHE_MIN_CHARS:
+                try:
+                    disk.put(cache_key, result)
+                except Exception:
+                    logger.debug("Token count disk cache write failed", exc_info=True)
         
         return result
-    
+
     @staticmethod
-    def _count_anthropic(text: Optional[str], messages: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
-        """Count tokens for Anthropic models."""
-        try:
-            # For now, use estimation
-            # In the future, we could use Anthropic's token counting API
-            return TokenCounter._count_estimate(text, messages)
-        except Exception as e:
-            logger.error(f"Error counting Anthropic tokens: {e}")
-            return {"success": False, "error": str(e)}
-    
+    def count_many(
+        texts: Sequence[str],
+        provider: str = "anthropic",
+        model: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> List[int]:
+        """Return token counts for ``texts`` in order, encoding cache misses in one batch.
+
+        Pass ``use_cache=False`` for many short throwaway fragments (e.g.
+        chunker sentences) so they do not evict useful entries.
+        """
+        counts: List[Optional[int]] = [None] * len(texts)
+        keys = [_cache_key(provider, model, "text", text) for text in texts] if use_cache else []
+        missing: List[int] = []
+        if not use_cache:
+            missing = list(range(len(texts)))
+        for index, key in enumerate(keys):
+            cached = _MEMORY_CACHE.get(key)
+            if cached is not None:
+                counts[index] = int(cached["token_count"])
+            else:
+                missing.append(index)
+
+        # Large texts missing from memory may be in the on-disk store.
+        disk = _DISK_CACHE if use_cache else None
+        if disk is not None and missing:
+            large = [index for index in missing if len(texts[index]) >= _DISK_CACHE_MIN_CHARS]
+            try:
+                stored = disk.get_many([keys[index] for index in large]) if large else {}
+            except Exception:
+                logger.debug("Token count disk cache lookup failed", exc_info=True)
+                stored = {}
+            for index in large:
+                cached = stored.get(keys[index])
+                if cached is not None:
+                    counts[index] = int(cached["token_count"])
+                    _MEMORY_CACHE.put(keys[index], cached)
+            missing = [index for index in missing if counts[index] is None]
+
+        if missing:
+            encoder = get_tokenizer(provider, model)
+            missing_texts = [texts[index] for index in missing]
+            if encoder is not None:
+                try:
+                    values = encoder.count_batch(missing_texts)
+                    estimated = encoder.estimated
+                except Exception as e:
+                    logger.error(f"Error batch counting {provider} tokens: {e}")
+                    values = [len(text) // 4 for text in missing_texts]
+                    estimated = True
+            else:
+                values = [len(text) // 4 for text in missing_texts]
+                estimated = True
+            to_store: List[Tuple[str, Dict[str, Any]]] = []
+            for index, value in zip(missing, values):
+                counts[index] = value
+                if use_cache:
+                    result: Dict[str, Any] = {"success": True, "token_count": value}
+                    if estimated:
+                        result["estimated"] = True
+                    _MEMORY_CACHE.put(keys[index], result)
+                    if len(texts[index]) >= _DISK_CACHE_MIN_CHARS:
+                        to_store.append((keys[index], result))
+            if disk is not None and to_store:
+                try:
+                    disk.put_many(to_store)
+                except Exception:
+                    logger.debug("Token count disk cache write failed", exc_info=True)
+        return [int(count or 0) for count in counts]
+
     @staticmethod
-    def _count_openai(
-        text: Optional[str], 
+    def _count_with_encoder(
+        encoder: TokenEncoder,
+        text: Optional[str],
         messages: Optional[List[Dict[str, Any]]],
-        model: Optional[str]
     ) -> Dict[str, Any]:
-        """Count tokens for OpenAI/Azure OpenAI models using tiktoken."""
+        """Count tokens with a real tokenizer (OpenAI cookbook framing for messages)."""
         try:
-            import tiktoken
-            
-            # Get encoding for the model
-            encoding_name = "cl100k_base"  # Default for GPT-4 models
-            encoding = tiktoken.get_encoding(encoding_name)
-            
             num_tokens = 0
             
             if text is not None:
-                num_tokens = len(encoding.encode(text))
+                num_tokens = encoder.count(text)
             elif messages is not None:
                 # Based on OpenAI's token counting cookbook
                 tokens_per_message = 3
@@ -170,28 +449,25 @@ class TokenCounter:
                     num_tokens += tokens_per_message
                     for key, value in message.items():
                         if isinstance(value, str):
-                            num_tokens += len(encoding.encode(value))
+                            num_tokens += encoder.count(value)
+                        elif key == "content" and isinstance(value, list):
+                            for item in value:
+                                if isinstance(item, dict) and isinstance(item.get("text"), str):
+                                    num_tokens += encoder.count(item["text"])
                         if key == "name":
                             num_tokens += tokens_per_name
                 
                 num_tokens += 3  # Every reply is primed with assistant
             
-            return {"success": True, "token_count": num_tokens}
+            result: Dict[str, Any] = {"success": True, "token_count": num_tokens}
+            if encoder.estimated:
+                result["estimated"] = True
+            return result
             
-        except ImportError:
-            logger.warning("tiktoken not available, using estimation")
-            return TokenCounter._count_estimate(text, messages)
         except Exception as e:
-            logger.error(f"Error counting OpenAI tokens: {e}")
+            logger.error(f"Error counting tokens with {encoder.name}: {e}")
             return TokenCounter._count_estimate(text, messages)
     
-    @staticmethod
-    def _count_gemini(text: Optional[str], messages: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
-        """Count tokens for Gemini models."""
-        # Gemini doesn't have a public token counting API
-        # Use estimation
-        return TokenCounter._count_estimate(text, messages)
-    
     @staticmethod
     def _count_estimate(text: Optional[str], messages: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
         """Estimate token count using character-based approximation."""
@@ -224,24 +500,49 @@ class TokenCounter:
         except Exception as e:
             logger.error(f"Error estimating tokens: {e}")
             return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def enable_disk_cache(path: Path) -> None:
+        """Persist token counts for large texts in a SQLite file at ``path``.
+
+        The store is process-wide; enabling the same path again is a no-op.
+        """
+        global _DISK_CACHE
+        path = Path(path)
+        current = _DISK_CACHE
+        if current is not None and current.path == path:
+            return
+        try:
+            store = TokenCountStore(path)
+        except Exception as e:
+            logger.warning(f"Token count disk cache unavailable at {path}: {e}")
+            return
+        _DISK_CACHE = store
+        if current is not None:
+            current.close()
+
+    @staticmethod
+    def disable_disk_cache() -> None:
+        """Stop using the on-disk token count cache."""
+        global _DISK_CACHE
+        current, _DISK_CACHE = _DISK_CACHE, None
+        if current is not None:
+            current.close()
     
     @staticmethod
     def get_cache_stats() -> Dict[str, int]:
         """Get token counting cache statistics."""
         return {
-            "hits": _CACHE_STATS["hits"],
-            "misses": _CACHE_STATS["misses"],
-            "size": len(_TOKEN_COUNT_CACHE),
-            "max_size": _MAX_CACHE_SIZE
+            "hits": _MEMORY_CACHE.hits,
+            "misses": _MEMORY_CACHE.misses,
+            "size": len(_MEMORY_CACHE),
+            "max_size": _MEMORY_CACHE.max_size
         }
     
     @staticmethod
     def clear_cache():
         """Clear the token counting cache."""
-        global _TOKEN_COUNT_CACHE
-        _TOKEN_COUNT_CACHE = {}
-        _CACHE_STATS["hits"] = 0
-        _CACHE_STATS["misses"] = 0
+        _MEMORY_CACHE.clear()
         logger.info("Token counting cache cleared")
 
 
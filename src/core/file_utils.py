@@ -3,8 +3,14 @@ File utility module for Llestrade (formerly Forensic Psych Report Drafter).
 Provides functions for file operations, including reading, writing, and previewing file content.
 """
 
+import atexit
+import hashlib
 import logging
+import multiprocessing
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
 
@@ -74,6 +80,166 @@ def extract_text_from_pdf(pdf_path, max_pages=None):
         raise
 
 
+# PyMuPDF is not thread-safe. Every in-process use of it from threads that can
+# run concurrently (conversion workers, Azure range splitting, highlight
+# extraction) takes this lock.
+FITZ_LOCK = threading.Lock()
+
+# Documents shorter than this are extracted in-process; starting worker
+# processes would cost more than it saves.
+PARALLEL_EXTRACTION_MIN_PAGES = 64
+# Smallest page range handed to one worker process.
+_MIN_PAGES_PER_TASK = 16
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+
+def _extract_page_range(pdf_path, start, end):
+    """Return the text of pages ``start``..``end - 1`` (zero-based); runs in a worker process."""
+    import fitz  # PyMuPDF
+
+    with fitz.open(pdf_path) as doc:
+        return [doc[i].get_text() for i in range(start, end)]
+
+
+def _get_page_pool():
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # Spawn rather than fork: the Qt application runs many threads.
+            _page_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_shutdown_page_pool)
+        return _page_pool
+
+
+def _shutdown_page_pool():
+    global _page_pool
+    with _page_pool_lock:
+        pool, _page_pool = _page_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def extract_pdf_pages(pdf_path, max_workers=None):
+    """
+    Extract the text of every page of a PDF, using worker processes for large files.
+
+    The document is opened once here, under :data:`FITZ_LOCK`, to count its
+    pages; short documents are extracted from that same handle. Longer ones
+    are split into page ranges that are extracted on a shared process pool,
+    one range per core, without holding the lock.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        max_workers (int, optional): Upper bound on page ranges extracted at once
+
+    Returns:
+        tuple: (pages, page_count) where pages is a list of (page_number, text)
+            in page order, numbered from 1
+
+    Raises:
+        FileNotFoundError: If the file is not found
+        Exception: If there's an issue extracting text from the PDF
+    """
+    import fitz  # PyMuPDF
+
+    pdf_path = str(pdf_path)
+    try:
+        with FITZ_LOCK, fitz.open(pdf_path) as doc:
+            page_count = len(doc)
+            workers = min(max_workers or os.cpu_count() or 1, page_count // _MIN_PAGES_PER_TASK)
+            if page_count < PARALLEL_EXTRACTION_MIN_PAGES or workers <= 1:
+                texts = [doc[i].get_text() for i in range(page_count)]
+                return list(enumerate(texts, start=1)), page_count
+    except FileNotFoundError:
+        logging.error(f"PDF file not found: {pdf_path}")
+        raise
+    except Exception as e:
+        logging.error(f"Error extracting text from PDF {pdf_path}: {str(e)}")
+        raise
+
+    step = -(-page_count // workers)
+    bounds = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    try:
+        pool = _get_page_pool()
+        futures = [pool.submit(_extract_page_range, pdf_path, start, end) for start, end in bounds]
+        texts = [text for future in futures for text in future.result()]
+    except BrokenProcessPool:
+        logging.warning("PDF extraction workers stopped unexpectedly; extracting %s in-process", pdf_path)
+        _shutdown_page_pool()
+        with FITZ_LOCK:
+            texts = _extract_page_range(pdf_path, 0, page_count)
+    return list(enumerate(texts, start=1)), page_count
+
+
+# Bump when the fingerprint recipe changes so cached pages are not reused.
+PAGE_FINGERPRINT_VERSION = 1
+
+
+def _fingerprint_pages(pdf_path):
+    """Return one content fingerprint per page of ``pdf_path``; runs in a worker process."""
+    import fitz  # PyMuPDF
+
+    stream_digests = {}
+    fingerprints = []
+    with fitz.open(pdf_path) as doc:
+
+        def _stream_digest(xref):
+            digest = stream_digests.get(xref)
+            if digest is None:
+                try:
+                    digest = hashlib.sha256(doc.xref_stream_raw(xref) or b"").digest()
+                except Exception:
+                    digest = b""
+                stream_digests[xref] = digest
+            return digest
+
+        for page in doc:
+            hasher = hashlib.sha256()
+            hasher.update(f"v{PAGE_FINGERPRINT_VERSION}|{page.rect}|{page.rotation}|".encode("utf-8"))
+            hasher.update(page.read_contents())
+            for image in page.get_images(full=True):
+                hasher.update(b"|img|")
+                hasher.update(_stream_digest(image[0]))
+            for xobject in page.get_xobjects():
+                hasher.update(b"|xobj|")
+                hasher.update(_stream_digest(xobject[0]))
+            for annot in page.annots() or ():
+                info = annot.info or {}
+                hasher.update(f"|annot|{annot.type[0]}|{annot.rect}|{info.get('content', '')}".encode("utf-8"))
+            fingerprints.append(hasher.hexdigest())
+    return fingerprints
+
+
+def pdf_page_fingerprints(pdf_path):
+    """
+    Fingerprint every page of a PDF on the shared process pool.
+
+    Fingerprinting reads each page's content streams and the raw bytes of
+    every image, a full read of large scanned files, so it runs in a worker
+    process rather than under :data:`FITZ_LOCK`. If the pool has stopped it
+    falls back to the calling thread, holding the lock.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+
+    Returns:
+        list: One hex digest per page, in page order
+    """
+    pdf_path = str(pdf_path)
+    try:
+        return _get_page_pool().submit(_fingerprint_pages, pdf_path).result()
+    except BrokenProcessPool:
+        logging.warning("PDF workers stopped unexpectedly; fingerprinting %s in-process", pdf_path)
+        _shutdown_page_pool()
+        with FITZ_LOCK:
+            return _fingerprint_pages(pdf_path)
+
+
 def read_file_preview(file_path, max_chars=5000, max_lines=None, max_pages=2):
     """
     Read a preview of a file.
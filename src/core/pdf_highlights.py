@@ -0,0 +1,226 @@
+"""
+PDF highlight annotation reading for Llestrade.
+
+Kept outside the ``src.app`` package so worker processes that extract
+highlights import only PyMuPDF, not the Qt application.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+
+LOGGER = logging.getLogger(__name__)
+
+
+COLOR_NAMES = {
+    (1.0, 1.0, 0.0): ("yellow", "#ffff00"),
+    (1.0, 0.0, 0.0): ("red", "#ff0000"),
+    (0.0, 1.0, 0.0): ("green", "#00ff00"),
+    (0.0, 0.0, 1.0): ("blue", "#0000ff"),
+    (1.0, 0.5, 0.0): ("orange", "#ff8000"),
+    (1.0, 0.0, 1.0): ("magenta", "#ff00ff"),
+    (0.0, 1.0, 1.0): ("cyan", "#00ffff"),
+    (0.5, 0.5, 0.5): ("gray", "#808080"),
+    (1.0, 0.75, 0.8): ("pink", "#ffbfcc"),
+    (0.5, 0.0, 0.5): ("purple", "#800080"),
+}
+
+
+def rgb_to_color_name(rgb):
+    """Return a friendly name for `rgb`, falling back to raw values."""
+
+    rgb_tuple = tuple(rgb)
+    if len(rgb_tuple) < 3:
+        return "unknown"
+
+    r, g, b = rgb_tuple[:3]
+    min_distance = float("inf")
+    closest_color = "unknown"
+    closest_hex = ""
+    for color_rgb, (name, hex_value) in COLOR_NAMES.items():
+        distance = sum((component - reference) ** 2 for component, reference in zip((r, g, b), color_rgb))
+        if distance < min_distance:
+            min_distance = distance
+            closest_color = name
+            closest_hex = hex_value
+
+    if min_distance > 0.3:
+        hex_code = f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+        return f"rgb({r:.2f},{g:.2f},{b:.2f}) {hex_code}"
+
+    return f"{closest_color} ({closest_hex})"
+
+
+def annotated_pages(pdf_document):
+    """Return zero-based numbers of the pages that carry an ``/Annots`` entry.
+
+    Reads each page dictionary straight from the xref table, so pages are not
+    loaded or parsed; a PDF without annotations costs one key lookup per page.
+    """
+
+    pages = []
+    for page_index in range(pdf_document.page_count):
+        kind, value = pdf_document.xref_get_key(pdf_document.page_xref(page_index), "Annots")
+        if kind == "null" or (kind == "array" and value.strip("[] ") == ""):
+            continue
+        pages.append(page_index)
+    return pages
+
+
+class PageWordIndex:
+    """A page's words, read once and bucketed by vertical band for rectangle lookups.
+
+    ``page.get_text(clip=...)`` re-parses the page content stream on every
+    call; a page with a hundred highlighted spans would be parsed a hundred
+    times. This reads ``get_text("words")`` on the first lookup and answers
+    later ones from the band buckets.
+    """
+
+    BAND_HEIGHT = 12.0
+
+    def __init__(self, page):
+        self._page = page
+        self._words = None
+        self._bands = {}
+
+    def text_in(self, rect):
+        """Return the words whose centre lies inside ``rect``, in reading order."""
+
+        if self._words is None:
+            self._build()
+        candidates = set()
+        for band in range(self._band(rect.y0), self._band(rect.y1) + 1):
+            candidates.update(self._bands.get(band, ()))
+        parts = []
+        for position in sorted(candidates):
+            x0, y0, x1, y1, word = self._words[position][:5]
+            centre_x = (x0 + x1) / 2
+            centre_y = (y0 + y1) / 2
+            if rect.x0 <= centre_x <= rect.x1 and rect.y0 <= centre_y <= rect.y1:
+                parts.append(word)
+        return " ".join(parts)
+
+    def _build(self):
+        self._words = self._page.get_text("words")
+        for position, word in enumerate(self._words):
+            for band in range(self._band(word[1]), self._band(word[3]) + 1):
+                self._bands.setdefault(band, []).append(position)
+
+    def _band(self, y):
+        return int(y // self.BAND_HEIGHT)
+
+
+def read_highlight_annotations(pdf_path, word_index=False):
+    """
+    Read the highlight annotations of a PDF.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        word_index (bool): Recover text from a per-page :class:`PageWordIndex`,
+            parsing each page once; by default every quad is clipped with
+            ``page.get_text``, which keeps partially covered words at the cost
+            of one page parse per quad
+
+    Returns:
+        list: (text, page_number, color, position_x, position_y) tuples in
+            page order, with pages numbered from 1
+    """
+    records = []
+    with fitz.open(str(pdf_path)) as pdf_document:
+        for page_index in annotated_pages(pdf_document):
+            page_number = page_index + 1
+            page = pdf_document[page_index]
+            annotations = page.annots()
+            if not annotations:
+                continue
+            page_words = PageWordIndex(page) if word_index else None
+
+            for annotation in annotations:
+                if annotation.type[0] != 8:  # type 8 is highlight
+                    continue
+
+                try:
+                    color = rgb_to_color_name(annotation.colors.get("stroke", (1.0, 1.0, 0.0)))
+                    text = annotation_text(annotation, page, page_words)
+                    if not text:
+                        continue
+                    rect = annotation.rect
+                    records.append((text, page_number, color, float(rect.x0), float(rect.y0)))
+                except Exception:  # pragma: no cover - defensive guard
+                    LOGGER.debug(
+                        "Skipping annotation on page %s for %s", page_number, pdf_path,
+                        exc_info=True,
+                    )
+                    continue
+    return records
+
+
+def annotation_text(annotation, page, page_words=None):
+    """Attempt to extract reliable text for a highlight annotation."""
+
+    def clipped_text(rect):
+        if page_words is not None:
+            return page_words.text_in(rect)
+        return page.get_text("text", clip=rect).strip()
+
+    text = ""
+
+    if hasattr(annotation, "get_text"):
+        try:
+            text = (annotation.get_text() or "").strip()
+        except Exception:
+            text = ""
+
+    if not text:
+        vertices = getattr(annotation, "vertices", None)
+        if vertices:
+            quads = [vertices[i : i + 4] for i in range(0, len(vertices), 4)]
+            for quad in quads:
+                if len(quad) != 4:
+                    continue
+                rect = fitz.Quad(quad).rect
+                extracted = clipped_text(rect)
+                if extracted:
+                    text += extracted + " "
+            text = text.strip()
+
+    if not text:
+        try:
+            rect = annotation.rect
+            text = clipped_text(rect)
+        except Exception:
+            text = ""
+
+    return text
+
+
+_highlight_pool = None
+_highlight_pool_lock = threading.Lock()
+
+
+def get_highlight_pool():
+    """Return the shared process pool for highlight extraction, starting it once."""
+    global _highlight_pool
+    with _highlight_pool_lock:
+        if _highlight_pool is None:
+            # Spawn rather than fork: the Qt application runs many threads.
+            _highlight_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(shutdown_highlight_pool)
+        return _highlight_pool
+
+
+def shutdown_highlight_pool():
+    """Stop the shared pool; the next :func:`get_highlight_pool` call starts a new one."""
+    global _highlight_pool
+    with _highlight_pool_lock:
+        pool, _highlight_pool = _highlight_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
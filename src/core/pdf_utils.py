@@ -3,11 +3,13 @@ PDF utility functions for Llestrade
 Handles PDF file operations like splitting and merging.
 """
 
+import io
 import json
 import os
 import shutil
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import fitz  # PyMuPDF
@@ -17,6 +19,8 @@ from azure.ai.documentintelligence.models import AnalyzeResult, DocumentContentF
 # Azure Document Intelligence imports
 from azure.core.credentials import AzureKeyCredential
 
+from src.core.file_utils import FITZ_LOCK
+
 
 def get_pdf_page_count(pdf_path):
     """
@@ -28,10 +32,8 @@ def get_pdf_page_count(pdf_path):
     Returns:
         int: Number of pages in the PDF
     """
-    doc = fitz.open(pdf_path)
-    page_count = len(doc)
-    doc.close()
-    return page_count
+    with FITZ_LOCK, fitz.open(pdf_path) as doc:
+        return len(doc)
 
 
 def split_large_pdf(pdf_path, output_dir, max_pages=1750, overlap=10):
@@ -464,10 +466,13 @@ def _azure_markdown_chunked(
     total_pages: int,
     max_pages: int,
     overlap: int,
+    max_concurrent: int = 4,
 ) -> str:
     """Return combined Markdown by analyzing the PDF in page ranges with overlap.
 
-    - Uses the `pages` parameter if supported; otherwise falls back to pre-splitting the PDF.
+    - Submits up to `max_concurrent` ranges at once and stitches results in page order.
+    - Uses the `pages` parameter if supported; otherwise falls back to sub-PDFs cut
+      from a single open document into in-memory buffers.
     - Ensures a PageBreak between pages and at range boundaries.
     - Deduplicates the first `overlap` pages of each chunk beyond the first.
     """
@@ -493,11 +498,24 @@ def _azure_markdown_chunked(
         parts = pat.split(md)
         return [p.strip("\n") for p in parts]
 
-    combined_segments: list[str] = []
-    first = True
-    for rs, re_ in ranges:
-        use_pages_param = True
-        content = None
+    # PyMuPDF is not thread-safe: the source document is opened once, lazily,
+    # and only touched under the process-wide lock shared with other conversions.
+    source_doc = None
+
+    def _sub_pdf(rs: int, re_: int) -> bytes:
+        nonlocal source_doc
+        with FITZ_LOCK:
+            if source_doc is None:
+                source_doc = fitz.open(pdf_path)
+            sub = fitz.open()
+            try:
+                sub.insert_pdf(source_doc, from_page=rs - 1, to_page=re_ - 1)
+                return sub.tobytes()
+            finally:
+                sub.close()
+
+    def _analyze_range(page_range: tuple[int, int]):
+        rs, re_ = page_range
         try:
             with open(pdf_path, "rb") as fh:
                 poller = client.begin_analyze_document(
@@ -507,41 +525,32 @@ def _azure_markdown_chunked(
                     pages=f"{rs}-{re_}",
                 )
                 result = poller.result(timeout=1800)
-                content = result.content
-        except TypeError:
-            use_pages_param = False
+                return result.content
         except Exception:
-            # Some SDKs may not accept pages for file streams
-            use_pages_param = False
-
-        if not use_pages_param:
-            # Fallback: render only the page range via temporary sub-PDF
-            import fitz
+            # Some SDKs may not accept pages for file streams; fall back to
+            # analysing only the page range as a sub-PDF.
+            pass
+
+        poller = client.begin_analyze_document(
+            "prebuilt-layout",
+            io.BytesIO(_sub_pdf(rs, re_)),
+            output_content_format=DocumentContentFormat.MARKDOWN,
+        )
+        result = poller.result(timeout=1800)
+        return result.content
 
-            doc = fitz.open(pdf_path)
-            sub = fitz.open()
-            sub.insert_pdf(doc, from_page=rs - 1, to_page=re_ - 1)
-            tmp_path = os.path.join(
-                os.path.dirname(pdf_path), f".__tmp_azure_{rs}_{re_}.pdf"
-            )
-            try:
-                sub.save(tmp_path)
-                sub.close()
-                doc.close()
-                with open(tmp_path, "rb") as fh:
-                    poller = client.begin_analyze_document(
-                        "prebuilt-layout",
-                        fh,
-                        output_content_format=DocumentContentFormat.MARKDOWN,
-                    )
-                    result = poller.result(timeout=1800)
-                    content = result.content
-            finally:
-                try:
-                    os.remove(tmp_path)
-                except Exception:
-                    pass
+    try:
+        workers = max(1, min(max_concurrent, len(ranges)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="azure-range") as pool:
+            contents = list(pool.map(_analyze_range, ranges))
+    finally:
+        if source_doc is not None:
+            with FITZ_LOCK:
+                source_doc.close()
 
+    combined_segments: list[str] = []
+    first = True
+    for content in contents:
         if not content:
             continue
 
@@ -569,6 +578,46 @@ def _azure_markdown_chunked(
     return combined
 
 
+def analyze_pdf_bytes_with_azure(pdf_bytes, endpoint, key, max_retries=3):
+    """
+    Analyse an in-memory PDF with Azure Document Intelligence.
+
+    Used to re-convert only the changed pages of a document, which the caller
+    has cut into a sub-PDF.
+
+    Args:
+        pdf_bytes: PDF file content
+        endpoint: Azure Document Intelligence endpoint
+        key: Azure Document Intelligence API key
+        max_retries: Attempts before giving up
+
+    Returns:
+        str: The Markdown content, with ``<!-- PageBreak -->`` between pages
+    """
+    if not endpoint or not key:
+        raise ValueError("Azure endpoint and key must be provided")
+
+    client = DocumentIntelligenceClient(
+        endpoint=endpoint, credential=AzureKeyCredential(key)
+    )
+    retry_delay = 3
+    for attempt in range(1, max_retries + 1):
+        try:
+            poller = client.begin_analyze_document(
+                "prebuilt-layout",
+                io.BytesIO(pdf_bytes),
+                output_content_format=DocumentContentFormat.MARKDOWN,
+            )
+            return poller.result(timeout=1800).content or ""
+        except Exception as e:
+            if attempt == max_retries:
+                raise Exception(
+                    f"Failed to process PDF pages for Markdown after {max_retries} attempts: {str(e)}"
+                )
+            time.sleep(retry_delay)
+            retry_delay *= 1.5
+
+
 def process_pdfs_with_azure(pdf_files, output_dir, endpoint=None, key=None):
     """
     Process multiple PDF files using Azure Document Intelligence.
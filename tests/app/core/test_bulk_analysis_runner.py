@@ -178,3 +178,178 @@ def test_combine_chunk_summaries_hierarchical_wraps_errors_with_context() -> Non
     error_msg = str(excinfo.value)
     # During hierarchical batching, errors should be wrapped with context
     assert "Hierarchical reduction failed" in error_msg or ("level" in error_msg.lower() and "batch" in error_msg.lower())
+
+
+def test_map_bounded_returns_results_in_input_order() -> None:
+    import threading
+    import time
+
+    completed: list[int] = []
+    caller = threading.get_ident()
+    callback_threads: set[int] = set()
+
+    def work(value: int) -> int:
+        # Later items finish first so completion order differs from input order.
+        time.sleep(0.01 * (5 - value))
+        return value * 10
+
+    def on_complete(index: int, result: int) -> None:
+        callback_threads.add(threading.get_ident())
+        completed.append(index)
+
+    results = runner.map_bounded(list(range(5)), work, max_workers=5, on_complete=on_complete)
+
+    assert results == [0, 10, 20, 30, 40]
+    assert sorted(completed) == [0, 1, 2, 3, 4]
+    assert callback_threads == {caller}
+
+
+def test_map_bounded_propagates_errors() -> None:
+    def work(value: int) -> int:
+        if value == 2:
+            raise RuntimeError("boom")
+        return value
+
+    with pytest.raises(RuntimeError, match="boom"):
+        runner.map_bounded([1, 2, 3], work, max_workers=3)
+
+
+def test_combine_chunk_summaries_hierarchical_dispatches_level_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+    import time
+
+    monkeypatch.setattr(
+        runner.TokenCounter,
+        "count",
+        staticmethod(lambda text, provider, model=None: {"success": True, "token_count": len(text)}),
+    )
+    monkeypatch.setattr(
+        runner.TokenCounter,
+        "count_many",
+        staticmethod(lambda texts, provider, model=None: [len(text) for text in texts]),
+    )
+    monkeypatch.setattr(runner.TokenCounter, "get_model_context_window", staticmethod(lambda model: 2000))
+
+    summaries = [f"summary-{index:02d} " + "x" * 400 for index in range(8)]
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+    saved: list[tuple[int, int]] = []
+    caller = threading.get_ident()
+
+    def invoke(prompt: str) -> str:
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(0.05)
+        with lock:
+            state["in_flight"] -= 1
+        labels = [line.split()[0] for line in prompt.splitlines() if line.startswith(("summary-", "level-"))]
+        return "level-" + "+".join(label.removeprefix("level-") for label in labels)
+
+    def save_batch(level: int, batch_index: int, checksum: str, content: str) -> None:
+        assert threading.get_ident() == caller
+        saved.append((level, batch_index))
+
+    result = runner.combine_chunk_summaries_hierarchical(
+        summaries,
+        document_name="Doc",
+        metadata=None,
+        provider_id="anthropic",
+        invoke_fn=invoke,
+        save_batch_fn=save_batch,
+        max_concurrent_batches=4,
+    )
+
+    assert state["peak"] > 1
+    # Batch results are stitched back in order regardless of completion order.
+    expected = "+".join(f"summary-{index:02d}" for index in range(8))
+    assert result.replace("level-", "") == expected
+    assert (1, 1) in saved
+
+
+def test_pack_summary_batches_greedy_respects_budget() -> None:
+    counts = [40, 30, 50, 20, 60, 10]
+    batches = runner.pack_summary_batches(counts, budget=100, overhead=10, separator_tokens=2)
+
+    assert [i for batch in batches for i in batch] == list(range(len(counts)))
+    for batch in batches:
+        cost = 10 + sum(counts[i] for i in batch) + 2 * (len(batch) - 1)
+        assert cost <= 100
+    assert batches == [[0, 1], [2, 3], [4, 5]]
+
+
+def test_pack_summary_batches_balanced_evens_out_batches() -> None:
+    counts = [30] * 7
+    greedy = runner.pack_summary_batches(counts, budget=100, strategy="greedy")
+    balanced = runner.pack_summary_batches(counts, budget=100, strategy="balanced")
+
+    assert [len(batch) for batch in greedy] == [3, 3, 1]
+    assert len(balanced) == len(greedy)
+    assert sorted(len(batch) for batch in balanced) == [2, 2, 3]
+
+
+def test_pack_summary_batches_pairs_oversized_summaries() -> None:
+    batches = runner.pack_summary_batches([500, 500, 500], budget=100)
+    assert batches == [[0, 1], [2]]
+
+    with pytest.raises(ValueError):
+        runner.pack_summary_batches([1], budget=100, strategy="unknown")
+
+
+def test_pack_summary_batches_benchmark_5000_summaries() -> None:
+    """Benchmark: counting and packing 5,000 summaries stays well under a second."""
+    import random
+    import time
+
+    rng = random.Random(1234)
+    summaries = [" ".join(["finding"] * rng.randint(50, 400)) for _ in range(5000)]
+
+    started = time.perf_counter()
+    counts = runner.TokenCounter.count_many(summaries, provider="anthropic")
+    greedy = runner.pack_summary_batches(counts, budget=84_000, overhead=200, separator_tokens=3)
+    balanced = runner.pack_summary_batches(
+        counts, budget=84_000, overhead=200, separator_tokens=3, strategy="balanced"
+    )
+    elapsed = time.perf_counter() - started
+
+    assert len(balanced) == len(greedy) > 1
+    assert elapsed < 1.0, f"packing 5,000 summaries took {elapsed:.3f}s"
+
+
+def test_amap_bounded_limits_in_flight_and_keeps_order() -> None:
+    import asyncio
+
+    state = {"in_flight": 0, "peak": 0}
+    completed: list[int] = []
+
+    async def work(value: int) -> int:
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01 * (5 - value))
+        state["in_flight"] -= 1
+        return value * 10
+
+    results = asyncio.run(
+        runner.amap_bounded(list(range(5)), work, limit=2, on_complete=lambda index, _: completed.append(index))
+    )
+
+    assert results == [0, 10, 20, 30, 40]
+    assert sorted(completed) == [0, 1, 2, 3, 4]
+    assert state["peak"] == 2
+
+
+def test_amap_bounded_cancels_remaining_items_on_error() -> None:
+    import asyncio
+
+    started: list[int] = []
+
+    async def work(value: int) -> int:
+        started.append(value)
+        if value == 0:
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.05)
+        return value
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(runner.amap_bounded(list(range(6)), work, limit=2))
+    assert len(started) < 6
@@ -0,0 +1,81 @@
+"""Tests for conversion planning and the source hash cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from src.app.core import conversion_manager
+from src.app.core.conversion_manager import HASH_CACHE_FILENAME, build_conversion_jobs
+
+
+def _age(path: Path) -> None:
+    past = time.time_ns() - 60_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> SimpleNamespace:
+    source_root = tmp_path / "sources"
+    (source_root / "case").mkdir(parents=True)
+    for name, content in (("a.txt", "alpha"), ("b.txt", "beta"), ("copy_of_a.txt", "alpha")):
+        path = source_root / "case" / name
+        path.write_text(content)
+        _age(path)
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    state = SimpleNamespace(root=str(source_root), selected_folders=["case"])
+    return SimpleNamespace(project_dir=project_dir, source_state=state)
+
+
+def test_plan_reports_duplicates(project: SimpleNamespace) -> None:
+    plan = build_conversion_jobs(project)
+
+    assert len(plan.duplicates) == 1
+    duplicate = plan.duplicates[0]
+    assert {duplicate.primary_relative, duplicate.duplicate_relative} == {"case/a.txt", "case/copy_of_a.txt"}
+    assert sorted(job.relative_path for job in plan.jobs) == sorted(["case/b.txt", duplicate.primary_relative])
+
+
+def test_replan_only_hashes_changed_sources(project: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    build_conversion_jobs(project)
+    assert (project.project_dir / HASH_CACHE_FILENAME).exists()
+
+    hashed: list[str] = []
+    original = conversion_manager._hash_source
+
+    def counting_hash(path: Path) -> str | None:
+        hashed.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(conversion_manager, "_hash_source", counting_hash)
+
+    plan = build_conversion_jobs(project)
+    assert hashed == []
+    assert len(plan.duplicates) == 1
+
+    changed = Path(project.source_state.root) / "case" / "b.txt"
+    changed.write_text("beta, revised")
+    _age(changed)
+    build_conversion_jobs(project)
+    assert hashed == ["b.txt"]
+
+
+def test_replan_drops_hashes_for_removed_sources(project: SimpleNamespace) -> None:
+    build_conversion_jobs(project)
+    cache_path = project.project_dir / HASH_CACHE_FILENAME
+    case_dir = Path(project.source_state.root) / "case"
+    assert str(case_dir / "b.txt") in json.loads(cache_path.read_text())["entries"]
+
+    (case_dir / "b.txt").rename(case_dir / "renamed.txt")
+    build_conversion_jobs(project)
+
+    entries = json.loads(cache_path.read_text())["entries"]
+    assert set(entries) == {str(case_dir / name) for name in ("a.txt", "copy_of_a.txt", "renamed.txt")}
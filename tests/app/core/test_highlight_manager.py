@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
 import fitz
+import pytest
 
 from src.app.core.highlight_manager import build_highlight_jobs
 from src.app.core.project_manager import ProjectManager, ProjectMetadata, SourceTreeState
@@ -155,3 +158,119 @@ def test_highlight_worker_migrates_legacy_colors_directory(tmp_path: Path) -> No
     assert not legacy_colors.exists()
     colors_dir = project_root / "highlights" / "colors"
     assert colors_dir.exists()
+
+
+def test_highlight_worker_extracts_in_processes_and_reuses_cache(tmp_path: Path, monkeypatch) -> None:
+    manager, project_root, sources_root = _setup_manager(tmp_path)
+
+    for index in range(4):
+        _create_pdf(sources_root / "folder" / f"doc{index}.pdf", f"Marked {index}", highlight=index % 2 == 0)
+        converted_path = project_root / "converted_documents" / "folder" / f"doc{index}.md"
+        converted_path.parent.mkdir(parents=True, exist_ok=True)
+        converted_path.write_text("content", encoding="utf-8")
+    # Cached results are only trusted once a file's mtime is outside the racy window.
+    for pdf_path in (sources_root / "folder").glob("*.pdf"):
+        os.utime(pdf_path, ns=(time.time_ns() - 10**10, time.time_ns() - 10**10))
+
+    jobs = build_highlight_jobs(manager)
+    worker = HighlightWorker(jobs, max_workers=2)
+    worker._run()
+
+    assert worker.summary is not None
+    assert worker.summary.documents_with_highlights == 2
+    assert (project_root / ".highlight_cache.json").exists()
+    first_output = jobs[0].highlight_output.read_text(encoding="utf-8")
+
+    from src.app.core import highlight_extractor
+
+    monkeypatch.setattr(
+        highlight_extractor.HighlightExtractor,
+        "_extract_sync",
+        lambda self, path: pytest.fail(f"re-extracted {path}"),
+    )
+    rerun = HighlightWorker(build_highlight_jobs(manager), max_workers=1)
+    rerun._run()
+
+    assert rerun.summary is not None
+    assert rerun.summary.documents_with_highlights == 2
+    assert rerun.summary.total_highlights == worker.summary.total_highlights
+    assert jobs[0].highlight_output.read_text(encoding="utf-8") == first_output
+
+
+def test_highlight_worker_keeps_aggregates_complete_for_partial_runs(tmp_path: Path) -> None:
+    manager, project_root, sources_root = _setup_manager(tmp_path)
+
+    for name in ("first", "second"):
+        _create_pdf(sources_root / "folder" / f"{name}.pdf", f"Marked {name}", highlight=True)
+        converted_path = project_root / "converted_documents" / "folder" / f"{name}.md"
+        converted_path.parent.mkdir(parents=True, exist_ok=True)
+        converted_path.write_text("content", encoding="utf-8")
+
+    jobs = build_highlight_jobs(manager)
+    HighlightWorker(jobs, max_workers=1)._run()
+    colors_dir = project_root / "highlights" / "colors"
+    assert (colors_dir / ".index.json").exists()
+
+    second_only = [job for job in jobs if job.pdf_relative == "folder/second.pdf"]
+    rerun = HighlightWorker(second_only, max_workers=1)
+    rerun._run()
+
+    assert rerun.summary is not None
+    assert rerun.summary.color_files_written == 0
+    content = "".join(path.read_text(encoding="utf-8") for path in colors_dir.glob("*.md"))
+    assert "folder/first.pdf" in content
+    assert "folder/second.pdf" in content
+
+    # Deselecting first.pdf drops it from the aggregates although the PDF remains.
+    deselected = HighlightWorker(second_only, max_workers=1, selected_sources=["folder/second.pdf"])
+    deselected._run()
+
+    content = "".join(path.read_text(encoding="utf-8") for path in colors_dir.glob("*.md"))
+    assert "folder/first.pdf" not in content
+    assert "folder/second.pdf" in content
+
+
+def test_annotated_pages_skips_pages_without_annotations(tmp_path: Path) -> None:
+    from src.app.core.highlight_extractor import annotated_pages
+
+    pdf_path = tmp_path / "mixed.pdf"
+    doc = fitz.open()
+    for index in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 100), f"Page {index}", fontsize=12)
+        if index == 1:
+            page.add_highlight_annot(page.search_for(f"Page {index}")[0]).update()
+    doc.save(pdf_path)
+    doc.close()
+
+    with fitz.open(pdf_path) as document:
+        assert annotated_pages(document) == [1]
+
+
+def test_highlight_worker_passes_word_index_to_the_pool(tmp_path: Path, monkeypatch) -> None:
+    from concurrent.futures import Future
+
+    from src.app.workers import highlight_worker
+
+    manager, project_root, sources_root = _setup_manager(tmp_path)
+    for index in range(4):
+        _create_pdf(sources_root / "folder" / f"doc{index}.pdf", f"Marked {index}", highlight=True)
+        converted_path = project_root / "converted_documents" / "folder" / f"doc{index}.md"
+        converted_path.parent.mkdir(parents=True, exist_ok=True)
+        converted_path.write_text("content", encoding="utf-8")
+    submitted: list[tuple] = []
+
+    class _InlinePool:
+        def submit(self, fn, *args):
+            submitted.append(args)
+            future: Future = Future()
+            future.set_result(fn(*args))
+            return future
+
+    monkeypatch.setattr(highlight_worker, "get_highlight_pool", lambda: _InlinePool())
+    worker = HighlightWorker(build_highlight_jobs(manager), max_workers=2, word_index=True)
+    worker._run()
+
+    assert len(submitted) == 4
+    assert all(word_index is True for _, word_index in submitted)
+    assert worker.summary is not None and worker.summary.total_highlights == 4
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 import frontmatter
@@ -8,8 +8,12 @@ import fitz
 
 from src.app.core.highlight_extractor import HighlightExtractor
 from src.app.core.highlights import (
+    Highlight,
     HighlightCollection,
+    HighlightIndex,
+    aggregate_highlights_by_color,
     highlight_markdown_content,
+    save_color_aggregates,
     save_highlights_markdown,
     save_placeholder_markdown,
 )
@@ -99,3 +103,111 @@ def test_highlight_extractor_returns_empty_collection(tmp_path: Path) -> None:
     assert collection is not None
     assert collection.is_empty()
     assert list(collection.highlights) == []
+
+
+def _collection(source: Path, *entries: tuple[str, str]) -> HighlightCollection:
+    return HighlightCollection(
+        highlights=tuple(Highlight(text, 1, color, 0.0, float(row)) for row, (text, color) in enumerate(entries)),
+        source_file=source,
+    )
+
+
+def test_highlight_index_rewrites_only_touched_colors(tmp_path: Path) -> None:
+    sources = tmp_path / "sources"
+    sources.mkdir()
+    first, second = sources / "a.pdf", sources / "b.pdf"
+    first.write_bytes(b"%PDF")
+    second.write_bytes(b"%PDF")
+    colors_dir = tmp_path / "colors"
+    generated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    index = HighlightIndex(colors_dir / ".index.json")
+    assert not index.exists
+    index.update("a.pdf", _collection(first, ("alpha", "yellow"), ("gamma", "green")))
+    index.update("b.pdf", _collection(second, ("beta", "yellow")))
+    save_color_aggregates(aggregate_highlights_by_color(index.collections()), colors_dir, generated_at=generated_at)
+    index.save()
+    (colors_dir / "green.md").write_text("untouched", encoding="utf-8")
+
+    # A later run that only saw b.pdf keeps a.pdf's entries in the aggregates.
+    index = HighlightIndex(colors_dir / ".index.json")
+    assert index.exists
+    assert index.update("b.pdf", _collection(second, ("beta", "yellow"))) == set()
+    touched = index.update("b.pdf", _collection(second, ("delta", "pink")))
+    assert touched == {"yellow", "pink"}
+    written = save_color_aggregates(
+        aggregate_highlights_by_color(index.collections(), colors=touched),
+        colors_dir,
+        generated_at=generated_at,
+        colors=touched,
+    )
+
+    assert set(written) == {"yellow", "pink"}
+    assert (colors_dir / "green.md").read_text(encoding="utf-8") == "untouched"
+    yellow = (colors_dir / "yellow.md").read_text(encoding="utf-8")
+    assert "alpha" in yellow and "beta" not in yellow
+    assert "delta" in (colors_dir / "pink.md").read_text(encoding="utf-8")
+
+    second.unlink()
+    assert index.prune_missing_sources() == {"pink"}
+    save_color_aggregates(
+        aggregate_highlights_by_color(index.collections(), colors={"pink"}),
+        colors_dir,
+        generated_at=generated_at,
+        colors={"pink"},
+    )
+    assert not (colors_dir / "pink.md").exists()
+
+    # Deselecting a folder drops its documents even though the PDFs remain.
+    assert index.prune_unselected(["b.pdf"]) == {"yellow", "green"}
+    assert index.collections() == []
+
+
+def test_word_index_parses_each_page_once(tmp_path: Path, monkeypatch) -> None:
+    pdf_path = tmp_path / "marked.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    for row in range(30):
+        page.insert_text((72, 60 + row * 20), f"finding {row} noted", fontsize=11)
+    for row in range(30):
+        for rect in page.search_for(f"finding {row} noted"):
+            page.add_highlight_annot(rect).update()
+    doc.save(pdf_path)
+    doc.close()
+
+    clipped = HighlightExtractor().extract(pdf_path)
+
+    calls: list[str] = []
+    original = fitz.Page.get_text
+
+    def counting_get_text(self, *args, **kwargs):
+        calls.append(args[0] if args else "text")
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(fitz.Page, "get_text", counting_get_text)
+    indexed = HighlightExtractor(word_index=True).extract(pdf_path)
+
+    assert calls == ["words"]
+    assert clipped is not None and indexed is not None
+    assert [item.text for item in indexed.highlights] == [
+        " ".join(item.text.split()) for item in clipped.highlights
+    ]
+    assert indexed.highlights[29].text == "finding 29 noted"
+
+
+def test_in_process_extraction_holds_the_fitz_lock(tmp_path: Path, monkeypatch) -> None:
+    from src.app.core import highlight_extractor
+    from src.core.file_utils import FITZ_LOCK
+
+    pdf_path = tmp_path / "sample.pdf"
+    _create_pdf_with_highlight(pdf_path)
+    held: list[bool] = []
+    original = highlight_extractor.read_highlight_annotations
+
+    def recording_read(path, word_index=False):
+        held.append(FITZ_LOCK.locked())
+        return original(path, word_index=word_index)
+
+    monkeypatch.setattr(highlight_extractor, "read_highlight_annotations", recording_read)
+    assert HighlightExtractor().extract(pdf_path) is not None
+    assert held == [True]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from src.app.core import markdown_stream
+from src.app.core.markdown_stream import StreamedMarkdown
+from src.common.llm import tokens
+
+
+class _WordEncoder:
+    name = "words"
+    estimated = False
+
+    def count(self, text: str) -> int:
+        return len(text.split())
+
+    def count_batch(self, texts):
+        return [len(text.split()) for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def word_tokenizer(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tokens, "_TOKENIZER_REGISTRY", dict(tokens._TOKENIZER_REGISTRY))
+    monkeypatch.setattr(tokens, "_TOKENIZERS", {})
+    tokens.register_tokenizer("test", lambda model: _WordEncoder())
+
+
+def _write(tmp_path: Path, body: str, front: str = "---\ntitle: Record\nsources:\n  - relative: a.pdf\n---\n") -> Path:
+    path = tmp_path / "doc.md"
+    path.write_bytes((front + body).encode("utf-8"))
+    return path
+
+
+def test_plan_spans_small_windows_without_losing_text(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Tiny windows force many window hand-offs; multi-byte text exercises
+    # the character/byte offset mapping.
+    monkeypatch.setattr(markdown_stream, "_WINDOW_BYTES", 1)
+    monkeypatch.setattr(markdown_stream, "_CHARS_PER_TOKEN_CEILING", 1)
+    body = "".join(
+        f"## Päge {page}\n\n" + " ".join(f"Entry {page}.{n} — café noted." for n in range(10)) + "\n\n"
+        for page in range(30)
+    )
+    path = _write(tmp_path, body)
+
+    with StreamedMarkdown(path) as stream:
+        spans = stream.plan(40, "test", overlap_tokens=8)
+        chunks = [text for _, text, _ in stream.iter_chunks()]
+
+        assert stream.metadata["title"] == "Record"
+        assert len(spans) > 5
+        for span, chunk in zip(spans, chunks):
+            assert len(chunk.split()) <= 40
+            assert span.checksum == hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+        assert not chunks[0].startswith("---")
+        assert stream.body_checksum == hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+    joined = "\n".join(chunks)
+    for page in range(30):
+        for n in range(10):
+            assert f"Entry {page}.{n} — café noted." in joined
+
+
+def test_plan_without_front_matter(tmp_path: Path) -> None:
+    path = _write(tmp_path, "Just one sentence.", front="")
+
+    with StreamedMarkdown(path) as stream:
+        stream.plan(100, "test")
+        assert stream.metadata == {}
+        assert [text for _, text, _ in stream.iter_chunks()] == ["Just one sentence."]
+
+
+def test_should_stream_uses_size_threshold(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = _write(tmp_path, "x" * 100)
+    monkeypatch.setattr(markdown_stream, "STREAMING_THRESHOLD_BYTES", 50)
+    assert markdown_stream.should_stream(path)
+    monkeypatch.setattr(markdown_stream, "STREAMING_THRESHOLD_BYTES", 10_000)
+    assert not markdown_stream.should_stream(path)
+    assert not markdown_stream.should_stream(tmp_path / "missing.md")
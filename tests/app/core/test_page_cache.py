@@ -0,0 +1,63 @@
+"""Tests for page fingerprints and the per-page conversion cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from src.app.core.page_cache import PageCache, page_fingerprints
+from src.core import file_utils
+
+
+def _write_pdf(path: Path, texts: list[str]) -> None:
+    doc = fitz.open()
+    for text in texts:
+        doc.new_page().insert_text((72, 100), text, fontsize=12)
+    doc.save(path)
+    doc.close()
+
+
+def test_fingerprints_follow_page_content(tmp_path: Path) -> None:
+    first, second = tmp_path / "first.pdf", tmp_path / "second.pdf"
+    _write_pdf(first, ["alpha", "beta"])
+    _write_pdf(second, ["alpha", "gamma", "beta"])
+
+    before = page_fingerprints(first)
+    after = page_fingerprints(second)
+
+    assert len(before) == 2 and len(after) == 3
+    assert after[0] == before[0] and after[2] == before[1]
+    assert after[1] not in before
+
+
+def test_fingerprints_fall_back_in_process_under_the_lock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _write_pdf(pdf_path, ["alpha"])
+    held: list[bool] = []
+    original = file_utils._fingerprint_pages
+
+    class _BrokenPool:
+        def submit(self, *args, **kwargs):
+            raise file_utils.BrokenProcessPool("stopped")
+
+    def recording(path):
+        held.append(file_utils.FITZ_LOCK.locked())
+        return original(path)
+
+    monkeypatch.setattr(file_utils, "_get_page_pool", lambda: _BrokenPool())
+    monkeypatch.setattr(file_utils, "_fingerprint_pages", recording)
+
+    assert len(page_fingerprints(pdf_path)) == 1
+    assert held == [True]
+
+
+def test_page_cache_round_trip(tmp_path: Path) -> None:
+    cache = PageCache(tmp_path / ".page_cache.sqlite3")
+    try:
+        cache.put_many("pdf-local", [("a", "page a"), ("b", "page b")])
+        assert cache.get_many("pdf-local", ["a", "b", "c"]) == {"a": "page a", "b": "page b"}
+        assert cache.get_many("azure", ["a"]) == {}
+    finally:
+        cache.close()
@@ -0,0 +1,96 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.app.core import stat_index
+from src.app.core.stat_index import StatIndex
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate ``path`` so its mtime is outside the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _tree(root: Path) -> None:
+    for rel in ("a/one.md", "a/two.md", "b/deep/three.md", "top.md"):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel, encoding="utf-8")
+    for path in sorted(root.rglob("*"), reverse=True):
+        _age(path)
+    _age(root)
+
+
+class _Probe:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, path: Path) -> bool:
+        self.calls.append(path.name)
+        return path.name.startswith("t")
+
+
+def test_files_matches_full_walk_and_probes(tmp_path: Path) -> None:
+    root = tmp_path / "docs"
+    _tree(root)
+    probe = _Probe()
+
+    files = StatIndex(tmp_path / "index.json").files("docs", root, probe)
+
+    assert files == {"a/one.md": False, "a/two.md": True, "b/deep/three.md": True, "top.md": True}
+    assert sorted(probe.calls) == ["one.md", "three.md", "top.md", "two.md"]
+
+
+def test_unchanged_directories_are_not_listed_again(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = tmp_path / "docs"
+    _tree(root)
+    index_path = tmp_path / "index.json"
+    first = StatIndex(index_path)
+    expected = first.files("docs", root)
+    first.save()
+
+    listed: list[str] = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(stat_index.os, "scandir", counting_scandir)
+    assert StatIndex(index_path).files("docs", root) == expected
+    assert listed == []
+
+
+def test_probe_reruns_only_for_changed_files(tmp_path: Path) -> None:
+    root = tmp_path / "docs"
+    _tree(root)
+    index_path = tmp_path / "index.json"
+    index = StatIndex(index_path)
+    index.files("docs", root, _Probe())
+    index.save()
+
+    changed = root / "a" / "one.md"
+    changed.write_text("rewritten in place", encoding="utf-8")
+    probe = _Probe()
+    StatIndex(index_path).files("docs", root, probe)
+
+    assert probe.calls == ["one.md"]
+
+
+def test_added_and_removed_entries_are_detected(tmp_path: Path) -> None:
+    root = tmp_path / "docs"
+    _tree(root)
+    index_path = tmp_path / "index.json"
+    index = StatIndex(index_path)
+    index.files("docs", root)
+    index.save()
+
+    (root / "b" / "deep" / "new.md").write_text("new", encoding="utf-8")
+    (root / "a" / "two.md").unlink()
+
+    files = StatIndex(index_path).files("docs", root)
+
+    assert set(files) == {"a/one.md", "b/deep/three.md", "b/deep/new.md", "top.md"}
@@ -0,0 +1,166 @@
+"""Tests for the filesystem watcher that drives workspace metric refreshes."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+PySide6 = pytest.importorskip("PySide6")
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication
+
+from src.app.core.workspace_watcher import WorkspaceWatcher
+
+
+@pytest.fixture(scope="module")
+def qt_app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _wait_for(events: List[List[str]], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not events and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    for folder in ("converted_documents", "bulk_analysis/group/outputs", "highlights"):
+        (root / folder).mkdir(parents=True)
+    return root
+
+
+def test_watcher_reports_changed_folder(project_dir: Path, qt_app: QApplication) -> None:
+    assert qt_app is not None
+    events: List[List[str]] = []
+    watcher = WorkspaceWatcher(debounce_ms=20)
+    watcher.folders_changed.connect(events.append)
+    watcher.watch(project_dir)
+    try:
+        if watcher.polling:
+            pytest.skip("Native directory watching is unavailable here")
+        (project_dir / "bulk_analysis" / "group" / "outputs" / "doc.md").write_text("analysis")
+        _wait_for(events)
+    finally:
+        watcher.stop()
+
+    assert events and events[0] == ["bulk_analysis"]
+
+
+def test_watcher_polls_when_tree_exceeds_watch_limit(project_dir: Path, qt_app: QApplication) -> None:
+    assert qt_app is not None
+    events: List[List[str]] = []
+    watcher = WorkspaceWatcher(poll_interval_ms=20, max_directories=1)
+    watcher.folders_changed.connect(events.append)
+    watcher.watch(project_dir)
+    try:
+        assert watcher.polling
+        _wait_for(events)
+    finally:
+        watcher.stop()
+
+    assert events and set(events[0]) == {"converted_documents", "bulk_analysis", "highlights"}
+
+
+def test_list_watch_directories_stops_past_limit(project_dir: Path) -> None:
+    from src.app.core.workspace_watcher import list_watch_directories
+
+    for index in range(10):
+        (project_dir / "converted_documents" / f"folder{index}").mkdir()
+
+    full = list_watch_directories(project_dir)
+    assert full is not None
+    assert str(project_dir) in full
+    assert str(project_dir / "bulk_analysis" / "group" / "outputs") in full
+    assert str(project_dir / "converted_documents" / "folder9") in full
+
+    capped = list_watch_directories(project_dir, limit=3)
+    assert capped is not None and 3 < len(capped) < len(full)
+    assert list_watch_directories(project_dir, is_cancelled=lambda: True) is None
+
+
+def test_watch_scan_worker_feeds_watcher(project_dir: Path, qt_app: QApplication) -> None:
+    from src.app.workers.source_scan_worker import WatchScanWorker
+
+    assert qt_app is not None
+    listed: List[List[str]] = []
+    worker = WatchScanWorker(project_dir, limit=1)
+    worker.finished.connect(listed.append)
+    worker._run()
+
+    assert listed and len(listed[0]) > 1
+    watcher = WorkspaceWatcher(max_directories=1)
+    watcher.watch(project_dir, listed[0])
+    try:
+        assert watcher.polling
+    finally:
+        watcher.stop()
+
+
+def test_watcher_walks_only_new_subdirectories_and_skips_journals(
+    project_dir: Path, qt_app: QApplication, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.app.core import workspace_watcher
+
+    assert qt_app is not None
+    group = project_dir / "bulk_analysis" / "group"
+    watcher = WorkspaceWatcher(debounce_ms=10_000)
+    watcher.watch(project_dir)
+    if watcher.polling:
+        watcher.stop()
+        pytest.skip("Native directory watching is unavailable here")
+    walked: List[Path] = []
+    original_walk = workspace_watcher._walk_directories
+
+    def recording_walk(root: Path):
+        walked.append(root)
+        return original_walk(root)
+
+    monkeypatch.setattr(workspace_watcher, "_walk_directories", recording_walk)
+    try:
+        (group / "token_counts.sqlite3").write_bytes(b"")
+        watcher._on_directory_changed(str(group))
+        assert walked == [] and watcher._pending == {"bulk_analysis"}
+        watcher._pending.clear()
+
+        # A commit's journal and the store's new mtime are not a change.
+        (group / "token_counts.sqlite3-journal").write_bytes(b"")
+        (group / "token_counts.sqlite3").write_bytes(b"data")
+        watcher._on_directory_changed(str(group))
+        assert watcher._pending == set()
+
+        (group / "reduce" / "nested").mkdir(parents=True)
+        watcher._on_directory_changed(str(group))
+        assert walked == [group / "reduce"]
+        assert str(group / "reduce" / "nested") in watcher._watcher.directories()
+    finally:
+        watcher.stop()
+
+
+def test_watcher_refreshes_during_sustained_changes(project_dir: Path, qt_app: QApplication) -> None:
+    assert qt_app is not None
+    events: List[List[str]] = []
+    watcher = WorkspaceWatcher(debounce_ms=50)
+    watcher.folders_changed.connect(events.append)
+    watcher.watch(project_dir)
+    outputs = project_dir / "bulk_analysis" / "group" / "outputs"
+    try:
+        deadline = time.monotonic() + 0.5
+        index = 0
+        while time.monotonic() < deadline:
+            (outputs / f"doc{index}.md").write_text("analysis")
+            watcher._on_directory_changed(str(outputs))
+            index += 1
+            QCoreApplication.processEvents()
+            time.sleep(0.01)
+        assert events, "no refresh while events kept arriving"
+    finally:
+        watcher.stop()
@@ -129,6 +129,39 @@ def test_workspace_metrics_include_group_coverage(tmp_path: Path, qt_app: QAppli
     assert set(group_metrics.converted_files) == {"folder/doc1.md", "folder/doc2.md"}
 
 
+def test_refresh_workspace_metrics_recomputes_only_affected_groups(tmp_path: Path, qt_app: QApplication) -> None:
+    assert qt_app is not None
+    manager = ProjectManager()
+    manager.create_project(tmp_path, ProjectMetadata(case_name="Incremental Metrics"))
+
+    converted_dir = manager.project_dir / "converted_documents" / "folder"
+    converted_dir.mkdir(parents=True, exist_ok=True)
+    (converted_dir / "doc1.md").write_text("converted")
+    (converted_dir / "doc2.md").write_text("converted")
+
+    first = manager.save_bulk_analysis_group(BulkAnalysisGroup.create(name="First", directories=["folder"]))
+    second = manager.save_bulk_analysis_group(BulkAnalysisGroup.create(name="Second", directories=["folder"]))
+
+    before = manager.refresh_workspace_metrics()
+
+    outputs_dir = manager.project_dir / "bulk_analysis" / first.slug / "outputs" / "folder"
+    outputs_dir.mkdir(parents=True, exist_ok=True)
+    (outputs_dir / "doc1.md").write_text("analysis")
+
+    after = manager.refresh_workspace_metrics(["bulk_analysis"])
+
+    assert after.groups[first.group_id].bulk_analysis_total == 1
+    assert after.groups[first.group_id].pending_files == ("folder/doc2.md",)
+    assert after.groups[second.group_id] is before.groups[second.group_id]
+    assert after.dashboard.bulk_analysis_total == 1
+
+    (converted_dir / "doc3.md").write_text("converted")
+    rebuilt = manager.refresh_workspace_metrics(["converted_documents"])
+
+    assert rebuilt.groups[second.group_id] is not after.groups[second.group_id]
+    assert rebuilt.groups[second.group_id].converted_count == 3
+
+
 def test_welcome_stage_uses_persisted_metrics(
     tmp_path: Path, qt_app: QApplication, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -138,3 +138,74 @@ def test_scan_ignores_bulk_analysis_noise_files(project_root: Path) -> None:
 
     assert snapshot.bulk_analysis_count == 1
     assert snapshot.files["bulk_analysis"] == ["case/doc1_analysis.md"]
+
+
+def test_rescan_with_stat_index_tracks_rewritten_files(project_root: Path):
+    write_file(project_root / "converted_documents", "doc1.md", "---\nsource_format: pdf\n---\ncontent")
+    write_file(project_root / "converted_documents", "doc2.md", "plain")
+    first = FileTracker(project_root).scan()
+
+    write_file(project_root / "converted_documents", "doc2.md", "---\nsource_format: pdf\n---\nnow a pdf")
+    second = FileTracker(project_root).scan()
+
+    assert (project_root / ".file_tracker_index.json").exists()
+    assert first.files["imported_pdf"] == ["doc1.md"]
+    assert second.files["imported_pdf"] == ["doc1.md", "doc2.md"]
+    assert second.files["imported"] == first.files["imported"]
+
+
+def test_rescan_reports_changes_for_requested_folders(project_root: Path):
+    write_file(project_root / "converted_documents", "doc1.md")
+    tracker = FileTracker(project_root)
+    _, initial = tracker.rescan()
+    assert initial == {"converted_documents": {"doc1.md"}}
+
+    write_file(project_root / "bulk_analysis", "group/outputs/doc1_analysis.md")
+    write_file(project_root / "converted_documents", "doc2.md")
+    snapshot, changes = tracker.rescan(["bulk_analysis"])
+
+    # converted_documents was not rescanned, so doc2 is not seen yet.
+    assert changes == {"bulk_analysis": {"group/outputs/doc1_analysis.md"}}
+    assert snapshot.files["imported"] == ["doc1.md"]
+    assert snapshot.files["bulk_analysis"] == ["group/outputs/doc1_analysis.md"]
+
+    _, changes = tracker.rescan()
+    assert changes == {"converted_documents": {"doc2.md"}}
+
+
+def test_combined_status_cache_tracks_input_rewrites(project_root: Path) -> None:
+    import os
+
+    from src.app.core.bulk_analysis_groups import BulkAnalysisGroup
+    from src.app.core.file_tracker import CombinedStatusCache
+
+    write_file(project_root / "bulk_analysis", "map/outputs/doc1.md", "analysis")
+    group = BulkAnalysisGroup.create(name="Combined")
+    group.slug = "combined"
+    group.operation = "combined"
+    group.combine_map_groups = ["map"]
+    cache = CombinedStatusCache()
+
+    count, latest, _, stale = cache.status(project_root, group)
+    assert (count, latest, stale) == (1, None, True)
+
+    doc = project_root / "bulk_analysis" / "map" / "outputs" / "doc1.md"
+    reduce_dir = project_root / "bulk_analysis" / group.slug / "reduce"
+    write_file(reduce_dir, "combined_1.md", "combined")
+    manifest = {"inputs": [{"path": "map/map/doc1.md", "mtime_ns": doc.stat().st_mtime_ns}]}
+    write_file(reduce_dir, "combined_1.manifest.json", json.dumps(manifest))
+
+    cache.begin_refresh()
+    count, latest, _, stale = cache.status(project_root, group)
+    assert latest == f"bulk_analysis/{group.slug}/reduce/combined_1.md"
+    assert (count, stale) == (1, False)
+
+    # Rewriting an input in place leaves its directory mtime untouched.
+    future = doc.stat().st_mtime_ns + 10_000_000_000
+    os.utime(doc, ns=(future, future))
+    cache.begin_refresh()
+    assert cache.status(project_root, group)[3] is True
+
+    write_file(project_root / "bulk_analysis", "map/outputs/doc2.md", "analysis")
+    cache.begin_refresh()
+    assert cache.status(project_root, group)[0] == 2
@@ -0,0 +1,93 @@
+"""Tests for the lazily populated Documents tab source tree."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from src.app.ui.workspace.source_tree_model import SourceTreeModel, is_skipped_source_name
+from src.app.workers.source_scan_worker import list_source_directories
+
+
+@pytest.fixture(scope="module")
+def qt_app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _make_tree(root: Path) -> None:
+    for relative in ("a/a1/deep", "a/a2", "b", ".azure-di/cache"):
+        (root / relative).mkdir(parents=True)
+    (root / "a" / "a1" / "deep" / "doc.pdf").write_bytes(b"%PDF")
+    (root / "b" / "notes.txt").write_text("x", encoding="utf-8")
+
+
+def _children(model: SourceTreeModel, parent) -> list[tuple[str, str]]:
+    return [model.index(row, 0, parent).data(Qt.UserRole) for row in range(model.rowCount(parent))]
+
+
+def test_directories_are_listed_on_demand(qt_app: QApplication, tmp_path: Path) -> None:
+    assert qt_app is not None
+    root = tmp_path / "source"
+    _make_tree(root)
+    model = SourceTreeModel()
+    model.set_root(root, "source", [])
+
+    root_index = model.root_index()
+    assert _children(model, root_index) == [("dir", "a"), ("dir", "b")]
+    a_index = model.index(0, 0, root_index)
+    assert model.rowCount(a_index) == 0
+    assert model.hasChildren(a_index) and model.canFetchMore(a_index)
+
+    model.fetchMore(a_index)
+    assert _children(model, a_index) == [("dir", "a/a1"), ("dir", "a/a2")]
+    assert not model.canFetchMore(a_index)
+
+    deep = model.index_for_directory("a/a1/deep")
+    assert deep.data(Qt.UserRole) == ("dir", "a/a1/deep")
+    model.fetchMore(deep)
+    assert _children(model, deep) == [("file", "a/a1/deep/doc.pdf")]
+
+
+def test_selection_survives_collapsed_folders_and_cascades(qt_app: QApplication, tmp_path: Path) -> None:
+    assert qt_app is not None
+    root = tmp_path / "source"
+    _make_tree(root)
+    model = SourceTreeModel()
+    changes: list[tuple[str, str]] = []
+    model.check_state_changed.connect(lambda kind, relative: changes.append((kind, relative)))
+    model.set_root(root, "source", ["a/a1/deep"])
+
+    a_index = model.index(0, 0, model.root_index())
+    assert a_index.data(Qt.CheckStateRole) == Qt.PartiallyChecked
+    assert model.selected_directories() == ["a/a1/deep"]
+
+    b_index = model.index(1, 0, model.root_index())
+    model.setData(b_index, Qt.Checked, Qt.CheckStateRole)
+    assert changes == [("dir", "b")]
+    assert model.selected_directories() == ["a/a1/deep", "b"]
+
+    model.setData(a_index, Qt.Checked, Qt.CheckStateRole)
+    model.fetchMore(a_index)
+    assert {model.index(row, 0, a_index).data(Qt.CheckStateRole) for row in range(2)} == {Qt.Checked}
+    assert model.selected_directories() == ["a", "b"]
+
+    a2_index = model.index_for_directory("a/a2")
+    model.setData(a2_index, Qt.Unchecked, Qt.CheckStateRole)
+    assert a_index.data(Qt.CheckStateRole) == Qt.PartiallyChecked
+    assert model.selected_directories() == ["a/a1", "b"]
+
+
+def test_list_source_directories_skips_azure_sidecars(tmp_path: Path) -> None:
+    root = tmp_path / "source"
+    _make_tree(root)
+
+    directories = list_source_directories(root, is_skipped=is_skipped_source_name)
+
+    assert directories == ["a", "a/a1", "a/a1/deep", "a/a2", "b"]
+    assert list_source_directories(root, is_cancelled=lambda: True) is None
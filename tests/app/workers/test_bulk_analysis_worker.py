@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from typing import Sequence
 
@@ -229,3 +231,325 @@ def test_bulk_worker_applies_placeholder_values(tmp_path: Path, monkeypatch: pyt
     assert captured["system"][0] == "System for Project XYZ"
     assert "doc.pdf" in captured["user"][0]
     assert "ACME" in captured["user"][0]
+
+
+def test_bulk_worker_processes_documents_concurrently(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    project_dir = tmp_path
+    converted = project_dir / "converted_documents"
+    converted.mkdir(parents=True, exist_ok=True)
+    names = [f"doc{i}.md" for i in range(3)]
+    for name in names:
+        (converted / name).write_text(f"content {name}", encoding="utf-8")
+
+    group = BulkAnalysisGroup.create("Group", files=names)
+    group.max_concurrent_documents = 3
+
+    monkeypatch.setattr(
+        worker_module,
+        "load_prompts",
+        lambda *_args, **_kwargs: PromptBundle("System", "User {document_content}"),
+    )
+    monkeypatch.setattr(BulkAnalysisWorker, "_resolve_provider", lambda self: ProviderConfig("anthropic", "model"))
+    monkeypatch.setattr(BulkAnalysisWorker, "_create_provider", lambda self, *_: object())
+
+    # Every document waits for the others, so this only completes when all three run at once.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_process(self, _provider, _config, _bundle, _system, document, *_args):
+        barrier.wait()
+        return f"summary {document.relative_path}", {"chunk_count": 1}, {}
+
+    monkeypatch.setattr(BulkAnalysisWorker, "_process_document", fake_process)
+
+    worker = BulkAnalysisWorker(
+        project_dir=project_dir,
+        group=group,
+        files=names,
+        metadata=ProjectMetadata(case_name="Case"),
+        placeholder_values={},
+    )
+    progress: list[tuple[int, int]] = []
+    results: list[tuple[int, int]] = []
+    worker.progress.connect(lambda done, total, _path: progress.append((done, total)))
+    worker.finished.connect(lambda ok, failed: results.append((ok, failed)))
+    worker._run()
+
+    assert results == [(3, 0)]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    manifest = _load_manifest(_manifest_path(project_dir, group))
+    assert sorted(manifest["documents"]) == names
+    for name in names:
+        output = project_dir / "bulk_analysis" / group.folder_name / f"{Path(name).stem}_analysis.md"
+        assert f"summary {name}" in output.read_text(encoding="utf-8")
+
+
+def test_group_concurrency_roundtrip() -> None:
+    group = BulkAnalysisGroup.create("Group")
+    group.max_concurrent_documents = 4
+    group.max_concurrent_chunks = 6
+    restored = BulkAnalysisGroup.from_dict(group.to_dict())
+    assert restored.max_concurrent_documents == 4
+    assert restored.max_concurrent_chunks == 6
+
+    payload = group.to_dict()
+    payload.pop("max_concurrent_documents")
+    payload["max_concurrent_chunks"] = "bogus"
+    legacy = BulkAnalysisGroup.from_dict(payload)
+    assert legacy.max_concurrent_documents == 1
+    assert legacy.max_concurrent_chunks == 1
+
+
+def test_process_document_maps_chunks_concurrently_in_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    project_dir = tmp_path
+    source_path = project_dir / "converted_documents" / "big.md"
+    source_path.parent.mkdir(parents=True, exist_ok=True)
+    source_path.write_text("large body", encoding="utf-8")
+
+    group = BulkAnalysisGroup.create("Group", files=["big.md"])
+    group.max_concurrent_chunks = 4
+    chunks = ["chunk-a", "chunk-b", "chunk-c", "chunk-d"]
+    monkeypatch.setattr(worker_module, "should_chunk", lambda *_args, **_kwargs: (True, 50_000, 10_000))
+    monkeypatch.setattr(worker_module, "generate_chunks", lambda *_args, **_kwargs: list(chunks))
+
+    barrier = threading.Barrier(len(chunks), timeout=5)
+    combine_prompts: list[str] = []
+
+    def fake_invoke(self, provider, config, prompt, system_prompt):  # noqa: ANN001
+        for name in chunks:
+            if prompt.startswith("You are analysing chunk") and name in prompt:
+                barrier.wait()
+                return f"summary of {name}"
+        combine_prompts.append(prompt)
+        return "combined"
+
+    monkeypatch.setattr(BulkAnalysisWorker, "_invoke_provider", fake_invoke)
+
+    worker = BulkAnalysisWorker(
+        project_dir=project_dir,
+        group=group,
+        files=["big.md"],
+        metadata=None,
+        placeholder_values={},
+    )
+    checkpoint_root = project_dir / "bulk_analysis" / group.folder_name / "map" / "checkpoints"
+    manifest: dict[str, object] = {"version": 2, "signature": None, "documents": {}}
+    document = worker_module.BulkAnalysisDocument(
+        source_path=source_path,
+        relative_path="big.md",
+        output_path=project_dir / "bulk_analysis" / group.folder_name / "big_analysis.md",
+    )
+
+    result, run_details, _ = worker._process_document(
+        provider=object(),
+        provider_config=ProviderConfig("anthropic", "model"),
+        bundle=PromptBundle("System", "User {document_content}"),
+        system_prompt="System",
+        document=document,
+        global_placeholders=worker._build_placeholder_map(),
+        checkpoint_mgr=CheckpointManager(checkpoint_root),
+        manifest=manifest,
+        prompt_hash="hash",
+        manifest_path=_manifest_path(project_dir, group),
+    )
+
+    assert result == "combined"
+    assert run_details["chunk_count"] == 4
+    positions = [combine_prompts[0].index(f"summary of {name}") for name in chunks]
+    assert positions == sorted(positions)
+    entry = manifest["documents"]["big.md"]
+    assert entry["chunks_done"] == [1, 2, 3, 4]
+    assert entry["status"] == "complete"
+    with closing(sqlite3.connect(checkpoint_root / "checkpoints.sqlite3")) as conn:
+        saved = conn.execute("SELECT COUNT(*) FROM checkpoints WHERE scope = 'map:big.md'").fetchone()
+        current = conn.execute(
+            "SELECT COUNT(*) FROM checkpoints c JOIN generations g ON g.scope = c.scope "
+            "WHERE c.scope = 'map:big.md' AND c.generation = g.generation"
+        ).fetchone()
+    # Every chunk was checkpointed, then invalidated once the document completed.
+    assert saved == (4,)
+    assert current == (0,)
+    assert CheckpointManager(checkpoint_root).load_map_chunks("big.md") == {}
+
+
+def test_process_document_streams_large_documents_from_disk(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project_dir = tmp_path
+    source_path = project_dir / "converted_documents" / "huge.md"
+    source_path.parent.mkdir(parents=True, exist_ok=True)
+    sentences = " ".join(f"Observation {index} was recorded." for index in range(400))
+    source_path.write_text("---\ntitle: Huge\n---\n# Record\n\n" + sentences + "\n", encoding="utf-8")
+
+    group = BulkAnalysisGroup.create("Group", files=["huge.md"])
+    group.model_context_window = 1_000
+    monkeypatch.setattr(worker_module, "should_stream", lambda _path: True)
+    monkeypatch.setattr(
+        BulkAnalysisWorker,
+        "_load_document",
+        lambda *_args, **_kwargs: pytest.fail("streamed documents must not be loaded whole"),
+    )
+    monkeypatch.setattr(worker_module, "chunk_token_budget", lambda *_args, **_kwargs: 300)
+
+    mapped: list[str] = []
+
+    def fake_invoke(self, provider, config, prompt, system_prompt):  # noqa: ANN001
+        if prompt.startswith("You are analysing chunk"):
+            mapped.append(prompt)
+            return f"summary {len(mapped)}"
+        return "combined"
+
+    monkeypatch.setattr(BulkAnalysisWorker, "_invoke_provider", fake_invoke)
+
+    worker = BulkAnalysisWorker(
+        project_dir=project_dir,
+        group=group,
+        files=["huge.md"],
+        metadata=None,
+        placeholder_values={},
+    )
+    checkpoint_root = project_dir / "bulk_analysis" / group.folder_name / "map" / "checkpoints"
+    manifest: dict[str, object] = {"version": 2, "signature": None, "documents": {}}
+    document = worker_module.BulkAnalysisDocument(
+        source_path=source_path,
+        relative_path="huge.md",
+        output_path=project_dir / "bulk_analysis" / group.folder_name / "huge_analysis.md",
+    )
+
+    result, run_details, _ = worker._process_document(
+        provider=object(),
+        provider_config=ProviderConfig("anthropic", "model"),
+        bundle=PromptBundle("System", "User {document_content}"),
+        system_prompt="System",
+        document=document,
+        global_placeholders=worker._build_placeholder_map(),
+        checkpoint_mgr=CheckpointManager(checkpoint_root),
+        manifest=manifest,
+        prompt_hash="hash",
+        manifest_path=_manifest_path(project_dir, group),
+    )
+
+    assert result == "combined"
+    assert run_details["streamed"] is True
+    assert run_details["chunk_count"] == len(mapped) > 1
+    assert "title: Huge" not in "".join(mapped)
+    assert "Observation 399 was recorded." in mapped[-1]
+    entry = manifest["documents"]["huge.md"]
+    assert entry["status"] == "complete"
+    assert len(entry["checksums"]) == len(mapped)
+
+
+def test_process_document_maps_chunks_on_event_loop_for_async_providers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import asyncio
+    import threading
+
+    project_dir = tmp_path
+    source_path = project_dir / "converted_documents" / "big.md"
+    source_path.parent.mkdir(parents=True, exist_ok=True)
+    source_path.write_text("large body", encoding="utf-8")
+
+    group = BulkAnalysisGroup.create("Group", files=["big.md"])
+    group.max_concurrent_chunks = 3
+    chunks = [f"chunk-{index}" for index in range(6)]
+    monkeypatch.setattr(worker_module, "should_chunk", lambda *_args, **_kwargs: (True, 50_000, 10_000))
+    monkeypatch.setattr(worker_module, "generate_chunks", lambda *_args, **_kwargs: list(chunks))
+
+    caller = threading.get_ident()
+
+    class _AsyncProvider:
+        supports_async = True
+
+        def __init__(self) -> None:
+            self.threads: set[int] = set()
+            self.in_flight = 0
+            self.peak = 0
+
+        async def agenerate(self, prompt, **_kwargs):  # noqa: ANN001
+            self.threads.add(threading.get_ident())
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            name = next(name for name in chunks if name in prompt)
+            return {"success": True, "content": f"summary of {name}"}
+
+        def generate(self, prompt, **_kwargs):  # noqa: ANN001
+            return {"success": True, "content": "combined"}
+
+    provider = _AsyncProvider()
+    worker = BulkAnalysisWorker(
+        project_dir=project_dir,
+        group=group,
+        files=["big.md"],
+        metadata=None,
+        placeholder_values={},
+    )
+    checkpoint_root = project_dir / "bulk_analysis" / group.folder_name / "map" / "checkpoints"
+    manifest: dict[str, object] = {"version": 2, "signature": None, "documents": {}}
+    document = worker_module.BulkAnalysisDocument(
+        source_path=source_path,
+        relative_path="big.md",
+        output_path=project_dir / "bulk_analysis" / group.folder_name / "big_analysis.md",
+    )
+
+    result, run_details, _ = worker._process_document(
+        provider=provider,
+        provider_config=ProviderConfig("anthropic", "model"),
+        bundle=PromptBundle("System", "User {document_content}"),
+        system_prompt="System",
+        document=document,
+        global_placeholders=worker._build_placeholder_map(),
+        checkpoint_mgr=CheckpointManager(checkpoint_root),
+        manifest=manifest,
+        prompt_hash="hash",
+        manifest_path=_manifest_path(project_dir, group),
+    )
+
+    assert result == "combined"
+    assert run_details["chunk_count"] == 6
+    assert provider.threads == {caller}
+    assert provider.peak == 3
+    assert manifest["documents"]["big.md"]["chunks_done"] == [1, 2, 3, 4, 5, 6]
+
+
+def test_invoke_provider_reuses_cached_responses(tmp_path: Path) -> None:
+    from src.common.llm.response_cache import ResponseCache
+
+    class _Provider:
+        default_model = "model"
+
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def generate(self, prompt, **_kwargs):  # noqa: ANN001
+            self.calls += 1
+            return {"success": True, "content": f"answer {self.calls}"}
+
+    group = BulkAnalysisGroup.create("Group", files=["doc.md"])
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    provider = _Provider()
+    config = ProviderConfig("anthropic", "model")
+
+    def make_worker(force_rerun: bool) -> BulkAnalysisWorker:
+        worker = BulkAnalysisWorker(
+            project_dir=tmp_path,
+            group=group,
+            files=["doc.md"],
+            metadata=None,
+            force_rerun=force_rerun,
+        )
+        worker._response_cache = cache
+        return worker
+
+    first = make_worker(False)._invoke_provider(provider, config, "prompt", "System")
+    second = make_worker(False)._invoke_provider(provider, config, "prompt", "System")
+    assert first == second == "answer 1"
+    assert provider.calls == 1
+
+    # Forced re-runs skip the lookup but refresh the cached entry.
+    assert make_worker(True)._invoke_provider(provider, config, "prompt", "System") == "answer 2"
+    assert make_worker(False)._invoke_provider(provider, config, "prompt", "System") == "answer 2"
+    assert provider.calls == 2
@@ -41,6 +41,11 @@ def test_hierarchical_combiner_reuses_cached_batches(monkeypatch) -> None:
         "count",
         staticmethod(lambda text, provider, model=None: {"success": True, "token_count": 100000}),
     )
+    monkeypatch.setattr(
+        runner.TokenCounter,
+        "count_many",
+        staticmethod(lambda texts, provider, model=None: [100000 for _ in texts]),
+    )
     monkeypatch.setattr(
         runner.TokenCounter,
         "get_model_context_window",
@@ -83,3 +88,69 @@ def test_hierarchical_combiner_reuses_cached_batches(monkeypatch) -> None:
     assert result
     assert any(entry.endswith("combined-1") or entry.endswith("combined-2") for entry in saved_batches)
 
+
+def test_checkpoint_manager_overwrites_in_single_store(tmp_path: Path) -> None:
+    mgr = CheckpointManager(tmp_path / "checkpoints")
+    mgr.save_map_chunk("doc.md", 1, "first", _sha256("a"))
+    mgr.save_map_chunk("doc.md", 1, "second", _sha256("a"))
+
+    assert [p.name for p in (tmp_path / "checkpoints").iterdir()] == ["checkpoints.sqlite3"]
+    assert mgr.load_map_chunk("doc.md", 1)["content"] == "second"
+
+
+def test_load_map_chunks_returns_every_chunk_for_document(tmp_path: Path) -> None:
+    mgr = CheckpointManager(tmp_path)
+    for index in (1, 2, 3):
+        mgr.save_map_chunk("docs/a.md", index, f"summary {index}", _sha256(f"chunk {index}"))
+    mgr.save_map_chunk("docs/b.md", 1, "other", _sha256("other"))
+
+    chunks = mgr.load_map_chunks("docs/a.md")
+
+    assert sorted(chunks) == [1, 2, 3]
+    assert chunks[2]["content"] == "summary 2"
+    assert chunks[2]["input_checksum"] == _sha256("chunk 2")
+
+
+def test_clears_are_scoped_and_survive_reopen(tmp_path: Path) -> None:
+    mgr = CheckpointManager(tmp_path)
+    mgr.save_map_chunk("a.md", 1, "a", _sha256("a"))
+    mgr.save_map_chunk("b.md", 1, "b", _sha256("b"))
+    mgr.save_reduce_batch(1, 1, "batch", _sha256("batch"))
+
+    mgr.clear_map_document("a.md")
+    assert mgr.load_map_chunk("a.md", 1) is None
+    assert mgr.load_map_chunk("b.md", 1)["content"] == "b"
+
+    # Chunks saved after a clear belong to the new generation.
+    mgr.save_map_chunk("a.md", 1, "a2", _sha256("a"))
+    mgr.clear_reduce()
+    mgr.close()
+
+    reopened = CheckpointManager(tmp_path)
+    assert reopened.load_map_chunk("a.md", 1)["content"] == "a2"
+    assert reopened.load_reduce_batch(1, 1) is None
+
+    reopened.clear_all()
+    assert reopened.load_map_chunks("a.md") == {}
+    assert reopened.load_map_chunk("b.md", 1) is None
+
+
+def test_legacy_checkpoint_files_are_imported(tmp_path: Path) -> None:
+    legacy = tmp_path / "map" / "nested" / "doc.md" / "chunk_2.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(
+        json.dumps({"input_checksum": "in", "content": "kept", "content_checksum": _sha256("kept")}),
+        encoding="utf-8",
+    )
+    batch = tmp_path / "reduce" / "batches" / "level_1_batch_3.json"
+    batch.parent.mkdir(parents=True)
+    batch.write_text(
+        json.dumps({"input_checksum": "b", "content": "batch", "content_checksum": _sha256("batch")}),
+        encoding="utf-8",
+    )
+
+    mgr = CheckpointManager(tmp_path)
+
+    assert mgr.load_map_chunk("nested/doc.md", 2)["content"] == "kept"
+    assert mgr.load_reduce_batch(1, 3)["content"] == "batch"
+    assert not (tmp_path / "map").exists() and not (tmp_path / "reduce").exists()
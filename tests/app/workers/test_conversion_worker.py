@@ -0,0 +1,172 @@
+"""Tests for pipelined document conversion."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from PySide6.QtWidgets import QApplication
+
+from src.app.core.conversion_manager import ConversionJob
+from src.app.workers.conversion_worker import ConversionWorker
+
+
+@pytest.fixture(scope="module")
+def qt_app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _jobs(tmp_path: Path, count: int) -> List[ConversionJob]:
+    return [
+        ConversionJob(
+            source_path=tmp_path / f"doc{index}.pdf",
+            relative_path=f"doc{index}.pdf",
+            destination_path=tmp_path / "converted_documents" / f"doc{index}.md",
+            conversion_type="pdf",
+        )
+        for index in range(count)
+    ]
+
+
+def test_pipelined_conversion_overlaps_jobs_and_reports_in_order(
+    qt_app: QApplication, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert qt_app is not None
+    jobs = _jobs(tmp_path, 4)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_execute(self, job: ConversionJob) -> None:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Later jobs finish first to exercise ordered reporting.
+        time.sleep(0.05 * (len(jobs) - jobs.index(job)))
+        with lock:
+            in_flight -= 1
+        if job.relative_path == "doc1.pdf":
+            raise RuntimeError("analysis failed")
+
+    monkeypatch.setattr(ConversionWorker, "_execute", fake_execute)
+    worker = ConversionWorker(jobs, helper="azure_di", options={"max_concurrent_jobs": 4})
+    progress: list[tuple[int, int, str]] = []
+    failures: list[tuple[str, str]] = []
+    finished: list[tuple[int, int]] = []
+    worker.progress.connect(lambda done, total, name: progress.append((done, total, name)))
+    worker.file_failed.connect(lambda path, error: failures.append((path, error)))
+    worker.finished.connect(lambda ok, failed: finished.append((ok, failed)))
+
+    worker._run()
+
+    assert peak > 1
+    assert progress == [(index + 1, 4, f"doc{index}.pdf") for index in range(4)]
+    assert failures == [(str(jobs[1].source_path), "analysis failed")]
+    assert finished == [(3, 1)]
+
+
+def test_azure_conversions_pipeline_by_default(
+    qt_app: QApplication, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert qt_app is not None
+    jobs = _jobs(tmp_path, 3)
+    modes: list[str] = []
+
+    def fake_pipelined(self, concurrency: int) -> tuple[int, int]:
+        modes.append(f"pipelined:{concurrency}")
+        return len(jobs), 0
+
+    def fake_serial(self) -> tuple[int, int]:
+        modes.append("serial")
+        return len(jobs), 0
+
+    monkeypatch.setattr(ConversionWorker, "_run_pipelined", fake_pipelined)
+    monkeypatch.setattr(ConversionWorker, "_run_serial", fake_serial)
+
+    ConversionWorker(jobs, helper="azure_di")._run()
+    ConversionWorker(jobs, helper="azure_di", options={"max_concurrent_jobs": 1})._run()
+    ConversionWorker(jobs, helper="local")._run()
+
+    assert modes == ["pipelined:4", "serial", "serial"]
+
+
+def _write_pdf(path: Path, texts: List[str]) -> None:
+    import fitz  # PyMuPDF
+
+    with fitz.open() as doc:
+        for text in texts:
+            doc.new_page().insert_text((72, 72), text)
+        doc.save(path)
+
+
+def test_reconversion_only_analyses_changed_pages(
+    qt_app: QApplication, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import fitz  # PyMuPDF
+    import src.core.pdf_utils as pdf_utils
+
+    assert qt_app is not None
+    (tmp_path / "sources").mkdir()
+    source = tmp_path / "sources" / "record.pdf"
+    _write_pdf(source, ["alpha", "beta", "gamma"])
+    job = ConversionJob(
+        source_path=source,
+        relative_path="sources/record.pdf",
+        destination_path=tmp_path / "converted_documents" / "sources" / "record.md",
+        conversion_type="pdf",
+    )
+
+    def fake_full(self, source_path, output_dir, json_dir, endpoint, key):
+        produced = Path(output_dir) / f"{Path(source_path).stem}.md"
+        produced.write_text(
+            "# record.pdf\n\nPAGE alpha\n\n<!-- PageBreak -->\n\nPAGE beta\n\n<!-- PageBreak -->\n\nPAGE gamma\n",
+            encoding="utf-8",
+        )
+        return None, str(produced)
+
+    analysed: list[list[str]] = []
+
+    def fake_pages(pdf_bytes, endpoint, key):
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            texts = [page.get_text().strip() for page in doc]
+        analysed.append(texts)
+        return "\n<!-- PageBreak -->\n".join(f"PAGE {text}" for text in texts)
+
+    monkeypatch.setattr(ConversionWorker, "_azure_credentials", lambda self: ("https://example", "key"))
+    monkeypatch.setattr(ConversionWorker, "_process_with_azure", fake_full)
+    monkeypatch.setattr(pdf_utils, "analyze_pdf_bytes_with_azure", fake_pages)
+
+    ConversionWorker([job], helper="azure_di")._run()
+
+    # Stamp page two and append a fourth page.
+    with fitz.open(source) as doc:
+        doc[1].insert_text((72, 700), "BATES-0002")
+        doc.new_page().insert_text((72, 72), "delta")
+        doc.save(tmp_path / "updated.pdf")
+    (tmp_path / "updated.pdf").replace(source)
+    failures: list[tuple[str, str]] = []
+    worker = ConversionWorker([job], helper="azure_di")
+    worker.file_failed.connect(lambda path, error: failures.append((path, error)))
+    monkeypatch.setattr(ConversionWorker, "_process_with_azure", lambda *args: pytest.fail("full conversion"))
+
+    worker._run()
+
+    assert failures == []
+    assert analysed == [["beta\nBATES-0002", "delta"]]
+    content = job.destination_path.read_text(encoding="utf-8")
+    assert content.count("<!--- sources/record.pdf#page=") == 4
+    assert [line for line in content.splitlines() if line.startswith("PAGE")] == [
+        "PAGE alpha",
+        "PAGE beta",
+        "PAGE gamma",
+        "PAGE delta",
+    ]
+    assert "BATES-0002" in content
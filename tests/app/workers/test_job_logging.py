@@ -34,3 +34,78 @@ def test_job_logging_cancel(caplog):
     messages = [rec.getMessage() for rec in caplog.records if rec.name.endswith("base.dummy")]
     assert any(tag in m and "cancel requested" in m for m in messages), "should log cancel with job tag"
 
+
+
+def test_run_async_returns_result():
+    import asyncio
+
+    async def work():
+        await asyncio.sleep(0)
+        return "done"
+
+    assert _DummyWorker().run_async(work()) == "done"
+
+
+def test_run_async_cancels_on_request():
+    import asyncio
+    import threading
+
+    import pytest
+
+    worker = _DummyWorker()
+    threading.Timer(0.05, worker.cancel).start()
+
+    async def forever():
+        await asyncio.sleep(30)
+
+    with pytest.raises(asyncio.CancelledError):
+        worker.run_async(forever())
+
+
+def test_run_async_closes_loop_clients_between_runs():
+    from src.common.llm.base import BaseLLMProvider
+    from src.common.llm.providers.gemini import GeminiProvider
+
+    class _FakeAsyncClient:
+        def __init__(self) -> None:
+            self.closed = False
+
+        async def close(self) -> None:
+            self.closed = True
+
+    class _AsyncProvider(BaseLLMProvider):
+        def __init__(self) -> None:
+            super().__init__(default_system_prompt="test")
+            self.clients: list[_FakeAsyncClient] = []
+
+        def generate(self, prompt, model=None, max_tokens=1, temperature=0.0, system_prompt=None):
+            return {"success": True}
+
+        async def agenerate(self, prompt, model=None, max_tokens=1, temperature=0.0, system_prompt=None):
+            client = self._async_client(_FakeAsyncClient)
+            assert not client.closed
+            self.clients.append(client)
+            return {"success": True}
+
+        def count_tokens(self, text=None, messages=None):
+            return {"success": True, "token_count": 0}
+
+        @property
+        def provider_name(self) -> str:
+            return "fake"
+
+        @property
+        def default_model(self) -> str:
+            return "fake-model"
+
+    worker = _DummyWorker()
+    provider = _AsyncProvider()
+
+    assert worker.run_async(provider.agenerate("one")) == {"success": True}
+    assert worker.run_async(provider.agenerate("two")) == {"success": True}
+
+    first, second = provider.clients
+    assert first is not second
+    assert first.closed and second.closed
+    # Gemini's SDK binds one async client to the first loop, so it stays on threads.
+    assert GeminiProvider.agenerate is BaseLLMProvider.agenerate
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+from src.app.workers.manifest_store import ManifestJournal
+from src.app.workers.bulk_analysis_worker import _load_manifest, _save_manifest
+
+
+def test_record_appends_without_rewriting_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    journal = ManifestJournal(path)
+    journal.compact({"version": 2, "documents": {"a.md": {"prompt_hash": "x"}}})
+    snapshot = path.read_text(encoding="utf-8")
+
+    journal.record(["documents", "b.md"], {"prompt_hash": "y"})
+    journal.record(["documents", "a.md"], {"prompt_hash": "z"})
+
+    assert path.read_text(encoding="utf-8") == snapshot
+    loaded = ManifestJournal(path).load()
+    assert loaded["documents"] == {"a.md": {"prompt_hash": "z"}, "b.md": {"prompt_hash": "y"}}
+
+
+def test_torn_final_line_is_ignored_and_folded(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    journal = ManifestJournal(path)
+    journal.record(["documents", "a.md"], {"prompt_hash": "x"})
+    with journal.journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"k": ["documents", "b.md"], "v": {"pro')
+
+    loaded = ManifestJournal(path).load()
+
+    assert loaded == {"documents": {"a.md": {"prompt_hash": "x"}}}
+    # Recovery compacts so later appends are not stranded behind the torn line.
+    assert not journal.journal_path.exists()
+    assert json.loads(path.read_text(encoding="utf-8")) == loaded
+
+
+def test_record_requests_compaction_after_threshold(tmp_path: Path) -> None:
+    journal = ManifestJournal(tmp_path / "manifest.json", compact_after=3)
+
+    assert not journal.record(["documents", "a"], 1)
+    assert not journal.record(["documents", "b"], 2)
+    assert journal.record(["documents", "c"], 3)
+    journal.compact({"documents": {"a": 1, "b": 2, "c": 3}})
+    assert not journal.journal_path.exists()
+    assert not journal.record(["documents", "d"], 4)
+
+
+def test_legacy_manifest_json_loads_and_migrates(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    legacy = {"version": 2, "signature": {"prompt_hash": "h"}, "documents": {"a.md": {"prompt_hash": "h"}}}
+    path.write_text(json.dumps(legacy, indent=2, sort_keys=True), encoding="utf-8")
+
+    manifest = _load_manifest(path)
+    assert manifest == legacy
+
+    journal = ManifestJournal(path)
+    journal.record(["documents", "b.md"], {"prompt_hash": "h"})
+    manifest = _load_manifest(path, journal)
+    _save_manifest(path, manifest, journal)
+
+    assert not journal.journal_path.exists()
+    assert set(json.loads(path.read_text(encoding="utf-8"))["documents"]) == {"a.md", "b.md"}
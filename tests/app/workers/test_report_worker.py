@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import re
+import threading
+import time
 from pathlib import Path
 from textwrap import dedent
 
@@ -483,3 +486,108 @@ def test_draft_worker_supports_transcript_without_inputs(
     assert finished_results
     draft_path = Path(finished_results[0]["draft_path"])
     assert draft_path.exists()
+
+
+class _SectionProvider(_StubProvider):
+    """Answers each section after a delay that makes later sections finish first."""
+
+    def __init__(self, *, failures: dict[str, int] | None = None) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._failures = dict(failures or {})
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def generate(self, prompt: str, **kwargs) -> dict:  # type: ignore[override]
+        number = int(re.search(r"Details for section (\d+)", prompt).group(1))
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            remaining_failures = self._failures.get(str(number), 0)
+            if remaining_failures:
+                self._failures[str(number)] = remaining_failures - 1
+        try:
+            time.sleep(0.01 * (6 - number))
+            if remaining_failures:
+                return {"success": False, "error": f"section {number} unavailable"}
+            return {"success": True, "content": f"Body {number}"}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _run_sectioned_draft(
+    project_dir: Path, monkeypatch: pytest.MonkeyPatch, provider: _SectionProvider, **options
+) -> tuple[list[dict], list[str], list[tuple[int, str]]]:
+    (common_paths, _) = _prepare_common_files(project_dir)
+    template_path, generation_user_prompt_path, _, generation_system_prompt_path = common_paths
+    template_path.write_text(
+        "\n".join(f"# Section {number}\n\nDetails for section {number}.\n" for number in range(1, 6)),
+        encoding="utf-8",
+    )
+    _patch_worker_dependencies(monkeypatch, provider)
+
+    worker = DraftReportWorker(
+        project_dir=project_dir,
+        inputs=[(REPORT_CATEGORY_CONVERTED, "converted_documents/doc.md")],
+        provider_id="anthropic",
+        model="claude-sonnet-4-5-20250929",
+        custom_model=None,
+        context_window=None,
+        template_path=template_path,
+        transcript_path=None,
+        generation_user_prompt_path=generation_user_prompt_path,
+        generation_system_prompt_path=generation_system_prompt_path,
+        metadata=ProjectMetadata(case_name="Case"),
+        **options,
+    )
+    finished_results: list[dict] = []
+    failures: list[str] = []
+    progress: list[tuple[int, str]] = []
+    worker.finished.connect(lambda payload: finished_results.append(payload))
+    worker.failed.connect(failures.append)
+    worker.progress.connect(lambda pct, message: progress.append((pct, message)))
+    worker.run()
+    return finished_results, failures, progress
+
+
+def test_draft_worker_generates_sections_concurrently_in_template_order(
+    tmp_path: Path,
+    qt_app: QApplication,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert qt_app is not None
+    provider = _SectionProvider(failures={"3": 1})
+
+    finished_results, failures, progress = _run_sectioned_draft(
+        tmp_path, monkeypatch, provider, max_concurrent_sections=3, section_retries=1
+    )
+
+    assert not failures
+    assert 1 < provider.peak_in_flight <= 3
+    manifest = json.loads(Path(finished_results[0]["manifest_path"]).read_text(encoding="utf-8"))
+    assert [section["title"] for section in manifest["sections"]] == [f"Section {n}" for n in range(1, 6)]
+    draft_text = Path(finished_results[0]["draft_path"]).read_text(encoding="utf-8")
+    positions = [draft_text.index(f"Body {number}") for number in range(1, 6)]
+    assert positions == sorted(positions)
+    section_progress = [message for _, message in progress if message.startswith("Generated section")]
+    assert [message.split(":")[0] for message in section_progress] == [
+        f"Generated section {n} of 5" for n in range(1, 6)
+    ]
+
+
+def test_draft_worker_fails_without_writing_when_a_section_keeps_failing(
+    tmp_path: Path,
+    qt_app: QApplication,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert qt_app is not None
+    provider = _SectionProvider(failures={"2": 2})
+
+    finished_results, failures, _ = _run_sectioned_draft(
+        tmp_path, monkeypatch, provider, max_concurrent_sections=2, section_retries=1
+    )
+
+    assert not finished_results
+    assert failures == ["section 2 unavailable"]
+    assert not list(tmp_path.glob("reports/*-draft.md"))
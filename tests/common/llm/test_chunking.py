@@ -0,0 +1,81 @@
+import pytest
+
+from src.common.llm import tokens
+from src.common.llm.chunking import ChunkingStrategy
+
+
+class _WordEncoder:
+    """One token per whitespace-separated word."""
+
+    name = "words"
+    estimated = False
+
+    def count(self, text: str) -> int:
+        return len(text.split())
+
+    def count_batch(self, texts):
+        return [len(text.split()) for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def word_tokenizer(monkeypatch):
+    monkeypatch.setattr(tokens, "_TOKENIZER_REGISTRY", dict(tokens._TOKENIZER_REGISTRY))
+    monkeypatch.setattr(tokens, "_TOKENIZERS", {})
+    tokens.register_tokenizer("test", lambda model: _WordEncoder())
+
+
+def _document(sections: int = 12, sentences: int = 8) -> str:
+    parts = []
+    for section in range(sections):
+        parts.append(f"## Section {section}\n\n")
+        body = " ".join(f"Finding {section}-{index} was noted today." for index in range(sentences))
+        parts.append(body + "\n\n")
+    return "".join(parts)
+
+
+def test_markdown_tokens_never_exceeds_budget() -> None:
+    text = _document()
+
+    chunks = ChunkingStrategy.markdown_tokens(text, 60, provider="test", overlap_tokens=10)
+
+    assert len(chunks) > 1
+    assert all(len(chunk.split()) <= 60 for chunk in chunks)
+    # Every sentence survives chunking.
+    joined = " ".join(chunks)
+    for section in range(12):
+        for index in range(8):
+            assert f"Finding {section}-{index} " in joined
+
+
+def test_markdown_tokens_overlap_starts_on_sentence_boundary() -> None:
+    text = _document()
+
+    chunks = ChunkingStrategy.markdown_tokens(text, 60, provider="test", overlap_tokens=12)
+
+    for chunk in chunks[1:]:
+        assert chunk.startswith("Finding") or chunk.startswith("## Section")
+    # At least one chunk repeats the tail of its predecessor.
+    assert any(
+        chunk.split(". ")[0] in previous for previous, chunk in zip(chunks, chunks[1:]) if chunk.startswith("Finding")
+    )
+
+
+def test_markdown_tokens_prefers_header_cuts() -> None:
+    text = _document(sections=6, sentences=6)
+
+    chunks = ChunkingStrategy.markdown_tokens(text, 50, provider="test", overlap_tokens=0)
+
+    assert all(chunk.startswith("## Section") for chunk in chunks)
+
+
+def test_markdown_tokens_splits_text_without_boundaries() -> None:
+    text = " ".join(f"w{index}" for index in range(500))
+
+    chunks = ChunkingStrategy.markdown_tokens(text, 40, provider="test", overlap_tokens=0)
+
+    assert all(len(chunk.split()) <= 40 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_markdown_tokens_small_document_is_single_chunk() -> None:
+    assert ChunkingStrategy.markdown_tokens("Short note.", 100, provider="test") == ["Short note."]
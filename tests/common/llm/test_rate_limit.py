@@ -0,0 +1,270 @@
+import threading
+import types
+
+import pytest
+
+from src.common.llm import rate_limit
+from src.common.llm.rate_limit import (
+    FATAL,
+    RATE_LIMITED,
+    TRANSIENT,
+    ConcurrencyController,
+    RateLimiter,
+    TokenBucket,
+    classify_error,
+)
+
+
+class _RateLimitError(Exception):
+    def __init__(self, headers=None):
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+        self.response = types.SimpleNamespace(status_code=429, headers=headers or {})
+
+
+class _ServerError(Exception):
+    status_code = 500
+
+
+class _BadRequest(Exception):
+    status_code = 400
+
+
+def _limiter(**kwargs) -> tuple[RateLimiter, list[float]]:
+    sleeps: list[float] = []
+    limiter = RateLimiter(("test", "model"), sleep=sleeps.append, **kwargs)
+    return limiter, sleeps
+
+
+def test_classify_error() -> None:
+    assert classify_error(_RateLimitError()) == RATE_LIMITED
+    assert classify_error(_ServerError()) == TRANSIENT
+    assert classify_error(TimeoutError()) == TRANSIENT
+    assert classify_error(_BadRequest()) == FATAL
+    assert classify_error(type("ResourceExhausted", (Exception,), {})()) == RATE_LIMITED
+
+
+def test_token_bucket_reports_wait_once_exhausted() -> None:
+    bucket = TokenBucket(per_minute=600)
+
+    assert bucket.reserve(600) == 0.0
+    wait = bucket.reserve(60)
+    assert wait == pytest.approx(6.0, rel=0.05)
+
+    bucket.credit(60)
+    assert bucket.reserve(1) == pytest.approx(0.1, rel=0.5)
+
+
+def test_unknown_bucket_does_not_limit() -> None:
+    assert TokenBucket().reserve(10_000_000) == 0.0
+
+
+def test_call_retries_rate_limits_using_retry_after() -> None:
+    limiter, sleeps = _limiter()
+    attempts = {"count": 0}
+
+    def request():
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            raise _RateLimitError({"retry-after": "3"})
+        return "ok"
+
+    before = limiter.concurrency.limit
+    assert limiter.call(request, max_retries=2) == "ok"
+    assert attempts["count"] == 2
+    assert 3.0 in sleeps
+    assert limiter.concurrency.limit < before
+    assert limiter.stats["rate_limited"] == 1
+
+
+def test_call_raises_fatal_errors_without_retry() -> None:
+    limiter, sleeps = _limiter()
+    attempts = {"count": 0}
+
+    def request():
+        attempts["count"] += 1
+        raise _BadRequest("bad")
+
+    with pytest.raises(_BadRequest):
+        limiter.call(request, max_retries=3)
+    assert attempts["count"] == 1
+    assert sleeps == []
+
+
+def test_call_gives_up_after_max_retries() -> None:
+    limiter, sleeps = _limiter()
+
+    def request():
+        raise _ServerError("boom")
+
+    with pytest.raises(_ServerError):
+        limiter.call(request, max_retries=2)
+    assert sleeps == [1.0, 2.0]
+
+
+def test_observe_headers_learns_limits() -> None:
+    limiter, _ = _limiter()
+    limiter.observe_headers(
+        {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-input-tokens-limit": "40000",
+        }
+    )
+
+    assert limiter.requests.capacity == 50
+    assert limiter.tokens.capacity == 40000
+    assert limiter.requests.reserve(1) > 0
+
+
+def test_rate_limit_headers_on_429_are_learned() -> None:
+    limiter, _ = _limiter()
+    calls = {"count": 0}
+
+    def request():
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise _RateLimitError({"x-ratelimit-limit-tokens": "90000", "x-ratelimit-reset-tokens": "6m0s"})
+        return "ok"
+
+    limiter.call(request)
+    assert limiter.tokens.capacity == 90000
+
+
+def test_remaining_only_headers_raise_an_inferred_capacity() -> None:
+    limiter, _ = _limiter()
+    limiter.observe_headers({"x-ratelimit-remaining-requests": "3", "x-ratelimit-remaining-tokens": "5000"})
+    assert limiter.tokens.capacity == 5000
+
+    for _ in range(5):
+        limiter.observe_headers({"x-ratelimit-remaining-requests": "950", "x-ratelimit-remaining-tokens": "290000"})
+
+    assert limiter.requests.capacity == 950
+    assert limiter.tokens.capacity == 290000
+    assert [limiter._reserve(2000) for _ in range(5)] == [0.0] * 5
+
+    # A lower reading afterwards only drains the balance.
+    limiter.observe_headers({"x-ratelimit-remaining-tokens": "1000"})
+    assert limiter.tokens.capacity == 290000
+    assert limiter.tokens.available <= 1000 + 1
+
+
+def test_anthropic_input_token_bucket_is_credited_with_input_tokens_only() -> None:
+    limiter, _ = _limiter()
+    headers = {"anthropic-ratelimit-input-tokens-limit": "40000"}
+    limiter.observe_headers({**headers, "anthropic-ratelimit-input-tokens-remaining": "20000"})
+    usage = types.SimpleNamespace(input_tokens=100, output_tokens=4000)
+    raw = _RawResponse(headers, types.SimpleNamespace(usage=usage))
+
+    limiter.call(lambda: raw, estimated_tokens=1000)
+
+    # 1000 reserved, 100 used: the output tokens are not charged.
+    assert limiter.tokens.available == pytest.approx(19900, abs=5)
+
+
+class _RawResponse:
+    def __init__(self, headers, parsed):
+        self.headers = headers
+        self._parsed = parsed
+
+    def parse(self):
+        return self._parsed
+
+
+def test_raw_response_headers_are_learned_on_success() -> None:
+    limiter, _ = _limiter()
+    usage = types.SimpleNamespace(input_tokens=10, output_tokens=5)
+    message = types.SimpleNamespace(usage=usage)
+    raw = _RawResponse(
+        {"anthropic-ratelimit-requests-limit": "50", "anthropic-ratelimit-input-tokens-limit": "40000"},
+        message,
+    )
+
+    assert limiter.call(lambda: raw) is message
+    assert limiter.requests.capacity == 50
+    assert limiter.tokens.capacity == 40000
+
+
+def test_acall_learns_raw_response_headers() -> None:
+    import asyncio
+
+    limiter, _ = _limiter()
+    raw = _RawResponse({"x-ratelimit-limit-requests": "30"}, "parsed")
+
+    async def request():
+        return raw
+
+    assert asyncio.run(limiter.acall(request)) == "parsed"
+    assert limiter.requests.capacity == 30
+
+
+def test_success_raises_concurrency_additively() -> None:
+    controller = ConcurrencyController(initial=2, maximum=4)
+    for _ in range(4):
+        controller.on_success()
+    assert int(controller.limit) == 3
+    assert controller.on_throttle()
+    assert controller.limit == pytest.approx(1.5, rel=0.2)
+    # A burst of 429s from requests already in flight only halves once.
+    assert not controller.on_throttle()
+
+
+def test_limiter_caps_in_flight_requests() -> None:
+    limiter, _ = _limiter(initial_concurrency=2, max_concurrency=2)
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+    release = threading.Event()
+
+    def request():
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        release.wait(0.05)
+        with lock:
+            state["in_flight"] -= 1
+        return "ok"
+
+    threads = [threading.Thread(target=limiter.call, args=(request,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert state["peak"] == 2
+
+
+def test_registry_shares_limiter_per_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rate_limit, "_LIMITERS", {})
+    monkeypatch.setattr(rate_limit, "_LIMITS", {})
+    rate_limit.configure_rate_limit("anthropic", requests_per_minute=100, max_concurrency=3)
+
+    first = rate_limit.get_rate_limiter("anthropic", "claude")
+    assert rate_limit.get_rate_limiter("anthropic", "claude") is first
+    assert rate_limit.get_rate_limiter("anthropic", "other") is not first
+    assert first.requests.capacity == 100
+    assert first.concurrency.maximum == 3
+
+
+def test_acall_retries_and_caps_in_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    monkeypatch.setattr(rate_limit, "_BASE_BACKOFF", 0.01)
+    limiter, _ = _limiter(initial_concurrency=2, max_concurrency=2)
+    state = {"in_flight": 0, "peak": 0, "failed": False}
+
+    async def request():
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        if not state["failed"]:
+            state["failed"] = True
+            raise _ServerError("flaky")
+        return "ok"
+
+    async def main():
+        return await asyncio.gather(*(limiter.acall(request, max_retries=1) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["ok"] * 5
+    assert state["peak"] == 2
+    assert limiter.stats["requests"] == 5
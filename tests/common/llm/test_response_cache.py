@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from src.common.llm import response_cache
+from src.common.llm.response_cache import ResponseCache, open_response_cache, response_cache_key
+
+
+def _key(**overrides) -> str:
+    fields = {
+        "provider": "anthropic",
+        "model": "claude",
+        "temperature": 0.1,
+        "max_tokens": 1000,
+        "system_prompt": "System",
+        "prompt": "Summarise this.",
+    }
+    fields.update(overrides)
+    return response_cache_key(**fields)
+
+
+def test_key_covers_every_request_field() -> None:
+    base = _key()
+
+    assert _key() == base
+    for field, value in (
+        ("provider", "azure_openai"),
+        ("model", "other"),
+        ("temperature", 0.2),
+        ("max_tokens", 2000),
+        ("system_prompt", "Other"),
+        ("prompt", "Summarise that."),
+    ):
+        assert _key(**{field: value}) != base
+    # Field boundaries are unambiguous.
+    assert _key(system_prompt="ab", prompt="c") != _key(system_prompt="a", prompt="bc")
+
+
+def test_get_put_tracks_hits_and_misses(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+
+    assert cache.get("k") is None
+    cache.put("k", "answer")
+    assert cache.get("k") == "answer"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["entries"] == 1 and stats["bytes"] == len("answer")
+
+
+def test_persists_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "responses.sqlite3"
+    ResponseCache(path).put("k", "answer")
+
+    reopened = ResponseCache(path)
+
+    assert reopened.get("k") == "answer"
+    assert reopened.stats()["bytes"] == len("answer")
+
+
+def test_evicts_least_recently_used_past_size_limit(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "responses.sqlite3", max_bytes=30)
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    cache.put("c", "z" * 10)
+    assert cache.get("a") is not None  # "b" is now the least recently used
+
+    cache.put("d", "w" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("d") is not None
+    assert cache.stats()["bytes"] <= 30
+    assert cache.stats()["evictions"] >= 1
+
+
+def test_open_response_cache_is_opt_in_and_shared(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(response_cache, "_SHARED", {})
+    path = tmp_path / "responses.sqlite3"
+
+    assert open_response_cache(None) is None
+    assert open_response_cache({"enabled": False, "path": str(path)}) is None
+
+    first = open_response_cache({"enabled": True, "path": str(path), "max_size_mb": 1})
+    second = open_response_cache({"enabled": True, "path": str(path)})
+    assert first is not None and first is second
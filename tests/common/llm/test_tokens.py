@@ -0,0 +1,150 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from src.common.llm import tokens
+from src.common.llm.tokens import TokenCounter
+
+
+class _WordEncoder:
+    """Deterministic stand-in tokenizer: one token per whitespace-separated word."""
+
+    name = "words"
+
+    def __init__(self, estimated: bool = False) -> None:
+        self.estimated = estimated
+        self.calls = 0
+        self.batch_calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+    def count_batch(self, texts):
+        self.batch_calls += 1
+        return [len(text.split()) for text in texts]
+
+
+@pytest.fixture
+def word_encoder(monkeypatch):
+    encoder = _WordEncoder()
+    monkeypatch.setattr(tokens, "_TOKENIZER_REGISTRY", dict(tokens._TOKENIZER_REGISTRY))
+    monkeypatch.setattr(tokens, "_TOKENIZERS", {})
+    tokens.register_tokenizer("test", lambda model: encoder)
+    TokenCounter.clear_cache()
+    yield encoder
+    TokenCounter.clear_cache()
+    TokenCounter.disable_disk_cache()
+
+
+def test_count_uses_registered_tokenizer_and_caches(word_encoder) -> None:
+    first = TokenCounter.count(text="one two three", provider="test")
+    second = TokenCounter.count(text="one two three", provider="test")
+
+    assert first == {"success": True, "token_count": 3}
+    assert second == first
+    assert word_encoder.calls == 1
+    stats = TokenCounter.get_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_cache_key_includes_model(word_encoder) -> None:
+    TokenCounter.count(text="alpha beta", provider="test", model="a")
+    TokenCounter.count(text="alpha beta", provider="test", model="b")
+
+    assert word_encoder.calls == 2
+
+
+def test_tokenizer_resolved_once_per_model(monkeypatch) -> None:
+    monkeypatch.setattr(tokens, "_TOKENIZER_REGISTRY", dict(tokens._TOKENIZER_REGISTRY))
+    monkeypatch.setattr(tokens, "_TOKENIZERS", {})
+    resolved = []
+
+    def resolver(model):
+        resolved.append(model)
+        return _WordEncoder()
+
+    tokens.register_tokenizer("test", resolver)
+    for _ in range(3):
+        tokens.get_tokenizer("test", "m")
+
+    assert resolved == ["m"]
+
+
+def test_unavailable_tokenizer_falls_back_to_estimate(monkeypatch) -> None:
+    monkeypatch.setattr(tokens, "_TOKENIZER_REGISTRY", dict(tokens._TOKENIZER_REGISTRY))
+    monkeypatch.setattr(tokens, "_TOKENIZERS", {})
+
+    def resolver(model):
+        raise OSError("encoding not downloadable")
+
+    tokens.register_tokenizer("test", resolver)
+    result = TokenCounter.count(text="x" * 40, provider="test", use_cache=False)
+
+    assert result == {"success": True, "token_count": 10, "estimated": True}
+
+
+def test_count_many_batches_cache_misses(word_encoder) -> None:
+    TokenCounter.count(text="cached text", provider="test")
+
+    counts = TokenCounter.count_many(["a b c", "cached text", "d e"], provider="test")
+
+    assert counts == [3, 2, 2]
+    assert word_encoder.batch_calls == 1
+    assert TokenCounter.count_many(["a b c", "d e"], provider="test") == [3, 2]
+    assert word_encoder.batch_calls == 1
+
+
+def test_memory_cache_is_bounded(word_encoder, monkeypatch) -> None:
+    monkeypatch.setattr(tokens._MEMORY_CACHE, "max_size", 3)
+
+    for index in range(5):
+        TokenCounter.count(text=f"text {index}", provider="test")
+
+    assert TokenCounter.get_cache_stats()["size"] == 3
+
+
+def test_disk_cache_survives_memory_clear(word_encoder, tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(tokens, "_DISK_CACHE_MIN_CHARS", 1)
+    TokenCounter.enable_disk_cache(tmp_path / "token_counts.sqlite3")
+
+    TokenCounter.count(text="persist me please", provider="test")
+    TokenCounter.clear_cache()
+    result = TokenCounter.count(text="persist me please", provider="test")
+
+    assert result["token_count"] == 3
+    assert word_encoder.calls == 1
+    assert (tmp_path / "token_counts.sqlite3").exists()
+
+
+def test_count_many_uses_disk_cache(word_encoder, tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(tokens, "_DISK_CACHE_MIN_CHARS", 1)
+    TokenCounter.enable_disk_cache(tmp_path / "token_counts.sqlite3")
+
+    assert TokenCounter.count_many(["one two", "three"], provider="test") == [2, 1]
+    TokenCounter.clear_cache()
+
+    assert TokenCounter.count_many(["one two", "three", "four five six"], provider="test") == [2, 1, 3]
+    assert TokenCounter.count(text="one two", provider="test")["token_count"] == 2
+    assert word_encoder.batch_calls == 2
+    assert word_encoder.calls == 0
+
+
+def test_estimated_encoders_scale_counts_up(monkeypatch) -> None:
+    class _WordEncoding:
+        def encode_ordinary(self, text):
+            return text.split()
+
+        def encode_ordinary_batch(self, texts):
+            return [text.split() for text in texts]
+
+    monkeypatch.setattr(tokens, "_load_encoding", lambda name: _WordEncoding())
+    exact = tokens.TokenEncoder("cl100k_base")
+    estimated = tokens._approximate_tokenizer("claude-sonnet-4-5-20250929")
+    text = "Patient seen on 03/14/2021 at 10:45"
+
+    assert exact.count(text) == 6
+    assert estimated.estimated
+    assert estimated.count(text) == math.ceil(6 * tokens._ESTIMATE_SAFETY_FACTOR)
+    assert estimated.count_batch([text, text]) == [estimated.count(text)] * 2
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("azure.ai.documentintelligence")
+
+from src.core.pdf_utils import _azure_markdown_chunked
+
+
+def _range_markdown(start: int, end: int) -> str:
+    return "\n<!-- PageBreak -->\n".join(f"page {n}" for n in range(start, end + 1))
+
+
+class _Poller:
+    def __init__(self, content: str, delay: float) -> None:
+        self._content = content
+        self._delay = delay
+
+    def result(self, timeout: int):
+        time.sleep(self._delay)
+        return type("Result", (), {"content": self._content})()
+
+
+class _PagesClient:
+    """Accepts the ``pages`` parameter; later ranges finish first."""
+
+    def __init__(self, total_pages: int) -> None:
+        self.total_pages = total_pages
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def begin_analyze_document(self, model, body, *, output_content_format, pages):
+        start, end = (int(part) for part in pages.split("-"))
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        delay = 0.05 * (self.total_pages - start) / self.total_pages
+
+        client = self
+
+        class _TrackedPoller(_Poller):
+            def result(self, timeout: int):
+                try:
+                    return super().result(timeout)
+                finally:
+                    with client._lock:
+                        client.in_flight -= 1
+
+        return _TrackedPoller(_range_markdown(start, end), delay)
+
+
+class _NoPagesClient:
+    """Rejects ``pages`` and reads the page range from the submitted sub-PDF."""
+
+    def __init__(self) -> None:
+        self.streams = []
+
+    def begin_analyze_document(self, model, body, *, output_content_format, **kwargs):
+        if "pages" in kwargs:
+            raise TypeError("pages not supported")
+        self.streams.append(body)
+        doc = fitz.open(stream=body.read(), filetype="pdf")
+        texts = [page.get_text().strip() for page in doc]
+        doc.close()
+        return _Poller("\n<!-- PageBreak -->\n".join(texts), 0)
+
+
+def _expected(total: int) -> list[str]:
+    return [f"page {n}" for n in range(1, total + 1)]
+
+
+def _pages(markdown: str) -> list[str]:
+    return [part.strip() for part in markdown.split("<!-- PageBreak -->")]
+
+
+def test_ranges_run_concurrently_and_stitch_in_order(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "record.pdf"
+    pdf_path.write_bytes(b"%PDF")
+    client = _PagesClient(total_pages=25)
+
+    combined = _azure_markdown_chunked(
+        client=client, pdf_path=str(pdf_path), total_pages=25, max_pages=10, overlap=2
+    )
+
+    assert _pages(combined) == _expected(25)
+    assert client.peak > 1
+
+
+def test_fallback_cuts_sub_pdfs_in_memory(tmp_path: Path) -> None:
+    source_dir = tmp_path / "sources"
+    source_dir.mkdir()
+    pdf_path = source_dir / "record.pdf"
+    doc = fitz.open()
+    for n in range(1, 8):
+        doc.new_page().insert_text((72, 72), f"page {n}")
+    doc.save(pdf_path)
+    doc.close()
+    client = _NoPagesClient()
+
+    combined = _azure_markdown_chunked(
+        client=client, pdf_path=str(pdf_path), total_pages=7, max_pages=3, overlap=1
+    )
+
+    assert _pages(combined) == _expected(7)
+    assert len(client.streams) == 2
+    assert list(source_dir.iterdir()) == [pdf_path]
@@ -50,3 +50,25 @@ def test_warn_if_page_mismatch_logs(qt_app: QApplication, caplog: pytest.LogCapt
     worker._warn_if_page_mismatch(job, pages_detected=1200, pages_pdf=1180)
     assert any("Page count mismatch" in rec.message for rec in caplog.records)
 
+
+
+def test_extract_pdf_pages_splits_large_documents_across_processes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fitz = pytest.importorskip("fitz")
+    from src.core import file_utils
+
+    pdf_path = tmp_path / "long.pdf"
+    doc = fitz.open()
+    for n in range(1, 41):
+        doc.new_page().insert_text((72, 72), f"page {n}")
+    doc.save(pdf_path)
+    doc.close()
+
+    monkeypatch.setattr(file_utils, "PARALLEL_EXTRACTION_MIN_PAGES", 8)
+    monkeypatch.setattr(file_utils, "_MIN_PAGES_PER_TASK", 8)
+    pages, page_count = file_utils.extract_pdf_pages(pdf_path, max_workers=3)
+
+    assert page_count == 40
+    assert [number for number, _ in pages] == list(range(1, 41))
+    assert [text.strip() for _, text in pages] == [f"page {n}" for n in range(1, 41)]